@@ -0,0 +1,421 @@
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left
+from collections.abc import Iterable, Iterator
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+from suite_trading.domain.market_data.bar.bar import Bar
+from suite_trading.domain.market_data.bar.bar_type import BarType
+from suite_trading.utils.datetime_tools import expect_utc, format_range
+from suite_trading.utils.numeric_tools import DecimalLike, as_decimal
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_NO_VOLUME = -(2**63)
+# Largest magnitude a scaled value may have (int64, with -(2**63) reserved for $_NO_VOLUME)
+_MAX_SCALED_INT = 2**63 - 1
+
+
+class BarSeries:
+    """Column-backed container of bars that share one `BarType`.
+
+    Stores timestamps and OHLCV values as typed column arrays instead of one `Bar` object per
+    row. Timestamps are kept as microseconds since the UNIX epoch and prices/volumes as scaled
+    64-bit integers, so one row costs 57 bytes instead of roughly 800 bytes for a materialized
+    `Bar` with its Decimals and datetimes.
+
+    Rows are handed out as lightweight `BarView` objects, which implement the full `Bar` read
+    API and convert fields to Decimal/datetime only when accessed.
+
+    Notes:
+        - Bars must be appended in chronological order ($end_dt non-decreasing).
+        - Every price must be representable with $price_decimals digits after the decimal point
+          and every volume with $volume_decimals digits; otherwise `append` raises, because
+          silently rounding market data is never acceptable.
+
+    Example:
+        series = BarSeries.from_bars(DGA.bar.create_series(num_bars=1_000))
+        bar = series[-1]  # BarView, usable wherever a Bar is expected
+        assert bar.close == series.get_bar(-1).close
+    """
+
+    __slots__ = (
+        "_bar_type",
+        "_price_decimals",
+        "_volume_decimals",
+        "_start_us",
+        "_end_us",
+        "_open",
+        "_high",
+        "_low",
+        "_close",
+        "_volume",
+        "_is_partial",
+    )
+
+    # region Init
+
+    def __init__(
+        self,
+        bar_type: BarType,
+        *,
+        price_decimals: int | None = None,
+        volume_decimals: int | None = None,
+    ) -> None:
+        """Create an empty series for bars of $bar_type.
+
+        Args:
+            bar_type: Type shared by all bars in this series.
+            price_decimals: Digits after the decimal point stored for prices. Defaults to the
+                precision of $bar_type.instrument.price_increment.
+            volume_decimals: Digits after the decimal point stored for volumes. Defaults to the
+                precision of $bar_type.instrument.qty_increment.
+
+        Raises:
+            ValueError: If $price_decimals or $volume_decimals is negative.
+        """
+        instrument = bar_type.instrument
+        price_decimals = _count_decimals(instrument.price_increment) if price_decimals is None else price_decimals
+        volume_decimals = _count_decimals(instrument.qty_increment) if volume_decimals is None else volume_decimals
+
+        # Raise: scales must be non-negative digit counts
+        if price_decimals < 0 or volume_decimals < 0:
+            raise ValueError(f"Cannot call `BarSeries.__init__` because $price_decimals ({price_decimals}) or $volume_decimals ({volume_decimals}) is negative")
+
+        self._bar_type = bar_type
+        self._price_decimals = price_decimals
+        self._volume_decimals = volume_decimals
+
+        # Typed columns (one row per bar)
+        self._start_us: array[int] = array("q")
+        self._end_us: array[int] = array("q")
+        self._open: array[int] = array("q")
+        self._high: array[int] = array("q")
+        self._low: array[int] = array("q")
+        self._close: array[int] = array("q")
+        self._volume: array[int] = array("q")
+        self._is_partial = bytearray()
+
+    @classmethod
+    def from_bars(
+        cls,
+        bars: Iterable[Bar],
+        *,
+        price_decimals: int | None = None,
+        volume_decimals: int | None = None,
+    ) -> BarSeries:
+        """Build a series from $bars, which must be non-empty and share one `BarType`.
+
+        Args:
+            bars: Chronologically ordered bars.
+            price_decimals: See `BarSeries.__init__`.
+            volume_decimals: See `BarSeries.__init__`.
+
+        Returns:
+            BarSeries: New series holding the values of $bars.
+
+        Raises:
+            ValueError: If $bars is empty or any bar violates `append_bar` rules.
+        """
+        iterator = iter(bars)
+        first_bar = next(iterator, None)
+
+        # Raise: BarType of the series is taken from the first bar
+        if first_bar is None:
+            raise ValueError("Cannot call `BarSeries.from_bars` because $bars is empty")
+
+        result = cls(first_bar.bar_type, price_decimals=price_decimals, volume_decimals=volume_decimals)
+        result.append_bar(first_bar)
+        for bar in iterator:
+            result.append_bar(bar)
+        return result
+
+    # endregion
+
+    # region Main
+
+    def append(
+        self,
+        start_dt: datetime,
+        end_dt: datetime,
+        open: DecimalLike,
+        high: DecimalLike,
+        low: DecimalLike,
+        close: DecimalLike,
+        volume: DecimalLike | None,
+        *,
+        is_partial: bool = False,
+    ) -> None:
+        """Append one bar given by its raw values; validation matches `Bar.__init__`.
+
+        Raises:
+            ValueError: If timestamps are not UTC, $end_dt is not after $start_dt, $end_dt is older
+                than the last stored bar, OHLC relations are invalid, or a value cannot be stored
+                exactly with the configured number of decimals or does not fit an int64 column.
+        """
+        start_us = _to_us(expect_utc(start_dt))
+        end_us = _to_us(expect_utc(end_dt))
+        open_int = _to_scaled_int(open, self._price_decimals, "open")
+        high_int = _to_scaled_int(high, self._price_decimals, "high")
+        low_int = _to_scaled_int(low, self._price_decimals, "low")
+        close_int = _to_scaled_int(close, self._price_decimals, "close")
+        volume_int = _NO_VOLUME if volume is None else _to_scaled_int(volume, self._volume_decimals, "volume")
+
+        # Raise: bar must have positive duration
+        if end_us <= start_us:
+            raise ValueError(f"Cannot call `BarSeries.append` because $end_dt ({end_dt}) is not after $start_dt ({start_dt})")
+
+        # Raise: series is kept in chronological order so it can be searched by time
+        if self._end_us and end_us < self._end_us[-1]:
+            raise ValueError(f"Cannot call `BarSeries.append` because $end_dt ({end_dt}) is older than the last bar in the series ({self.get_end_dt(-1)})")
+
+        # Raise: high must be the highest price and low the lowest
+        if high_int < max(open_int, low_int, close_int) or low_int > min(open_int, close_int):
+            raise ValueError(f"Cannot call `BarSeries.append` because OHLC relations are invalid: open={open}, high={high}, low={low}, close={close}")
+
+        self._start_us.append(start_us)
+        self._end_us.append(end_us)
+        self._open.append(open_int)
+        self._high.append(high_int)
+        self._low.append(low_int)
+        self._close.append(close_int)
+        self._volume.append(volume_int)
+        self._is_partial.append(1 if is_partial else 0)
+
+    def append_bar(self, bar: Bar) -> None:
+        """Append values of $bar to this series.
+
+        Raises:
+            ValueError: If $bar.bar_type differs from this series or `append` rejects the values.
+        """
+        # Raise: all rows share the series BarType
+        if bar.bar_type != self._bar_type:
+            raise ValueError(f"Cannot call `BarSeries.append_bar` because $bar.bar_type ('{bar.bar_type}') differs from series bar type ('{self._bar_type}')")
+
+        self.append(bar.start_dt, bar.end_dt, bar.open, bar.high, bar.low, bar.close, bar.volume, is_partial=bar.is_partial)
+
+    def get_bar(self, index: int) -> Bar:
+        """Materialize the row at $index as a standalone `Bar` that does not reference this series."""
+        result = self[index].to_bar()
+        return result
+
+    def find_first_index_at_or_after(self, dt: datetime) -> int:
+        """Return the index of the first bar with $end_dt >= $dt, or `len(self)` if none (O(log n))."""
+        result = bisect_left(self._end_us, _to_us(expect_utc(dt)))
+        return result
+
+    # endregion
+
+    # region Properties
+
+    @property
+    def bar_type(self) -> BarType:
+        return self._bar_type
+
+    @property
+    def price_decimals(self) -> int:
+        return self._price_decimals
+
+    @property
+    def volume_decimals(self) -> int:
+        return self._volume_decimals
+
+    @property
+    def nbytes(self) -> int:
+        """Return the number of bytes used by the column buffers."""
+        columns = (self._start_us, self._end_us, self._open, self._high, self._low, self._close, self._volume)
+        result = sum(column.itemsize * len(column) for column in columns) + len(self._is_partial)
+        return result
+
+    # endregion
+
+    # region Utilities
+
+    def get_start_dt(self, index: int) -> datetime:
+        return _from_us(self._start_us[index])
+
+    def get_end_dt(self, index: int) -> datetime:
+        return _from_us(self._end_us[index])
+
+    def get_open(self, index: int) -> Decimal:
+        return _from_scaled_int(self._open[index], self._price_decimals)
+
+    def get_high(self, index: int) -> Decimal:
+        return _from_scaled_int(self._high[index], self._price_decimals)
+
+    def get_low(self, index: int) -> Decimal:
+        return _from_scaled_int(self._low[index], self._price_decimals)
+
+    def get_close(self, index: int) -> Decimal:
+        return _from_scaled_int(self._close[index], self._price_decimals)
+
+    def get_volume(self, index: int) -> Decimal | None:
+        value = self._volume[index]
+        if value == _NO_VOLUME:
+            return None
+        return _from_scaled_int(value, self._volume_decimals)
+
+    def get_is_partial(self, index: int) -> bool:
+        return bool(self._is_partial[index])
+
+    # endregion
+
+    # region Magic
+
+    def __len__(self) -> int:
+        return len(self._end_us)
+
+    def __getitem__(self, index: int) -> BarView:
+        count = len(self._end_us)
+        normalized_index = index + count if index < 0 else index
+
+        # Raise: index must address an existing row
+        if normalized_index < 0 or normalized_index >= count:
+            raise IndexError(f"Cannot call `BarSeries.__getitem__` because $index ({index}) is out of range for series of length {count}")
+
+        result = BarView(self, normalized_index)
+        return result
+
+    def __iter__(self) -> Iterator[BarView]:
+        for index in range(len(self._end_us)):
+            yield BarView(self, index)
+
+    def __str__(self) -> str:
+        if not self._end_us:
+            return f"{self.__class__.__name__}({self._bar_type}, len=0)"
+        return f"{self.__class__.__name__}({self._bar_type}, {format_range(self.get_start_dt(0), self.get_end_dt(-1))}, len={len(self)})"
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(bar_type={self._bar_type!r}, len={len(self)}, price_decimals={self._price_decimals}, volume_decimals={self._volume_decimals})"
+
+    # endregion
+
+
+class BarView(Bar):
+    """Read-only view of one row in a `BarSeries`.
+
+    Subclasses `Bar`, so it is accepted wherever a `Bar` is (engine, aggregators, indicators,
+    order-book conversion). Fields are converted from the underlying columns on each access;
+    call `to_bar` when a standalone `Bar` is needed (e.g. to keep it after the series is dropped).
+    """
+
+    __slots__ = ("_series", "_index")
+
+    # region Init
+
+    def __init__(self, series: BarSeries, index: int) -> None:
+        # Intentionally does not call `Bar.__init__`; values live in $series and were validated on append
+        self._series = series
+        self._index = index
+
+    # endregion
+
+    # region Main
+
+    def to_bar(self) -> Bar:
+        """Return a standalone `Bar` with the same values as this view."""
+        result = Bar(
+            bar_type=self.bar_type,
+            start_dt=self.start_dt,
+            end_dt=self.end_dt,
+            open=self.open,
+            high=self.high,
+            low=self.low,
+            close=self.close,
+            volume=self.volume,
+            is_partial=self.is_partial,
+        )
+        return result
+
+    # endregion
+
+    # region Properties
+
+    @property
+    def series(self) -> BarSeries:
+        return self._series
+
+    @property
+    def index(self) -> int:
+        return self._index
+
+    @property
+    def bar_type(self) -> BarType:
+        return self._series.bar_type
+
+    @property
+    def start_dt(self) -> datetime:
+        return self._series.get_start_dt(self._index)
+
+    @property
+    def end_dt(self) -> datetime:
+        return self._series.get_end_dt(self._index)
+
+    @property
+    def open(self) -> Decimal:
+        return self._series.get_open(self._index)
+
+    @property
+    def high(self) -> Decimal:
+        return self._series.get_high(self._index)
+
+    @property
+    def low(self) -> Decimal:
+        return self._series.get_low(self._index)
+
+    @property
+    def close(self) -> Decimal:
+        return self._series.get_close(self._index)
+
+    @property
+    def volume(self) -> Decimal | None:
+        return self._series.get_volume(self._index)
+
+    @property
+    def is_partial(self) -> bool:
+        return self._series.get_is_partial(self._index)
+
+    # endregion
+
+
+# region Utilities
+
+
+def _count_decimals(increment: Decimal) -> int:
+    """Return number of digits after the decimal point needed to represent $increment exactly."""
+    exponent = increment.normalize().as_tuple().exponent
+    result = max(0, -int(exponent))
+    return result
+
+
+def _to_us(dt: datetime) -> int:
+    delta = dt - _EPOCH
+    result = (delta.days * 86_400 + delta.seconds) * 1_000_000 + delta.microseconds
+    return result
+
+
+def _from_us(us: int) -> datetime:
+    return _EPOCH + timedelta(microseconds=us)
+
+
+def _to_scaled_int(value: DecimalLike, decimals: int, field_name: str) -> int:
+    scaled = as_decimal(value).scaleb(decimals)
+    result = int(scaled)
+
+    # Raise: storing $value would lose precision
+    if scaled != result:
+        raise ValueError(f"Cannot store ${field_name} ({value}) in `BarSeries` because it has more than {decimals} decimals; increase the series precision")
+
+    # Raise: value must fit the int64 column (checked before any column is appended, so columns stay aligned)
+    if not -_MAX_SCALED_INT <= result <= _MAX_SCALED_INT:
+        raise ValueError(f"Cannot store ${field_name} ({value}) in `BarSeries` because it does not fit an int64 column with {decimals} decimals; reduce the series precision")
+
+    return result
+
+
+def _from_scaled_int(value: int, decimals: int) -> Decimal:
+    return Decimal(value).scaleb(-decimals)
+
+
+# endregion
@@ -0,0 +1,248 @@
+from __future__ import annotations
+
+from bisect import bisect_left, insort
+from collections.abc import Iterable
+from datetime import datetime
+from decimal import Decimal
+
+from suite_trading.domain.instrument import Instrument
+from suite_trading.domain.market_data.order_book.order_book import BookLevel, OrderBook
+from suite_trading.domain.market_data.order_book.order_book_delta import BookDelta, BookDeltaAction, BookSide
+from suite_trading.utils.datetime_tools import expect_utc, format_dt
+
+
+class IncrementalOrderBook:
+    """Mutable limit order book for one Instrument, maintained from `BookDelta` changes.
+
+    Each side is kept as a price-sorted ladder (sorted price list + price-indexed levels). A
+    MODIFY is an O(1) dict update and best-price lookups are O(1); an ADD or DELETE locates the
+    price by binary search in O(log L) but shifts the price list, so it costs O(L) (a single
+    memmove, cheap for the shallow ladders this book is meant for).
+
+    Matching code never sees this mutable object directly: call `get_snapshot` to obtain a
+    read-only `OrderBook`. The snapshot is built lazily, reuses the stored `BookLevel` objects and
+    is cached until the next change, so callers that do not need a snapshot for a given update
+    pay nothing for it.
+
+    Args:
+        instrument: Instrument this book belongs to.
+        timestamp: Initial timestamp (timezone-aware UTC).
+    """
+
+    __slots__ = ("_instrument", "_timestamp", "_bid_ladder", "_ask_ladder", "_cached_snapshot")
+
+    # region Init
+
+    def __init__(self, instrument: Instrument, timestamp: datetime) -> None:
+        self._instrument = instrument
+        self._timestamp = expect_utc(timestamp)
+        self._bid_ladder = _Ladder(is_descending=True)
+        self._ask_ladder = _Ladder(is_descending=False)
+        self._cached_snapshot: OrderBook | None = None
+
+    @classmethod
+    def from_order_book(cls, order_book: OrderBook) -> IncrementalOrderBook:
+        """Create an incremental book initialized with all levels of $order_book."""
+        result = cls(order_book.instrument, order_book.timestamp)
+        result.reset(order_book)
+        return result
+
+    # endregion
+
+    # region Main
+
+    def apply_deltas(self, deltas: Iterable[BookDelta], timestamp: datetime) -> None:
+        """Apply $deltas in order and move the book to $timestamp.
+
+        The whole batch is validated before anything changes, so a rejected batch leaves the book
+        (levels and timestamp) exactly as it was.
+
+        Args:
+            deltas: Price-level changes to apply.
+            timestamp: Source time of the changes (timezone-aware UTC).
+
+        Raises:
+            ValueError: If $timestamp is older than the current book timestamp or a delta is
+                inconsistent with the book (ADD of an existing level, MODIFY/DELETE of a missing
+                level, negative volume).
+        """
+        # Raise: book time must not move backwards
+        if expect_utc(timestamp) < self._timestamp:
+            raise ValueError(f"Cannot call `IncrementalOrderBook.apply_deltas` because $timestamp ({format_dt(timestamp)}) is older than book timestamp ({format_dt(self._timestamp)})")
+
+        deltas = list(deltas)
+        self._validate_deltas(deltas)
+
+        self._timestamp = timestamp
+        self._cached_snapshot = None
+
+        for delta in deltas:
+            ladder = self._bid_ladder if delta.side is BookSide.BID else self._ask_ladder
+            action = delta.action
+
+            if action is BookDeltaAction.DELETE:
+                ladder.remove_level(delta.price)
+            elif action is BookDeltaAction.ADD:
+                ladder.add_level(BookLevel(delta.price, delta.volume))
+            elif delta.volume == 0:
+                ladder.remove_level(delta.price)
+            else:
+                ladder.replace_level(BookLevel(delta.price, delta.volume))
+
+    def reset(self, order_book: OrderBook | None = None) -> None:
+        """Clear all levels, or replace them with the levels of $order_book when provided."""
+        self._bid_ladder.clear()
+        self._ask_ladder.clear()
+        self._cached_snapshot = None
+
+        # Skip: only clearing was requested
+        if order_book is None:
+            return
+
+        self._timestamp = order_book.timestamp
+        for level in order_book.bids:
+            self._bid_ladder.add_level(level)
+        for level in order_book.asks:
+            self._ask_ladder.add_level(level)
+
+    def get_snapshot(self) -> OrderBook:
+        """Return a read-only `OrderBook` snapshot of the current state (cached until next change)."""
+        if self._cached_snapshot is None:
+            self._cached_snapshot = OrderBook(self._instrument, self._timestamp, self._bid_ladder.list_levels(), self._ask_ladder.list_levels())
+        return self._cached_snapshot
+
+    # endregion
+
+    # region Properties
+
+    @property
+    def instrument(self) -> Instrument:
+        return self._instrument
+
+    @property
+    def timestamp(self) -> datetime:
+        return self._timestamp
+
+    @property
+    def best_bid(self) -> BookLevel | None:
+        return self._bid_ladder.best_level
+
+    @property
+    def best_ask(self) -> BookLevel | None:
+        return self._ask_ladder.best_level
+
+    @property
+    def bid_depth(self) -> int:
+        return len(self._bid_ladder)
+
+    @property
+    def ask_depth(self) -> int:
+        return len(self._ask_ladder)
+
+    # endregion
+
+    # region Utilities
+
+    def _validate_deltas(self, deltas: list[BookDelta]) -> None:
+        """Raise if any of $deltas, applied in order, is inconsistent with the book."""
+        # Level presence after the deltas seen so far, for levels touched by this batch
+        has_level_by_key: dict[tuple[BookSide, Decimal], bool] = {}
+
+        for delta in deltas:
+            key = (delta.side, delta.price)
+            has_level = has_level_by_key.get(key)
+            if has_level is None:
+                ladder = self._bid_ladder if delta.side is BookSide.BID else self._ask_ladder
+                has_level = ladder.has_level(delta.price)
+
+            action = delta.action
+            if action is BookDeltaAction.ADD:
+                # Raise: ADD must not overwrite an existing level
+                if has_level:
+                    raise ValueError(f"Cannot call `IncrementalOrderBook.apply_deltas` because ADD targets existing {delta.side.value} level at price {delta.price}; use MODIFY instead")
+            # Raise: MODIFY and DELETE require an existing level
+            elif not has_level:
+                raise ValueError(f"Cannot call `IncrementalOrderBook.apply_deltas` because {action.value} targets missing {delta.side.value} level at price {delta.price}")
+
+            # Raise: resting volume cannot be negative
+            if action is not BookDeltaAction.DELETE and delta.volume < 0:
+                raise ValueError(f"Cannot call `IncrementalOrderBook.apply_deltas` because $delta.volume ({delta.volume}) is negative for {delta.side.value} level at price {delta.price}")
+
+            has_level_by_key[key] = action is BookDeltaAction.ADD or (action is BookDeltaAction.MODIFY and delta.volume != 0)
+
+    # endregion
+
+    # region Magic
+
+    def __str__(self) -> str:
+        best_bid_price = self.best_bid.price if self.best_bid else None
+        best_ask_price = self.best_ask.price if self.best_ask else None
+        return f"{self.__class__.__name__}(instrument={self._instrument}, best_bid={best_bid_price}, best_ask={best_ask_price}, depth={self.bid_depth}/{self.ask_depth}, timestamp={format_dt(self._timestamp)})"
+
+    def __repr__(self) -> str:
+        return self.__str__()
+
+    # endregion
+
+
+class _Ladder:
+    """One side of an `IncrementalOrderBook`: ascending price list plus price-indexed levels."""
+
+    __slots__ = ("_is_descending", "_sorted_prices", "_level_by_price", "_cached_levels")
+
+    def __init__(self, *, is_descending: bool) -> None:
+        self._is_descending = is_descending
+        self._sorted_prices: list[Decimal] = []  # Always ascending; bids are read from the end
+        self._level_by_price: dict[Decimal, BookLevel] = {}
+        self._cached_levels: tuple[BookLevel, ...] | None = None
+
+    def add_level(self, level: BookLevel) -> None:
+        # Raise: ADD must not overwrite an existing level
+        if level.price in self._level_by_price:
+            raise ValueError(f"Cannot call `_Ladder.add_level` because a level at price {level.price} already exists; use MODIFY instead")
+
+        insort(self._sorted_prices, level.price)
+        self._level_by_price[level.price] = level
+        self._cached_levels = None
+
+    def replace_level(self, level: BookLevel) -> None:
+        # Raise: MODIFY requires an existing level
+        if level.price not in self._level_by_price:
+            raise ValueError(f"Cannot call `_Ladder.replace_level` because no level exists at price {level.price}; use ADD instead")
+
+        self._level_by_price[level.price] = level
+        self._cached_levels = None
+
+    def remove_level(self, price: Decimal) -> None:
+        # Raise: DELETE requires an existing level
+        if self._level_by_price.pop(price, None) is None:
+            raise ValueError(f"Cannot call `_Ladder.remove_level` because no level exists at price {price}")
+
+        del self._sorted_prices[bisect_left(self._sorted_prices, price)]
+        self._cached_levels = None
+
+    def has_level(self, price: Decimal) -> bool:
+        return price in self._level_by_price
+
+    def clear(self) -> None:
+        self._sorted_prices.clear()
+        self._level_by_price.clear()
+        self._cached_levels = None
+
+    def list_levels(self) -> tuple[BookLevel, ...]:
+        """Return levels best-first (cached until the ladder changes)."""
+        if self._cached_levels is None:
+            prices = reversed(self._sorted_prices) if self._is_descending else self._sorted_prices
+            level_by_price = self._level_by_price
+            self._cached_levels = tuple(level_by_price[price] for price in prices)
+        return self._cached_levels
+
+    @property
+    def best_level(self) -> BookLevel | None:
+        if not self._sorted_prices:
+            return None
+        best_price = self._sorted_prices[-1] if self._is_descending else self._sorted_prices[0]
+        return self._level_by_price[best_price]
+
+    def __len__(self) -> int:
+        return len(self._sorted_prices)
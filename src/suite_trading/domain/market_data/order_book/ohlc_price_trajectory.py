@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+from suite_trading.domain.instrument import Instrument
+from suite_trading.domain.market_data.bar.bar import Bar
+from suite_trading.domain.market_data.order_book.order_book import BookLevel, OrderBook
+
+# Cache of (high offset, low offset) from bar start, per bar duration (bars of one run share few durations)
+_ohlc_offsets_by_duration: dict[timedelta, tuple[timedelta, timedelta]] = {}
+
+
+def compute_ohlc_timestamps(start_dt: datetime, end_dt: datetime) -> tuple[datetime, datetime, datetime, datetime]:
+    """Return the (open, high, low, close) timestamps of a bar spanning [$start_dt, $end_dt].
+
+    Open is at $start_dt, high at 1/3 and low at 2/3 of the duration, close at $end_dt. The two
+    offsets are computed once per bar duration and reused.
+    """
+    duration = end_dt - start_dt
+    offsets = _ohlc_offsets_by_duration.get(duration)
+    if offsets is None:
+        offsets = _ohlc_offsets_by_duration[duration] = (duration / 3, 2 * duration / 3)
+
+    result = (start_dt, start_dt + offsets[0], start_dt + offsets[1], end_dt)
+    return result
+
+
+class OhlcPriceTrajectory:
+    """Zero-spread price path of one Bar, e.g. open → high → low → close at evenly spaced timestamps.
+
+    A trajectory is the compact form of the OrderBooks a Bar decomposes into: one Instrument,
+    one volume and a sequence of (timestamp, price) points. `from_bar` gives the same 4 points
+    as `bar_to_order_books`; intrabar path models can produce other or longer paths. Simulated
+    brokers can match against a point by its price alone and ask for the full OrderBook of a
+    point (built once and cached) only when they need it.
+
+    For `from_bar`, `get_order_book(index)` returns an OrderBook equal to the one at the same
+    position in the 4-book decomposition, so matching through a trajectory gives identical results.
+    """
+
+    __slots__ = ("_instrument", "_timestamps", "_prices", "_volume", "_order_books")
+
+    # region Init
+
+    def __init__(
+        self,
+        instrument: Instrument,
+        timestamps: tuple[datetime, ...],
+        prices: tuple[Decimal, ...],
+        volume: Decimal,
+    ) -> None:
+        """Create a price trajectory.
+
+        Args:
+            instrument: Instrument of all points.
+            timestamps: Point timestamps, ascending (timezone-aware UTC).
+            prices: Point prices; bid and ask of each point.
+            volume: Volume available at every point (on both sides).
+
+        Raises:
+            ValueError: If $timestamps and $prices differ in length or $timestamps are not ascending.
+        """
+        # Raise: each point needs exactly one timestamp and one price
+        if len(timestamps) != len(prices):
+            raise ValueError(f"Cannot create `OhlcPriceTrajectory` because $timestamps ({len(timestamps)}) and $prices ({len(prices)}) differ in length")
+        # Raise: points must be in time order
+        if any(later < earlier for earlier, later in zip(timestamps, timestamps[1:])):
+            raise ValueError(f"Cannot create `OhlcPriceTrajectory` because $timestamps are not ascending ({timestamps})")
+
+        self._instrument = instrument
+        self._timestamps = timestamps
+        self._prices = prices
+        self._volume = volume
+        self._order_books: list[OrderBook | None] = [None] * len(prices)
+
+    @classmethod
+    def from_bar(cls, bar: Bar) -> OhlcPriceTrajectory:
+        """Create the open → high → low → close trajectory of $bar (missing volume counts as 0)."""
+        volume = bar.volume if bar.volume is not None else Decimal("0")
+        result = cls(bar.instrument, compute_ohlc_timestamps(bar.start_dt, bar.end_dt), (bar.open, bar.high, bar.low, bar.close), volume)
+        return result
+
+    # endregion
+
+    # region Main
+
+    def get_order_book(self, index: int) -> OrderBook:
+        """Return the zero-spread OrderBook of point $index (built on first use, then cached)."""
+        result = self._order_books[index]
+        if result is None:
+            # One shared levels tuple for both sides (OrderBook keeps tuples as they are)
+            levels = (BookLevel(self._prices[index], self._volume),)
+            result = self._order_books[index] = OrderBook(self._instrument, self._timestamps[index], levels, levels)
+        return result
+
+    def list_order_books(self) -> list[OrderBook]:
+        """Return OrderBooks of all points, in time order."""
+        result = [self.get_order_book(index) for index in range(len(self._prices))]
+        return result
+
+    # endregion
+
+    # region Properties
+
+    @property
+    def instrument(self) -> Instrument:
+        return self._instrument
+
+    @property
+    def timestamps(self) -> tuple[datetime, ...]:
+        return self._timestamps
+
+    @property
+    def prices(self) -> tuple[Decimal, ...]:
+        return self._prices
+
+    @property
+    def volume(self) -> Decimal:
+        return self._volume
+
+    # endregion
+
+    # region Magic
+
+    def __len__(self) -> int:
+        return len(self._prices)
+
+    def __str__(self) -> str:
+        return f"{self.__class__.__name__}(instrument={self._instrument}, prices={list(self._prices)}, volume={self._volume})"
+
+    def __repr__(self) -> str:
+        return self.__str__()
+
+    # endregion
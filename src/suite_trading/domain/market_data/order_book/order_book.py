@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+from bisect import bisect_left, bisect_right
 from datetime import datetime
 from decimal import Decimal
+from itertools import accumulate
 from typing import NamedTuple, Sequence
 
 from suite_trading.domain.instrument import Instrument
@@ -48,6 +50,21 @@ class ProposedFill(NamedTuple):
         return abs(self.signed_qty)
 
 
+class DepthIndex(NamedTuple):
+    """Prefix sums over one side of an `OrderBook`, used for O(log L) depth queries.
+
+    Attributes:
+        sort_keys: Ascending keys for bisect, one per level: price for asks, -price for bids.
+        cum_volumes: Cumulative volume; `cum_volumes[i]` is the total volume of the first $i levels
+            (length L + 1, starts with 0).
+        cum_notionals: Cumulative price * volume with the same layout as $cum_volumes.
+    """
+
+    sort_keys: list[Decimal]
+    cum_volumes: list[Decimal]
+    cum_notionals: list[Decimal]
+
+
 class OrderBook:
     """Read-only snapshot of the limit order book for one Instrument.
 
@@ -77,11 +94,16 @@ class OrderBook:
         spread_in_ticks: Spread in tick units (price_increment), or None if one side is missing.
         is_empty: True if both sides are empty.
 
+    Depth queries:
+        Cumulative volume/notional per side (`DepthIndex`) are computed lazily on first use and
+        cached, so `simulate_fills`, `compute_fillable_qty`, `compute_vwap_for_qty` and
+        `get_price_at_depth` locate their levels by bisect instead of walking the ladder.
+
     Raises:
         ValueError: When $VALIDATE is True and inputs fail validation.
     """
 
-    __slots__ = ("_instrument", "_timestamp", "_bids", "_asks")
+    __slots__ = ("_instrument", "_timestamp", "_bids", "_asks", "_bid_depth_index", "_ask_depth_index")
 
     # Enable or disable validation for all instances of OrderBook.
     # Disabled by default because a full validation pass over all book levels is relatively expensive.
@@ -104,6 +126,10 @@ class OrderBook:
         self._bids: tuple[BookLevel, ...] = tuple(bids)
         self._asks: tuple[BookLevel, ...] = tuple(asks)
 
+        # Lazily built prefix sums (see `_get_depth_index`)
+        self._bid_depth_index: DepthIndex | None = None
+        self._ask_depth_index: DepthIndex | None = None
+
         # Optionally validate inputs (disabled by default for speed).
         if self.__class__.VALIDATE:
             self._validate()
@@ -158,39 +184,96 @@ class OrderBook:
         if not order_book_levels or target_signed_qty == 0:
             return []
 
-        def is_price_level_within_limits(price_level: BookLevel) -> bool:
-            if min_price is not None and price_level.price < min_price:
-                return False
-            if max_price is not None and price_level.price > max_price:
-                return False
-            return True
+        # Locate eligible levels [first, stop) and the level where the target quantity is reached
+        depth_index = self._get_depth_index(is_buy)
+        first, stop = self._find_level_range_within_price_band(depth_index, is_buy, min_price, max_price)
+        cum_volumes = depth_index.cum_volumes
+        target_cum_volume = cum_volumes[first] + abs(target_signed_qty)
+        last = bisect_left(cum_volumes, target_cum_volume, first + 1, stop + 1) - 1  # == $stop if band depth is insufficient
 
         # Initialize state for matching
         side_sign = Decimal("1") if is_buy else Decimal("-1")
-        remaining_signed_qty = target_signed_qty
         result: list[ProposedFill] = []
 
-        # Iterate over prices order-book prices from best to worst
-        for price_level in order_book_levels:
-            # Stop once we have filled the full $target_signed_qty
-            if remaining_signed_qty == 0:
-                break
-
-            if not is_price_level_within_limits(price_level):
-                continue
-
-            # Take as much as possible at this price level
-            fill_abs_qty = min(price_level.volume, abs(remaining_signed_qty))
+        # Take whole levels before $last, then the remainder at $last
+        for i in range(first, min(last + 1, stop)):
+            price_level = order_book_levels[i]
+            fill_abs_qty = price_level.volume if i < last else target_cum_volume - cum_volumes[i]
             if fill_abs_qty > 0:
-                # Add proposed fill for this price level (signed based on side)
-                fill_signed_qty = fill_abs_qty * side_sign
-                proposed_fill = ProposedFill(signed_qty=fill_signed_qty, price=price_level.price, timestamp=self._timestamp)
+                proposed_fill = ProposedFill(signed_qty=fill_abs_qty * side_sign, price=price_level.price, timestamp=self._timestamp)
                 result.append(proposed_fill)
-                # Reduce remaining signed quantity by the filled amount
-                remaining_signed_qty -= fill_signed_qty
 
         return result
 
+    def compute_fillable_qty(
+        self,
+        is_buy: bool,
+        *,
+        min_price: Decimal | None = None,
+        max_price: Decimal | None = None,
+    ) -> Decimal:
+        """Return total visible volume a buy ($is_buy) or sell could take within [$min_price, $max_price].
+
+        Args:
+            is_buy: True to query asks (liquidity for buyers), False to query bids.
+            min_price: Optional inclusive lower price bound.
+            max_price: Optional inclusive upper price bound.
+
+        Returns:
+            Decimal: Sum of level volumes inside the price band (0 if none).
+        """
+        depth_index = self._get_depth_index(is_buy)
+        first, stop = self._find_level_range_within_price_band(depth_index, is_buy, min_price, max_price)
+        result = depth_index.cum_volumes[stop] - depth_index.cum_volumes[first]
+        return result
+
+    def compute_vwap_for_qty(self, target_signed_qty: Decimal) -> Decimal | None:
+        """Return the volume-weighted average price for taking $target_signed_qty best-first.
+
+        Args:
+            target_signed_qty: Positive to buy from asks, negative to sell into bids.
+
+        Returns:
+            Decimal | None: VWAP, or None if $target_signed_qty is 0 or visible depth is insufficient.
+        """
+        # Skip: nothing to price
+        if target_signed_qty == 0:
+            return None
+
+        is_buy = target_signed_qty > 0
+        levels = self._asks if is_buy else self._bids
+        depth_index = self._get_depth_index(is_buy)
+        cum_volumes = depth_index.cum_volumes
+        abs_qty = abs(target_signed_qty)
+
+        # Skip: not enough visible depth
+        if cum_volumes[-1] < abs_qty:
+            return None
+
+        # Level $k is the first level where cumulative volume reaches $abs_qty
+        k = bisect_left(cum_volumes, abs_qty) - 1
+        notional = depth_index.cum_notionals[k] + (abs_qty - cum_volumes[k]) * levels[k].price
+        result = notional / abs_qty
+        return result
+
+    def get_price_at_depth(self, is_buy: bool, abs_qty: Decimal) -> Decimal | None:
+        """Return the worst price touched when taking $abs_qty best-first from asks ($is_buy) or bids.
+
+        Returns:
+            Decimal | None: Price of the level where cumulative volume reaches $abs_qty, or None if
+            visible depth is insufficient.
+        """
+        levels = self._asks if is_buy else self._bids
+        cum_volumes = self._get_depth_index(is_buy).cum_volumes
+
+        # Skip: not enough visible depth
+        if cum_volumes[-1] < abs_qty or not levels:
+            return None
+
+        k = max(bisect_left(cum_volumes, abs_qty) - 1, 0)
+        result = levels[k].price
+        return result
+
     # endregion
 
     # region Properties
@@ -249,6 +332,36 @@ class OrderBook:
 
     # region Utilities
 
+    def _get_depth_index(self, is_buy: bool) -> DepthIndex:
+        """Return cached prefix sums for asks ($is_buy) or bids, building them on first use."""
+        if is_buy:
+            if self._ask_depth_index is None:
+                self._ask_depth_index = _build_depth_index(self._asks, is_descending=False)
+            return self._ask_depth_index
+
+        if self._bid_depth_index is None:
+            self._bid_depth_index = _build_depth_index(self._bids, is_descending=True)
+        return self._bid_depth_index
+
+    @staticmethod
+    def _find_level_range_within_price_band(
+        depth_index: DepthIndex,
+        is_buy: bool,
+        min_price: Decimal | None,
+        max_price: Decimal | None,
+    ) -> tuple[int, int]:
+        """Return index range [first, stop) of best-first levels with price inside [$min_price, $max_price]."""
+        sort_keys = depth_index.sort_keys
+        if is_buy:
+            first = 0 if min_price is None else bisect_left(sort_keys, min_price)
+            stop = len(sort_keys) if max_price is None else bisect_right(sort_keys, max_price)
+        else:
+            first = 0 if max_price is None else bisect_left(sort_keys, -max_price)
+            stop = len(sort_keys) if min_price is None else bisect_right(sort_keys, -min_price)
+
+        result = (first, max(first, stop))
+        return result
+
     def _validate(self) -> None:
         """Validate $bids and $asks shape, types, finiteness, non-negative volume, and ordering.
 
@@ -323,3 +436,18 @@ class OrderBook:
         return f"{self.__class__.__name__}(instrument={self.instrument}, best_bid={best_bid_price}, best_ask={best_ask_price}, timestamp={format_dt(self.timestamp)})"
 
     # endregion
+
+
+# region Utilities
+
+
+def _build_depth_index(levels: tuple[BookLevel, ...], *, is_descending: bool) -> DepthIndex:
+    zero = Decimal("0")
+    sort_keys = [-level.price for level in levels] if is_descending else [level.price for level in levels]
+    cum_volumes = list(accumulate((level.volume for level in levels), initial=zero))
+    cum_notionals = list(accumulate((level.price * level.volume for level in levels), initial=zero))
+    result = DepthIndex(sort_keys=sort_keys, cum_volumes=cum_volumes, cum_notionals=cum_notionals)
+    return result
+
+
+# endregion
@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+from decimal import Decimal
+from enum import Enum
+from typing import NamedTuple
+
+
+class BookSide(Enum):
+    """Side of the order book a `BookDelta` applies to."""
+
+    BID = "BID"
+    ASK = "ASK"
+
+
+class BookDeltaAction(Enum):
+    """How a `BookDelta` changes one price level.
+
+    Actions:
+        ADD: Insert a new price level; the level must not exist yet.
+        MODIFY: Replace the volume of an existing price level (volume 0 removes the level).
+        DELETE: Remove an existing price level; $volume is ignored.
+    """
+
+    ADD = "ADD"
+    MODIFY = "MODIFY"
+    DELETE = "DELETE"
+
+
+class BookDelta(NamedTuple):
+    """Single price-level change of an order book.
+
+    Attributes:
+        side: Book side the change applies to.
+        action: Kind of change (ADD, MODIFY, DELETE).
+        price: Price of the affected level (can be negative in some markets).
+        volume: New total resting volume at $price; ignored for DELETE.
+    """
+
+    side: BookSide
+    action: BookDeltaAction
+    price: Decimal
+    volume: Decimal = Decimal("0")
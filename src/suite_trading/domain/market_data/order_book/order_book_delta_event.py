@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+from datetime import datetime
+
+from suite_trading.domain.event import Event
+from suite_trading.domain.instrument import Instrument
+from suite_trading.domain.market_data.order_book.order_book_delta import BookDelta
+from suite_trading.utils.datetime_tools import format_dt
+
+
+class OrderBookDeltaEvent(Event):
+    """Event carrying incremental price-level changes for one Instrument's order book.
+
+    Unlike `OrderBookEvent`, which always carries a full snapshot, this event carries only the
+    levels that changed. Consumers keep an `IncrementalOrderBook` and apply $deltas in order.
+
+    Attributes:
+        instrument: Instrument whose order book changed.
+        timestamp: When the changes happened at the source (timezone-aware UTC); used as $dt_event.
+        deltas: Price-level changes, applied in the given order.
+        dt_received: When the event entered our system (timezone-aware UTC).
+        is_historical: Whether these changes are historical or live.
+    """
+
+    __slots__ = ("_instrument", "_deltas", "_is_historical")
+
+    # region Init
+
+    def __init__(
+        self,
+        instrument: Instrument,
+        timestamp: datetime,
+        deltas: Sequence[BookDelta],
+        dt_received: datetime,
+        is_historical: bool,
+    ) -> None:
+        """Initialize a new order book delta event.
+
+        Args:
+            instrument: Instrument whose order book changed.
+            timestamp: When the changes happened at the source (timezone-aware UTC).
+            deltas: Price-level changes, applied in the given order.
+            dt_received: When the event entered our system (timezone-aware UTC).
+            is_historical: Whether these changes are historical or live.
+        """
+        super().__init__(dt_event=timestamp, dt_received=dt_received)
+        self._instrument = instrument
+        self._deltas: tuple[BookDelta, ...] = tuple(deltas)
+        self._is_historical = is_historical
+
+    # endregion
+
+    # region Properties
+
+    @property
+    def instrument(self) -> Instrument:
+        return self._instrument
+
+    @property
+    def timestamp(self) -> datetime:
+        return self._dt_event
+
+    @property
+    def deltas(self) -> tuple[BookDelta, ...]:
+        return self._deltas
+
+    @property
+    def is_historical(self) -> bool:
+        return self._is_historical
+
+    # endregion
+
+    # region Magic
+
+    def __str__(self) -> str:
+        return f"{self.__class__.__name__}(instrument={self.instrument}, deltas={len(self.deltas)}, timestamp={format_dt(self.timestamp)}, dt_received={format_dt(self.dt_received)}, is_historical={self.is_historical})"
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(instrument={self.instrument!r}, deltas={self.deltas!r}, timestamp={format_dt(self.timestamp)}, dt_received={format_dt(self.dt_received)}, is_historical={self.is_historical})"
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, OrderBookDeltaEvent):
+            return False
+        return self.instrument == other.instrument and self.timestamp == other.timestamp and self.deltas == other.deltas and self.dt_received == other.dt_received and self.is_historical == other.is_historical
+
+    # endregion
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from enum import Enum
 from typing import Final
-from suite_trading.utils.state_machine import State, Action, StateMachine
+from suite_trading.utils.state_machine import State, Action, StateMachine, TransitionTable
 
 
 class OrderState(State):
@@ -74,16 +74,8 @@ class OrderAction(Action):
     COMMUNICATION_FAILURE = "COMMUNICATION_FAILURE"  # Lost connection or received conflicting status
 
 
-def create_order_state_machine(initial_state: OrderState) -> StateMachine[OrderState, OrderAction]:
-    """Create a state machine for order lifecycle management.
-
-    Args:
-        initial_state: Starting `OrderState` for the state machine.
-
-    Returns:
-        StateMachine[OrderState, OrderAction]: A configured state machine for managing order states.
-    """
-    transitions = {
+_ORDER_TRANSITION_TABLE: Final[TransitionTable[OrderState, OrderAction]] = TransitionTable(
+    {
         # Initial submission of order
         (OrderState.INITIALIZED, OrderAction.DENY): OrderState.DENIED,
         (OrderState.INITIALIZED, OrderAction.SUBMIT): OrderState.PENDING_SUBMIT,
@@ -139,9 +131,20 @@ def create_order_state_machine(initial_state: OrderState) -> StateMachine[OrderS
         # Real-world late fill race handling
         (OrderState.CANCELLED, OrderAction.PARTIAL_FILL): OrderState.PARTIALLY_FILLED,
         (OrderState.CANCELLED, OrderAction.FILL): OrderState.FILLED,
-    }
+    },
+)
+
 
-    return StateMachine(initial_state, transitions)
+def create_order_state_machine(initial_state: OrderState) -> StateMachine[OrderState, OrderAction]:
+    """Create a state machine for order lifecycle management.
+
+    Args:
+        initial_state: Starting `OrderState` for the state machine.
+
+    Returns:
+        StateMachine[OrderState, OrderAction]: A configured state machine for managing order states.
+    """
+    return StateMachine(initial_state, _ORDER_TRANSITION_TABLE)
 
 
 class OrderStateCategory(Enum):
@@ -3,6 +3,7 @@ from datetime import datetime
 from decimal import Decimal
 
 from suite_trading.domain.instrument import Instrument
+from suite_trading.domain.monetary.currency import Currency
 from suite_trading.domain.monetary.money import Money
 from suite_trading.domain.order.order_fill import OrderFill
 from suite_trading.domain.order.order_enums import OrderSide, TimeInForce
@@ -75,6 +76,13 @@ class Order:
 
         # Fill tracking (single source of truth)
         self._fills: list[OrderFill] = []  # Chronological by append order
+        self._cached_fills: tuple[OrderFill, ...] | None = ()  # Immutable copy for `list_fills`; None after a new fill
+
+        # Running fill aggregates (updated in `add_fill`, so derived properties are O(1))
+        self._abs_filled_qty: Decimal = Decimal("0")
+        self._signed_filled_qty: Decimal = Decimal("0")
+        self._abs_filled_notional: Decimal = Decimal("0")  # sum of price * abs_qty; contract size not applied
+        self._commission_by_currency: dict[Currency, Money] = {}
 
         # Internal state — created exactly once based on subclass-declared INITIAL_STATE
         self._state_machine: StateMachine[OrderState, OrderAction] = create_order_state_machine(initial_state=self.__class__.INITIAL_STATE)
@@ -153,10 +161,7 @@ class Order:
         This value is always positive and represents the magnitude of fills
         regardless of whether it is a buy or sell order.
         """
-        total = Decimal("0")
-        for e in self._fills:
-            total += e.abs_quantity
-        return total
+        return self._abs_filled_qty
 
     @property
     def signed_filled_quantity(self) -> Decimal:
@@ -164,10 +169,7 @@ class Order:
 
         Returns a positive value for buy fills and a negative value for sell fills.
         """
-        total = Decimal("0")
-        for e in self._fills:
-            total += e.signed_quantity
-        return total
+        return self._signed_filled_qty
 
     @property
     def abs_unfilled_quantity(self) -> Decimal:
@@ -193,7 +195,7 @@ class Order:
         Returns:
             bool: True if $abs_filled_quantity is 0.
         """
-        return self.abs_filled_quantity == Decimal("0")
+        return self._abs_filled_qty == Decimal("0")
 
     @property
     def is_partially_filled(self) -> bool:
@@ -202,7 +204,7 @@ class Order:
         Returns:
             bool: True if 0 < $abs_filled_quantity < $abs_qty.
         """
-        return Decimal("0") < self.abs_filled_quantity < self.abs_quantity
+        return Decimal("0") < self._abs_filled_qty < self.abs_quantity
 
     @property
     def is_fully_filled(self) -> bool:
@@ -211,7 +213,7 @@ class Order:
         Returns:
             bool: True if $abs_filled_quantity == $abs_qty.
         """
-        return self.abs_filled_quantity == self.abs_quantity
+        return self._abs_filled_qty == self.abs_quantity
 
     @property
     def average_fill_price(self) -> Decimal | None:
@@ -224,17 +226,22 @@ class Order:
         Returns:
             Decimal | None: VWAP of fills, or None.
         """
-        filled = self.abs_filled_quantity
+        filled = self._abs_filled_qty
         if filled == 0:
             return None
 
-        notional = Decimal("0")
-        for e in self._fills:
-            notional += e.price * e.abs_quantity
-
-        avg_price = notional / filled
+        avg_price = self._abs_filled_notional / filled
         return avg_price
 
+    @property
+    def total_commissions(self) -> tuple[Money, ...]:
+        """Total commission paid across all fills, one `Money` per currency (empty if unfilled).
+
+        Returns:
+            tuple[Money, ...]: Commission totals in order of first appearance of each currency.
+        """
+        return tuple(self._commission_by_currency.values())
+
     @property
     def time_in_force(self) -> TimeInForce:
         """Get how long the order remains active.
@@ -303,7 +310,7 @@ class Order:
         Ordering:
             - The fill object is constructed and validated first.
             - The order state transition is applied next.
-            - The fill is appended to `$self._fills` last.
+            - The fill is appended to `$self._fills` and running fill aggregates are updated last.
 
         This ordering ensures that if the state transition fails, no fill is recorded.
 
@@ -335,22 +342,34 @@ class Order:
         order_fill = OrderFill(order=self, signed_qty=signed_qty, price=price, timestamp=timestamp, commission=commission, id=child_id)
 
         # Update state of the order (partial or full fill)
-        new_filled_quantity = self.abs_filled_quantity + order_fill.abs_quantity
+        fill_abs_qty = order_fill.abs_quantity
+        new_filled_quantity = self._abs_filled_qty + fill_abs_qty
         action = OrderAction.FILL if new_filled_quantity == self.abs_quantity else OrderAction.PARTIAL_FILL
         self.change_state(action)
 
-        # Store fill
+        # Store fill and update running aggregates
         self._fills.append(order_fill)
+        self._cached_fills = None
+        self._abs_filled_qty = new_filled_quantity
+        self._signed_filled_qty += order_fill.signed_quantity
+        self._abs_filled_notional += order_fill.price * fill_abs_qty
+        commission = order_fill.commission
+        previous_commission = self._commission_by_currency.get(commission.currency)
+        self._commission_by_currency[commission.currency] = commission if previous_commission is None else previous_commission + commission
 
         return order_fill
 
     def list_fills(self) -> tuple[OrderFill, ...]:
         """Return fills in chronological order as an immutable tuple.
 
+        The tuple is cached until the next fill, so repeated reads do not copy.
+
         Returns:
             tuple[OrderFill, ...]: Fills for this order.
         """
-        return tuple(self._fills)
+        if self._cached_fills is None:
+            self._cached_fills = tuple(self._fills)
+        return self._cached_fills
 
     def change_state(self, action: OrderAction) -> None:
         """Change order state based on action.
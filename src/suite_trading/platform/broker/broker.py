@@ -153,6 +153,52 @@ class Broker(Protocol):
         """
         ...
 
+    def submit_orders(self, orders: list[Order]) -> None:
+        """Submit all $orders, in list order.
+
+        The default implementation calls `submit_order` per order. Brokers that can validate or
+        send a batch at once should override it and validate all $orders before submitting any.
+
+        Args:
+            orders (list[Order]): The orders to submit.
+
+        Raises:
+            ConnectionError: If not connected to broker.
+            ValueError: If an order is invalid or cannot be submitted.
+        """
+        for order in orders:
+            self.submit_order(order)
+
+    def cancel_orders(self, orders: list[Order]) -> None:
+        """Cancel all $orders, in list order (see `cancel_order`).
+
+        The default implementation calls `cancel_order` per order.
+
+        Args:
+            orders (list[Order]): The orders to cancel.
+
+        Raises:
+            ConnectionError: If not connected to broker.
+            ValueError: If an order is not tracked by this broker.
+        """
+        for order in orders:
+            self.cancel_order(order)
+
+    def update_orders(self, orders: list[Order]) -> None:
+        """Update all $orders, in list order (see `update_order`).
+
+        The default implementation calls `update_order` per order.
+
+        Args:
+            orders (list[Order]): The orders carrying updated fields.
+
+        Raises:
+            ConnectionError: If not connected to broker.
+            ValueError: If an order is not tracked, terminal, or its immutable fields have changed.
+        """
+        for order in orders:
+            self.update_order(order)
+
     def list_active_orders(self) -> list[Order]:
         """List active (non-terminal) orders known to this Broker.
 
@@ -252,3 +298,24 @@ class Broker(Protocol):
         ...
 
     # endregion
+
+
+@runtime_checkable
+class OrderSubmissionValidator(Protocol):
+    """Brokers that can check a batch of orders for submission without submitting it (optional).
+
+    `TradingEngine.submit_orders` calls `validate_orders_for_submission` before it changes the
+    state of any order, so a batch the broker would reject leaves all its orders untouched.
+    """
+
+    def validate_orders_for_submission(self, orders: list[Order]) -> None:
+        """Raise if any of $orders cannot be submitted now; change nothing.
+
+        Args:
+            orders (list[Order]): The orders about to be submitted, still in their pre-submit state.
+
+        Raises:
+            ConnectionError: If not connected to broker.
+            ValueError: If an order is invalid or cannot be submitted.
+        """
+        ...
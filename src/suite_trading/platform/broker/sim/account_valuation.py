@@ -0,0 +1,195 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+import pandas as pd
+
+from suite_trading.domain.instrument import Instrument
+from suite_trading.domain.market_data.order_book.order_book import OrderBook
+from suite_trading.domain.monetary.currency import Currency
+from suite_trading.domain.order.order_fill import OrderFill
+from suite_trading.platform.broker.account import Account
+from suite_trading.platform.broker.trade_ledger import LedgerTable
+
+
+class _MarkedPosition:
+    """Open position of one instrument with its cash flow and latest mark price."""
+
+    __slots__ = ("signed_qty", "avg_price", "cash_flow", "mark_price", "contract_size", "currency")
+
+    def __init__(self, instrument: Instrument, mark_price: Decimal) -> None:
+        self.signed_qty = Decimal("0")
+        self.avg_price = Decimal("0")
+        self.cash_flow = Decimal("0")  # Sum of -signed_qty * price * contract_size over fills
+        self.mark_price = mark_price
+        self.contract_size = instrument.contract_size
+        self.currency = instrument.settlement_currency
+
+
+class AccountValuation:
+    """Marks open positions of one `SimBroker` account to market and samples its equity curve.
+
+    Each OrderBook only replaces the mark price of its instrument (O(1), nothing is recomputed),
+    and unrealized PnL of an instrument is derived on request from its mark price. Equity is
+    computed only when a sample is due, every $sample_interval of simulated time, and appended
+    to a preallocated column buffer together with unrealized PnL and drawdown.
+
+    Equity per currency = funds + blocked margins + PnL of all positions (realized + unrealized).
+    Marks use the mid price of the latest OrderBook (or its only side).
+    """
+
+    __slots__ = ("_sample_interval", "_next_sample_dt", "_position_by_instrument", "_realized_pnl_by_currency", "_peak_equity_by_currency", "_equity_samples")
+
+    # region Init
+
+    def __init__(self, *, sample_interval: timedelta) -> None:
+        """Create a valuation engine that samples equity every $sample_interval.
+
+        Args:
+            sample_interval: Minimum simulated time between two equity samples.
+
+        Raises:
+            ValueError: If $sample_interval is not positive.
+        """
+        # Raise: sampling must advance in time
+        if sample_interval <= timedelta(0):
+            raise ValueError(f"Cannot call `AccountValuation.__init__` because $sample_interval ({sample_interval}) is not positive")
+
+        self._sample_interval = sample_interval
+        self._next_sample_dt: datetime | None = None
+
+        # POSITIONS (open only) and PnL of closed positions
+        self._position_by_instrument: dict[Instrument, _MarkedPosition] = {}
+        self._realized_pnl_by_currency: dict[Currency, Decimal] = {}
+
+        # EQUITY CURVE
+        self._peak_equity_by_currency: dict[Currency, Decimal] = {}
+        self._equity_samples = LedgerTable({"timestamp": "datetime", "currency": "category", "equity": "float", "unrealized_pnl": "float", "drawdown": "float"})
+
+    # endregion
+
+    # region Main
+
+    def update_mark_price(self, order_book: OrderBook) -> None:
+        """Mark the open position in $order_book.instrument (if any) to $order_book."""
+        position = self._position_by_instrument.get(order_book.instrument)
+
+        # Skip: no open position to mark
+        if position is None:
+            return
+
+        mark_price = self._extract_mark_price(order_book)
+        if mark_price is not None:
+            position.mark_price = mark_price
+
+    def record_order_fill(self, order_fill: OrderFill, signed_qty_after: Decimal, avg_price_after: Decimal | None) -> None:
+        """Apply $order_fill to the marked position of its instrument.
+
+        Args:
+            order_fill: Fill just booked by the broker.
+            signed_qty_after: Net position of the instrument after the fill.
+            avg_price_after: Average entry price after the fill (None when flat).
+        """
+        instrument = order_fill.order.instrument
+        position = self._position_by_instrument.get(instrument)
+        if position is None:
+            position = self._position_by_instrument[instrument] = _MarkedPosition(instrument, mark_price=order_fill.price)
+
+        position.cash_flow -= order_fill.signed_quantity * order_fill.price * position.contract_size
+        position.signed_qty = signed_qty_after
+        position.avg_price = avg_price_after if avg_price_after is not None else Decimal("0")
+
+        # Fold the PnL of a closed position into realized PnL of its currency
+        if signed_qty_after == 0:
+            currency = position.currency
+            self._realized_pnl_by_currency[currency] = self._realized_pnl_by_currency.get(currency, Decimal("0")) + position.cash_flow
+            del self._position_by_instrument[instrument]
+
+    def sample_if_due(self, dt: datetime, account: Account) -> None:
+        """Append one equity sample per currency of $account if $sample_interval passed since the last one."""
+        # Skip: the next sample is not due yet
+        if self._next_sample_dt is not None and dt < self._next_sample_dt:
+            return
+
+        self._next_sample_dt = dt + self._sample_interval
+        for currency, equity in self.compute_equity_by_currency(account).items():
+            peak_equity = max(self._peak_equity_by_currency.get(currency, equity), equity)
+            self._peak_equity_by_currency[currency] = peak_equity
+            self._equity_samples.append(dt, currency.code, equity, self.compute_unrealized_pnl(currency), peak_equity - equity)
+
+    def compute_equity_by_currency(self, account: Account) -> dict[Currency, Decimal]:
+        """Return current equity of $account per currency (funds + blocked margins + PnL)."""
+        result = {currency: funds.value for currency, funds in account.get_all_funds().items()}
+        for blocked_margins in account.list_blocked_margins().values():
+            currency = blocked_margins.initial.currency
+            result[currency] = result.get(currency, Decimal("0")) + blocked_margins.initial.value + blocked_margins.maintenance.value
+        for currency, realized_pnl in self._realized_pnl_by_currency.items():
+            result[currency] = result.get(currency, Decimal("0")) + realized_pnl
+        for position in self._position_by_instrument.values():
+            position_pnl = position.cash_flow + position.signed_qty * position.mark_price * position.contract_size
+            result[position.currency] = result.get(position.currency, Decimal("0")) + position_pnl
+        return result
+
+    def get_unrealized_pnl(self, instrument: Instrument) -> Decimal:
+        """Return unrealized PnL of the open position in $instrument at its latest mark (0 if flat)."""
+        position = self._position_by_instrument.get(instrument)
+        if position is None:
+            return Decimal("0")
+
+        result = position.signed_qty * (position.mark_price - position.avg_price) * position.contract_size
+        return result
+
+    def compute_unrealized_pnl(self, currency: Currency) -> Decimal:
+        """Return unrealized PnL of all open positions settled in $currency."""
+        return sum((self.get_unrealized_pnl(instrument) for instrument, position in self._position_by_instrument.items() if position.currency == currency), Decimal("0"))
+
+    def has_open_position(self, instrument: Instrument) -> bool:
+        return instrument in self._position_by_instrument
+
+    def has_open_positions(self) -> bool:
+        return bool(self._position_by_instrument)
+
+    def equity_curve_to_dataframe(self) -> pd.DataFrame:
+        """Return sampled equity as a DataFrame (timestamp, currency, equity, unrealized_pnl, drawdown)."""
+        return self._equity_samples.to_dataframe()
+
+    # endregion
+
+    # region Properties
+
+    @property
+    def sample_interval(self) -> timedelta:
+        return self._sample_interval
+
+    @property
+    def sample_count(self) -> int:
+        return len(self._equity_samples)
+
+    # endregion
+
+    # region Utilities
+
+    @staticmethod
+    def _extract_mark_price(order_book: OrderBook) -> Decimal | None:
+        best_bid = order_book.best_bid
+        best_ask = order_book.best_ask
+        if best_bid is not None and best_ask is not None:
+            return (best_bid.price + best_ask.price) / 2
+        if best_bid is not None:
+            return best_bid.price
+        if best_ask is not None:
+            return best_ask.price
+        return None
+
+    # endregion
+
+    # region Magic
+
+    def __str__(self) -> str:
+        return f"{self.__class__.__name__}(sample_interval={self._sample_interval}, open_positions={len(self._position_by_instrument)}, samples={len(self._equity_samples)})"
+
+    def __repr__(self) -> str:
+        return self.__str__()
+
+    # endregion
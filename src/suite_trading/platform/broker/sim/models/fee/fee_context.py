@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+from datetime import datetime
+from decimal import Decimal
+
+from suite_trading.domain.instrument import Instrument
+from suite_trading.domain.order.order_fill import OrderFill
+from suite_trading.utils.notional import compute_notional_value
+
+_ZERO = Decimal("0")
+
+
+class FeeContext:
+    """Running fill totals of one account, passed to `IncrementalFeeModel.compute_commission_with_context`.
+
+    Keeps abs traded volume and notional value all-time and per calendar month (UTC), both for
+    the whole account and per instrument. Recording a fill and every query are O(1), so
+    volume-tiered commissions never rescan the fill history.
+
+    Notes:
+        - Periods are calendar months of the fill timestamp in UTC, as used by typical monthly
+          volume tiers.
+        - `SimBroker` records every committed fill; FOK dry-runs record into a `copy`.
+    """
+
+    __slots__ = ("_fill_count", "_volume_by_key", "_notional_by_key")
+
+    # region Init
+
+    def __init__(self) -> None:
+        self._fill_count = 0
+
+        # TOTALS keyed by (instrument or None for the whole account, period or None for all-time)
+        self._volume_by_key: dict[tuple[Instrument | None, tuple[int, int] | None], Decimal] = {}
+        self._notional_by_key: dict[tuple[Instrument | None, tuple[int, int] | None], Decimal] = {}
+
+    @classmethod
+    def from_order_fills(cls, order_fills: Iterable[OrderFill]) -> FeeContext:
+        """Return a FeeContext with the totals of $order_fills (O(n))."""
+        result = cls()
+        for order_fill in order_fills:
+            result.record_fill(order_fill.order.instrument, order_fill.signed_quantity, order_fill.price, order_fill.timestamp)
+        return result
+
+    # endregion
+
+    # region Main
+
+    def record_fill(self, instrument: Instrument, signed_qty: Decimal, price: Decimal, timestamp: datetime) -> None:
+        """Add one fill of $signed_qty at $price to all running totals."""
+        abs_qty = abs(signed_qty)
+        notional = compute_notional_value(price, signed_qty, instrument.contract_size)
+        period = self.compute_period(timestamp)
+
+        volume_by_key = self._volume_by_key
+        notional_by_key = self._notional_by_key
+        for key in ((None, None), (None, period), (instrument, None), (instrument, period)):
+            volume_by_key[key] = volume_by_key.get(key, _ZERO) + abs_qty
+            notional_by_key[key] = notional_by_key.get(key, _ZERO) + notional
+        self._fill_count += 1
+
+    def get_volume(self, instrument: Instrument | None = None) -> Decimal:
+        """Return all-time abs traded volume of the account, or of $instrument if given."""
+        return self._volume_by_key.get((instrument, None), _ZERO)
+
+    def get_notional(self, instrument: Instrument | None = None) -> Decimal:
+        """Return all-time abs traded notional value of the account, or of $instrument if given."""
+        return self._notional_by_key.get((instrument, None), _ZERO)
+
+    def get_period_volume(self, timestamp: datetime, instrument: Instrument | None = None) -> Decimal:
+        """Return abs traded volume in the period containing $timestamp (account-wide or for $instrument)."""
+        return self._volume_by_key.get((instrument, self.compute_period(timestamp)), _ZERO)
+
+    def get_period_notional(self, timestamp: datetime, instrument: Instrument | None = None) -> Decimal:
+        """Return abs traded notional in the period containing $timestamp (account-wide or for $instrument)."""
+        return self._notional_by_key.get((instrument, self.compute_period(timestamp)), _ZERO)
+
+    def copy(self) -> FeeContext:
+        """Return an independent copy, e.g. for dry-runs that must not change the real totals."""
+        result = FeeContext()
+        result._fill_count = self._fill_count
+        result._volume_by_key = dict(self._volume_by_key)
+        result._notional_by_key = dict(self._notional_by_key)
+        return result
+
+    @staticmethod
+    def compute_period(timestamp: datetime) -> tuple[int, int]:
+        """Return the (year, month) period of $timestamp (expected in UTC)."""
+        return timestamp.year, timestamp.month
+
+    # endregion
+
+    # region Properties
+
+    @property
+    def fill_count(self) -> int:
+        return self._fill_count
+
+    # endregion
+
+    # region Magic
+
+    def __str__(self) -> str:
+        return f"{self.__class__.__name__}(fill_count={self._fill_count}, volume={self.get_volume()})"
+
+    def __repr__(self) -> str:
+        return self.__str__()
+
+    # endregion
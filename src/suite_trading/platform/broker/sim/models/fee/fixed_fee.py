@@ -7,12 +7,16 @@ from suite_trading.domain.order.orders import Order
 from suite_trading.domain.order.order_fill import OrderFill
 from suite_trading.domain.market_data.order_book.order_book import ProposedFill
 
-from .protocol import FeeModel
+from .fee_context import FeeContext
+from .protocol import FeeModel, IncrementalFeeModel
 
 
-class FixedFeeModel(FeeModel):
+class FixedFeeModel(FeeModel, IncrementalFeeModel):
     """Fixed per-unit commission model.
 
+    Needs no account history, so it also implements `IncrementalFeeModel` and works with
+    `SimBroker(keep_order_fills=False)`.
+
     Args:
         fee_per_unit: Commission $fee_per_unit charged for each 1 unit filled.
             Example: 0.005 USD per share → Money(Decimal("0.005"), USD)
@@ -50,3 +54,20 @@ class FixedFeeModel(FeeModel):
             raise ValueError(f"Cannot call `compute_commission` because $signed_quantity ({signed_qty}) is zero for order $id ('{order.id}')")
 
         return self._fee_per_unit * abs(signed_qty)
+
+    def compute_commission_with_context(
+        self,
+        proposed_fill: ProposedFill,
+        order: Order,
+        fee_context: FeeContext,
+    ) -> Money:
+        """Implements: IncrementalFeeModel.compute_commission_with_context
+
+        Charge like `compute_commission`; $fee_context is not used in this model.
+        """
+        result = self.compute_commission(proposed_fill, order, ())
+        return result
+
+    @property
+    def fee_per_unit(self) -> Money:
+        return self._fee_per_unit
@@ -1,12 +1,14 @@
 from __future__ import annotations
 
-from typing import Protocol, Sequence
+from typing import Protocol, Sequence, runtime_checkable
 
 from suite_trading.domain.order.orders import Order
 from suite_trading.domain.order.order_fill import OrderFill
 from suite_trading.domain.monetary.money import Money
 from suite_trading.domain.market_data.order_book.order_book import ProposedFill
 
+from .fee_context import FeeContext
+
 
 # region Interface
 
@@ -44,4 +46,34 @@ class FeeModel(Protocol):
         ...
 
 
+@runtime_checkable
+class IncrementalFeeModel(Protocol):
+    """FeeModel(s) that read account history from running totals instead of the fill list (optional).
+
+    `SimBroker` calls `compute_commission_with_context` instead of `compute_commission` for
+    models implementing this protocol, so volume-tiered fees cost O(1) per fill and work when
+    the broker does not keep `OrderFill` history.
+    """
+
+    def compute_commission_with_context(
+        self,
+        proposed_fill: ProposedFill,
+        order: Order,
+        fee_context: FeeContext,
+    ) -> Money:
+        """Compute the commission for $proposed_fill, like `FeeModel.compute_commission`.
+
+        Args:
+            proposed_fill: The specific trade data (price and quantity) for which to
+                calculate the commission.
+            order: The order that generated this fill.
+            fee_context: Running volume and notional totals of the account's previous
+                trades (not including $proposed_fill).
+
+        Returns:
+            The commission amount as Money.
+        """
+        ...
+
+
 # endregion
@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+from bisect import bisect_right
+from collections.abc import Sequence
+from decimal import Decimal
+
+from suite_trading.domain.market_data.order_book.order_book import ProposedFill
+from suite_trading.domain.monetary.currency import Currency
+from suite_trading.domain.monetary.money import Money
+from suite_trading.domain.order.order_fill import OrderFill
+from suite_trading.domain.order.orders import Order
+from suite_trading.utils.numeric_tools import DecimalLike, as_decimal
+
+from .fee_context import FeeContext
+from .protocol import FeeModel, IncrementalFeeModel
+
+
+class TieredVolumeFeeModel(FeeModel, IncrementalFeeModel):
+    """Per-unit commission that drops as the account's monthly traded volume grows.
+
+    The tier is selected by the abs volume already traded in the calendar month (UTC) of the
+    fill, read in O(1) from `FeeContext` (via `IncrementalFeeModel`); the whole fill is charged at
+    that tier's rate. Callers of plain `compute_commission` get the same result, computed from
+    $previous_order_fills in O(n).
+    Per-unit fees are kept as Decimal, so sub-cent rates work; only the total commission is
+    rounded to $currency precision.
+
+    Example:
+        Stock-style tiers (per share): 0.0035 USD up to 300k shares a month, 0.002 USD up to
+        3M shares, 0.0015 USD above:
+
+            fee_model = TieredVolumeFeeModel(
+                tiers=[(0, "0.0035"), (300_000, "0.002"), (3_000_000, "0.0015")],
+                currency=USD,
+            )
+    """
+
+    __slots__ = ("_min_volumes", "_fees_per_unit", "_currency", "_is_per_instrument")
+
+    # region Init
+
+    def __init__(self, tiers: Sequence[tuple[DecimalLike, DecimalLike]], currency: Currency, *, is_per_instrument: bool = False) -> None:
+        """Create a tiered fee model.
+
+        Args:
+            tiers: (min monthly volume, fee per unit) pairs with strictly increasing volumes,
+                starting at 0. Fees are in $currency and must not be negative.
+            currency: Currency of the charged commission.
+            is_per_instrument: If True, monthly volume is counted per instrument; otherwise for
+                the whole account.
+
+        Raises:
+            ValueError: If $tiers is empty, does not start at 0, is not strictly increasing, or
+                has a negative fee.
+        """
+        min_volumes = [as_decimal(min_volume) for min_volume, _ in tiers]
+        fees_per_unit = [as_decimal(fee_per_unit) for _, fee_per_unit in tiers]
+
+        # Raise: first tier must cover zero volume
+        if not min_volumes or min_volumes[0] != 0:
+            raise ValueError(f"Cannot call `TieredVolumeFeeModel.__init__` because $tiers must start at volume 0 (got {min_volumes})")
+        # Raise: tier boundaries must be strictly increasing
+        if any(previous >= current for previous, current in zip(min_volumes, min_volumes[1:])):
+            raise ValueError(f"Cannot call `TieredVolumeFeeModel.__init__` because $tiers volumes are not strictly increasing ({min_volumes})")
+        # Raise: fees must not be negative
+        if any(fee_per_unit < 0 for fee_per_unit in fees_per_unit):
+            raise ValueError(f"Cannot call `TieredVolumeFeeModel.__init__` because $tiers contain a negative fee ({fees_per_unit})")
+
+        self._min_volumes: list[Decimal] = min_volumes
+        self._fees_per_unit: list[Decimal] = fees_per_unit
+        self._currency = currency
+        self._is_per_instrument = is_per_instrument
+
+    # endregion
+
+    # region Protocol FeeModel
+
+    def compute_commission(
+        self,
+        proposed_fill: ProposedFill,
+        order: Order,
+        previous_order_fills: Sequence[OrderFill],
+    ) -> Money:
+        """Implements: FeeModel.compute_commission
+
+        Totals $previous_order_fills into a `FeeContext`, then charges like `compute_commission_with_context`.
+        """
+        result = self.compute_commission_with_context(proposed_fill, order, FeeContext.from_order_fills(previous_order_fills))
+        return result
+
+    # endregion
+
+    # region Protocol IncrementalFeeModel
+
+    def compute_commission_with_context(
+        self,
+        proposed_fill: ProposedFill,
+        order: Order,
+        fee_context: FeeContext,
+    ) -> Money:
+        """Implements: IncrementalFeeModel.compute_commission_with_context
+
+        Charge the per-unit fee of the tier reached by this month's volume before $proposed_fill.
+        """
+        signed_qty = proposed_fill.signed_qty
+
+        # Raise: ensure signed quantity is non-zero
+        if signed_qty == 0:
+            raise ValueError(f"Cannot call `compute_commission` because $signed_quantity ({signed_qty}) is zero for order $id ('{order.id}')")
+
+        instrument = order.instrument if self._is_per_instrument else None
+        monthly_volume = fee_context.get_period_volume(proposed_fill.timestamp, instrument)
+        tier_index = bisect_right(self._min_volumes, monthly_volume) - 1
+
+        result = Money(self._fees_per_unit[tier_index] * abs(signed_qty), self._currency)
+        return result
+
+    # endregion
+
+    # region Properties
+
+    @property
+    def currency(self) -> Currency:
+        return self._currency
+
+    @property
+    def is_per_instrument(self) -> bool:
+        return self._is_per_instrument
+
+    # endregion
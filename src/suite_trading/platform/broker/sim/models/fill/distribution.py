@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from bisect import bisect_left
 from decimal import Decimal
 import random
 
@@ -10,9 +11,12 @@ from suite_trading.domain.order.orders import (
     LimitOrder,
     StopLimitOrder,
 )
+from suite_trading.domain.instrument import Instrument
 from suite_trading.domain.market_data.order_book.order_book import OrderBook, ProposedFill
 from suite_trading.utils.numeric_tools import DecimalLike, as_decimal
 
+from .block_random import BlockRandom
+
 
 class DistributionFillModel:
     """Distribution-based fill model for realistic slippage and limit-on-touch behavior.
@@ -46,6 +50,11 @@ class DistributionFillModel:
     The per-fill independent sampling creates realistic variance in order_fill quality,
     where different portions of the same order can have different outcomes.
 
+    Sampling is O(log n) per proposed fill: the distribution is turned into a float cumulative
+    table once at construction and searched with bisect. For tick-level backtests, set
+    $rng_block_size to draw random numbers in blocks from one seeded substream per Instrument
+    (see `BlockRandom`).
+
     Examples:
         Realistic stochastic configuration for production backtests:
 
@@ -89,6 +98,7 @@ class DistributionFillModel:
         market_fill_adjustment_distribution: dict[int, Decimal] | None = None,
         limit_on_touch_fill_probability: DecimalLike | None = None,
         rng_seed: int | None = None,
+        rng_block_size: int | None = None,
     ):
         """Initialize distribution fill model.
 
@@ -110,6 +120,14 @@ class DistributionFillModel:
                 Decimal-like scalar. If None, uses a pessimistic default of Decimal("0.30")
                 (30% chance to fill on touch).
             rng_seed: Random seed for reproducible backtests. If None, uses system randomness.
+            rng_block_size: If set, random numbers are drawn in blocks of this size from one
+                substream per Instrument (seeded from $rng_seed), so each Instrument's results
+                stay reproducible when the order of Instrument(s) changes. If None, one shared
+                `random.Random` stream is used.
+
+        Raises:
+            ValueError: If $market_fill_adjustment_distribution is empty or has a negative weight,
+                or if $limit_on_touch_fill_probability is outside [0, 1].
         """
         # Use realistic defaults if None provided
         if market_fill_adjustment_distribution is None:
@@ -127,9 +145,23 @@ class DistributionFillModel:
         if limit_on_touch_fill_probability < Decimal("0") or limit_on_touch_fill_probability > Decimal("1"):
             raise ValueError(f"Cannot create `DistributionFillModel` because $limit_on_touch_fill_probability ({limit_on_touch_fill_probability}) is outside [0, 1]")
 
+        # Raise: distribution needs at least one outcome and non-negative weights
+        if not market_fill_adjustment_distribution:
+            raise ValueError("Cannot create `DistributionFillModel` because $market_fill_adjustment_distribution is empty")
+        if any(weight < 0 for weight in market_fill_adjustment_distribution.values()):
+            raise ValueError(f"Cannot create `DistributionFillModel` because $market_fill_adjustment_distribution ({market_fill_adjustment_distribution}) has a negative weight")
+
         self._market_fill_adjustment_distribution = market_fill_adjustment_distribution
         self._limit_on_touch_fill_probability = limit_on_touch_fill_probability
+
+        # SAMPLING TABLES (precomputed once; cumulative weights in ascending tick order)
+        self._adjustment_ticks, self._cumulative_weights = self._build_cumulative_table(market_fill_adjustment_distribution)
+        self._fallback_adjustment_ticks = list(market_fill_adjustment_distribution.keys())[-1]
+        self._limit_on_touch_fill_probability_float = float(limit_on_touch_fill_probability)
+
+        # RANDOMNESS (one shared stream, or block-drawn substreams per Instrument)
         self._rng = random.Random(rng_seed)
+        self._block_rng: BlockRandom | None = BlockRandom(seed=rng_seed, block_size=rng_block_size) if rng_block_size is not None else None
 
     # endregion
 
@@ -174,7 +206,7 @@ class DistributionFillModel:
         slipped_fills: list[ProposedFill] = []
         for proposed_fill in proposed_fills:
             # Sample adjustment amount in ticks for this specific fill
-            adjustment_ticks = self._sample_from_distribution(self._market_fill_adjustment_distribution)
+            adjustment_ticks = self._sample_adjustment_ticks(instrument)
 
             # Compute adjustment amount from tick size
             adjustment_amount = tick_size * adjustment_ticks
@@ -239,13 +271,13 @@ class DistributionFillModel:
                 continue
 
             # Probability is strictly between 0 and 1: use randomness per proposed fill
-            random_value = as_decimal(self._rng.random())
-            if random_value <= limit_on_touch_probability:
+            random_value = self._draw_random(order.instrument)
+            if random_value <= self._limit_on_touch_fill_probability_float:
                 accepted_fills.append(proposed_fill)
 
         return accepted_fills
 
-    def _sample_from_distribution(self, distribution: dict[int, Decimal]) -> int:
+    def _sample_adjustment_ticks(self, instrument: Instrument) -> int:
         """Select an adjustment value from the configured distribution.
 
         This function has two behaviors:
@@ -253,29 +285,51 @@ class DistributionFillModel:
         * If the distribution contains exactly one key, we already know the only possible
           result. In that case we return that key directly and do not use the random
           generator at all.
-        * If the distribution contains several keys, we draw a random number and use it to
-          pick one of the possible adjustment values based on their relative weights.
+        * If the distribution contains several keys, we draw a random number and bisect the
+          precomputed cumulative weights to pick one of the possible adjustment values.
 
         Args:
-            distribution: Mapping from fill adjustment in ticks to non-negative weights.
+            instrument: Instrument of the proposed fill; selects the random substream.
 
         Returns:
             Chosen adjustment value in ticks.
         """
-        # Simple case: only one possible outcome, no need for randomness
-        if len(distribution) == 1:
-            return next(iter(distribution.keys()))
-
-        # General case: draw a random value and walk the cumulative weights
-        random_value = as_decimal(self._rng.random())
+        adjustment_ticks = self._adjustment_ticks
 
-        cumulative_probability = Decimal("0")
+        # Simple case: only one possible outcome, no need for randomness
+        if len(adjustment_ticks) == 1:
+            return adjustment_ticks[0]
+
+        # General case: first outcome whose cumulative weight reaches the random value
+        index = bisect_left(self._cumulative_weights, self._draw_random(instrument))
+        if index < len(adjustment_ticks):
+            return adjustment_ticks[index]
+
+        # Fallback: weights sum to less than the random value, so the last configured key absorbs the rest
+        return self._fallback_adjustment_ticks
+
+    def _draw_random(self, instrument: Instrument) -> float:
+        """Return the next random number in [0, 1) for a proposed fill of $instrument."""
+        block_rng = self._block_rng
+        if block_rng is not None:
+            return block_rng.random(instrument)
+        return self._rng.random()
+
+    @staticmethod
+    def _build_cumulative_table(distribution: dict[int, Decimal]) -> tuple[list[int], list[float]]:
+        """Return (adjustment ticks, cumulative weights) sorted by tick, ready for bisect.
+
+        Weights are summed as Decimal and converted to float once, so the table matches summing
+        the configured weights exactly.
+        """
+        adjustment_ticks: list[int] = []
+        cumulative_weights: list[float] = []
+        cumulative_weight = Decimal("0")
         for slippage_ticks, probability_weight in sorted(distribution.items(), key=lambda item: item[0]):
-            cumulative_probability += probability_weight
-            if random_value <= cumulative_probability:
-                return slippage_ticks
+            cumulative_weight += as_decimal(probability_weight)
+            adjustment_ticks.append(slippage_ticks)
+            cumulative_weights.append(float(cumulative_weight))
 
-        # Fallback: return last slippage_ticks value if rounding causes issues
-        return list(distribution.keys())[-1]
+        return adjustment_ticks, cumulative_weights
 
     # endregion
@@ -0,0 +1,262 @@
+from __future__ import annotations
+
+from decimal import Decimal
+
+from suite_trading.domain.instrument import Instrument
+from suite_trading.domain.market_data.order_book.order_book import OrderBook, ProposedFill
+from suite_trading.domain.order.order_state import OrderStateCategory
+from suite_trading.domain.order.orders import LimitOrder, Order, StopLimitOrder
+
+from .protocol import FillModel
+
+
+class _LevelQueue:
+    """FIFO queue of our resting limit orders at one price level of one side.
+
+    Queue positions are measured on one axis: the cumulative volume traded at this level since
+    the level was first seen ($traded_volume). An order may fill at the limit price once
+    $traded_volume has passed its position; everything traded beyond that is its share.
+    """
+
+    __slots__ = ("traded_volume", "tail_position", "visible_qty", "last_order_book")
+
+    def __init__(self) -> None:
+        self.traded_volume = Decimal("0")
+        # Position right after the last queued order (so our own orders queue behind each other)
+        self.tail_position = Decimal("0")
+        # Same-side volume at the level in the last depth snapshot, minus trades printed since (None until first snapshot)
+        self.visible_qty: Decimal | None = None
+        # OrderBook whose traded volume was already counted (each snapshot counts once per level)
+        self.last_order_book: OrderBook | None = None
+
+
+class _QueueEntry:
+    """Queue position of one resting limit order."""
+
+    __slots__ = ("order", "level", "position", "released_qty")
+
+    def __init__(self, order: Order, level: _LevelQueue, position: Decimal) -> None:
+        self.order = order
+        self.level = level
+        # Volume that must trade at the level before this order fills
+        self.position = position
+        # Quantity already released at the limit price
+        self.released_qty = Decimal("0")
+
+
+class QueuePositionFillModel:
+    """Fill model that releases on-touch limit fills only after the volume queued ahead has traded.
+
+    Each resting limit-like order (LimitOrder, StopLimitOrder) joins the back of the queue at its
+    price level when the model first sees it: the volume ahead of it is the last visible volume on
+    its own side at its limit price, plus our own orders already queued there.
+
+    Traded volume at the level is inferred from two kinds of OrderBook:
+    - Trade prints (zero-spread OrderBooks, which is how a TradeTick is converted): the printed
+      volume at the limit price counts as traded.
+    - Depth snapshots (all other OrderBooks): a decrease of the same-side volume at the limit
+      price counts as traded. Opposite-side volume resting at the limit price is a quote, not a
+      trade, so a static book repeated N times advances nothing.
+
+    Printed volume is also taken off the visible same-side volume, so a later depth snapshot
+    showing the same depletion does not count it twice. Traded volume first consumes the queue
+    ahead; only volume beyond it is released as on-touch fills, in FIFO order across our orders
+    at the same level. Each OrderBook is counted once per level, no matter how many of our orders
+    rest there.
+
+    Behavior by proposed fill price:
+    - Strictly better than the limit: the level was traded through, so the whole queue at the
+      level is consumed and all proposed fills are accepted.
+    - Exactly at the limit (on touch): accepted up to the volume traded beyond the order's
+      queue position.
+
+    Market-like orders (MarketOrder, StopMarketOrder) are passed to $market_fill_model, or accepted
+    unchanged if it is None.
+
+    Levels are indexed by (Instrument, side, price) and orders by id, so a snapshot update and
+    a fill decision are O(1) plus one O(log L) depth query on the OrderBook, independent of how
+    many orders rest in the book. Entries of finished orders are dropped in sweeps that run
+    when the number of entries has doubled, so cleanup is amortized O(1) per order.
+
+    Simplifications:
+    - Own orders that are cancelled do not advance our orders queued behind them (conservative).
+    - Every same-side decrease counts as traded, including cancellations of other participants
+      (they leave the queue ahead of us just like trades do).
+    - A locked quote (best bid == best ask) is treated as a trade print.
+
+    Example:
+        broker = SimBroker(fill_model=QueuePositionFillModel())
+    """
+
+    __slots__ = ("_market_fill_model", "_level_by_key", "_entry_by_order_id", "_sweep_threshold")
+
+    # Minimum number of entries before finished orders are swept
+    _MIN_SWEEP_THRESHOLD = 1024
+
+    # region Init
+
+    def __init__(self, market_fill_model: FillModel | None = None) -> None:
+        """Create a queue-position fill model.
+
+        Args:
+            market_fill_model: Fill model applied to market-like orders (for example to add
+                slippage). If None, their proposed fills are accepted unchanged.
+        """
+        self._market_fill_model = market_fill_model
+        self._level_by_key: dict[tuple[Instrument, bool, Decimal], _LevelQueue] = {}
+        self._entry_by_order_id: dict[str, _QueueEntry] = {}
+        self._sweep_threshold = self._MIN_SWEEP_THRESHOLD
+
+    # endregion
+
+    # region Protocol FillModel
+
+    def apply_fill_policy(
+        self,
+        order: Order,
+        order_book: OrderBook,
+        proposed_fills: list[ProposedFill],
+    ) -> list[ProposedFill]:
+        """Implements: FillModel.apply_fill_policy
+
+        Track the queue position of limit-like $order and release on-touch fills once the volume ahead has traded.
+        """
+        if not isinstance(order, (LimitOrder, StopLimitOrder)):
+            market_fill_model = self._market_fill_model
+            if market_fill_model is None:
+                return proposed_fills
+            return market_fill_model.apply_fill_policy(order, order_book, proposed_fills)
+
+        limit_price = order.limit_price
+        level = self._get_or_create_level(order.instrument, order.is_buy, limit_price)
+
+        # Count traded volume of a new snapshot before queuing, so an order never fills from trades it saw on arrival
+        if level.last_order_book is not order_book:
+            level.last_order_book = order_book
+            self._count_traded_volume(level, order.is_buy, limit_price, order_book)
+
+        entry = self._entry_by_order_id.get(order.id)
+        if entry is None:
+            entry = self._enqueue_order(order, level)
+
+        # Skip: nothing to release
+        if not proposed_fills:
+            return []
+
+        # Level traded through: the whole queue at the limit price is consumed
+        if any(proposed_fill.price != limit_price for proposed_fill in proposed_fills):
+            level.traded_volume = max(level.traded_volume, level.tail_position)
+
+        releasable_qty = level.traded_volume - entry.position - entry.released_qty
+        result: list[ProposedFill] = []
+        for proposed_fill in proposed_fills:
+            # Price is strictly better than the limit: always fill
+            if proposed_fill.price != limit_price:
+                result.append(proposed_fill)
+                continue
+
+            # Skip: queue ahead not consumed yet
+            if releasable_qty <= 0:
+                continue
+
+            abs_qty = min(proposed_fill.abs_qty, releasable_qty)
+            releasable_qty -= abs_qty
+            entry.released_qty += abs_qty
+            if abs_qty == proposed_fill.abs_qty:
+                result.append(proposed_fill)
+            else:
+                signed_qty = abs_qty if proposed_fill.signed_qty > 0 else -abs_qty
+                result.append(ProposedFill(signed_qty=signed_qty, price=proposed_fill.price, timestamp=proposed_fill.timestamp))
+
+        return result
+
+    # endregion
+
+    # region Main
+
+    def get_qty_ahead(self, order: Order) -> Decimal | None:
+        """Return the volume still queued ahead of $order at its limit price.
+
+        Returns:
+            Decimal | None: Volume ahead (0 once consumed), or None if the model has not seen $order.
+        """
+        entry = self._entry_by_order_id.get(order.id)
+
+        # Skip: order not queued
+        if entry is None:
+            return None
+
+        result = max(entry.position - entry.level.traded_volume, Decimal("0"))
+        return result
+
+    # endregion
+
+    # region Properties
+
+    @property
+    def market_fill_model(self) -> FillModel | None:
+        return self._market_fill_model
+
+    @property
+    def queued_order_count(self) -> int:
+        """Number of tracked orders (finished orders are dropped lazily)."""
+        return len(self._entry_by_order_id)
+
+    # endregion
+
+    # region Utilities
+
+    def _get_or_create_level(self, instrument: Instrument, is_buy: bool, price: Decimal) -> _LevelQueue:
+        key = (instrument, is_buy, price)
+        result = self._level_by_key.get(key)
+        if result is None:
+            result = self._level_by_key[key] = _LevelQueue()
+        return result
+
+    @staticmethod
+    def _count_traded_volume(level: _LevelQueue, is_buy: bool, limit_price: Decimal, order_book: OrderBook) -> None:
+        """Add volume traded at $level since the previous OrderBook and refresh its visible same-side volume."""
+        # Trade print: the printed volume at the limit price traded and left the visible queue
+        if order_book.spread_as_price == 0:
+            printed_qty = order_book.compute_fillable_qty(is_buy, min_price=limit_price, max_price=limit_price)
+            level.traded_volume += printed_qty
+            if level.visible_qty is not None:
+                level.visible_qty = max(level.visible_qty - printed_qty, Decimal("0"))
+            return
+
+        # Depth snapshot: only a decrease of same-side volume at the level advances the queue
+        same_side_qty = order_book.compute_fillable_qty(not is_buy, min_price=limit_price, max_price=limit_price)
+        if level.visible_qty is not None and same_side_qty < level.visible_qty:
+            level.traded_volume += level.visible_qty - same_side_qty
+        level.visible_qty = same_side_qty
+
+    def _enqueue_order(self, order: Order, level: _LevelQueue) -> _QueueEntry:
+        """Queue $order behind the visible same-side volume at its limit price and behind our earlier orders."""
+        visible_qty_ahead = level.visible_qty if level.visible_qty is not None else Decimal("0")
+        position = max(level.traded_volume + visible_qty_ahead, level.tail_position)
+        level.tail_position = position + order.abs_unfilled_quantity
+
+        if len(self._entry_by_order_id) >= self._sweep_threshold:
+            self._sweep_finished_orders()
+
+        result = self._entry_by_order_id[order.id] = _QueueEntry(order, level, position)
+        return result
+
+    def _sweep_finished_orders(self) -> None:
+        """Drop entries of finished orders and levels without entries; runs when entries have doubled."""
+        terminal = OrderStateCategory.TERMINAL
+        self._entry_by_order_id = {order_id: entry for order_id, entry in self._entry_by_order_id.items() if entry.order.state_category != terminal}
+
+        live_levels = {id(entry.level) for entry in self._entry_by_order_id.values()}
+        self._level_by_key = {key: level for key, level in self._level_by_key.items() if id(level) in live_levels}
+
+        self._sweep_threshold = max(2 * len(self._entry_by_order_id), self._MIN_SWEEP_THRESHOLD)
+
+    # endregion
+
+    # region Magic
+
+    def __str__(self) -> str:
+        return f"{self.__class__.__name__}(queued_orders={len(self._entry_by_order_id)}, levels={len(self._level_by_key)})"
+
+    # endregion
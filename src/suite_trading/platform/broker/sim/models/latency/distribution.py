@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+from bisect import bisect_left
+from datetime import timedelta
+from decimal import Decimal
+import random
+
+from suite_trading.domain.order.order_state import OrderAction
+from suite_trading.domain.order.orders import Order
+from suite_trading.utils.numeric_tools import as_decimal
+
+from .protocol import LatencyModel
+
+
+class DistributionLatencyModel(LatencyModel):
+    """Random latency per request, sampled from a discrete distribution per request kind.
+
+    Each distribution maps a latency to a Decimal weight. Weights typically add up to 1.0 so
+    they read as probabilities; any non-negative weights work and the largest latency absorbs
+    leftover probability from rounding. Sampling is O(log k) for k outcomes: cumulative weights
+    are built once and searched with bisect.
+
+    Example:
+        latency_model = DistributionLatencyModel(
+            submit_latency_distribution={
+                timedelta(milliseconds=2): Decimal("0.80"),
+                timedelta(milliseconds=10): Decimal("0.20"),
+            },
+            cancel_latency_distribution={timedelta(milliseconds=1): Decimal("1")},
+            rng_seed=42,
+        )
+        broker = SimBroker(latency_model=latency_model)
+    """
+
+    __slots__ = ("_table_by_action", "_rng")
+
+    # region Init
+
+    def __init__(
+        self,
+        submit_latency_distribution: dict[timedelta, Decimal],
+        cancel_latency_distribution: dict[timedelta, Decimal] | None = None,
+        update_latency_distribution: dict[timedelta, Decimal] | None = None,
+        rng_seed: int | None = None,
+    ) -> None:
+        """Create a distribution latency model.
+
+        Args:
+            submit_latency_distribution: Latency → weight for new orders.
+            cancel_latency_distribution: Latency → weight for cancels. If None, $submit_latency_distribution is used.
+            update_latency_distribution: Latency → weight for modifications. If None, $submit_latency_distribution is used.
+            rng_seed: Random seed for reproducible backtests. If None, uses system randomness.
+
+        Raises:
+            ValueError: If a distribution is empty, or has a negative latency or weight.
+        """
+        distribution_by_action = {
+            OrderAction.SUBMIT: submit_latency_distribution,
+            OrderAction.CANCEL: cancel_latency_distribution if cancel_latency_distribution is not None else submit_latency_distribution,
+            OrderAction.UPDATE: update_latency_distribution if update_latency_distribution is not None else submit_latency_distribution,
+        }
+        self._table_by_action = {action: self._build_cumulative_table(action, distribution) for action, distribution in distribution_by_action.items()}
+        self._rng = random.Random(rng_seed)
+
+    # endregion
+
+    # region Protocol LatencyModel
+
+    def compute_latency(self, order: Order, action: OrderAction) -> timedelta:
+        """Implements: LatencyModel.compute_latency
+
+        Sample a latency for $action.
+        """
+        latencies, cumulative_weights = self._table_by_action[action]
+
+        # Simple case: only one possible outcome, no need for randomness
+        if len(latencies) == 1:
+            return latencies[0]
+
+        index = bisect_left(cumulative_weights, self._rng.random())
+        result = latencies[min(index, len(latencies) - 1)]
+        return result
+
+    # endregion
+
+    # region Utilities
+
+    @staticmethod
+    def _build_cumulative_table(action: OrderAction, distribution: dict[timedelta, Decimal]) -> tuple[list[timedelta], list[float]]:
+        """Return (latencies, cumulative weights) sorted by latency, ready for bisect."""
+        # Raise: distribution needs at least one outcome
+        if not distribution:
+            raise ValueError(f"Cannot create `DistributionLatencyModel` because latency distribution of {action.name} is empty")
+
+        latencies: list[timedelta] = []
+        cumulative_weights: list[float] = []
+        cumulative_weight = Decimal("0")
+        for latency, weight in sorted(distribution.items(), key=lambda item: item[0]):
+            weight = as_decimal(weight)
+
+            # Raise: latencies and weights must be non-negative
+            if latency < timedelta(0) or weight < 0:
+                raise ValueError(f"Cannot create `DistributionLatencyModel` because latency distribution of {action.name} has a negative latency or weight ({latency}: {weight})")
+
+            cumulative_weight += weight
+            latencies.append(latency)
+            cumulative_weights.append(float(cumulative_weight))
+
+        return latencies, cumulative_weights
+
+    # endregion
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+from datetime import timedelta
+
+from suite_trading.domain.order.order_state import OrderAction
+from suite_trading.domain.order.orders import Order
+
+from .protocol import LatencyModel
+
+
+class FixedLatencyModel(LatencyModel):
+    """Constant latency per request kind.
+
+    Args:
+        submit_latency: Latency of new orders.
+        cancel_latency: Latency of cancels. If None, $submit_latency is used.
+        update_latency: Latency of modifications. If None, $submit_latency is used.
+
+    Raises:
+        ValueError: If any latency is negative.
+    """
+
+    __slots__ = ("_latency_by_action",)
+
+    def __init__(
+        self,
+        submit_latency: timedelta,
+        cancel_latency: timedelta | None = None,
+        update_latency: timedelta | None = None,
+    ) -> None:
+        latency_by_action = {
+            OrderAction.SUBMIT: submit_latency,
+            OrderAction.CANCEL: cancel_latency if cancel_latency is not None else submit_latency,
+            OrderAction.UPDATE: update_latency if update_latency is not None else submit_latency,
+        }
+
+        # Raise: requests cannot arrive before they were sent
+        for action, latency in latency_by_action.items():
+            if latency < timedelta(0):
+                raise ValueError(f"Cannot create `FixedLatencyModel` because latency of {action.name} ({latency}) is negative")
+
+        self._latency_by_action = latency_by_action
+
+    def compute_latency(self, order: Order, action: OrderAction) -> timedelta:
+        """Implements: LatencyModel.compute_latency
+
+        Return the configured latency of $action.
+        """
+        return self._latency_by_action[action]
+
+    @property
+    def submit_latency(self) -> timedelta:
+        return self._latency_by_action[OrderAction.SUBMIT]
+
+    @property
+    def cancel_latency(self) -> timedelta:
+        return self._latency_by_action[OrderAction.CANCEL]
+
+    @property
+    def update_latency(self) -> timedelta:
+        return self._latency_by_action[OrderAction.UPDATE]
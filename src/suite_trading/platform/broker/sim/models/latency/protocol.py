@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+from datetime import timedelta
+from typing import Protocol
+
+from suite_trading.domain.order.order_state import OrderAction
+from suite_trading.domain.order.orders import Order
+
+
+# region Interface
+
+
+class LatencyModel(Protocol):
+    """Protocol for modeling how long order requests travel to the simulated exchange.
+
+    `SimBroker` asks for one latency per request: `OrderAction.SUBMIT` for a new order,
+    `OrderAction.CANCEL` for a cancel and `OrderAction.UPDATE` for a modification. The request
+    takes effect once simulated time reaches the request time plus the returned latency.
+    """
+
+    def compute_latency(self, order: Order, action: OrderAction) -> timedelta:
+        """Return the latency of request $action for $order.
+
+        Args:
+            order: Order the request is about.
+            action: `OrderAction.SUBMIT`, `OrderAction.CANCEL` or `OrderAction.UPDATE`.
+
+        Returns:
+            Non-negative latency; zero applies the request immediately.
+        """
+        ...
+
+
+# endregion
@@ -8,10 +8,11 @@ from suite_trading.domain.market_data.order_book.order_book import OrderBook
 from suite_trading.domain.monetary.money import Money
 from suite_trading.utils.notional import compute_notional_value
 
-from .protocol import MarginModel
+from .margin_context import MarginContext
+from .protocol import MarginContextProvider, MarginModel
 
 
-class FixedRatioMarginModel(MarginModel):
+class FixedRatioMarginModel(MarginModel, MarginContextProvider):
     """Simple fixed-ratio margin model (symmetric long/short)."""
 
     # region Init
@@ -86,6 +87,37 @@ class FixedRatioMarginModel(MarginModel):
 
     # endregion
 
+    # region Protocol MarginContextProvider
+
+    def build_margin_context(self, order_book: OrderBook) -> MarginContext:
+        """Implements: MarginContextProvider.build_margin_context
+
+        Extract the reference price of $order_book once and turn both ratios into per-unit margins.
+        """
+        instrument = order_book.instrument
+        notional_per_unit = compute_notional_value(self._extract_price_from_order_book(order_book), Decimal("1"), instrument.contract_size)
+        result = MarginContext(
+            order_book=order_book,
+            initial_margin_per_unit=notional_per_unit * self._initial_margin_ratio,
+            maint_margin_per_unit=notional_per_unit * self._maint_margin_ratio,
+            currency=instrument.settlement_currency,
+        )
+        return result
+
+    # endregion
+
+    # region Properties
+
+    @property
+    def initial_margin_ratio(self) -> Decimal:
+        return self._initial_margin_ratio
+
+    @property
+    def maint_margin_ratio(self) -> Decimal:
+        return self._maint_margin_ratio
+
+    # endregion
+
     # region Utilities
 
     def _extract_price_from_order_book(self, order_book: OrderBook) -> Decimal:
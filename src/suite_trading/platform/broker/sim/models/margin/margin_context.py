@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+from decimal import Decimal
+
+from suite_trading.domain.market_data.order_book.order_book import OrderBook
+from suite_trading.domain.monetary.currency import Currency
+
+
+class MarginContext:
+    """Per-unit margin rates of one Instrument, computed once for one OrderBook snapshot.
+
+    Built by a `MarginContextProvider` so that a simulated broker can price many proposed fills
+    against the same $order_book with plain Decimal arithmetic, without re-extracting the
+    reference price or constructing `Money` for every intermediate value.
+
+    Margin values are rounded to $currency precision, exactly like `Money`, so results match
+    the `MarginModel` methods they replace.
+    """
+
+    __slots__ = ("_order_book", "_initial_margin_per_unit", "_maint_margin_per_unit", "_currency", "_quantum")
+
+    # region Init
+
+    def __init__(
+        self,
+        order_book: OrderBook,
+        initial_margin_per_unit: Decimal,
+        maint_margin_per_unit: Decimal,
+        currency: Currency,
+    ) -> None:
+        """Create a margin context.
+
+        Args:
+            order_book: OrderBook snapshot the rates were computed from.
+            initial_margin_per_unit: Initial margin for 1 unit of abs exposure.
+            maint_margin_per_unit: Maintenance margin for 1 unit of abs exposure.
+            currency: Currency of all margin values.
+
+        Raises:
+            ValueError: If $initial_margin_per_unit or $maint_margin_per_unit is negative.
+        """
+        # Raise: margin rates must not be negative
+        if initial_margin_per_unit < 0 or maint_margin_per_unit < 0:
+            raise ValueError(f"Cannot create `MarginContext` because margin per unit is negative ($initial_margin_per_unit={initial_margin_per_unit}, $maint_margin_per_unit={maint_margin_per_unit})")
+
+        self._order_book = order_book
+        self._initial_margin_per_unit = initial_margin_per_unit
+        self._maint_margin_per_unit = maint_margin_per_unit
+        self._currency = currency
+        self._quantum = Decimal(f"0.{'0' * currency.precision}") if currency.precision > 0 else Decimal("1")
+
+    # endregion
+
+    # region Main
+
+    def compute_initial_margin_value(self, signed_qty: Decimal) -> Decimal:
+        """Return initial margin value for a position change of $signed_qty, rounded to currency precision."""
+        return (self._initial_margin_per_unit * abs(signed_qty)).quantize(self._quantum)
+
+    def compute_maint_margin_value(self, signed_qty: Decimal) -> Decimal:
+        """Return maintenance margin value for a net position of $signed_qty, rounded to currency precision."""
+        return (self._maint_margin_per_unit * abs(signed_qty)).quantize(self._quantum)
+
+    # endregion
+
+    # region Properties
+
+    @property
+    def order_book(self) -> OrderBook:
+        return self._order_book
+
+    @property
+    def initial_margin_per_unit(self) -> Decimal:
+        return self._initial_margin_per_unit
+
+    @property
+    def maint_margin_per_unit(self) -> Decimal:
+        return self._maint_margin_per_unit
+
+    @property
+    def currency(self) -> Currency:
+        return self._currency
+
+    # endregion
+
+    # region Magic
+
+    def __str__(self) -> str:
+        return f"{self.__class__.__name__}(instrument={self._order_book.instrument}, initial_margin_per_unit={self._initial_margin_per_unit}, maint_margin_per_unit={self._maint_margin_per_unit}, currency={self._currency.code})"
+
+    def __repr__(self) -> str:
+        return self.__str__()
+
+    # endregion
@@ -1,12 +1,14 @@
 from __future__ import annotations
 
-from typing import Protocol
+from typing import Protocol, runtime_checkable
 
 from suite_trading.utils.numeric_tools import DecimalLike
 
 from suite_trading.domain.monetary.money import Money
 from suite_trading.domain.market_data.order_book.order_book import OrderBook
 
+from .margin_context import MarginContext
+
 
 class MarginModel(Protocol):
     """Interface for calculation of initial and maintenance margin requirements.
@@ -76,3 +78,24 @@ class MarginModel(Protocol):
                 Accepts Decimal-like scalar.
         """
         ...
+
+
+@runtime_checkable
+class MarginContextProvider(Protocol):
+    """MarginModel(s) whose margin is linear in abs quantity for a given OrderBook snapshot.
+
+    Simulated brokers build one `MarginContext` per Instrument and OrderBook snapshot and reuse
+    it for every proposed fill (including FOK dry-runs) against that snapshot. MarginModel(s)
+    that do not implement this protocol are called per proposed fill instead.
+    """
+
+    def build_margin_context(self, order_book: OrderBook) -> MarginContext:
+        """Return per-unit margin rates for the Instrument of $order_book.
+
+        The returned context must give the same values as `compute_initial_margin` and
+        `compute_maintenance_margin` for the same $order_book.
+
+        Args:
+            order_book: OrderBook snapshot used to price the Instrument.
+        """
+        ...
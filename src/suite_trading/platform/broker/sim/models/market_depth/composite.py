@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+from suite_trading.domain.instrument import Instrument
+from suite_trading.domain.market_data.order_book.order_book import BookLevel
+
+from .ladder import LadderMarketDepthModel
+
+
+class CompositeMarketDepthModel(LadderMarketDepthModel):
+    """Applies several `LadderMarketDepthModel`(s) in order, building only one OrderBook.
+
+    The ladder steps of all $models run on the same level lists, so no intermediate OrderBook
+    is created per step; the composite result is memoized like any `LadderMarketDepthModel`.
+
+    Example:
+        depth_model = CompositeMarketDepthModel(
+            [
+                MaxLevelsMarketDepthModel(5),
+                SpreadWideningMarketDepthModel(1),
+                VolumeScalingMarketDepthModel("0.5"),
+            ],
+        )
+    """
+
+    __slots__ = ("_models",)
+
+    # region Init
+
+    def __init__(self, models: Sequence[LadderMarketDepthModel]) -> None:
+        """Create a composite depth model.
+
+        Args:
+            models: Models applied left to right.
+
+        Raises:
+            ValueError: If $models is empty.
+        """
+        super().__init__()
+
+        # Raise: composing nothing is a configuration error
+        if not models:
+            raise ValueError("Cannot create `CompositeMarketDepthModel` because $models is empty")
+
+        self._models: tuple[LadderMarketDepthModel, ...] = tuple(models)
+
+    # endregion
+
+    # region Utilities
+
+    def _transform_ladders(self, instrument: Instrument, bids: list[BookLevel], asks: list[BookLevel]) -> tuple[list[BookLevel], list[BookLevel]]:
+        for model in self._models:
+            bids, asks = model._transform_ladders(instrument, bids, asks)
+        return bids, asks
+
+    # endregion
+
+    # region Properties
+
+    @property
+    def models(self) -> tuple[LadderMarketDepthModel, ...]:
+        return self._models
+
+    # endregion
+
+    # region Magic
+
+    def __str__(self) -> str:
+        return f"{self.__class__.__name__}(models={list(self._models)})"
+
+    # endregion
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from decimal import Decimal
+
+from suite_trading.domain.instrument import Instrument
+from suite_trading.domain.market_data.order_book.order_book import BookLevel, OrderBook
+
+from .protocol import MarketDepthModel
+
+
+class LadderMarketDepthModel(MarketDepthModel, ABC):
+    """Base class for depth models that derive matching liquidity from the bid/ask ladders.
+
+    Subclasses only transform plain level lists in `_transform_ladders`; this class builds the
+    customized OrderBook once and memoizes it per (snapshot, model): the latest input OrderBook
+    of each Instrument and its customized result are kept, so every `SimBrokerGroup` using the
+    same model instance gets the same customized OrderBook for the same snapshot instead of
+    rebuilding it.
+
+    Models are composed with `CompositeMarketDepthModel`, which chains their
+    `_transform_ladders` steps on the same level lists and builds only one OrderBook.
+    """
+
+    __slots__ = ("_latest_result_by_instrument",)
+
+    # region Init
+
+    def __init__(self) -> None:
+        # MEMO (latest input OrderBook and its customized result per Instrument; matched by identity)
+        self._latest_result_by_instrument: dict[Instrument, tuple[OrderBook, OrderBook]] = {}
+
+    # endregion
+
+    # region Protocol MarketDepthModel
+
+    def customize_matching_liquidity(self, order_book: OrderBook) -> OrderBook:
+        """Implements: MarketDepthModel.customize_matching_liquidity
+
+        Return the memoized customized OrderBook for $order_book, building it on first request.
+        """
+        instrument = order_book.instrument
+        latest_result = self._latest_result_by_instrument.get(instrument)
+        if latest_result is not None and latest_result[0] is order_book:
+            return latest_result[1]
+
+        bids, asks = self._transform_ladders(instrument, list(order_book.bids), list(order_book.asks))
+        result = OrderBook(instrument=instrument, timestamp=order_book.timestamp, bids=bids, asks=asks)
+        self._latest_result_by_instrument[instrument] = (order_book, result)
+        return result
+
+    # endregion
+
+    # region Utilities
+
+    @abstractmethod
+    def _transform_ladders(self, instrument: Instrument, bids: list[BookLevel], asks: list[BookLevel]) -> tuple[list[BookLevel], list[BookLevel]]:
+        """Return customized ($bids, $asks), both best-first.
+
+        $bids and $asks are private copies owned by the caller, so implementations may modify
+        them in place and return them.
+        """
+
+    @staticmethod
+    def _round_volume_down(instrument: Instrument, volume: Decimal) -> Decimal:
+        """Return $volume rounded down to a multiple of $instrument.qty_increment.
+
+        Fills are snapped to $qty_increment, so a level volume between increments would either
+        snap to 0 (an invalid fill) or snap up (more than the model allows).
+        """
+        qty_increment = instrument.qty_increment
+        result = (volume // qty_increment) * qty_increment
+        return result
+
+    # endregion
+
+    # region Magic
+
+    def __repr__(self) -> str:
+        return self.__str__()
+
+    # endregion
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+from suite_trading.domain.instrument import Instrument
+from suite_trading.domain.market_data.order_book.order_book import BookLevel
+
+from .ladder import LadderMarketDepthModel
+
+
+class MaxLevelsMarketDepthModel(LadderMarketDepthModel):
+    """Keeps only the best $max_levels levels on each side of the book.
+
+    Use it when deeper levels of the data source are not reachable by your orders (e.g. a
+    broker that only routes to the top of book).
+    """
+
+    __slots__ = ("_max_levels",)
+
+    # region Init
+
+    def __init__(self, max_levels: int) -> None:
+        """Create a truncating depth model.
+
+        Args:
+            max_levels: Number of best levels kept per side.
+
+        Raises:
+            ValueError: If $max_levels is not positive.
+        """
+        super().__init__()
+
+        # Raise: keep at least the top of book
+        if max_levels <= 0:
+            raise ValueError(f"Cannot create `MaxLevelsMarketDepthModel` because $max_levels ({max_levels}) is not positive")
+
+        self._max_levels = max_levels
+
+    # endregion
+
+    # region Utilities
+
+    def _transform_ladders(self, instrument: Instrument, bids: list[BookLevel], asks: list[BookLevel]) -> tuple[list[BookLevel], list[BookLevel]]:
+        max_levels = self._max_levels
+        del bids[max_levels:]
+        del asks[max_levels:]
+        return bids, asks
+
+    # endregion
+
+    # region Properties
+
+    @property
+    def max_levels(self) -> int:
+        return self._max_levels
+
+    # endregion
+
+    # region Magic
+
+    def __str__(self) -> str:
+        return f"{self.__class__.__name__}(max_levels={self._max_levels})"
+
+    # endregion
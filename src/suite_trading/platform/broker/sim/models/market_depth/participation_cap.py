@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+from decimal import Decimal
+
+from suite_trading.domain.instrument import Instrument
+from suite_trading.domain.market_data.order_book.order_book import BookLevel
+from suite_trading.utils.numeric_tools import DecimalLike, as_decimal
+
+from .ladder import LadderMarketDepthModel
+
+
+class ParticipationCapMarketDepthModel(LadderMarketDepthModel):
+    """Caps the volume we may take from each side to a share of that side's displayed volume.
+
+    Per side, the allowed volume is $participation_rate × total displayed volume, optionally
+    capped by $max_volume. Levels are kept best-first until the allowed volume is used up; the
+    last kept level is reduced to the remainder. The allowed volume is rounded down to the
+    Instrument's $qty_increment, so fills never exceed the cap. Prices are unchanged.
+    """
+
+    __slots__ = ("_participation_rate", "_max_volume")
+
+    # region Init
+
+    def __init__(self, participation_rate: DecimalLike, max_volume: DecimalLike | None = None) -> None:
+        """Create a participation-cap depth model.
+
+        Args:
+            participation_rate: Share of the displayed side volume available to us, in [0, 1].
+            max_volume: Optional absolute cap of the available volume per side.
+
+        Raises:
+            ValueError: If $participation_rate is outside [0, 1] or $max_volume is negative.
+        """
+        super().__init__()
+        participation_rate = as_decimal(participation_rate)
+        max_volume = as_decimal(max_volume) if max_volume is not None else None
+
+        # Raise: rate in [0, 1]
+        if not (Decimal("0") <= participation_rate <= Decimal("1")):
+            raise ValueError(f"Cannot create `ParticipationCapMarketDepthModel` because $participation_rate ({participation_rate}) is out of [0, 1]")
+        # Raise: cap cannot be negative
+        if max_volume is not None and max_volume < 0:
+            raise ValueError(f"Cannot create `ParticipationCapMarketDepthModel` because $max_volume ({max_volume}) is negative")
+
+        self._participation_rate: Decimal = participation_rate
+        self._max_volume: Decimal | None = max_volume
+
+    # endregion
+
+    # region Utilities
+
+    def _transform_ladders(self, instrument: Instrument, bids: list[BookLevel], asks: list[BookLevel]) -> tuple[list[BookLevel], list[BookLevel]]:
+        self._cap_side_in_place(instrument, bids)
+        self._cap_side_in_place(instrument, asks)
+        return bids, asks
+
+    def _cap_side_in_place(self, instrument: Instrument, levels: list[BookLevel]) -> None:
+        """Keep $levels best-first until the allowed volume of this side is used up."""
+        allowed_volume = sum((level.volume for level in levels), Decimal("0")) * self._participation_rate
+        if self._max_volume is not None:
+            allowed_volume = min(allowed_volume, self._max_volume)
+        allowed_volume = self._round_volume_down(instrument, allowed_volume)
+
+        for index, (price, volume) in enumerate(levels):
+            if volume >= allowed_volume:
+                # Reduce the last kept level to the remainder (whole increments only) and drop everything behind it
+                remaining_volume = self._round_volume_down(instrument, allowed_volume)
+                levels[index] = BookLevel(price, remaining_volume)
+                del levels[index + 1 if remaining_volume > 0 else index :]
+                return
+            allowed_volume -= volume
+
+    # endregion
+
+    # region Properties
+
+    @property
+    def participation_rate(self) -> Decimal:
+        return self._participation_rate
+
+    @property
+    def max_volume(self) -> Decimal | None:
+        return self._max_volume
+
+    # endregion
+
+    # region Magic
+
+    def __str__(self) -> str:
+        return f"{self.__class__.__name__}(participation_rate={self._participation_rate}, max_volume={self._max_volume})"
+
+    # endregion
@@ -26,6 +26,10 @@ class MarketDepthModel(Protocol):
 
     The resulting OrderBook is used by the broker as the single source of truth
     for order matching, margin calculations, and reporting.
+
+    Ready-made models (volume scaling, max levels, spread widening, participation cap) derive
+    from `LadderMarketDepthModel`, which memoizes the customized OrderBook per snapshot, and
+    compose with `CompositeMarketDepthModel`.
     """
 
     def customize_matching_liquidity(self, order_book: OrderBook) -> OrderBook:
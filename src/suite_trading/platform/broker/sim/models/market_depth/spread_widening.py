@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+from suite_trading.domain.instrument import Instrument
+from suite_trading.domain.market_data.order_book.order_book import BookLevel
+
+from .ladder import LadderMarketDepthModel
+
+
+class SpreadWideningMarketDepthModel(LadderMarketDepthModel):
+    """Moves all bids down and all asks up by $ticks_per_side ticks of the Instrument.
+
+    The spread grows by 2 × $ticks_per_side ticks, modelling a broker whose execution prices
+    are worse than the data feed. Volumes are unchanged; negative prices are allowed.
+    """
+
+    __slots__ = ("_ticks_per_side",)
+
+    # region Init
+
+    def __init__(self, ticks_per_side: int) -> None:
+        """Create a spread-widening depth model.
+
+        Args:
+            ticks_per_side: Number of price increments added to asks and subtracted from bids.
+
+        Raises:
+            ValueError: If $ticks_per_side is negative.
+        """
+        super().__init__()
+
+        # Raise: narrowing could cross the book
+        if ticks_per_side < 0:
+            raise ValueError(f"Cannot create `SpreadWideningMarketDepthModel` because $ticks_per_side ({ticks_per_side}) is negative")
+
+        self._ticks_per_side = ticks_per_side
+
+    # endregion
+
+    # region Utilities
+
+    def _transform_ladders(self, instrument: Instrument, bids: list[BookLevel], asks: list[BookLevel]) -> tuple[list[BookLevel], list[BookLevel]]:
+        price_shift = instrument.price_increment * self._ticks_per_side
+        bids = [BookLevel(price - price_shift, volume) for price, volume in bids]
+        asks = [BookLevel(price + price_shift, volume) for price, volume in asks]
+        return bids, asks
+
+    # endregion
+
+    # region Properties
+
+    @property
+    def ticks_per_side(self) -> int:
+        return self._ticks_per_side
+
+    # endregion
+
+    # region Magic
+
+    def __str__(self) -> str:
+        return f"{self.__class__.__name__}(ticks_per_side={self._ticks_per_side})"
+
+    # endregion
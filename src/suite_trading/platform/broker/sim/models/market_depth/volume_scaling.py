@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+from decimal import Decimal
+
+from suite_trading.domain.instrument import Instrument
+from suite_trading.domain.market_data.order_book.order_book import BookLevel
+from suite_trading.utils.numeric_tools import DecimalLike, as_decimal
+
+from .ladder import LadderMarketDepthModel
+
+
+class VolumeScalingMarketDepthModel(LadderMarketDepthModel):
+    """Multiplies the volume of every level by $volume_factor.
+
+    Use a factor below 1 to simulate thinner markets (more slippage for larger orders) and above
+    1 to test capacity without market impact. Prices are unchanged. Scaled volumes are rounded
+    down to the Instrument's $qty_increment; levels that round down to 0 are dropped.
+    """
+
+    __slots__ = ("_volume_factor",)
+
+    # region Init
+
+    def __init__(self, volume_factor: DecimalLike) -> None:
+        """Create a volume-scaling depth model.
+
+        Args:
+            volume_factor: Non-negative multiplier applied to each level's volume.
+
+        Raises:
+            ValueError: If $volume_factor is negative.
+        """
+        super().__init__()
+        volume_factor = as_decimal(volume_factor)
+
+        # Raise: volume cannot become negative
+        if volume_factor < 0:
+            raise ValueError(f"Cannot create `VolumeScalingMarketDepthModel` because $volume_factor ({volume_factor}) is negative")
+
+        self._volume_factor: Decimal = volume_factor
+
+    # endregion
+
+    # region Utilities
+
+    def _transform_ladders(self, instrument: Instrument, bids: list[BookLevel], asks: list[BookLevel]) -> tuple[list[BookLevel], list[BookLevel]]:
+        result = self._scale_side(instrument, bids), self._scale_side(instrument, asks)
+        return result
+
+    def _scale_side(self, instrument: Instrument, levels: list[BookLevel]) -> list[BookLevel]:
+        factor = self._volume_factor
+        result: list[BookLevel] = []
+        for price, volume in levels:
+            scaled_volume = self._round_volume_down(instrument, volume * factor)
+
+            # Skip: level too small to fill even one increment
+            if scaled_volume <= 0:
+                continue
+
+            result.append(BookLevel(price, scaled_volume))
+        return result
+
+    # endregion
+
+    # region Properties
+
+    @property
+    def volume_factor(self) -> Decimal:
+        return self._volume_factor
+
+    # endregion
+
+    # region Magic
+
+    def __str__(self) -> str:
+        return f"{self.__class__.__name__}(volume_factor={self._volume_factor})"
+
+    # endregion
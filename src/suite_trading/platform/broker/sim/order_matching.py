@@ -1,8 +1,10 @@
 from __future__ import annotations
 
-from typing import Callable
+from decimal import Decimal
 
 from suite_trading.domain.market_data.order_book.order_book import OrderBook, ProposedFill
+from suite_trading.domain.order.order_enums import TimeInForce
+from suite_trading.domain.order.order_state import OrderState
 from suite_trading.domain.order.orders import (
     Order,
     MarketOrder,
@@ -12,97 +14,135 @@ from suite_trading.domain.order.orders import (
 )
 
 
-# region Main
+# region Matching record
 
 
-def should_trigger_stop_condition(order: StopMarketOrder | StopLimitOrder, order_book: OrderBook) -> bool:
-    """Return True if a stop-like $order should trigger on the current $order_book.
+class OrderMatchingRecord:
+    """Compact, precompiled view of one Order for the matching inner loop.
 
-    This function is intentionally stop-specific.
+    The SimBroker compiles a record when an order is submitted, updated or its stop triggers
+    (see `compile_order_matching_record`), so matching a snapshot does not dispatch on the order
+    class or walk order properties. The `Order` stays the source of truth: fills are applied to
+    the Order and mirrored into $abs_unfilled_qty by `sync_fill`.
 
-    Note:
-        If the required quote side is missing (BUY needs best ask, SELL needs best bid), this returns False.
-        That means this predicate is a practical decision the broker can act on, not a strict "cannot evaluate" signal.
+    Attributes:
+        order: The compiled Order.
+        is_buy: True for buy orders.
+        side_sign: +1 for buy orders, -1 for sell orders.
+        is_trigger_pending: True while a stop-like order waits for its stop condition.
+        stop_price: Stop price of stop-like orders, else None.
+        limit_price: Limit price of limit-like orders, else None (market-like).
+        min_fill_price: Lowest acceptable fill price (sell limits), else None.
+        max_fill_price: Highest acceptable fill price (buy limits), else None.
+        abs_unfilled_qty: Remaining quantity to fill.
+        time_in_force: TimeInForce of the order.
+    """
 
-    Args:
-        order: Stop-like order to evaluate.
-        order_book: OrderBook snapshot to evaluate against.
+    __slots__ = (
+        "order",
+        "is_buy",
+        "side_sign",
+        "is_trigger_pending",
+        "stop_price",
+        "limit_price",
+        "min_fill_price",
+        "max_fill_price",
+        "abs_unfilled_qty",
+        "time_in_force",
+    )
 
-    Returns:
-        bool: True if the stop condition is met; otherwise False.
-    """
-    best_bid = order_book.best_bid
-    best_ask = order_book.best_ask
+    def __init__(
+        self,
+        order: Order,
+        is_buy: bool,
+        is_trigger_pending: bool,
+        stop_price: Decimal | None,
+        limit_price: Decimal | None,
+        abs_unfilled_qty: Decimal,
+        time_in_force: TimeInForce,
+    ) -> None:
+        self.order = order
+        self.is_buy = is_buy
+        self.side_sign = 1 if is_buy else -1
+        self.is_trigger_pending = is_trigger_pending
+        self.stop_price = stop_price
+        self.limit_price = limit_price
+        self.min_fill_price = None if is_buy else limit_price
+        self.max_fill_price = limit_price if is_buy else None
+        self.abs_unfilled_qty = abs_unfilled_qty
+        self.time_in_force = time_in_force
+
+    def sync_fill(self, abs_qty: Decimal) -> None:
+        """Mirror a fill of $abs_qty that was applied to $order."""
+        self.abs_unfilled_qty -= abs_qty
+
+    def __str__(self) -> str:
+        return f"{self.__class__.__name__}(order_id={self.order.id}, side_sign={self.side_sign}, stop_price={self.stop_price}, limit_price={self.limit_price}, abs_unfilled_qty={self.abs_unfilled_qty})"
+
+    def __repr__(self) -> str:
+        return self.__str__()
+
+
+def compile_order_matching_record(order: Order) -> OrderMatchingRecord:
+    """Compile $order into an `OrderMatchingRecord` for its current state.
 
-    if order.is_buy:
-        if best_ask is None:
-            return False
-        return best_ask.price >= order.stop_price
+    Raises:
+        ValueError: If the order type is unsupported by the simulator, or a non-stop order is TRIGGER_PENDING.
+    """
+    # Dispatch on the order class once per compile instead of once per snapshot
+    if isinstance(order, StopLimitOrder):
+        stop_price, limit_price = order.stop_price, order.limit_price
+    elif isinstance(order, LimitOrder):
+        stop_price, limit_price = None, order.limit_price
+    elif isinstance(order, StopMarketOrder):
+        stop_price, limit_price = order.stop_price, None
+    elif isinstance(order, MarketOrder):
+        stop_price, limit_price = None, None
+    else:
+        raise ValueError(f"Cannot call `compile_order_matching_record` because order type is unsupported for order $id ('{order.id}') with class '{order.__class__.__name__}'")
 
-    if best_bid is None:
-        return False
-    return best_bid.price <= order.stop_price
+    is_trigger_pending = order.state == OrderState.TRIGGER_PENDING
 
+    # Raise: TRIGGER_PENDING is valid only for stop-like orders
+    if is_trigger_pending and stop_price is None:
+        raise ValueError(f"Cannot call `compile_order_matching_record` because $order.state is TRIGGER_PENDING, which is valid only for StopMarketOrder and StopLimitOrder (got '{order.__class__.__name__}', $id='{order.id}')")
 
-def simulate_fills_for_market_order(order: Order, order_book: OrderBook) -> list[ProposedFill]:
-    """Simulate fills for a market-like order from the other side of the book (best price first).
+    result = OrderMatchingRecord(order, order.is_buy, is_trigger_pending, stop_price, limit_price, order.abs_unfilled_quantity, order.time_in_force)
+    return result
 
-    Returns fills as price/signed_qty/timestamp triplets. Fees are not included. Negative prices are allowed.
 
-    Args:
-        order: Order to fill (MarketOrder or any market-like order such as a triggered StopMarketOrder).
-        order_book: OrderBook snapshot for the simulation.
+def should_trigger_stop_record(record: OrderMatchingRecord, order_book: OrderBook) -> bool:
+    """Return True if the stop condition of TRIGGER_PENDING $record is met on $order_book.
 
-    Returns:
-        list[ProposedFill]: Fills (price, signed_qty, timestamp); fees not included.
+    A buy stop triggers when best ask >= stop price, a sell stop when best bid <= stop price; a
+    missing quote side never triggers.
     """
-    fills = order_book.simulate_fills(target_signed_qty=order.signed_unfilled_quantity)
-    return fills
+    if record.is_buy:
+        asks = order_book.asks
+        return bool(asks) and asks[0].price >= record.stop_price
 
+    bids = order_book.bids
+    return bool(bids) and bids[0].price <= record.stop_price
 
-def simulate_fills_for_limit_order(order: Order, order_book: OrderBook) -> list[ProposedFill]:
-    """Simulate fills for a limit-like order at prices equal to or better than $order.limit_price.
 
-    Args:
-        order: LimitOrder to fill (LimitOrder or a triggered StopLimitOrder).
-        order_book: OrderBook snapshot for fill simulation.
+def simulate_fills_for_record(record: OrderMatchingRecord, order_book: OrderBook) -> list[ProposedFill]:
+    """Simulate fills for $record against $order_book: limit-like within its limit price, market-like across the whole side.
 
     Returns:
         list[ProposedFill]: Fills (price, signed_qty, timestamp); fees not included.
     """
-    # Narrowing for the type checker
-    if not isinstance(order, (LimitOrder, StopLimitOrder)):
-        raise ValueError(f"Cannot call `simulate_fills_for_limit_order` because order class '{order.__class__.__name__}' does not have a limit price")
-
-    fills = order_book.simulate_fills(
-        target_signed_qty=order.signed_unfilled_quantity,
-        min_price=order.limit_price if order.is_sell else None,
-        max_price=order.limit_price if order.is_buy else None,
+    result = order_book.simulate_fills(
+        target_signed_qty=record.abs_unfilled_qty * record.side_sign,
+        min_price=record.min_fill_price,
+        max_price=record.max_fill_price,
     )
-    return fills
-
-
-def select_simulate_fills_function_for_order(order: Order) -> Callable[[Order, OrderBook], list[ProposedFill]]:
-    """Return the fill-simulation function for $order or raise if unsupported.
-
-    Args:
-        order: The order to simulate.
+    return result
 
-    Returns:
-        Callable that returns `ProposedFill` items (price, signed_qty, timestamp). Fees are handled elsewhere.
 
-    Raises:
-        ValueError: If the order type is unsupported by the simulator.
-    """
-    if isinstance(order, MarketOrder):
-        return simulate_fills_for_market_order
-    if isinstance(order, LimitOrder):
-        return simulate_fills_for_limit_order
-    if isinstance(order, StopMarketOrder):
-        return simulate_fills_for_market_order
-    if isinstance(order, StopLimitOrder):
-        return simulate_fills_for_limit_order
-    raise ValueError(f"Cannot call `select_simulate_fills_function_for_order` because order type is unsupported for order $id ('{order.id}') with class '{order.__class__.__name__}'")
+def compute_fillable_qty_for_record(record: OrderMatchingRecord, order_book: OrderBook) -> Decimal:
+    """Return visible volume on the opposite side of $order_book that $record could take now (O(log L))."""
+    result = order_book.compute_fillable_qty(record.is_buy, min_price=record.min_fill_price, max_price=record.max_fill_price)
+    return result
 
 
 # endregion
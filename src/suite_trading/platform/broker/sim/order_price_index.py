@@ -0,0 +1,222 @@
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right, insort
+from decimal import Decimal
+from itertools import count
+from operator import itemgetter
+
+from suite_trading.domain.market_data.order_book.order_book import OrderBook
+from suite_trading.domain.order.order_enums import TimeInForce
+from suite_trading.domain.order.orders import Order
+from suite_trading.platform.broker.sim.order_matching import OrderMatchingRecord, compile_order_matching_record
+
+_get_price = itemgetter(0)
+
+
+class OrderPriceIndex:
+    """Active orders of one Instrument, indexed by the top-of-book price at which they need matching.
+
+    Orders are placed into one of these groups:
+        - Buy stops / sell stops (TRIGGER_PENDING): sorted by $stop_price. A buy stop triggers when
+          best ask >= stop price, a sell stop when best bid <= stop price.
+        - Buy limits / sell limits (resting GTC/GTD/DAY limit-like orders): sorted by $limit_price.
+          A buy limit can fill when best ask <= limit price, a sell limit when best bid >= limit price.
+        - Unconditional: market-like orders and IOC/FOK orders, which must be matched on every snapshot.
+
+    For a new top of book, `list_orders_to_match` finds triggered stops and crossing limits by
+    binary search, so the cost is O(log n + k) for k candidates instead of O(n) over all orders.
+    Candidates are returned in submission order, which keeps matching deterministic.
+
+    Each order is kept as an `OrderMatchingRecord`, compiled on `add` and recompiled on `refresh`
+    (call it after a stop triggers or the order is updated). Groups are chosen from the record,
+    and `list_records_to_match` hands the records straight to the matching kernel.
+    """
+
+    __slots__ = (
+        "_sequence_counter",
+        "_record_by_sequence",
+        "_sequence_by_order_id",
+        "_group_by_sequence",
+        "_buy_stops",
+        "_sell_stops",
+        "_buy_limits",
+        "_sell_limits",
+        "_unconditional_sequences",
+    )
+
+    # region Init
+
+    def __init__(self) -> None:
+        self._sequence_counter = count()
+        self._record_by_sequence: dict[int, OrderMatchingRecord] = {}
+        self._sequence_by_order_id: dict[str, int] = {}
+        self._group_by_sequence: dict[int, list[tuple[Decimal, int]] | None] = {}  # None = unconditional
+
+        # Sorted (price, sequence) keys
+        self._buy_stops: list[tuple[Decimal, int]] = []
+        self._sell_stops: list[tuple[Decimal, int]] = []
+        self._buy_limits: list[tuple[Decimal, int]] = []
+        self._sell_limits: list[tuple[Decimal, int]] = []
+        self._unconditional_sequences: set[int] = set()
+
+    # endregion
+
+    # region Main
+
+    def add(self, order: Order) -> OrderMatchingRecord:
+        """Start tracking $order and place it by its current state and prices.
+
+        Returns:
+            OrderMatchingRecord: The compiled record of $order.
+        """
+        # Raise: each order can be tracked only once
+        if order.id in self._sequence_by_order_id:
+            raise ValueError(f"Cannot call `OrderPriceIndex.add` because Order $id ('{order.id}') is already tracked")
+
+        record = compile_order_matching_record(order)
+        sequence = next(self._sequence_counter)
+        self._record_by_sequence[sequence] = record
+        self._sequence_by_order_id[order.id] = sequence
+        self._place(sequence, record)
+        return record
+
+    def remove(self, order: Order) -> None:
+        """Stop tracking $order (no-op if it is not tracked)."""
+        sequence = self._sequence_by_order_id.pop(order.id, None)
+
+        # Skip: order is not tracked
+        if sequence is None:
+            return
+
+        self._unplace(sequence)
+        del self._record_by_sequence[sequence]
+
+    def refresh(self, order: Order) -> OrderMatchingRecord | None:
+        """Recompile and re-place $order after its state changed (e.g. a stop order triggered).
+
+        Returns:
+            OrderMatchingRecord | None: The new record, or None if $order is not tracked.
+        """
+        sequence = self._sequence_by_order_id.get(order.id)
+
+        # Skip: order is not tracked
+        if sequence is None:
+            return None
+
+        self._unplace(sequence)
+        record = self._record_by_sequence[sequence] = compile_order_matching_record(order)
+        self._place(sequence, record)
+        return record
+
+    def get_record(self, order: Order) -> OrderMatchingRecord | None:
+        """Return the record of $order, or None if it is not tracked."""
+        sequence = self._sequence_by_order_id.get(order.id)
+        result = self._record_by_sequence[sequence] if sequence is not None else None
+        return result
+
+    def list_orders_to_match(self, order_book: OrderBook) -> list[Order]:
+        """Return orders that need matching against $order_book, in submission order (see `list_records_to_match`)."""
+        result = [record.order for record in self.list_records_to_match(order_book)]
+        return result
+
+    def list_records_to_match(self, order_book: OrderBook) -> list[OrderMatchingRecord]:
+        """Return records of orders that need matching against $order_book, in submission order.
+
+        Returns unconditional orders, stops whose trigger condition is met and resting limits that
+        cross the top of $order_book. All other orders cannot trigger or fill on this snapshot.
+        """
+        sequences: set[int] = set(self._unconditional_sequences)
+
+        asks = order_book.asks
+        if asks:
+            ask_price = asks[0].price
+            buy_stops, buy_limits = self._buy_stops, self._buy_limits
+            sequences.update(sequence for _, sequence in buy_stops[: bisect_right(buy_stops, ask_price, key=_get_price)])
+            sequences.update(sequence for _, sequence in buy_limits[bisect_left(buy_limits, ask_price, key=_get_price) :])
+
+        bids = order_book.bids
+        if bids:
+            bid_price = bids[0].price
+            sell_stops, sell_limits = self._sell_stops, self._sell_limits
+            sequences.update(sequence for _, sequence in sell_stops[bisect_left(sell_stops, bid_price, key=_get_price) :])
+            sequences.update(sequence for _, sequence in sell_limits[: bisect_right(sell_limits, bid_price, key=_get_price)])
+
+        record_by_sequence = self._record_by_sequence
+        result = [record_by_sequence[sequence] for sequence in sorted(sequences)]
+        return result
+
+    def has_orders_to_match_at(self, bid_price: Decimal, ask_price: Decimal) -> bool:
+        """Return True if `list_orders_to_match` would return any order for a top of book at
+        $bid_price / $ask_price. Only the extreme price of each group is checked (O(1)).
+        """
+        if self._unconditional_sequences:
+            return True
+
+        buy_stops, buy_limits = self._buy_stops, self._buy_limits
+        if (buy_stops and buy_stops[0][0] <= ask_price) or (buy_limits and buy_limits[-1][0] >= ask_price):
+            return True
+
+        sell_stops, sell_limits = self._sell_stops, self._sell_limits
+        result = bool((sell_stops and sell_stops[-1][0] >= bid_price) or (sell_limits and sell_limits[0][0] <= bid_price))
+        return result
+
+    def list_orders(self) -> list[Order]:
+        """Return all tracked orders in submission order."""
+        return [record.order for record in self._record_by_sequence.values()]
+
+    # endregion
+
+    # region Utilities
+
+    def _place(self, sequence: int, record: OrderMatchingRecord) -> None:
+        group = self._select_group(record)
+        self._group_by_sequence[sequence] = group
+
+        if group is None:
+            self._unconditional_sequences.add(sequence)
+            return
+
+        insort(group, (self._get_group_price(group, record), sequence))
+
+    def _unplace(self, sequence: int) -> None:
+        group = self._group_by_sequence.pop(sequence)
+
+        if group is None:
+            self._unconditional_sequences.discard(sequence)
+            return
+
+        price = self._get_group_price(group, self._record_by_sequence[sequence])
+        del group[bisect_left(group, (price, sequence))]
+
+    def _select_group(self, record: OrderMatchingRecord) -> list[tuple[Decimal, int]] | None:
+        if record.is_trigger_pending:
+            return self._buy_stops if record.is_buy else self._sell_stops
+
+        # IOC/FOK must be matched (and expired) on the next snapshot, even when not crossing
+        if record.limit_price is not None and record.time_in_force not in (TimeInForce.IOC, TimeInForce.FOK):
+            return self._buy_limits if record.is_buy else self._sell_limits
+
+        return None
+
+    def _get_group_price(self, group: list[tuple[Decimal, int]], record: OrderMatchingRecord) -> Decimal:
+        if group is self._buy_stops or group is self._sell_stops:
+            return record.stop_price
+        return record.limit_price
+
+    # endregion
+
+    # region Magic
+
+    def __len__(self) -> int:
+        return len(self._record_by_sequence)
+
+    def __contains__(self, order: Order) -> bool:
+        return order.id in self._sequence_by_order_id
+
+    def __str__(self) -> str:
+        return f"{self.__class__.__name__}(orders={len(self)}, stops={len(self._buy_stops)}/{len(self._sell_stops)}, limits={len(self._buy_limits)}/{len(self._sell_limits)}, unconditional={len(self._unconditional_sequences)})"
+
+    def __repr__(self) -> str:
+        return self.__str__()
+
+    # endregion
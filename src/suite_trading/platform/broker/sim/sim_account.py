@@ -29,10 +29,20 @@ class SimAccount(Account):
         *,
         id: str,
         initial_funds: Mapping[Currency, Money] | None = None,
+        keep_paid_fees: bool = True,
     ) -> None:
+        """Create a simulated account.
+
+        Args:
+            id: Account identifier.
+            initial_funds: Funds per currency at creation.
+            keep_paid_fees: If True, every `PaidFee` is kept for `list_paid_fees`. Disable for long
+                runs that record fees elsewhere (e.g. in a `TradeLedger`).
+        """
         self._id = id
         self._funds_by_currency: dict[Currency, Money] = dict(initial_funds or {})
         self._blocked_margins_by_instrument: dict[Instrument, BlockedMargins] = {}
+        self._keep_paid_fees = keep_paid_fees
         self._paid_fees: list[PaidFee] = []
 
     # endregion
@@ -125,7 +135,7 @@ class SimAccount(Account):
         Pay a fee and record it.
 
         This is a high-level operation that subtracts from $funds and stores a
-        `PaidFee` record. Only strictly positive $amount is allowed.
+        `PaidFee` record (unless $keep_paid_fees is False). Only strictly positive $amount is allowed.
 
         Args:
             timestamp: When the fee was applied.
@@ -143,7 +153,8 @@ class SimAccount(Account):
         self.remove_funds(amount)
 
         # Record fee
-        self._paid_fees.append(PaidFee(timestamp=timestamp, amount=amount, description=description))
+        if self._keep_paid_fees:
+            self._paid_fees.append(PaidFee(timestamp=timestamp, amount=amount, description=description))
 
     def list_paid_fees(self) -> Sequence[PaidFee]:
         """Implements: Account.list_paid_fees
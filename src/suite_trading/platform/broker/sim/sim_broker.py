@@ -5,8 +5,9 @@ from typing import Callable, Sequence
 from decimal import Decimal
 import logging
 
-from suite_trading.platform.broker.account import Account
+from suite_trading.platform.broker.account import Account, BlockedMargins
 from suite_trading.platform.broker.sim.models.fill.distribution import DistributionFillModel
+from suite_trading.platform.broker.sim.account_valuation import AccountValuation
 from suite_trading.platform.broker.sim.sim_account import SimAccount
 from suite_trading.domain.monetary.currency import Currency
 from suite_trading.domain.monetary.currency_registry import USD
@@ -16,27 +17,35 @@ from suite_trading.domain.order.order_state import OrderAction, OrderStateCatego
 from suite_trading.domain.order.order_fill import OrderFill
 from suite_trading.domain.instrument import Instrument
 from suite_trading.platform.broker.position import Position
-from suite_trading.platform.broker.broker import Broker
-from suite_trading.platform.broker.simulated_broker_protocol import SimulatedBroker
+from suite_trading.platform.broker.trade_ledger import TradeLedger
+from suite_trading.platform.broker.broker import Broker, OrderSubmissionValidator
+from suite_trading.platform.broker.simulated_broker_protocol import OrderBookDemandReporter, PriceTrajectoryProcessor, SimulatedBroker, SimulatedBrokerGroupMember
 from suite_trading.platform.broker.sim.models.market_depth.protocol import MarketDepthModel
-from suite_trading.platform.broker.sim.models.market_depth.pass_through import PassThroughMarketDepthModel
-from suite_trading.platform.broker.sim.models.fee.protocol import FeeModel
+from suite_trading.platform.broker.sim.models.fee.protocol import FeeModel, IncrementalFeeModel
+from suite_trading.platform.broker.sim.models.fee.fee_context import FeeContext
 from suite_trading.platform.broker.sim.models.fee.fixed_fee import FixedFeeModel
 from suite_trading.domain.monetary.money import Money
-from suite_trading.platform.broker.sim.models.margin.protocol import MarginModel
+from suite_trading.platform.broker.sim.models.margin.margin_context import MarginContext
+from suite_trading.platform.broker.sim.models.margin.protocol import MarginContextProvider, MarginModel
 from suite_trading.platform.broker.sim.models.margin.fixed_ratio import FixedRatioMarginModel
 from suite_trading.platform.broker.sim.models.fill.protocol import FillModel
+from suite_trading.platform.broker.sim.models.latency.protocol import LatencyModel
+from suite_trading.domain.market_data.order_book.ohlc_price_trajectory import OhlcPriceTrajectory
 from suite_trading.domain.market_data.order_book.order_book import OrderBook, ProposedFill
+from suite_trading.platform.broker.sim.sim_broker_group import SimBrokerGroup
 from suite_trading.platform.broker.sim.order_matching import (
-    should_trigger_stop_condition,
-    select_simulate_fills_function_for_order,
+    OrderMatchingRecord,
+    compile_order_matching_record,
+    compute_fillable_qty_for_record,
+    should_trigger_stop_record,
+    simulate_fills_for_record,
 )
 from suite_trading.utils.datetime_tools import format_dt, is_utc
 
 logger = logging.getLogger(__name__)
 
 
-class SimBroker(Broker, SimulatedBroker):
+class SimBroker(Broker, OrderSubmissionValidator, SimulatedBroker, OrderBookDemandReporter, PriceTrajectoryProcessor, SimulatedBrokerGroupMember):
     """Simulated broker for backtesting and paper trading.
 
     This class implements the single-account `Broker` protocol using simulated
@@ -58,6 +67,17 @@ class SimBroker(Broker, SimulatedBroker):
       account.
     - Pattern 2 (separate accounts): each Strategy uses unique `SimBroker` instance
       for isolated results while still sharing the engine's global simulated time.
+    - Pattern 3 (many separate accounts): create the `SimBroker` instances with a
+      shared `SimBrokerGroup`, so simulated time, market-depth customization and
+      matching run once per snapshot for all accounts (see `SimBrokerGroup`).
+
+    With a $latency_model, submit, cancel and update requests take effect only once simulated
+    time passes their arrival time (see `LatencyModel`). Until then, the order keeps its previous
+    state: a submitted order is not live yet and an order being cancelled can still fill.
+
+    Market-side state (simulated time, latest OrderBooks, price index of active orders,
+    expiry schedule, requests in flight) lives in the `SimBrokerGroup` of this account; a `SimBroker` created
+    without $group gets a private group.
 
     Public API is grouped under `Protocol Broker` and `Protocol
     SimulatedBroker` regions; other methods are under `Utilities`.
@@ -72,45 +92,79 @@ class SimBroker(Broker, SimulatedBroker):
         margin_model: MarginModel | None = None,
         fee_model: FeeModel | None = None,
         fill_model: FillModel | None = None,
+        latency_model: LatencyModel | None = None,
+        group: SimBrokerGroup | None = None,
+        keep_order_fills: bool = True,
+        equity_sample_interval: timedelta | None = None,
     ) -> None:
         """Create a simulation broker.
 
         Args:
-            depth_model: MarketDepthModel used for matching. If None, a default model is built by
-                `_build_default_market_depth_model()`.
+            depth_model: MarketDepthModel used for matching. If None, the default model of
+                `SimBrokerGroup` is used. Must be None when $group is given (the group's model is used).
             margin_model: MarginModel used for margin calculations. If None, defaults to zero margin
                 via `_build_default_margin_model()`.
             fee_model: FeeModel used to compute commissions. If None, defaults to zero per-unit
                 commission via `_build_default_fee_model()`.
             fill_model: FillModel used for fill simulation. If None, defaults to deterministic
                 on-touch fills via `_build_default_fill_model()`.
+            latency_model: LatencyModel that delays submit, cancel and update requests. If None,
+                requests take effect immediately.
+            group: SimBrokerGroup shared with other accounts. If None, a private group is created.
+            keep_order_fills: If True, every `OrderFill` (and the account's `PaidFee`) is kept for
+                the whole run. If False, fills and fees are only recorded in the columnar $ledger,
+                and $fee_model must be an `IncrementalFeeModel` (it reads running volume totals
+                from `FeeContext` instead of the fill history).
+            equity_sample_interval: If set, open positions are marked to market on every OrderBook
+                and equity is sampled at this cadence of simulated time (see `AccountValuation`).
+                If None, no valuation runs.
+
+        Raises:
+            ValueError: If both $depth_model and $group are given, or if $keep_order_fills is False
+                and $fee_model is not an `IncrementalFeeModel`.
         """
+        # Raise: accounts of a shared group use the group's depth model
+        if group is not None and depth_model is not None:
+            raise ValueError("Cannot create `SimBroker` because both $depth_model and $group are set; configure the depth model on the SimBrokerGroup instead")
+        # Raise: without kept fills, a FeeModel reading $previous_order_fills would silently see no history
+        if not keep_order_fills and fee_model is not None and not isinstance(fee_model, IncrementalFeeModel):
+            raise ValueError(f"Cannot create `SimBroker` because $keep_order_fills is False and $fee_model ({type(fee_model).__name__}) is not an `IncrementalFeeModel`; it would receive no $previous_order_fills")
+
         # CONNECTION
         self._connected: bool = False
 
+        # VALUATION (mark-to-market and equity curve; optional)
+        self._valuation: AccountValuation | None = AccountValuation(sample_interval=equity_sample_interval) if equity_sample_interval is not None else None
+
+        # MARKET SIDE (simulated time, depth model, order index, expiry schedule, latest OrderBooks)
+        self._group: SimBrokerGroup = group or SimBrokerGroup(depth_model=depth_model)
+        self._group._add_account(self)
+
         # MODELS
-        self._depth_model: MarketDepthModel = depth_model or self._build_default_market_depth_model()
         self._margin_model: MarginModel = margin_model or self._build_default_margin_model()
         self._fee_model: FeeModel = fee_model or self._build_default_fee_model()
+        self._incremental_fee_model: IncrementalFeeModel | None = self._fee_model if isinstance(self._fee_model, IncrementalFeeModel) else None
         self._fill_model: FillModel = fill_model or self._build_default_fill_model()
+        self._latency_model: LatencyModel | None = latency_model
+        self._margin_context_provider: MarginContextProvider | None = self._margin_model if isinstance(self._margin_model, MarginContextProvider) else None
+        self._margin_context_by_instrument: dict[Instrument, MarginContext] = {}  # Latest per-snapshot margin rates; reused while the OrderBook is the same
 
         # ORDERS, ORDER FILLS, POSITIONS for this simulated account instance
-        self._orders_by_id: dict[str, Order] = {}
-        self._order_fill_history: list[OrderFill] = []  # Track fills per Broker (account scope); allows implementing volume-tiered fees
+        self._orders_by_id: dict[str, Order] = {}  # Also indexed by instrument and trigger/limit price in $_group
+        self._keep_order_fills = keep_order_fills
+        self._order_fill_history: list[OrderFill] = []  # Track fills per Broker (account scope)
+        self._fee_context = FeeContext()  # Running volume/notional totals (account scope); allows O(1) volume-tiered fees
         self._position_by_instrument: dict[Instrument, Position] = {}
 
+        # LEDGER (columnar record of fills, fees and margin changes; always kept)
+        self._ledger = TradeLedger()
+
         # Callbacks (where this broker should propagate fills and order-state updates?)
         self._order_fill_callback: Callable[[OrderFill], None] | None = None
         self._order_state_update_callback: Callable[[Order], None] | None = None
 
         # ACCOUNT for this simulated broker instance (single logical account)
-        self._account: Account = SimAccount(id="SIM")
-
-        # SIMULATED TIME (engine-injected)
-        self._timeline_dt: datetime | None = None
-
-        # ORDER BOOK CACHE (last known OrderBook per instrument for this account)
-        self._latest_order_book_by_instrument: dict[Instrument, OrderBook] = {}
+        self._account: Account = SimAccount(id="SIM", keep_paid_fees=keep_order_fills)
 
     # endregion
 
@@ -156,84 +210,56 @@ class SimBroker(Broker, SimulatedBroker):
     def submit_order(self, order: Order) -> None:
         """Implements: Broker.submit_order
 
-        Validate and register an $order, publishing each state transition.
+        Validate and register an $order, publishing each state transition. With a LatencyModel,
+        the order is registered when its submission arrives.
         """
-
-        # VALIDATE
         # Raise: broker must be connected to accept new orders
         if not self._connected:
             raise RuntimeError(f"Cannot call `submit_order` because $connected ({self._connected}) is False")
 
-        # Raise: enforce unique $id among active orders
-        if order.id in self._orders_by_id:
-            raise ValueError(f"Cannot call `submit_order` because $id ('{order.id}') already exists")
-
-        # Raise: DAY/GTD submission requires broker timeline time
-        if order.time_in_force in (TimeInForce.DAY, TimeInForce.GTD) and self._timeline_dt is None:
-            raise ValueError(f"Cannot call `submit_order` because $time_in_force ({order.time_in_force.value}) requires broker time, but $timeline_dt is None")
-
-        if order.time_in_force is TimeInForce.GTD:
-            # Raise: GTD orders must provide timezone-aware UTC $good_till_dt
-            if order.good_till_dt is None:
-                raise ValueError(f"Cannot call `submit_order` because $time_in_force is GTD but $good_till_dt is None for Order $id ('{order.id}')")
+        self._validate_order_for_submission(order, "submit_order")
+        self._request_submission(order)
 
-            # Raise: keep time-in-force comparisons deterministic in UTC
-            if not is_utc(order.good_till_dt):
-                raise ValueError(f"Cannot call `submit_order` because $good_till_dt ({format_dt(order.good_till_dt)}) is not timezone-aware UTC for GTD Order $id ('{order.id}')")
-
-            # Raise: GTD deadline must not be earlier than broker $timeline_dt at submission
-            if order.good_till_dt < self._timeline_dt:
-                raise ValueError(f"Cannot call `submit_order` because $good_till_dt ({format_dt(order.good_till_dt)}) is earlier than broker $timeline_dt ({format_dt(self._timeline_dt)}) for GTD Order $id ('{order.id}')")
-
-        # COMPUTE & DECIDE
-        is_stop_order = isinstance(order, (StopMarketOrder, StopLimitOrder))
-        order_actions_to_apply = [OrderAction.ARM_TRIGGER] if is_stop_order else [OrderAction.ACCEPT, OrderAction.ACCEPT]
-
-        # ACTIONS
-        # Set submission time into order
-        if self._timeline_dt is not None:
-            order._set_submitted_dt_once(self._timeline_dt)
-
-        # Store order
-        self._orders_by_id[order.id] = order
-
-        # Do order-state transitions
-        for action in order_actions_to_apply:
-            self._apply_order_action(order, action)
+    def submit_orders(self, orders: list[Order]) -> None:
+        """Implements: Broker.submit_orders
 
-        # Handle order expiration
-        if self._should_expire_order_now(order):
-            self._apply_order_action(order, OrderAction.EXPIRE)
-            return
+        Validate all $orders first, so none is submitted if one is invalid, then register them in
+        list order (see `submit_order`).
+        """
+        self._validate_orders_for_submission(orders, "submit_orders")
 
-        # Match order with order-book
-        last_order_book = self._latest_order_book_by_instrument.get(order.instrument)
-        if last_order_book is not None:
-            self._match_order_against_order_book(order, last_order_book)
+        for order in orders:
+            self._request_submission(order)
 
     def cancel_order(self, order: Order) -> None:
         """Implements: Broker.cancel_order
 
         Request cancellation of a tracked $order. If the order is already in a terminal
-        category, log a warning and return without emitting transitions.
+        category, log a warning and return without emitting transitions. With a LatencyModel,
+        the cancel is applied when it arrives (unless the order finished in the meantime).
         """
         # Raise: broker must be connected to act on orders
         if not self._connected:
             raise RuntimeError(f"Cannot call `cancel_order` because $connected ({self._connected}) is False")
 
-        # Raise: order must be known to the broker
-        tracked_order = self.get_order(order.id)
-        if tracked_order is None:
-            raise ValueError(f"Cannot call `cancel_order` because $id ('{order.id}') is not tracked")
+        self._validate_order_for_cancel(order, "cancel_order")
+        self._request_cancel(order)
 
-        # Skip: order is already in terminal state; warn and return
-        if tracked_order.state_category == OrderStateCategory.TERMINAL:
-            logger.warning(f"Bad logic: Ignoring `cancel_order` for terminal Order $id ('{order.id}') with $state_category ({tracked_order.state_category.name})")
-            return
+    def cancel_orders(self, orders: list[Order]) -> None:
+        """Implements: Broker.cancel_orders
+
+        Validate all $orders first, so none is cancelled if one is not tracked, then cancel them
+        in list order (see `cancel_order`).
+        """
+        # Raise: broker must be connected to act on orders
+        if not self._connected:
+            raise RuntimeError(f"Cannot call `cancel_orders` because $connected ({self._connected}) is False")
 
-        self._apply_order_action(tracked_order, OrderAction.CANCEL)
-        if tracked_order.state == OrderState.PENDING_CANCEL:
-            self._apply_order_action(tracked_order, OrderAction.ACCEPT)  # PENDING_CANCEL + ACCEPT = CANCELLED
+        for order in orders:
+            self._validate_order_for_cancel(order, "cancel_orders")
+
+        for order in orders:
+            self._request_cancel(order)
 
     def update_order(self, order: Order) -> None:
         """Implements: Broker.update_order
@@ -242,28 +268,30 @@ class SimBroker(Broker, SimulatedBroker):
 
         Validates that the broker is connected, the $order is tracked, not in a terminal
         category, and that immutable fields ($instrument) have not changed. Emits UPDATE → ACCEPT
-        transitions via the centralized notifier.
+        transitions via the centralized notifier (with a LatencyModel, when the update arrives).
         """
         # Raise: broker must be connected to act on orders
         if not self._connected:
             raise RuntimeError(f"Cannot call `update_order` because $connected ({self._connected}) is False")
 
-        # Raise: order must be known to the broker
-        tracked_order = self.get_order(order.id)
-        if tracked_order is None:
-            raise ValueError(f"Cannot call `update_order` because $id ('{order.id}') is not tracked")
+        self._validate_order_for_update(order, "update_order")
+        self._request_update(order)
 
-        # Raise: terminal orders cannot be modified
-        if tracked_order.state_category == OrderStateCategory.TERMINAL:
-            raise ValueError(f"Cannot call `update_order` because Order $state_category ({tracked_order.state_category.name}) is terminal.")
+    def update_orders(self, orders: list[Order]) -> None:
+        """Implements: Broker.update_orders
 
-        # Raise: instrument cannot be changed via modification
-        if tracked_order.instrument != order.instrument:
-            raise ValueError(f"Cannot call `update_order` because $instrument changed from '{tracked_order.instrument}' to '{order.instrument}' for Order $id ('{order.id}')")
+        Validate all $orders first, so none is updated if one is invalid, then update them in
+        list order (see `update_order`).
+        """
+        # Raise: broker must be connected to act on orders
+        if not self._connected:
+            raise RuntimeError(f"Cannot call `update_orders` because $connected ({self._connected}) is False")
 
-        # Transitions: UPDATE → ACCEPT
-        self._apply_order_action(tracked_order, OrderAction.UPDATE)
-        self._apply_order_action(tracked_order, OrderAction.ACCEPT)
+        for order in orders:
+            self._validate_order_for_update(order, "update_orders")
+
+        for order in orders:
+            self._request_update(order)
 
     def list_active_orders(self) -> list[Order]:
         """Implements: Broker.list_active_orders
@@ -318,6 +346,12 @@ class SimBroker(Broker, SimulatedBroker):
         """
         return self._position_by_instrument.get(instrument)
 
+    def has_open_position(self, instrument: Instrument) -> bool:
+        """Return True if this account has non-flat exposure in $instrument (O(1))."""
+        position = self._position_by_instrument.get(instrument)
+        result = position is not None and not position.is_flat
+        return result
+
     def get_signed_position_qty(self, instrument: Instrument) -> Decimal:
         """Implements: Broker.get_signed_position_qty
 
@@ -353,6 +387,17 @@ class SimBroker(Broker, SimulatedBroker):
 
     # endregion
 
+    # region Protocol OrderSubmissionValidator
+
+    def validate_orders_for_submission(self, orders: list[Order]) -> None:
+        """Implements: OrderSubmissionValidator.validate_orders_for_submission
+
+        Run the checks of `submit_orders` without submitting anything (errors name `submit_orders`).
+        """
+        self._validate_orders_for_submission(orders, "submit_orders")
+
+    # endregion
+
     # region Protocol SimulatedBroker
 
     def set_timeline_dt(self, dt: datetime) -> None:
@@ -362,52 +407,79 @@ class SimBroker(Broker, SimulatedBroker):
 
         The `TradingEngine` injects `$dt` before Strategy callbacks and before routing
         derived OrderBook snapshots so order lifecycle decisions can be deterministic
-        and independent of wall-clock time.
+        and independent of wall-clock time. Time is kept by the `SimBrokerGroup` of this
+        account, so this moves the time of all accounts in the group.
 
         Args:
             dt: Simulated time for the current engine event (timezone-aware UTC).
         """
-        # Raise: broker timeline $dt must be timezone-aware UTC
-        if not is_utc(dt):
-            raise ValueError(f"Cannot call `set_timeline_dt` because $dt ({dt}) is not timezone-aware UTC")
-        # Raise: broker timeline $dt cannot move backwards
-        if self._timeline_dt is not None and dt < self._timeline_dt:
-            raise ValueError(f"Cannot call `set_timeline_dt` because new $dt ({format_dt(dt)}) is earlier than current $timeline_dt ({format_dt(self._timeline_dt)})")
-
-        self._timeline_dt = dt
-
-        # Handle expired orders
-        for order in list(self._orders_by_id.values()):
-            if self._should_expire_order_now(order):
-                self._apply_order_action(order, OrderAction.EXPIRE)
+        self._group.set_timeline_dt(dt)
 
     def process_order_book(self, order_book: OrderBook) -> None:
         """Implements: SimulatedBroker.process_order_book
 
-        Process an OrderBook snapshot that drives order fills and order state updates.
+        Process an OrderBook snapshot that drives order fills and order state updates
+        (for all accounts in the `SimBrokerGroup` of this account).
 
         Args:
             order_book: OrderBook snapshot to process.
         """
-        # Raise: TradingEngine must set broker time before processing this snapshot
-        if self._timeline_dt is None:
-            raise ValueError(f"Cannot call `process_order_book` because $timeline_dt is None. TradingEngine must call `set_timeline_dt(order_book.timestamp)` immediately before calling `process_order_book` (got $order_book.timestamp={format_dt(order_book.timestamp)})")
-        # Raise: broker time must match the snapshot time exactly
-        if self._timeline_dt != order_book.timestamp:
-            raise ValueError(f"Cannot call `process_order_book` because $timeline_dt ({format_dt(self._timeline_dt)}) does not match $order_book.timestamp ({format_dt(order_book.timestamp)}). TradingEngine must call `set_timeline_dt(order_book.timestamp)` immediately before calling `process_order_book`")
+        self._group.process_order_book(order_book)
 
-        # Reusable variables
-        instrument = order_book.instrument
+    # endregion
+
+    # region Protocol PriceTrajectoryProcessor
+
+    def process_price_trajectory_point(self, trajectory: OhlcPriceTrajectory, index: int) -> None:
+        """Implements: PriceTrajectoryProcessor.process_price_trajectory_point
 
-        # Customize matching liquidity (simulates broker-specific environments)
-        customized_order_book = self._depth_model.customize_matching_liquidity(order_book)
-        # Store OrderBook
-        self._latest_order_book_by_instrument[instrument] = customized_order_book
+        Delegate point $index of $trajectory to the `SimBrokerGroup` of this account.
+        """
+        self._group.process_price_trajectory_point(trajectory, index)
+
+    # endregion
+
+    # region Protocol OrderBookDemandReporter
+
+    def needs_order_books(self, instrument: Instrument) -> bool:
+        """Implements: OrderBookDemandReporter.needs_order_books
 
-        # Process orders for this instrument
-        orders_for_instrument = [order for order in self._orders_by_id.values() if order.instrument == instrument]
-        for order in orders_for_instrument:
-            self._match_order_against_order_book(order, customized_order_book)
+        Return True if any account in the `SimBrokerGroup` of this account has an active order for $instrument.
+        """
+        return self._group.needs_order_books(instrument)
+
+    def set_latest_order_book(self, order_book: OrderBook) -> None:
+        """Implements: OrderBookDemandReporter.set_latest_order_book
+
+        Store $order_book as the latest snapshot of its Instrument in the `SimBrokerGroup` of this account.
+        """
+        self._group.set_latest_order_book(order_book)
+
+    # endregion
+
+    # region Protocol SimulatedBrokerGroupMember
+
+    @property
+    def group(self) -> SimBrokerGroup:
+        """Implements: SimulatedBrokerGroupMember.group
+
+        Return the `SimBrokerGroup` that drives time and matching for this account.
+        """
+        return self._group
+
+    # endregion
+
+    # region Properties
+
+    @property
+    def ledger(self) -> TradeLedger:
+        """Columnar record of all fills, paid fees and margin changes of this account."""
+        return self._ledger
+
+    @property
+    def valuation(self) -> AccountValuation | None:
+        """Mark-to-market valuation and equity curve, or None without $equity_sample_interval."""
+        return self._valuation
 
     # endregion
 
@@ -416,6 +488,16 @@ class SimBroker(Broker, SimulatedBroker):
     # region ORDER SIMULATION
 
     def _match_order_against_order_book(self, order: Order, order_book: OrderBook) -> None:
+        """Apply the per-order pipeline of `_match_record_against_order_book` to $order (e.g. at submission).
+
+        Args:
+            order: Order to process.
+            order_book: Customized OrderBook snapshot for matching.
+        """
+        record = self._group._get_matching_record(order) or compile_order_matching_record(order)
+        self._match_record_against_order_book(record, order_book)
+
+    def _match_record_against_order_book(self, record: OrderMatchingRecord, order_book: OrderBook) -> None:
         """Apply the per-order pipeline for a single OrderBook
 
         Pipeline:
@@ -424,45 +506,39 @@ class SimBroker(Broker, SimulatedBroker):
             2) If the order is fillable, simulate fills and apply them.
 
         Args:
-            order: Order to process.
+            record: Compiled matching record of the order to process.
             order_book: Customized OrderBook snapshot for matching.
         """
         # VALIDATE
+        order = record.order
         # Raise: avoid cross-instrument processing bugs
         if order.instrument != order_book.instrument:
-            raise ValueError(f"Cannot call `_match_order_against_order_book` because $order.instrument ('{order.instrument}') does not match $order_book.instrument ('{order_book.instrument}')")
+            raise ValueError(f"Cannot call `_match_record_against_order_book` because $order.instrument ('{order.instrument}') does not match $order_book.instrument ('{order_book.instrument}')")
 
         # ACT
-        self._maybe_trigger_stop_order(order, order_book)
-        self._try_fill_order_against_order_book(order, order_book)
+        if record.is_trigger_pending:
+            record = self._maybe_trigger_stop_order(record, order_book)
+        self._try_fill_order_against_order_book(record, order_book)
 
-    def _maybe_trigger_stop_order(self, order: Order, order_book: OrderBook) -> None:
-        """Trigger a stop-like $order if its stop condition is met.
+    def _maybe_trigger_stop_order(self, record: OrderMatchingRecord, order_book: OrderBook) -> OrderMatchingRecord:
+        """Trigger a stop-like order if its stop condition is met.
 
         This is a single step inside the per-order order-book pipeline.
 
         Stages:
-            Validate: Ensure TRIGGER_PENDING implies a stop-like order.
-            Compute: Evaluate stop condition against the current $order_book.
+            Compute: Evaluate stop condition of TRIGGER_PENDING $record against the current $order_book.
             Decide: Build the list of state-transition actions to apply.
-            Act: Apply transitions and publish updates.
+            Act: Apply transitions, publish updates and recompile the record.
 
         Args:
-            order: Order to evaluate for stop trigger.
+            record: Compiled matching record of a TRIGGER_PENDING stop-like order.
             order_book: Customized OrderBook snapshot for matching.
-        """
-
-        # VALIDATE
-        is_trigger_pending = order.state == OrderState.TRIGGER_PENDING
-        if not is_trigger_pending:
-            return
-
-        # Raise: TRIGGER_PENDING is valid only for stop-like orders
-        if not isinstance(order, (StopMarketOrder, StopLimitOrder)):
-            raise ValueError(f"Cannot call `_maybe_trigger_stop_order` because $order.state is TRIGGER_PENDING, which is valid only for StopMarketOrder and StopLimitOrder (got '{order.__class__.__name__}', $id='{order.id}')")
 
+        Returns:
+            OrderMatchingRecord: The record to continue matching with (recompiled if the stop triggered).
+        """
         # COMPUTE
-        should_trigger_stop = should_trigger_stop_condition(order, order_book)
+        should_trigger_stop = should_trigger_stop_record(record, order_book)
 
         # DECIDE
         stop_actions_to_apply: list[OrderAction] = []
@@ -471,28 +547,34 @@ class SimBroker(Broker, SimulatedBroker):
 
         # ACT
         if not stop_actions_to_apply:
-            return
+            return record
 
+        order = record.order
         logger.info(f"Triggered stop condition for Order $id ('{order.id}') for instrument '{order.instrument}'")
         for action in stop_actions_to_apply:
             self._apply_order_action(order, action)
 
-    def _try_fill_order_against_order_book(self, order: Order, order_book: OrderBook) -> None:
-        """Simulate and apply fills for a single $order using the broker's OrderBook.
+        # Move triggered order from stop-price index to limit-price (or unconditional) index
+        result = self._group._refresh_order(order) or compile_order_matching_record(order)
+        return result
+
+    def _try_fill_order_against_order_book(self, record: OrderMatchingRecord, order_book: OrderBook) -> None:
+        """Simulate and apply fills for a single order (compiled as $record) using the broker's OrderBook.
 
         Flow: Validate → Compute → Decide → Act
         """
         # VALIDATE
+        order = record.order
         if order.state_category != OrderStateCategory.FILLABLE:
             return
 
-        # Raise: ensure $order.instrument matches $order_book.instrument for pricing and margin
-        if order.instrument != order_book.instrument:
-            raise ValueError(f"Cannot call `_simulate_and_apply_fills_for_order_with_order_book` because $order.instrument ('{order.instrument}') does not match $order_book.instrument ('{order_book.instrument}')")
+        # Skip: FOK cannot be satisfied by visible depth, so expire it without simulating fills
+        if record.time_in_force == TimeInForce.FOK and compute_fillable_qty_for_record(record, order_book) < record.abs_unfilled_qty:
+            self._apply_order_action(order, OrderAction.EXPIRE)
+            return
 
         # COMPUTE
-        simulate_fn = select_simulate_fills_function_for_order(order)
-        proposed_fills_raw = simulate_fn(order, order_book)
+        proposed_fills_raw = simulate_fills_for_record(record, order_book)
         actual_fills = self._fill_model.apply_fill_policy(order, order_book, proposed_fills_raw)
 
         # DECIDE
@@ -500,19 +582,24 @@ class SimBroker(Broker, SimulatedBroker):
 
         # ACT
         # Apply fills
+        instrument = order_book.instrument
         for proposed_fill in proposed_fills:
-            signed_position_qty_before = self.get_signed_position_qty(order_book.instrument)
-            commission, initial_margin_delta, maint_margin_delta, maint_margin_after, peak_funds_required, available_funds, has_enough_funds = self._compute_funding_requirements_and_available_funds_for_proposed_fill(signed_position_qty_before=signed_position_qty_before, proposed_fill=proposed_fill, order=order, order_book=order_book, previous_order_fills=self._order_fill_history)
+            signed_position_qty_before = self.get_signed_position_qty(instrument)
+            commission = self._compute_commission(proposed_fill, order, self._fee_context, self._order_fill_history)
+            initial_margin_delta_value, maint_margin_delta_value, maint_margin_after_value, peak_funds_required_value = self._compute_funding_values_for_proposed_fill(signed_position_qty_before=signed_position_qty_before, proposed_fill=proposed_fill, order_book=order_book, commission=commission)
+            currency = commission.currency
+            available_funds_value = self._account.get_funds(currency).value
 
             # Cancel order
-            if not has_enough_funds:
-                logger.error(f"Reject ProposedFill for Order '{order.id}': $available_funds={available_funds}, $peak_funds_required={peak_funds_required}, $commission={commission}, $initial_margin_delta={initial_margin_delta}, $maint_margin_delta={maint_margin_delta}, $best_bid={order_book.best_bid.price}, $best_ask={order_book.best_ask.price}, $proposed_fill.signed_qty={proposed_fill.signed_qty}, $price={proposed_fill.price}, $proposed_fill.timestamp={proposed_fill.timestamp}")
+            if available_funds_value < peak_funds_required_value:
+                logger.error(f"Reject ProposedFill for Order '{order.id}': $available_funds={available_funds_value} {currency}, $peak_funds_required={peak_funds_required_value} {currency}, $commission={commission}, $initial_margin_delta={initial_margin_delta_value}, $maint_margin_delta={maint_margin_delta_value}, $best_bid={order_book.best_bid.price}, $best_ask={order_book.best_ask.price}, $proposed_fill.signed_qty={proposed_fill.signed_qty}, $price={proposed_fill.price}, $proposed_fill.timestamp={proposed_fill.timestamp}")
                 self._apply_order_action(order, OrderAction.CANCEL)
                 self._apply_order_action(order, OrderAction.ACCEPT)
                 return
 
             # Fill order
-            order_fill = self._commit_proposed_fill_to_order_and_account(order=order, proposed_fill=proposed_fill, instrument=order_book.instrument, commission=commission, initial_margin=initial_margin_delta, maint_margin_after=maint_margin_after)
+            order_fill = self._commit_proposed_fill_to_order_and_account(order=order, proposed_fill=proposed_fill, instrument=instrument, commission=commission, initial_margin=Money(initial_margin_delta_value, currency), maint_margin_after=Money(maint_margin_after_value, currency))
+            record.sync_fill(proposed_fill.abs_qty)
 
             # Handle (publish) new events
             self._handle_order_fill(order_fill)
@@ -596,6 +683,7 @@ class SimBroker(Broker, SimulatedBroker):
             fee_description = f"Commission for Instrument: {instrument.name} | Quantity: {order_fill.signed_quantity} Order ID / OrderFill ID: {order_fill.order.id} / {order_fill.id}"
             # Pay commission from $account funds
             self._account.pay_fee(order_fill.timestamp, order_fill.commission, fee_description)
+            self._ledger.record_fee(order_fill.timestamp, order.id, instrument, order_fill.commission)
 
         # Unblock initial margin
         if was_blocked_initial_margin:
@@ -604,107 +692,76 @@ class SimBroker(Broker, SimulatedBroker):
 
         # Block maintenance margin
         self._account.change_blocked_maint_margin(instrument, target=maint_margin_after)
+        # Record margins after the fill (the account drops records of fully released margins)
+        blocked_margins = self._account.get_blocked_margins(instrument) or BlockedMargins(initial=Money(0, maint_margin_after.currency), maintenance=maint_margin_after)
+        self._ledger.record_blocked_margins(order_fill.timestamp, instrument, blocked_margins)
 
         return order_fill
 
     # FUNDS-CENTRIC VALIDATION
 
-    def _compute_funding_requirements_for_proposed_fill(
+    def _compute_funding_values_for_proposed_fill(
         self,
         *,
         signed_position_qty_before: Decimal,
         proposed_fill: ProposedFill,
-        order: Order,
         order_book: OrderBook,
-        previous_order_fills: Sequence[OrderFill],
-    ) -> tuple[Money, Money, Money, Money, Money]:
-        """Compute all funding numbers needed to decide and apply one proposed fill.
+        commission: Money,
+    ) -> tuple[Decimal, Decimal, Decimal, Decimal]:
+        """Compute the funding numbers of one proposed fill as Decimal values in $commission.currency.
 
-        This helper is intentionally pure: it does not mutate broker, account, or order state.
+        This is the single place of the peak-funding formula, shared by the apply loop and the FOK
+        dry-run so they cannot drift apart. It is pure: it does not mutate broker, account, or order
+        state. Margins come from the per-snapshot `MarginContext` if the MarginModel provides one.
 
         Args:
             signed_position_qty_before: Net position signed quantity before applying the fill.
             proposed_fill: The fill being evaluated.
-            order: The parent Order that this fill belongs to.
             order_book: Market snapshot used for pricing and margin calculations.
-            previous_order_fills: Earlier fills for the same order, used for tiered commissions.
+            commission: Commission of $proposed_fill; all margins must be in its currency.
 
         Returns:
-            Tuple of (commission, initial_margin_delta, maint_margin_delta, maint_margin_after, peak_funds_required).
+            Tuple of (initial_margin_delta, maint_margin_delta, maint_margin_after, peak_funds_required) values.
+
+        Raises:
+            ValueError: If a margin is in a different currency than $commission.
         """
         # Compute position delta
         signed_position_qty_after = signed_position_qty_before + proposed_fill.signed_qty
         abs_position_qty_change = max(Decimal("0"), abs(signed_position_qty_after) - abs(signed_position_qty_before))
-
-        # Compute commission
-        commission = self._fee_model.compute_commission(proposed_fill=proposed_fill, order=order, previous_order_fills=previous_order_fills)
-
-        # Compute initial margin for size increase
-        initial_margin_delta = Money(0, commission.currency)
-        if abs_position_qty_change > 0:
-            signed_position_qty_change = abs_position_qty_change if proposed_fill.signed_qty > 0 else -abs_position_qty_change
-            initial_margin_delta = self._margin_model.compute_initial_margin(order_book=order_book, signed_qty=signed_position_qty_change)
-
-        # Compute maintenance margin delta
-        maint_margin_before = self._margin_model.compute_maintenance_margin(order_book=order_book, signed_qty=signed_position_qty_before)
-        maint_margin_after = self._margin_model.compute_maintenance_margin(order_book=order_book, signed_qty=signed_position_qty_after)
-        maint_margin_delta = maint_margin_after - maint_margin_before
+        currency = commission.currency
+
+        margin_context = self._get_margin_context(order_book)
+        if margin_context is not None:
+            # Compute margins from per-unit rates cached for this OrderBook snapshot
+            initial_margin_currency = maint_margin_currency = margin_context.currency
+            initial_margin_delta_value = margin_context.compute_initial_margin_value(abs_position_qty_change)
+            maint_margin_after_value = margin_context.compute_maint_margin_value(signed_position_qty_after)
+            maint_margin_delta_value = maint_margin_after_value - margin_context.compute_maint_margin_value(signed_position_qty_before)
+        else:
+            # Compute initial margin for size increase
+            initial_margin_currency = currency
+            initial_margin_delta_value = Decimal("0")
+            if abs_position_qty_change > 0:
+                signed_position_qty_change = abs_position_qty_change if proposed_fill.signed_qty > 0 else -abs_position_qty_change
+                initial_margin_delta = self._margin_model.compute_initial_margin(order_book=order_book, signed_qty=signed_position_qty_change)
+                initial_margin_currency, initial_margin_delta_value = initial_margin_delta.currency, initial_margin_delta.value
+
+            # Compute maintenance margin delta
+            maint_margin_before = self._margin_model.compute_maintenance_margin(order_book=order_book, signed_qty=signed_position_qty_before)
+            maint_margin_after = self._margin_model.compute_maintenance_margin(order_book=order_book, signed_qty=signed_position_qty_after)
+            maint_margin_currency = maint_margin_after.currency
+            maint_margin_after_value = maint_margin_after.value
+            maint_margin_delta_value = (maint_margin_after - maint_margin_before).value
 
         # Raise: peak-funding calculation assumes a single currency
-        if commission.currency != initial_margin_delta.currency or commission.currency != maint_margin_delta.currency:
-            raise ValueError(f"Cannot call `_compute_funding_requirements_for_proposed_fill` because currencies differ: $commission={commission}, $initial_margin_delta={initial_margin_delta}, $maint_margin_delta={maint_margin_delta}")
+        if initial_margin_currency != currency or maint_margin_currency != currency:
+            raise ValueError(f"Cannot call `_compute_funding_values_for_proposed_fill` because currencies differ: $commission={commission}, initial margin currency '{initial_margin_currency}', maintenance margin currency '{maint_margin_currency}'")
 
         # Compute peak funds required
-        peak_margin_delta = max(initial_margin_delta, maint_margin_delta)
-        peak_funds_required = peak_margin_delta + commission
-
-        result = commission, initial_margin_delta, maint_margin_delta, maint_margin_after, peak_funds_required
-        return result
-
-    def _compute_funding_requirements_and_available_funds_for_proposed_fill(
-        self,
-        *,
-        signed_position_qty_before: Decimal,
-        proposed_fill: ProposedFill,
-        order: Order,
-        order_book: OrderBook,
-        previous_order_fills: Sequence[OrderFill],
-        available_funds_by_currency: dict[Currency, Money] | None = None,
-    ) -> tuple[Money, Money, Money, Money, Money, Money, bool]:
-        """Compute funding requirements and available funds for one $proposed_fill.
-
-        This helper is intentionally pure with respect to broker/account state: it does not mutate anything.
-        It exists to avoid funding recomputation drift between the apply loop and the FOK dry-run.
-
-        Args:
-            signed_position_qty_before: Net position signed quantity before applying the fill.
-            proposed_fill: The fill being evaluated.
-            order: The parent Order that this fill belongs to.
-            order_book: Market snapshot used for pricing and margin calculations.
-            previous_order_fills: Earlier fills for the same order, used for tiered commissions.
-            available_funds_by_currency: Optional mapping used by dry-run flows to provide simulated funds.
-
-        Returns:
-            Tuple of (commission, initial_margin_delta, maint_margin_delta, maint_margin_after, peak_funds_required, available_funds, has_enough_funds).
-        """
-        # Compute required funding numbers
-        commission, initial_margin_delta, maint_margin_delta, maint_margin_after, peak_funds_required = self._compute_funding_requirements_for_proposed_fill(signed_position_qty_before=signed_position_qty_before, proposed_fill=proposed_fill, order=order, order_book=order_book, previous_order_fills=previous_order_fills)
-        currency = peak_funds_required.currency
-
-        # Select available funds source
-        if available_funds_by_currency is None:
-            available_funds = self._account.get_funds(currency)
-        else:
-            available_funds = available_funds_by_currency.get(currency, Money(0, currency))
-
-        # Raise: ensure $available_funds is in the same currency as $peak_funds_required
-        if available_funds.currency != currency:
-            raise ValueError(f"Cannot call `_compute_funding_requirements_and_available_funds_for_proposed_fill` because $available_funds.currency ('{available_funds.currency}') does not match $peak_funds_required.currency ('{currency}')")
-
-        # Decide if funds cover peak requirement
-        has_enough_funds = available_funds >= peak_funds_required
+        peak_funds_required_value = max(initial_margin_delta_value, maint_margin_delta_value) + commission.value
 
-        result = commission, initial_margin_delta, maint_margin_delta, maint_margin_after, peak_funds_required, available_funds, has_enough_funds
+        result = initial_margin_delta_value, maint_margin_delta_value, maint_margin_after_value, peak_funds_required_value
         return result
 
     def _has_enough_funds_for_proposed_fills(
@@ -713,31 +770,69 @@ class SimBroker(Broker, SimulatedBroker):
         proposed_fills: list[ProposedFill],
         order_book: OrderBook,
     ) -> bool:
-        """Evaluate if the account has enough funds for margins and fees for all $proposed_fills (dry-run)."""
+        """Evaluate if the account has enough funds for margins and fees for all $proposed_fills (dry-run).
+
+        Uses the same funding helper as the apply loop and keeps simulated funds as plain Decimal(s).
+        """
         # Initialize dry-run state
-        signed_position_qty_before = self.get_signed_position_qty(order_book.instrument)
-        simulated_order_fill_history = list(self._order_fill_history)
-        funds_by_currency = dict(self._account.get_all_funds())
+        signed_position_qty = self.get_signed_position_qty(order_book.instrument)
+        simulated_fee_context = self._fee_context.copy()
+        simulated_order_fill_history = self._copy_order_fill_history_for_dry_run()
+        funds_value_by_currency: dict[Currency, Decimal] = {}
 
         # Iterate proposed fills
         for i, proposed_fill in enumerate(proposed_fills):
             # Compute required funding for this fill
-            signed_position_qty_after = signed_position_qty_before + proposed_fill.signed_qty
-            commission, _initial_margin_delta, maint_margin_delta, _maint_margin_after, peak_funds_required, available_account_funds, has_enough_funds = self._compute_funding_requirements_and_available_funds_for_proposed_fill(signed_position_qty_before=signed_position_qty_before, proposed_fill=proposed_fill, order=order, order_book=order_book, previous_order_fills=simulated_order_fill_history, available_funds_by_currency=funds_by_currency)
-            if not has_enough_funds:
+            commission = self._compute_commission(proposed_fill, order, simulated_fee_context, simulated_order_fill_history)
+            _initial_margin_delta_value, maint_margin_delta_value, _maint_margin_after_value, peak_funds_required_value = self._compute_funding_values_for_proposed_fill(signed_position_qty_before=signed_position_qty, proposed_fill=proposed_fill, order_book=order_book, commission=commission)
+
+            currency = commission.currency
+            available_funds_value = funds_value_by_currency.get(currency)
+            if available_funds_value is None:
+                available_funds_value = self._account.get_funds(currency).value
+            if available_funds_value < peak_funds_required_value:
                 return False
 
-            # Simulate cash and maint margin impact
-            new_funds_value = available_account_funds.value - commission.value - maint_margin_delta.value
-            funds_by_currency[peak_funds_required.currency] = Money(new_funds_value, peak_funds_required.currency)
-
-            # Append synthetic fill and advance state
-            sim_order_fill = OrderFill(order=order, signed_qty=proposed_fill.signed_qty, price=proposed_fill.price, timestamp=proposed_fill.timestamp, commission=commission, id=f"FOK_DRY_RUN_{order.id}_{i}")
-            simulated_order_fill_history.append(sim_order_fill)
-            signed_position_qty_before = signed_position_qty_after
+            # Simulate cash and maint margin impact, then advance state
+            funds_value_by_currency[currency] = available_funds_value - commission.value - maint_margin_delta_value
+            self._record_dry_run_fill(order, proposed_fill, commission, i, simulated_fee_context, simulated_order_fill_history)
+            signed_position_qty += proposed_fill.signed_qty
 
         return True
 
+    def _compute_commission(self, proposed_fill: ProposedFill, order: Order, fee_context: FeeContext, previous_order_fills: Sequence[OrderFill]) -> Money:
+        """Compute the commission of $proposed_fill from $fee_context (`IncrementalFeeModel`) or $previous_order_fills."""
+        incremental_fee_model = self._incremental_fee_model
+        if incremental_fee_model is not None:
+            return incremental_fee_model.compute_commission_with_context(proposed_fill, order, fee_context)
+        return self._fee_model.compute_commission(proposed_fill=proposed_fill, order=order, previous_order_fills=previous_order_fills)
+
+    def _copy_order_fill_history_for_dry_run(self) -> list[OrderFill]:
+        """Return a copy of the fill history that FOK dry-runs can extend (empty for `IncrementalFeeModel`(s), which never read it)."""
+        if self._incremental_fee_model is not None:
+            return []
+        return list(self._order_fill_history)
+
+    def _record_dry_run_fill(self, order: Order, proposed_fill: ProposedFill, commission: Money, index: int, fee_context: FeeContext, order_fill_history: list[OrderFill]) -> None:
+        """Record $proposed_fill in the dry-run $fee_context and, for FeeModel(s) reading history, in $order_fill_history."""
+        fee_context.record_fill(order.instrument, proposed_fill.signed_qty, proposed_fill.price, proposed_fill.timestamp)
+        if self._incremental_fee_model is None:
+            order_fill_history.append(OrderFill(order=order, signed_qty=proposed_fill.signed_qty, price=proposed_fill.price, timestamp=proposed_fill.timestamp, commission=commission, id=f"FOK_DRY_RUN_{order.id}_{index}"))
+
+    def _get_margin_context(self, order_book: OrderBook) -> MarginContext | None:
+        """Return the MarginContext for $order_book, building it once per Instrument and snapshot.
+
+        Returns None if the MarginModel does not implement `MarginContextProvider`.
+        """
+        if self._margin_context_provider is None:
+            return None
+
+        margin_context = self._margin_context_by_instrument.get(order_book.instrument)
+        if margin_context is None or margin_context.order_book is not order_book:
+            margin_context = self._margin_context_provider.build_margin_context(order_book)
+            self._margin_context_by_instrument[order_book.instrument] = margin_context
+        return margin_context
+
     def _append_order_fill_to_history_and_update_position(self, order_fill: OrderFill) -> None:
         """Append $order_fill to order fill history and update Position.
 
@@ -748,8 +843,11 @@ class SimBroker(Broker, SimulatedBroker):
         instrument = order_fill.order.instrument
         trade_price: Decimal = Decimal(order_fill.price)
 
-        # Record $order_fill in history
-        self._order_fill_history.append(order_fill)
+        # Record $order_fill in ledger, fee totals and history
+        self._ledger.record_order_fill(order_fill)
+        self._fee_context.record_fill(instrument, order_fill.signed_quantity, trade_price, order_fill.timestamp)
+        if self._keep_order_fills:
+            self._order_fill_history.append(order_fill)
 
         # Read previous position
         previous_position = self.get_position(instrument)
@@ -775,6 +873,10 @@ class SimBroker(Broker, SimulatedBroker):
                 last_update=order_fill.timestamp,
             )
 
+        # Mark new position to market
+        if self._valuation is not None:
+            self._valuation.record_order_fill(order_fill, new_signed_qty, new_avg_price)
+
         logger.debug(f"Appended OrderFill to history and updated Position for Instrument '{instrument}' (class {self.__class__.__name__}): $previous_signed_qty={previous_signed_qty}, $new_signed_qty={new_signed_qty}, $trade_price={trade_price}")
 
     @staticmethod
@@ -816,42 +918,272 @@ class SimBroker(Broker, SimulatedBroker):
 
     # region ORDER LIFECYCLE
 
+    # ORDER REQUESTS (SUBMIT, CANCEL, UPDATE)
+
+    def _validate_orders_for_submission(self, orders: list[Order], method_name: str) -> None:
+        """Raise if the broker is not connected or any of $orders cannot be submitted now."""
+        # Raise: broker must be connected to accept new orders
+        if not self._connected:
+            raise RuntimeError(f"Cannot call `{method_name}` because $connected ({self._connected}) is False")
+
+        # Raise: enforce unique $id within the batch
+        order_ids = {order.id for order in orders}
+        if len(order_ids) != len(orders):
+            raise ValueError(f"Cannot call `{method_name}` because $orders contain duplicate $id values ({len(orders) - len(order_ids)} duplicates)")
+
+        for order in orders:
+            self._validate_order_for_submission(order, method_name)
+
+    def _validate_order_for_submission(self, order: Order, method_name: str) -> None:
+        """Raise ValueError if $order cannot be submitted to this account now."""
+        # Raise: enforce unique $id among active orders
+        if order.id in self._orders_by_id:
+            raise ValueError(f"Cannot call `{method_name}` because $id ('{order.id}') already exists")
+
+        # Raise: enforce unique $id among active orders of all accounts in the group
+        if self._group._is_order_id_tracked(order.id):
+            raise ValueError(f"Cannot call `{method_name}` because $id ('{order.id}') already exists in another account of this SimBrokerGroup")
+
+        # Raise: DAY/GTD submission requires broker timeline time
+        timeline_dt = self._group.timeline_dt
+        if order.time_in_force in (TimeInForce.DAY, TimeInForce.GTD) and timeline_dt is None:
+            raise ValueError(f"Cannot call `{method_name}` because $time_in_force ({order.time_in_force.value}) requires broker time, but $timeline_dt is None")
+
+        if order.time_in_force is TimeInForce.GTD:
+            # Raise: GTD orders must provide timezone-aware UTC $good_till_dt
+            if order.good_till_dt is None:
+                raise ValueError(f"Cannot call `{method_name}` because $time_in_force is GTD but $good_till_dt is None for Order $id ('{order.id}')")
+
+            # Raise: keep time-in-force comparisons deterministic in UTC
+            if not is_utc(order.good_till_dt):
+                raise ValueError(f"Cannot call `{method_name}` because $good_till_dt ({format_dt(order.good_till_dt)}) is not timezone-aware UTC for GTD Order $id ('{order.id}')")
+
+            # Raise: GTD deadline must not be earlier than broker $timeline_dt at submission
+            if order.good_till_dt < timeline_dt:
+                raise ValueError(f"Cannot call `{method_name}` because $good_till_dt ({format_dt(order.good_till_dt)}) is earlier than broker $timeline_dt ({format_dt(timeline_dt)}) for GTD Order $id ('{order.id}')")
+
+    def _request_submission(self, order: Order) -> None:
+        """Register validated $order now, or put its submission in flight."""
+        # Skip: order is in flight; it is registered when it arrives
+        if self._schedule_request_if_delayed(OrderAction.SUBMIT, order):
+            return
+
+        self._register_submitted_order(order)
+
+    def _validate_order_for_cancel(self, order: Order, method_name: str) -> None:
+        """Raise ValueError if $order is neither tracked nor in flight in this account."""
+        # Raise: order must be known to the broker
+        if self.get_order(order.id) is None and not self._group._is_submission_in_flight(order, self):
+            raise ValueError(f"Cannot call `{method_name}` because $id ('{order.id}') is not tracked")
+
+    def _request_cancel(self, order: Order) -> None:
+        """Cancel validated $order now, or put the cancel in flight."""
+        # Skip: cancel travels behind the submission of $order; it is applied when it arrives
+        if self._group._is_submission_in_flight(order, self):
+            self._group._schedule_request(self._compute_request_arrival_dt(OrderAction.CANCEL, order), OrderAction.CANCEL, order, self)
+            return
+
+        tracked_order = self.get_order(order.id)
+
+        # Skip: order is already in terminal state (and no longer tracked); warn and return
+        if tracked_order is None or tracked_order.state_category == OrderStateCategory.TERMINAL:
+            logger.warning(f"Bad logic: Ignoring `cancel_order` for terminal Order $id ('{order.id}') with $state_category ({order.state_category.name})")
+            return
+
+        # Skip: cancel is in flight; it is applied when it arrives
+        if self._schedule_request_if_delayed(OrderAction.CANCEL, tracked_order):
+            return
+
+        self._apply_cancel(tracked_order)
+
+    def _validate_order_for_update(self, order: Order, method_name: str) -> None:
+        """Raise ValueError if $order cannot be updated in this account."""
+        # Skip: update of an in-flight submission is checked when it arrives
+        if self._group._is_submission_in_flight(order, self):
+            return
+
+        # Raise: order must be known to the broker
+        tracked_order = self.get_order(order.id)
+        if tracked_order is None:
+            raise ValueError(f"Cannot call `{method_name}` because $id ('{order.id}') is not tracked")
+
+        # Raise: terminal orders cannot be modified
+        if tracked_order.state_category == OrderStateCategory.TERMINAL:
+            raise ValueError(f"Cannot call `{method_name}` because Order $state_category ({tracked_order.state_category.name}) is terminal.")
+
+        # Raise: instrument cannot be changed via modification
+        if tracked_order.instrument != order.instrument:
+            raise ValueError(f"Cannot call `{method_name}` because $instrument changed from '{tracked_order.instrument}' to '{order.instrument}' for Order $id ('{order.id}')")
+
+    def _request_update(self, order: Order) -> None:
+        """Update validated $order now, or put the update in flight."""
+        # Skip: update travels behind the submission of $order; it is applied when it arrives
+        if self._group._is_submission_in_flight(order, self):
+            self._group._schedule_request(self._compute_request_arrival_dt(OrderAction.UPDATE, order), OrderAction.UPDATE, order, self)
+            return
+
+        tracked_order = self.get_order(order.id)
+
+        # Skip: order finished earlier in the same batch
+        if tracked_order is None:
+            logger.warning(f"Bad logic: Ignoring `update_order` for terminal Order $id ('{order.id}') with $state_category ({order.state_category.name})")
+            return
+
+        # Skip: update is in flight; it is applied when it arrives
+        if self._schedule_request_if_delayed(OrderAction.UPDATE, tracked_order):
+            return
+
+        self._apply_update(tracked_order)
+
+    def _register_submitted_order(self, order: Order) -> None:
+        """Register submitted $order, apply its acceptance transitions and match it against the latest OrderBook."""
+        timeline_dt = self._group.timeline_dt
+
+        # COMPUTE & DECIDE
+        is_stop_order = isinstance(order, (StopMarketOrder, StopLimitOrder))
+        order_actions_to_apply = [OrderAction.ARM_TRIGGER] if is_stop_order else [OrderAction.ACCEPT, OrderAction.ACCEPT]
+
+        # ACTIONS
+        # Set submission time into order
+        if timeline_dt is not None:
+            order._set_submitted_dt_once(timeline_dt)
+
+        # Store order
+        self._orders_by_id[order.id] = order
+        self._schedule_order_expiry(order)
+
+        # Do order-state transitions
+        for action in order_actions_to_apply:
+            self._apply_order_action(order, action)
+
+        # Index order by price (needs the post-transition state: stops are placed by trigger price)
+        if order.state_category != OrderStateCategory.TERMINAL:
+            self._group._add_order(order, self)
+
+        # Handle order expiration
+        if self._should_expire_order_now(order):
+            self._apply_order_action(order, OrderAction.EXPIRE)
+            return
+
+        # Match order with order-book
+        last_order_book = self._group._get_latest_order_book(order.instrument)
+        if last_order_book is not None:
+            self._match_order_against_order_book(order, last_order_book)
+
+    def _apply_cancel(self, order: Order) -> None:
+        """Cancel tracked non-terminal $order (CANCEL → ACCEPT)."""
+        self._apply_order_action(order, OrderAction.CANCEL)
+        if order.state == OrderState.PENDING_CANCEL:
+            self._apply_order_action(order, OrderAction.ACCEPT)  # PENDING_CANCEL + ACCEPT = CANCELLED
+
+    def _apply_update(self, order: Order) -> None:
+        """Modify tracked non-terminal $order (UPDATE → ACCEPT) and recompile its matching record."""
+        self._apply_order_action(order, OrderAction.UPDATE)
+        self._apply_order_action(order, OrderAction.ACCEPT)
+        if order.state_category != OrderStateCategory.TERMINAL:
+            self._group._refresh_order(order)
+
+    def _schedule_request_if_delayed(self, action: OrderAction, order: Order) -> bool:
+        """Put request $action for $order in flight if the LatencyModel delays it.
+
+        Returns:
+            bool: True if the request is in flight, False if it must be applied now.
+        """
+        # Skip: no latency model, or no simulated time to measure latency from
+        if self._latency_model is None or self._group.timeline_dt is None:
+            return False
+
+        arrival_dt = self._compute_request_arrival_dt(action, order)
+
+        # Skip: zero latency
+        if arrival_dt <= self._group.timeline_dt:
+            return False
+
+        self._group._schedule_request(arrival_dt, action, order, self)
+        return True
+
+    def _compute_request_arrival_dt(self, action: OrderAction, order: Order) -> datetime:
+        """Return when request $action for $order, sent now, arrives."""
+        latency = self._latency_model.compute_latency(order, action) if self._latency_model is not None else timedelta(0)
+
+        # Raise: requests cannot arrive before they were sent
+        if latency < timedelta(0):
+            raise ValueError(f"Cannot call `_compute_request_arrival_dt` because LatencyModel returned negative $latency ({latency}) for {action.name} of Order $id ('{order.id}')")
+
+        result = self._group.timeline_dt + latency
+        return result
+
+    def _apply_arrived_request(self, action: OrderAction, order: Order) -> None:
+        """Apply request $action for $order whose latency has elapsed (called by `SimBrokerGroup`)."""
+        if action is OrderAction.SUBMIT:
+            self._register_submitted_order(order)
+            return
+
+        tracked_order = self._orders_by_id.get(order.id)
+
+        # Skip: order finished (e.g. filled or expired) while the request was in flight
+        if tracked_order is None:
+            logger.debug(f"Ignoring arrived {action.name} request for finished Order $id ('{order.id}')")
+            return
+
+        if action is OrderAction.CANCEL:
+            self._apply_cancel(tracked_order)
+        else:
+            self._apply_update(tracked_order)
+
     # TIME IN FORCE (EXPIRATION)
 
     def _should_expire_order_now(self, order: Order) -> bool:
+        now_dt = self._group.timeline_dt
+        if now_dt is None:
+            return False
+
+        expiry_dt = self._compute_order_expiry_dt(order)
+        result = expiry_dt is not None and now_dt >= expiry_dt
+        return result
+
+    def _schedule_order_expiry(self, order: Order) -> None:
+        """Schedule the expiry instant of a DAY/GTD $order in the group (computed once, at submission)."""
+        expiry_dt = self._compute_order_expiry_dt(order)
+
+        # Skip: this order never expires by time
+        if expiry_dt is None:
+            return
+
+        self._group._schedule_order_expiry(expiry_dt, order, self)
+
+    @staticmethod
+    def _compute_order_expiry_dt(order: Order) -> datetime | None:
+        """Return the instant at which $order expires by time-in-force, or None if it never expires by time."""
         time_in_force = order.time_in_force
 
         # These TIF types never expire by time
         if time_in_force in (TimeInForce.GTC, TimeInForce.IOC, TimeInForce.FOK):
-            return False
-
-        now_dt = self._timeline_dt
-        if now_dt is None:
-            return False
+            return None
 
         # GTD
         if time_in_force == TimeInForce.GTD:
             good_till_dt = order.good_till_dt
             # Raise: GTD orders must provide $good_till_dt
             if good_till_dt is None:
-                raise ValueError(f"Cannot call `_should_expire_order_now` because $time_in_force is GTD but $good_till_dt is None for Order $id ('{order.id}')")
+                raise ValueError(f"Cannot call `_compute_order_expiry_dt` because $time_in_force is GTD but $good_till_dt is None for Order $id ('{order.id}')")
 
-            return now_dt >= good_till_dt
+            return good_till_dt
 
         # DAY
         if time_in_force == TimeInForce.DAY:
             submitted_dt = order.submitted_dt
             # Raise: DAY orders must have a $submitted_dt to define the DAY boundary
             if submitted_dt is None:
-                raise ValueError(f"Cannot call `_should_expire_order_now` because $time_in_force is DAY but $submitted_dt is None for Order $id ('{order.id}')")
+                raise ValueError(f"Cannot call `_compute_order_expiry_dt` because $time_in_force is DAY but $submitted_dt is None for Order $id ('{order.id}')")
 
             # TODO: DAY uses UTC midnight for now; later we should use exchange session boundaries per instrument.
             # Note: In this SimBroker, DAY expires at the next UTC midnight after $submitted_dt.
             day_after_submission = submitted_dt + timedelta(days=1)
             expiry_dt = day_after_submission.replace(hour=0, minute=0, second=0, microsecond=0)
-            return now_dt >= expiry_dt
+            return expiry_dt
 
-        raise ValueError(f"Cannot call `_should_expire_order_now` because $time_in_force ({time_in_force.value}) is not supported")
+        raise ValueError(f"Cannot call `_compute_order_expiry_dt` because $time_in_force ({time_in_force.value}) is not supported")
 
     # ORDER UPDATES
 
@@ -900,18 +1232,12 @@ class SimBroker(Broker, SimulatedBroker):
         """Perform internal cleanup for an order that reached a terminal state."""
         self._orders_by_id.pop(order.id, None)
 
+        self._group._remove_order(order)
+
     # endregion
 
     # region DEFAULTS
 
-    def _build_default_market_depth_model(self) -> MarketDepthModel:
-        """Build the default MarketDepthModel used by this broker instance.
-
-        Returns:
-            A MarketDepthModel instance.
-        """
-        return PassThroughMarketDepthModel()
-
     def _build_default_margin_model(self) -> MarginModel:
         """Build the default MarginModel used by this broker instance.
 
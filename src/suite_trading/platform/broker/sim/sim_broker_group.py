@@ -0,0 +1,417 @@
+from __future__ import annotations
+
+from datetime import datetime
+from heapq import heapify, heappop, heappush
+from itertools import count
+from typing import TYPE_CHECKING
+
+from suite_trading.domain.instrument import Instrument
+from suite_trading.domain.market_data.order_book.ohlc_price_trajectory import OhlcPriceTrajectory
+from suite_trading.domain.market_data.order_book.order_book import OrderBook
+from suite_trading.domain.order.order_state import OrderAction
+from suite_trading.domain.order.orders import Order
+from suite_trading.platform.broker.sim.models.market_depth.pass_through import PassThroughMarketDepthModel
+from suite_trading.platform.broker.sim.models.market_depth.protocol import MarketDepthModel
+from suite_trading.platform.broker.sim.order_matching import OrderMatchingRecord
+from suite_trading.platform.broker.sim.order_price_index import OrderPriceIndex
+from suite_trading.platform.broker.simulated_broker_protocol import OrderBookDemandReporter, PriceTrajectoryProcessor, SimulatedBroker
+from suite_trading.utils.datetime_tools import format_dt, is_utc
+
+if TYPE_CHECKING:
+    from suite_trading.platform.broker.sim.sim_broker import SimBroker
+
+
+class SimBrokerGroup(SimulatedBroker, OrderBookDemandReporter, PriceTrajectoryProcessor):
+    """Market side shared by one or more `SimBroker` accounts.
+
+    A group owns everything that does not belong to a single account: simulated time, the
+    market-depth model with the latest customized OrderBook per instrument, one combined
+    instrument → orders price index across all accounts, one expiry schedule and the order
+    requests in flight (when accounts use a `LatencyModel`).
+
+    Per snapshot, the depth model runs once and only orders that can trigger or fill are
+    matched; each order is matched by its own account (own fill, fee and margin models, own
+    positions and funds). Points of an `OhlcPriceTrajectory` at which nothing can trigger or
+    fill are not turned into OrderBooks at all. Cost therefore grows with active orders, not with the number of
+    accounts, and each account behaves exactly as a standalone `SimBroker`.
+
+    Usage:
+        group = SimBrokerGroup()
+        brokers = [SimBroker(group=group, fill_model=...) for _ in range(100)]
+        # Register each SimBroker in the TradingEngine as usual; the engine drives the group once.
+
+    A `SimBroker` created without $group gets its own private group.
+
+    Notes:
+        Order $id values must be unique across all accounts of one group.
+    """
+
+    # region Init
+
+    def __init__(self, *, depth_model: MarketDepthModel | None = None) -> None:
+        """Create a group of simulated accounts.
+
+        Args:
+            depth_model: MarketDepthModel used for matching in all accounts. If None, a default
+                model is built by `_build_default_market_depth_model()`.
+        """
+        # MODELS
+        self._depth_model: MarketDepthModel = depth_model or self._build_default_market_depth_model()
+        # Trajectory points can be skipped by price only if the depth model does not change prices
+        self._is_depth_model_pass_through = isinstance(self._depth_model, PassThroughMarketDepthModel)
+
+        # ACCOUNTS (and the subset with mark-to-market valuation)
+        self._accounts: list[SimBroker] = []
+        self._valued_accounts: list[SimBroker] = []
+
+        # SIMULATED TIME (engine-injected)
+        self._timeline_dt: datetime | None = None
+
+        # ORDERS of all accounts: combined price index per instrument + owning account per order
+        self._order_index_by_instrument: dict[Instrument, OrderPriceIndex] = {}
+        self._account_by_order_id: dict[str, SimBroker] = {}
+
+        # EXPIRY SCHEDULE for DAY/GTD orders: min-heap of (expiry_dt, sequence, order, account); entries of
+        # orders that were terminalized earlier are dead: skipped when popped and compacted away once
+        # they make up more than half of the heap (see `_remove_order`)
+        self._expiry_heap: list[tuple[datetime, int, Order, SimBroker]] = []
+        self._expiry_sequence = count()
+        self._expiring_order_ids: set[str] = set()
+        self._dead_expiry_count = 0
+
+        # IN-FLIGHT REQUESTS (submit/cancel/update delayed by a LatencyModel): min-heap of
+        # (arrival_dt, sequence, action, order, account), released as simulated time passes arrival_dt
+        self._request_heap: list[tuple[datetime, int, OrderAction, Order, SimBroker]] = []
+        self._request_sequence = count()
+        # Latest (arrival_dt, sequence) per order with requests in flight; requests of one order arrive in sending order
+        self._last_request_arrival_by_order_id: dict[str, tuple[datetime, int]] = {}
+        # Submissions in flight: owning account per order + count per instrument (so OrderBooks keep flowing)
+        self._in_flight_account_by_order_id: dict[str, SimBroker] = {}
+        self._in_flight_submission_count_by_instrument: dict[Instrument, int] = {}
+
+        # ORDER BOOK CACHE (last known customized OrderBook per instrument)
+        self._latest_order_book_by_instrument: dict[Instrument, OrderBook] = {}
+        # Skipped trajectory point per instrument that is newer than its cached OrderBook; its
+        # OrderBook is built only if requested (see `_get_latest_order_book`)
+        self._latest_trajectory_point_by_instrument: dict[Instrument, tuple[OhlcPriceTrajectory, int]] = {}
+
+    # endregion
+
+    # region Main
+
+    def list_accounts(self) -> list[SimBroker]:
+        """Return all `SimBroker` accounts of this group in creation order."""
+        return list(self._accounts)
+
+    # endregion
+
+    # region Protocol SimulatedBroker
+
+    def set_timeline_dt(self, dt: datetime) -> None:
+        """Implements: SimulatedBroker.set_timeline_dt
+
+        Set simulated time for all accounts, apply order requests whose latency has elapsed and
+        expire DAY/GTD orders whose deadline has passed.
+
+        Args:
+            dt: Simulated time for the current engine event (timezone-aware UTC).
+        """
+        # Raise: broker timeline $dt must be timezone-aware UTC
+        if not is_utc(dt):
+            raise ValueError(f"Cannot call `set_timeline_dt` because $dt ({dt}) is not timezone-aware UTC")
+        # Raise: broker timeline $dt cannot move backwards
+        if self._timeline_dt is not None and dt < self._timeline_dt:
+            raise ValueError(f"Cannot call `set_timeline_dt` because new $dt ({format_dt(dt)}) is earlier than current $timeline_dt ({format_dt(self._timeline_dt)})")
+
+        self._timeline_dt = dt
+
+        # Handle arrived requests and expired orders in time order (on ties, expiry goes first)
+        expiry_heap = self._expiry_heap
+        request_heap = self._request_heap
+        while True:
+            is_expiry_due = bool(expiry_heap) and expiry_heap[0][0] <= dt
+            is_request_due = bool(request_heap) and request_heap[0][0] <= dt
+
+            # Skip: nothing else is due
+            if not is_expiry_due and not is_request_due:
+                break
+
+            if is_request_due and (not is_expiry_due or request_heap[0][0] < expiry_heap[0][0]):
+                self._release_next_request()
+                continue
+
+            _, _, order, account = heappop(expiry_heap)
+
+            # Skip: order was already terminalized (e.g. filled or cancelled) before its deadline
+            if order.id not in self._expiring_order_ids:
+                self._dead_expiry_count -= 1
+                continue
+
+            self._expiring_order_ids.remove(order.id)
+            account._apply_order_action(order, OrderAction.EXPIRE)
+
+        # Sample due equity curves of flat accounts (accounts with open positions are sampled after
+        # their marks were updated by the OrderBook of $dt)
+        for account in self._valued_accounts:
+            valuation = account._valuation
+            if not valuation.has_open_positions():
+                valuation.sample_if_due(dt, account.get_account())
+
+    def process_order_book(self, order_book: OrderBook) -> None:
+        """Implements: SimulatedBroker.process_order_book
+
+        Customize $order_book once and match it against orders of all accounts that can trigger
+        or fill on its top of book.
+
+        Args:
+            order_book: OrderBook snapshot to process.
+        """
+        # Raise: TradingEngine must set broker time before processing this snapshot
+        if self._timeline_dt is None:
+            raise ValueError(f"Cannot call `process_order_book` because $timeline_dt is None. TradingEngine must call `set_timeline_dt(order_book.timestamp)` immediately before calling `process_order_book` (got $order_book.timestamp={format_dt(order_book.timestamp)})")
+        # Raise: broker time must match the snapshot time exactly
+        if self._timeline_dt != order_book.timestamp:
+            raise ValueError(f"Cannot call `process_order_book` because $timeline_dt ({format_dt(self._timeline_dt)}) does not match $order_book.timestamp ({format_dt(order_book.timestamp)}). TradingEngine must call `set_timeline_dt(order_book.timestamp)` immediately before calling `process_order_book`")
+
+        # Reusable variables
+        instrument = order_book.instrument
+
+        # Customize matching liquidity (simulates broker-specific environments)
+        customized_order_book = self._depth_model.customize_matching_liquidity(order_book)
+        # Store OrderBook and mark open positions to it
+        self._latest_order_book_by_instrument[instrument] = customized_order_book
+        if self._latest_trajectory_point_by_instrument:
+            self._latest_trajectory_point_by_instrument.pop(instrument, None)
+        valued_accounts = self._valued_accounts
+        for account in valued_accounts:
+            account._valuation.update_mark_price(customized_order_book)
+
+        # Process only orders that can trigger or fill on this top of book (the returned list is a
+        # copy, because matching can terminalize and remove orders)
+        order_index = self._order_index_by_instrument.get(instrument)
+        if order_index is not None:
+            account_by_order_id = self._account_by_order_id
+            for record in order_index.list_records_to_match(customized_order_book):
+                account = account_by_order_id.get(record.order.id)
+
+                # Skip: order was terminalized while earlier orders were matched
+                if account is None:
+                    continue
+
+                account._match_record_against_order_book(record, customized_order_book)
+
+        # Sample equity curves that are due (after fills of this snapshot)
+        for account in valued_accounts:
+            account._valuation.sample_if_due(order_book.timestamp, account.get_account())
+
+    # endregion
+
+    # region Protocol PriceTrajectoryProcessor
+
+    def process_price_trajectory_point(self, trajectory: OhlcPriceTrajectory, index: int) -> None:
+        """Implements: PriceTrajectoryProcessor.process_price_trajectory_point
+
+        Process point $index of $trajectory exactly like its OrderBook, but build that OrderBook
+        only if an order can trigger or fill at the point's price or an open position is marked
+        to it.
+
+        Args:
+            trajectory: Price trajectory of one Instrument.
+            index: Index of the point to process.
+        """
+        instrument = trajectory.instrument
+        price = trajectory.prices[index]
+
+        order_index = self._order_index_by_instrument.get(instrument)
+        needs_order_book = not self._is_depth_model_pass_through or (order_index is not None and order_index.has_orders_to_match_at(price, price)) or any(account.has_open_position(instrument) for account in self._valued_accounts)
+        if needs_order_book:
+            self.process_order_book(trajectory.get_order_book(index))
+            return
+
+        # Raise: same time contract as `process_order_book`
+        if self._timeline_dt != trajectory.timestamps[index]:
+            raise ValueError(f"Cannot call `process_price_trajectory_point` because $timeline_dt ({format_dt(self._timeline_dt) if self._timeline_dt else None}) does not match point timestamp ({format_dt(trajectory.timestamps[index])}). TradingEngine must call `set_timeline_dt` with the point timestamp immediately before")
+
+        # Nothing can trigger, fill or be marked here: remember the point instead of its OrderBook
+        self._latest_trajectory_point_by_instrument[instrument] = (trajectory, index)
+
+        # Sample equity curves that are due (same as after an OrderBook without fills)
+        for account in self._valued_accounts:
+            account._valuation.sample_if_due(self._timeline_dt, account.get_account())
+
+    # endregion
+
+    # region Protocol OrderBookDemandReporter
+
+    def needs_order_books(self, instrument: Instrument) -> bool:
+        """Implements: OrderBookDemandReporter.needs_order_books
+
+        Return True if any account of this group has an active (or in-flight) order for
+        $instrument, or holds a position in it that is marked to market.
+        """
+        if instrument in self._order_index_by_instrument or instrument in self._in_flight_submission_count_by_instrument:
+            return True
+
+        result = any(account.has_open_position(instrument) for account in self._valued_accounts)
+        return result
+
+    def set_latest_order_book(self, order_book: OrderBook) -> None:
+        """Implements: OrderBookDemandReporter.set_latest_order_book
+
+        Store $order_book (customized by the market-depth model) as the latest snapshot of its
+        Instrument, used to match orders at submission.
+        """
+        customized_order_book = self._depth_model.customize_matching_liquidity(order_book)
+        self._latest_order_book_by_instrument[order_book.instrument] = customized_order_book
+        if self._latest_trajectory_point_by_instrument:
+            self._latest_trajectory_point_by_instrument.pop(order_book.instrument, None)
+        for account in self._valued_accounts:
+            account._valuation.update_mark_price(customized_order_book)
+
+    # endregion
+
+    # region Properties
+
+    @property
+    def timeline_dt(self) -> datetime | None:
+        return self._timeline_dt
+
+    @property
+    def depth_model(self) -> MarketDepthModel:
+        return self._depth_model
+
+    # endregion
+
+    # region Utilities
+
+    # region ACCOUNT HOOKS (called by SimBroker)
+
+    def _add_account(self, account: SimBroker) -> None:
+        self._accounts.append(account)
+        if account.valuation is not None:
+            self._valued_accounts.append(account)
+
+    def _is_order_id_tracked(self, order_id: str) -> bool:
+        return order_id in self._account_by_order_id or order_id in self._in_flight_account_by_order_id
+
+    def _is_submission_in_flight(self, order: Order, account: SimBroker) -> bool:
+        return self._in_flight_account_by_order_id.get(order.id) is account
+
+    def _add_order(self, order: Order, account: SimBroker) -> OrderMatchingRecord:
+        """Index active $order of $account by instrument and trigger/limit price; return its matching record."""
+        order_index = self._order_index_by_instrument.get(order.instrument)
+        if order_index is None:
+            order_index = self._order_index_by_instrument[order.instrument] = OrderPriceIndex()
+        result = order_index.add(order)
+        self._account_by_order_id[order.id] = account
+        return result
+
+    def _refresh_order(self, order: Order) -> OrderMatchingRecord | None:
+        """Recompile and re-place $order in the price index after its state changed (e.g. stop triggered or updated)."""
+        order_index = self._order_index_by_instrument.get(order.instrument)
+        result = order_index.refresh(order) if order_index is not None else None
+        return result
+
+    def _get_matching_record(self, order: Order) -> OrderMatchingRecord | None:
+        order_index = self._order_index_by_instrument.get(order.instrument)
+        result = order_index.get_record(order) if order_index is not None else None
+        return result
+
+    def _remove_order(self, order: Order) -> None:
+        """Drop terminalized $order from the price index and mark its expiry entry (if any) as dead."""
+        self._account_by_order_id.pop(order.id, None)
+
+        order_index = self._order_index_by_instrument.get(order.instrument)
+        if order_index is not None:
+            order_index.remove(order)
+            if not order_index:
+                del self._order_index_by_instrument[order.instrument]
+
+        if order.id in self._expiring_order_ids:
+            self._expiring_order_ids.remove(order.id)
+            self._dead_expiry_count += 1
+            if 2 * self._dead_expiry_count > len(self._expiry_heap):
+                self._compact_expiry_heap()
+
+    def _schedule_order_expiry(self, expiry_dt: datetime, order: Order, account: SimBroker) -> None:
+        heappush(self._expiry_heap, (expiry_dt, next(self._expiry_sequence), order, account))
+        self._expiring_order_ids.add(order.id)
+
+    def _compact_expiry_heap(self) -> None:
+        """Drop dead entries from the expiry heap in place (O(n), amortized O(1) per terminalized order)."""
+        expiring_order_ids = self._expiring_order_ids
+        self._expiry_heap[:] = [entry for entry in self._expiry_heap if entry[2].id in expiring_order_ids]
+        heapify(self._expiry_heap)
+        self._dead_expiry_count = 0
+
+    def _schedule_request(self, arrival_dt: datetime, action: OrderAction, order: Order, account: SimBroker) -> None:
+        """Put request $action for $order of $account in flight until $arrival_dt (O(log n)).
+
+        A request never arrives before an earlier request for the same $order.
+        """
+        last_arrival = self._last_request_arrival_by_order_id.get(order.id)
+        if last_arrival is not None and last_arrival[0] > arrival_dt:
+            arrival_dt = last_arrival[0]
+
+        sequence = next(self._request_sequence)
+        heappush(self._request_heap, (arrival_dt, sequence, action, order, account))
+        self._last_request_arrival_by_order_id[order.id] = (arrival_dt, sequence)
+
+        if action is OrderAction.SUBMIT:
+            self._in_flight_account_by_order_id[order.id] = account
+            count_by_instrument = self._in_flight_submission_count_by_instrument
+            count_by_instrument[order.instrument] = count_by_instrument.get(order.instrument, 0) + 1
+
+    def _release_next_request(self) -> None:
+        """Pop the earliest in-flight request and hand it to its account."""
+        arrival_dt, sequence, action, order, account = heappop(self._request_heap)
+
+        if self._last_request_arrival_by_order_id.get(order.id) == (arrival_dt, sequence):
+            del self._last_request_arrival_by_order_id[order.id]
+
+        if action is OrderAction.SUBMIT:
+            del self._in_flight_account_by_order_id[order.id]
+            count_by_instrument = self._in_flight_submission_count_by_instrument
+            remaining_count = count_by_instrument[order.instrument] - 1
+            if remaining_count:
+                count_by_instrument[order.instrument] = remaining_count
+            else:
+                del count_by_instrument[order.instrument]
+
+        account._apply_arrived_request(action, order)
+
+    def _get_latest_order_book(self, instrument: Instrument) -> OrderBook | None:
+        # Build the OrderBook of a skipped trajectory point on first request (pass-through depth model)
+        if self._latest_trajectory_point_by_instrument:
+            point = self._latest_trajectory_point_by_instrument.pop(instrument, None)
+            if point is not None:
+                trajectory, index = point
+                self._latest_order_book_by_instrument[instrument] = trajectory.get_order_book(index)
+
+        return self._latest_order_book_by_instrument.get(instrument)
+
+    # endregion
+
+    # region DEFAULTS
+
+    def _build_default_market_depth_model(self) -> MarketDepthModel:
+        """Build the default MarketDepthModel used by this group.
+
+        Returns:
+            A MarketDepthModel instance.
+        """
+        return PassThroughMarketDepthModel()
+
+    # endregion
+
+    # endregion
+
+    # region Magic
+
+    def __str__(self) -> str:
+        return f"{self.__class__.__name__}(accounts={len(self._accounts)}, active_orders={len(self._account_by_order_id)}, timeline_dt={format_dt(self._timeline_dt) if self._timeline_dt else None})"
+
+    def __repr__(self) -> str:
+        return self.__str__()
+
+    # endregion
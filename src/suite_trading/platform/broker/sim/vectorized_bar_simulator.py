@@ -0,0 +1,364 @@
+from __future__ import annotations
+
+from typing import NamedTuple
+
+import numpy as np
+import pandas as pd
+from numpy.typing import ArrayLike
+
+from suite_trading.domain.instrument import Instrument
+from suite_trading.platform.broker.sim.models.fee.fixed_fee import FixedFeeModel
+from suite_trading.platform.broker.sim.models.margin.fixed_ratio import FixedRatioMarginModel
+from suite_trading.utils.numeric_tools import DecimalLike, as_decimal
+
+
+class VectorizedBarBacktestResult(NamedTuple):
+    """Column arrays produced by `VectorizedBarSimulator.run`.
+
+    Fill columns hold one row per fill. Bar columns hold one row per input bar with the state
+    after all fills of that bar, including fills of orders submitted at its close.
+    """
+
+    # FILLS
+    fill_bar_indices: np.ndarray
+    fill_prices: np.ndarray
+    fill_signed_qtys: np.ndarray
+    fill_commissions: np.ndarray
+
+    # BARS
+    signed_positions: np.ndarray
+    cumulative_fees: np.ndarray
+    blocked_maint_margins: np.ndarray
+    equity: np.ndarray
+
+    def fills_to_dataframe(self) -> pd.DataFrame:
+        """Return fill columns as a DataFrame with one row per fill."""
+        result = pd.DataFrame(
+            {
+                "bar_index": self.fill_bar_indices,
+                "price": self.fill_prices,
+                "signed_qty": self.fill_signed_qtys,
+                "commission": self.fill_commissions,
+            },
+        )
+        return result
+
+    def bars_to_dataframe(self) -> pd.DataFrame:
+        """Return bar columns as a DataFrame with one row per input bar."""
+        result = pd.DataFrame(
+            {
+                "signed_position": self.signed_positions,
+                "cumulative_fees": self.cumulative_fees,
+                "blocked_maint_margin": self.blocked_maint_margins,
+                "equity": self.equity,
+            },
+        )
+        return result
+
+
+class VectorizedBarSimulator:
+    """Bar-level backtest over column arrays that reproduces `SimBroker` for target-position strategies.
+
+    Use it to sweep many parameter sets quickly; the event-driven `TradingEngine` + `SimBroker`
+    remain the reference for anything beyond the rules below.
+
+    Rules (same as a `SimBroker` fed by `bar_to_order_books` with a `DistributionFillModel` that
+    never adjusts prices and always fills on touch):
+    - At the close of bar $i where $signals[i] is True, an order for
+      $target_positions[i] - current position is submitted.
+    - Market orders fill at the close of bar $i.
+    - A limit order ($limit_prices[i] is not NaN) fills at the close of bar $i if that price is
+      marketable; otherwise it rests during bar $i + 1, whose OrderBooks come in O → H → L → C
+      order: a buy fills at the open if open <= limit, else at the low if low <= limit (sells
+      mirror this with the high). An unfilled order is cancelled at the close of bar $i + 1.
+    - Commission is `FixedFeeModel.fee_per_unit` × abs quantity. Margins follow
+      `FixedRatioMarginModel` at the fill price: a fill needs available funds for
+      max(initial margin of the position increase, maintenance-margin change) + commission,
+      otherwise the whole order is cancelled. Maintenance margin stays blocked at the value of the
+      last fill.
+    - Equity = initial funds - fees + traded cash + position marked to the bar close.
+
+    Notes:
+        - Bar volume is assumed to cover every order, so each order fills in one piece.
+        - Values are float64 rounded to currency precision like `Money`, so amounts that tie
+          exactly in Decimal may round or compare differently.
+        - Market-only runs are computed fully vectorized; runs with limit orders, or market runs
+          where some fill lacks funds, fall back to one pass over the bars.
+
+    Example:
+        simulator = VectorizedBarSimulator(instrument, fee_model=fee_model, initial_funds=100_000)
+        result = simulator.run(opens, highs, lows, closes, target_positions)
+        result.bars_to_dataframe()["equity"].plot()
+    """
+
+    __slots__ = ("_contract_size", "_fee_per_unit", "_fee_decimals", "_initial_margin_ratio", "_maint_margin_ratio", "_margin_decimals", "_initial_funds")
+
+    # region Init
+
+    def __init__(
+        self,
+        instrument: Instrument,
+        *,
+        fee_model: FixedFeeModel | None = None,
+        margin_model: FixedRatioMarginModel | None = None,
+        initial_funds: DecimalLike = 0,
+    ) -> None:
+        """Create a simulator for bars of $instrument.
+
+        Args:
+            instrument: Traded Instrument; provides $contract_size and the margin currency.
+            fee_model: Commission rules. If None, no commission is charged (as in `SimBroker`).
+            margin_model: Margin rules. If None, no margin is required (as in `SimBroker`).
+            initial_funds: Funds available before the first bar.
+        """
+        self._contract_size = float(instrument.contract_size)
+        self._fee_per_unit = float(fee_model.fee_per_unit.value) if fee_model is not None else 0.0
+        self._fee_decimals = fee_model.fee_per_unit.currency.precision if fee_model is not None else 0
+        self._initial_margin_ratio = float(margin_model.initial_margin_ratio) if margin_model is not None else 0.0
+        self._maint_margin_ratio = float(margin_model.maint_margin_ratio) if margin_model is not None else 0.0
+        self._margin_decimals = instrument.settlement_currency.precision
+        self._initial_funds = float(as_decimal(initial_funds))
+
+    # endregion
+
+    # region Main
+
+    def run(
+        self,
+        open_prices: ArrayLike,
+        high_prices: ArrayLike,
+        low_prices: ArrayLike,
+        close_prices: ArrayLike,
+        target_positions: ArrayLike,
+        *,
+        signals: ArrayLike | None = None,
+        limit_prices: ArrayLike | None = None,
+    ) -> VectorizedBarBacktestResult:
+        """Simulate orders that move the position to $target_positions at bar closes.
+
+        Args:
+            open_prices: Open price per bar.
+            high_prices: High price per bar.
+            low_prices: Low price per bar.
+            close_prices: Close price per bar.
+            target_positions: Signed target position per bar, used where $signals is True.
+            signals: Boolean per bar; True submits an order at that close. If None, every bar is
+                a signal.
+            limit_prices: Limit price per bar; NaN submits a market order. If None, all orders are
+                market orders.
+
+        Returns:
+            VectorizedBarBacktestResult: Fills and per-bar positions, fees, margins and equity.
+
+        Raises:
+            ValueError: If the arrays are not 1-D with equal length, or a signalled target is not finite.
+        """
+        opens = np.asarray(open_prices, dtype=np.float64)
+        highs = np.asarray(high_prices, dtype=np.float64)
+        lows = np.asarray(low_prices, dtype=np.float64)
+        closes = np.asarray(close_prices, dtype=np.float64)
+        targets = np.asarray(target_positions, dtype=np.float64)
+        signal_mask = np.ones(closes.shape, dtype=bool) if signals is None else np.asarray(signals, dtype=bool)
+        limits = None if limit_prices is None else np.asarray(limit_prices, dtype=np.float64)
+
+        # Raise: all columns must be 1-D with one value per bar
+        columns = [opens, highs, lows, closes, targets, signal_mask] + ([] if limits is None else [limits])
+        if closes.ndim != 1 or any(column.shape != closes.shape for column in columns):
+            raise ValueError(f"Cannot call `run` because input arrays are not 1-D with equal length (shapes: {[column.shape for column in columns]})")
+        # Raise: signalled targets must be real quantities
+        if not np.all(np.isfinite(targets[signal_mask])):
+            raise ValueError("Cannot call `run` because $target_positions contains a non-finite value at a bar where $signals is True")
+
+        # Fast path: market orders only, valid when every fill is funded
+        if limits is None or np.all(np.isnan(limits)):
+            result = self._run_market_orders_vectorized(closes, targets, signal_mask)
+            if result is not None:
+                return result
+            limits = np.full(len(closes), np.nan)
+
+        result = self._run_bar_by_bar(opens, highs, lows, closes, targets, signal_mask, limits)
+        return result
+
+    # endregion
+
+    # region Properties
+
+    @property
+    def initial_funds(self) -> float:
+        return self._initial_funds
+
+    # endregion
+
+    # region Utilities
+
+    def _run_market_orders_vectorized(self, closes: np.ndarray, targets: np.ndarray, signal_mask: np.ndarray) -> VectorizedBarBacktestResult | None:
+        """Simulate market orders with array operations; return None if any fill lacks funds."""
+        # Position held after each bar = target of the latest signal so far (flat before the first one)
+        bar_indices = np.arange(len(closes))
+        latest_signal_indices = np.maximum.accumulate(np.where(signal_mask, bar_indices, -1))
+        held_positions = np.where(latest_signal_indices >= 0, targets[np.maximum(latest_signal_indices, 0)], 0.0)
+
+        # Fills = position changes, executed at the close
+        position_changes = np.diff(held_positions, prepend=0.0)
+        fill_bar_indices = np.flatnonzero(position_changes)
+        fill_signed_qtys = position_changes[fill_bar_indices]
+        fill_prices = closes[fill_bar_indices]
+        positions_after = held_positions[fill_bar_indices]
+        positions_before = positions_after - fill_signed_qtys
+
+        # Funding requirement per fill (same formula as `_compute_fill_funding`)
+        unit_notionals = np.abs(fill_prices) * self._contract_size
+        fill_commissions = np.round(np.abs(fill_signed_qtys) * self._fee_per_unit, self._fee_decimals)
+        initial_margin_deltas = np.round(np.maximum(0.0, np.abs(positions_after) - np.abs(positions_before)) * unit_notionals * self._initial_margin_ratio, self._margin_decimals)
+        maint_margins_after = np.round(np.abs(positions_after) * unit_notionals * self._maint_margin_ratio, self._margin_decimals)
+        maint_margin_deltas = maint_margins_after - np.round(np.abs(positions_before) * unit_notionals * self._maint_margin_ratio, self._margin_decimals)
+        peak_funds_required = np.maximum(initial_margin_deltas, maint_margin_deltas) + fill_commissions
+
+        # Funds available before each fill = initial funds - fees paid so far - margin blocked by previous fill
+        fees_paid_before = np.cumsum(fill_commissions) - fill_commissions
+        blocked_before = np.concatenate(([0.0], maint_margins_after[:-1]))
+        available_funds = self._initial_funds - fees_paid_before - blocked_before
+
+        # Skip: a rejected fill changes all later positions, so it needs the bar-by-bar pass
+        if np.any(available_funds < peak_funds_required):
+            return None
+
+        result = self._build_result(closes, fill_bar_indices, fill_prices, fill_signed_qtys, fill_commissions, maint_margins_after)
+        return result
+
+    def _run_bar_by_bar(
+        self,
+        opens: np.ndarray,
+        highs: np.ndarray,
+        lows: np.ndarray,
+        closes: np.ndarray,
+        targets: np.ndarray,
+        signal_mask: np.ndarray,
+        limits: np.ndarray,
+    ) -> VectorizedBarBacktestResult:
+        """Simulate market and limit orders in one pass over the bars."""
+        # Plain Python floats are faster than NumPy scalars in a scalar loop
+        opens_list, highs_list, lows_list, closes_list = opens.tolist(), highs.tolist(), lows.tolist(), closes.tolist()
+        targets_list, signals_list, limits_list = targets.tolist(), signal_mask.tolist(), limits.tolist()
+
+        # Account state
+        position = 0.0
+        paid_fees = 0.0
+        blocked_maint_margin = 0.0
+
+        # Fill columns
+        fill_bar_indices: list[int] = []
+        fill_prices: list[float] = []
+        fill_signed_qtys: list[float] = []
+        fill_commissions: list[float] = []
+        maint_margins_after: list[float] = []
+
+        def fill_if_funded(index: int, signed_qty: float, price: float) -> None:
+            nonlocal position, paid_fees, blocked_maint_margin
+            commission, maint_margin_after, peak_funds_required = self._compute_fill_funding(position, signed_qty, price)
+
+            # Skip: insufficient funds cancel the whole order (as in `SimBroker`)
+            if self._initial_funds - paid_fees - blocked_maint_margin < peak_funds_required:
+                return
+
+            position += signed_qty
+            paid_fees += commission
+            blocked_maint_margin = maint_margin_after
+            fill_bar_indices.append(index)
+            fill_prices.append(price)
+            fill_signed_qtys.append(signed_qty)
+            fill_commissions.append(commission)
+            maint_margins_after.append(maint_margin_after)
+
+        # Limit order submitted at the previous close and resting during the current bar
+        resting_signed_qty = 0.0
+        resting_limit_price = 0.0
+
+        for index in range(len(closes_list)):
+            # Resting limit order trades through this bar's O → H → L books, else it is cancelled at the close
+            if resting_signed_qty != 0.0:
+                open_price = opens_list[index]
+                if resting_signed_qty > 0:
+                    fill_price = open_price if open_price <= resting_limit_price else lows_list[index] if lows_list[index] <= resting_limit_price else None
+                else:
+                    fill_price = open_price if open_price >= resting_limit_price else highs_list[index] if highs_list[index] >= resting_limit_price else None
+                if fill_price is not None:
+                    fill_if_funded(index, resting_signed_qty, fill_price)
+                resting_signed_qty = 0.0
+
+            # Skip: no order submitted at this close
+            if not signals_list[index]:
+                continue
+            signed_qty = targets_list[index] - position
+            if signed_qty == 0.0:
+                continue
+
+            # New order matches the close book at submission, otherwise it rests for the next bar
+            close_price = closes_list[index]
+            limit_price = limits_list[index]
+            is_market_order = limit_price != limit_price  # NaN
+            if is_market_order or (close_price <= limit_price if signed_qty > 0 else close_price >= limit_price):
+                fill_if_funded(index, signed_qty, close_price)
+            else:
+                resting_signed_qty, resting_limit_price = signed_qty, limit_price
+
+        result = self._build_result(
+            closes,
+            np.asarray(fill_bar_indices, dtype=np.int64),
+            np.asarray(fill_prices, dtype=np.float64),
+            np.asarray(fill_signed_qtys, dtype=np.float64),
+            np.asarray(fill_commissions, dtype=np.float64),
+            np.asarray(maint_margins_after, dtype=np.float64),
+        )
+        return result
+
+    def _compute_fill_funding(self, position: float, signed_qty: float, price: float) -> tuple[float, float, float]:
+        """Return (commission, maint_margin_after, peak_funds_required) for one fill, as `SimBroker` computes them.
+
+        Each amount is rounded to its currency precision, like `Money`.
+        """
+        abs_position_before = abs(position)
+        abs_position_after = abs(position + signed_qty)
+        unit_notional = abs(price) * self._contract_size
+
+        commission = round(abs(signed_qty) * self._fee_per_unit, self._fee_decimals)
+        initial_margin_delta = round(max(0.0, abs_position_after - abs_position_before) * unit_notional * self._initial_margin_ratio, self._margin_decimals)
+        maint_margin_after = round(abs_position_after * unit_notional * self._maint_margin_ratio, self._margin_decimals)
+        maint_margin_delta = maint_margin_after - round(abs_position_before * unit_notional * self._maint_margin_ratio, self._margin_decimals)
+        peak_funds_required = max(initial_margin_delta, maint_margin_delta) + commission
+
+        result = commission, maint_margin_after, peak_funds_required
+        return result
+
+    def _build_result(
+        self,
+        closes: np.ndarray,
+        fill_bar_indices: np.ndarray,
+        fill_prices: np.ndarray,
+        fill_signed_qtys: np.ndarray,
+        fill_commissions: np.ndarray,
+        maint_margins_after: np.ndarray,
+    ) -> VectorizedBarBacktestResult:
+        """Derive per-bar columns from fill columns."""
+        # Number of fills up to and including each bar (fills are in bar order)
+        fill_counts = np.searchsorted(fill_bar_indices, np.arange(len(closes)), side="right")
+
+        signed_positions = np.concatenate(([0.0], np.cumsum(fill_signed_qtys)))[fill_counts]
+        cumulative_fees = np.concatenate(([0.0], np.cumsum(fill_commissions)))[fill_counts]
+        blocked_maint_margins = np.concatenate(([0.0], maint_margins_after))[fill_counts]
+        traded_cash = np.concatenate(([0.0], np.cumsum(-fill_signed_qtys * fill_prices * self._contract_size)))[fill_counts]
+        equity = self._initial_funds - cumulative_fees + traded_cash + signed_positions * closes * self._contract_size
+
+        result = VectorizedBarBacktestResult(
+            fill_bar_indices=fill_bar_indices,
+            fill_prices=fill_prices,
+            fill_signed_qtys=fill_signed_qtys,
+            fill_commissions=fill_commissions,
+            signed_positions=signed_positions,
+            cumulative_fees=cumulative_fees,
+            blocked_maint_margins=blocked_maint_margins,
+            equity=equity,
+        )
+        return result
+
+    # endregion
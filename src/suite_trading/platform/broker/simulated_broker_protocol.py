@@ -3,6 +3,8 @@ from __future__ import annotations
 from datetime import datetime
 from typing import Protocol, runtime_checkable
 
+from suite_trading.domain.instrument import Instrument
+from suite_trading.domain.market_data.order_book.ohlc_price_trajectory import OhlcPriceTrajectory
 from suite_trading.domain.market_data.order_book.order_book import OrderBook
 
 
@@ -34,3 +36,67 @@ class SimulatedBroker(Protocol):
             order_book: OrderBook snapshot to process.
         """
         ...
+
+
+@runtime_checkable
+class OrderBookDemandReporter(Protocol):
+    """Simulated brokers that report which Instrument(s) need OrderBook snapshots.
+
+    The `TradingEngine` converts fill-driving events to OrderBook(s) only when some simulated
+    broker needs them for the event's Instrument. Simulated brokers that do not implement this
+    protocol are assumed to need OrderBook(s) for every Instrument.
+
+    When conversion was skipped, the engine passes the latest OrderBook of an Instrument via
+    `set_latest_order_book` just before an order for that Instrument is submitted, so the order
+    can still be matched immediately.
+    """
+
+    def needs_order_books(self, instrument: Instrument) -> bool:
+        """Return True if OrderBook snapshots of $instrument can trigger or fill any order now.
+
+        Args:
+            instrument: Instrument to check.
+        """
+        ...
+
+    def set_latest_order_book(self, order_book: OrderBook) -> None:
+        """Remember $order_book as the latest known market state of its Instrument, without matching.
+
+        Args:
+            order_book: Latest OrderBook snapshot of an Instrument with no orders in this broker.
+        """
+        ...
+
+
+@runtime_checkable
+class PriceTrajectoryProcessor(Protocol):
+    """Simulated brokers that match points of an `OhlcPriceTrajectory` without full OrderBook(s).
+
+    For each point, the `TradingEngine` calls `set_timeline_dt(trajectory.timestamps[index])` and
+    then `process_price_trajectory_point` instead of `process_order_book`. Results must be
+    identical to processing `trajectory.get_order_book(index)`; the broker only saves work for
+    points at which nothing can trigger or fill.
+    """
+
+    def process_price_trajectory_point(self, trajectory: OhlcPriceTrajectory, index: int) -> None:
+        """Match point $index of $trajectory, like `process_order_book(trajectory.get_order_book(index))`.
+
+        Args:
+            trajectory: Price trajectory of one Instrument.
+            index: Index of the point to process.
+        """
+        ...
+
+
+@runtime_checkable
+class SimulatedBrokerGroupMember(Protocol):
+    """Simulated broker accounts whose time and matching are driven by a shared group.
+
+    The `TradingEngine` drives each distinct $group once per step (time injection and
+    OrderBook routing) instead of driving every member account separately.
+    """
+
+    @property
+    def group(self) -> SimulatedBroker:
+        """Return the simulated broker that drives time and matching for this account."""
+        ...
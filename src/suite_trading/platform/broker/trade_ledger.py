@@ -0,0 +1,308 @@
+from __future__ import annotations
+
+from collections.abc import Mapping
+from datetime import datetime, timezone
+from decimal import Decimal
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from suite_trading.domain.instrument import Instrument
+from suite_trading.domain.monetary.money import Money
+from suite_trading.domain.order.order_fill import OrderFill
+from suite_trading.platform.broker.account import BlockedMargins
+from suite_trading.utils.numeric_tools import as_decimal
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+# Largest magnitude of a scaled "decimal" value (int64)
+_MAX_SCALED_INT = 2**63 - 1
+
+# Column kind → dtype of the stored chunk (categories are stored as int32 codes)
+_DTYPE_BY_COLUMN_KIND = {
+    "datetime": np.int64,
+    "decimal": np.dtype([("scaled", np.int64), ("exponent", np.int8)]),
+    "float": np.float64,
+    "str": object,
+    "category": np.int32,
+}
+
+
+class LedgerTable:
+    """Append-only table whose columns are stored in fixed-size NumPy chunks.
+
+    Rows are appended one at a time into preallocated chunks, so appending never copies earlier
+    rows and one row costs a few dozen bytes instead of a rich Python object graph.
+
+    Column kinds:
+    - "datetime": timezone-aware UTC datetime, stored as int64 microseconds since the UNIX epoch.
+    - "decimal": Decimal-like, stored exactly as an int64 scaled value with its int8 decimal exponent.
+    - "float": Decimal or float, stored as float64.
+    - "str": arbitrary string, stored as a Python object.
+    - "category": low-cardinality string (e.g. instrument, currency), stored as int32 code.
+
+    `to_dataframe` hands numeric and code arrays to pandas without copying them only while all rows
+    fit into the first chunk; once more chunks exist, every export concatenates them per column.
+    "decimal" columns are always exported as `Decimal` objects.
+    """
+
+    __slots__ = ("_kind_by_column", "_chunk_size", "_full_chunks", "_current_chunk", "_current_row_count", "_full_row_count", "_categories_by_column", "_code_by_category_by_column")
+
+    # region Init
+
+    def __init__(self, kind_by_column: Mapping[str, str], *, chunk_size: int = 4096) -> None:
+        """Create an empty table.
+
+        Args:
+            kind_by_column: Column name → kind ("datetime", "decimal", "float", "str" or "category"), in order.
+            chunk_size: Number of rows stored per chunk.
+
+        Raises:
+            ValueError: If $chunk_size is not positive or a column kind is unknown.
+        """
+        # Raise: chunks must hold at least one row
+        if chunk_size <= 0:
+            raise ValueError(f"Cannot call `LedgerTable.__init__` because $chunk_size ({chunk_size}) is not positive")
+        # Raise: every column kind must be supported
+        unknown_kinds = [kind for kind in kind_by_column.values() if kind not in _DTYPE_BY_COLUMN_KIND]
+        if unknown_kinds:
+            raise ValueError(f"Cannot call `LedgerTable.__init__` because $kind_by_column contains unknown kinds ({unknown_kinds})")
+
+        self._kind_by_column: dict[str, str] = dict(kind_by_column)
+        self._chunk_size = chunk_size
+
+        # CHUNKS (one array per column; the current chunk is filled up to $_current_row_count)
+        self._full_chunks: list[list[np.ndarray]] = []
+        self._current_chunk: list[np.ndarray] = self._allocate_chunk()
+        self._current_row_count = 0
+        self._full_row_count = 0
+
+        # CATEGORIES (per category column: code → value and value → code)
+        self._categories_by_column: dict[str, list[str]] = {name: [] for name, kind in self._kind_by_column.items() if kind == "category"}
+        self._code_by_category_by_column: dict[str, dict[str, int]] = {name: {} for name in self._categories_by_column}
+
+    # endregion
+
+    # region Main
+
+    def append(self, *values: object) -> None:
+        """Append one row with $values given in column order.
+
+        Raises:
+            ValueError: If the number of $values does not match the number of columns, or a
+                "decimal" value does not fit an int64 scaled value.
+        """
+        # Raise: one value per column
+        if len(values) != len(self._kind_by_column):
+            raise ValueError(f"Cannot call `append` because $values has {len(values)} items but the table has {len(self._kind_by_column)} columns ({list(self._kind_by_column)})")
+
+        # Start a new chunk when the current one is full
+        if self._current_row_count == self._chunk_size:
+            self._full_chunks.append(self._current_chunk)
+            self._full_row_count += self._chunk_size
+            self._current_chunk = self._allocate_chunk()
+            self._current_row_count = 0
+
+        row = self._current_row_count
+        for column_array, (name, kind), value in zip(self._current_chunk, self._kind_by_column.items(), values):
+            column_array[row] = self._encode_value(name, kind, value)
+        self._current_row_count += 1
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """Return all rows as a DataFrame (datetimes as UTC, decimals as `Decimal`, categories as pandas Categoricals)."""
+        data = {}
+        for column_index, (name, kind) in enumerate(self._kind_by_column.items()):
+            column_array = self._get_column_array(column_index)
+            if kind == "datetime":
+                data[name] = pd.DatetimeIndex(column_array.view("datetime64[us]"), tz="UTC")
+            elif kind == "decimal":
+                data[name] = np.array([Decimal(scaled).scaleb(exponent) for scaled, exponent in zip(column_array["scaled"].tolist(), column_array["exponent"].tolist())], dtype=object)
+            elif kind == "category":
+                data[name] = pd.Categorical.from_codes(column_array, categories=self._categories_by_column[name])
+            else:
+                data[name] = column_array
+
+        result = pd.DataFrame(data, copy=False)
+        return result
+
+    # endregion
+
+    # region Properties
+
+    @property
+    def column_names(self) -> list[str]:
+        return list(self._kind_by_column)
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes allocated for numeric and code chunks (string objects are not counted)."""
+        chunks = self._full_chunks + [self._current_chunk]
+        return sum(column_array.nbytes for chunk in chunks for column_array in chunk)
+
+    # endregion
+
+    # region Utilities
+
+    def _allocate_chunk(self) -> list[np.ndarray]:
+        return [np.empty(self._chunk_size, dtype=_DTYPE_BY_COLUMN_KIND[kind]) for kind in self._kind_by_column.values()]
+
+    def _encode_value(self, name: str, kind: str, value: object) -> object:
+        if kind == "datetime":
+            delta = value - _EPOCH
+            return (delta.days * 86_400 + delta.seconds) * 1_000_000 + delta.microseconds
+        if kind == "decimal":
+            return _to_scaled_int_with_exponent(name, value)
+        if kind == "float":
+            return float(value)
+        if kind == "category":
+            code_by_category = self._code_by_category_by_column[name]
+            code = code_by_category.get(value)
+            if code is None:
+                code = code_by_category[value] = len(code_by_category)
+                self._categories_by_column[name].append(value)
+            return code
+        return value
+
+    def _get_column_array(self, column_index: int) -> np.ndarray:
+        """Return the filled rows of one column; a view when all rows are in the current chunk."""
+        current_rows = self._current_chunk[column_index][: self._current_row_count]
+        if not self._full_chunks:
+            return current_rows
+
+        result = np.concatenate([chunk[column_index] for chunk in self._full_chunks] + [current_rows])
+        return result
+
+    # endregion
+
+    # region Magic
+
+    def __len__(self) -> int:
+        return self._full_row_count + self._current_row_count
+
+    def __str__(self) -> str:
+        return f"{self.__class__.__name__}(columns={list(self._kind_by_column)}, rows={len(self)})"
+
+    def __repr__(self) -> str:
+        return self.__str__()
+
+    # endregion
+
+
+class TradeLedger:
+    """Append-only columnar record of order fills, paid fees and blocked-margin changes.
+
+    Keeps plain column values (no references to `Order` or `OrderFill` objects), so it can
+    stay enabled for runs of any length and be exported to pandas or Parquet for analysis.
+
+    Tables:
+    - fills: timestamp, order_id, instrument, signed_qty, price, commission, currency
+    - fees: timestamp, order_id, instrument, amount, currency
+    - margins: timestamp, instrument, blocked_initial, blocked_maint, currency (state after each change)
+
+    Decimal values are stored exactly (as scaled int64 values) and exported as `Decimal` objects.
+    """
+
+    __slots__ = ("_fills", "_fees", "_margins")
+
+    # region Init
+
+    def __init__(self, *, chunk_size: int = 4096) -> None:
+        """Create an empty ledger.
+
+        Args:
+            chunk_size: Number of rows stored per chunk in each table.
+        """
+        self._fills = LedgerTable({"timestamp": "datetime", "order_id": "str", "instrument": "category", "signed_qty": "decimal", "price": "decimal", "commission": "decimal", "currency": "category"}, chunk_size=chunk_size)
+        self._fees = LedgerTable({"timestamp": "datetime", "order_id": "str", "instrument": "category", "amount": "decimal", "currency": "category"}, chunk_size=chunk_size)
+        self._margins = LedgerTable({"timestamp": "datetime", "instrument": "category", "blocked_initial": "decimal", "blocked_maint": "decimal", "currency": "category"}, chunk_size=chunk_size)
+
+    # endregion
+
+    # region Main
+
+    def record_order_fill(self, order_fill: OrderFill) -> None:
+        """Append one row for $order_fill to the fills table."""
+        commission = order_fill.commission
+        self._fills.append(order_fill.timestamp, order_fill.order.id, str(order_fill.order.instrument), order_fill.signed_quantity, order_fill.price, commission.value, commission.currency.code)
+
+    def record_fee(self, timestamp: datetime, order_id: str, instrument: Instrument, amount: Money) -> None:
+        """Append one row for a fee of $amount paid for $order_id to the fees table."""
+        self._fees.append(timestamp, order_id, str(instrument), amount.value, amount.currency.code)
+
+    def record_blocked_margins(self, timestamp: datetime, instrument: Instrument, blocked_margins: BlockedMargins) -> None:
+        """Append the $blocked_margins of $instrument after a change to the margins table."""
+        self._margins.append(timestamp, str(instrument), blocked_margins.initial.value, blocked_margins.maintenance.value, blocked_margins.maintenance.currency.code)
+
+    def fills_to_dataframe(self) -> pd.DataFrame:
+        return self._fills.to_dataframe()
+
+    def fees_to_dataframe(self) -> pd.DataFrame:
+        return self._fees.to_dataframe()
+
+    def margins_to_dataframe(self) -> pd.DataFrame:
+        return self._margins.to_dataframe()
+
+    def write_parquet(self, directory: str | Path) -> list[Path]:
+        """Write each table to `<table>.parquet` in $directory (created if missing).
+
+        Requires a pandas Parquet engine (pyarrow or fastparquet) to be installed.
+
+        Returns:
+            list[Path]: Paths of the written files (fills, fees, margins).
+        """
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+
+        result = []
+        for table_name, table in (("fills", self._fills), ("fees", self._fees), ("margins", self._margins)):
+            path = directory / f"{table_name}.parquet"
+            table.to_dataframe().to_parquet(path, index=False)
+            result.append(path)
+        return result
+
+    # endregion
+
+    # region Properties
+
+    @property
+    def fill_count(self) -> int:
+        return len(self._fills)
+
+    @property
+    def fee_count(self) -> int:
+        return len(self._fees)
+
+    @property
+    def margin_change_count(self) -> int:
+        return len(self._margins)
+
+    # endregion
+
+    # region Magic
+
+    def __str__(self) -> str:
+        return f"{self.__class__.__name__}(fills={len(self._fills)}, fees={len(self._fees)}, margin_changes={len(self._margins)})"
+
+    def __repr__(self) -> str:
+        return self.__str__()
+
+    # endregion
+
+
+def _to_scaled_int_with_exponent(name: str, value: object) -> tuple[int, int]:
+    """Return $value as `(scaled, exponent)` with `value == scaled * 10**exponent`."""
+    decimal_value = as_decimal(value)
+    exponent = decimal_value.as_tuple().exponent
+    scaled = int(decimal_value.scaleb(-exponent)) if isinstance(exponent, int) else None
+
+    # Strip trailing zeros when the value does not fit (e.g. an 18-decimal currency amount)
+    if scaled is not None and not -_MAX_SCALED_INT <= scaled <= _MAX_SCALED_INT:
+        exponent = decimal_value.normalize().as_tuple().exponent
+        scaled = int(decimal_value.scaleb(-exponent))
+
+    # Raise: value must be finite and fit the int64 scaled value with an int8 exponent
+    if scaled is None or not -_MAX_SCALED_INT <= scaled <= _MAX_SCALED_INT or not -128 <= exponent <= 127:
+        raise ValueError(f"Cannot store ${name} ({value}) in `LedgerTable` because it does not fit an int64 scaled value")
+
+    result = (scaled, exponent)
+    return result
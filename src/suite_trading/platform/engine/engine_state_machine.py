@@ -1,4 +1,8 @@
-from suite_trading.utils.state_machine import State, Action, StateMachine
+from __future__ import annotations
+
+from typing import Final
+
+from suite_trading.utils.state_machine import State, Action, StateMachine, TransitionTable
 
 
 class EngineState(State):
@@ -46,6 +50,16 @@ class EngineAction(Action):
     ERROR_OCCURRED = "ERROR_OCCURRED"
 
 
+_ENGINE_TRANSITION_TABLE: Final[TransitionTable[EngineState, EngineAction]] = TransitionTable(
+    {
+        (EngineState.NEW, EngineAction.START_ENGINE): EngineState.RUNNING,
+        (EngineState.NEW, EngineAction.ERROR_OCCURRED): EngineState.ERROR,
+        (EngineState.RUNNING, EngineAction.STOP_ENGINE): EngineState.STOPPED,
+        (EngineState.RUNNING, EngineAction.ERROR_OCCURRED): EngineState.ERROR,
+    },
+)
+
+
 def create_engine_state_machine() -> StateMachine[EngineState, EngineAction]:
     """Create a configured StateMachine for TradingEngine lifecycle management.
 
@@ -53,11 +67,4 @@ def create_engine_state_machine() -> StateMachine[EngineState, EngineAction]:
         StateMachine[EngineState, EngineAction]: A StateMachine instance configured with TradingEngine transitions,
         starting in NEW state.
     """
-    transitions = {
-        (EngineState.NEW, EngineAction.START_ENGINE): EngineState.RUNNING,
-        (EngineState.NEW, EngineAction.ERROR_OCCURRED): EngineState.ERROR,
-        (EngineState.RUNNING, EngineAction.STOP_ENGINE): EngineState.STOPPED,
-        (EngineState.RUNNING, EngineAction.ERROR_OCCURRED): EngineState.ERROR,
-    }
-
-    return StateMachine(EngineState.NEW, transitions)
+    return StateMachine(EngineState.NEW, _ENGINE_TRANSITION_TABLE)
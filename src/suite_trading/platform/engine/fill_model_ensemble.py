@@ -0,0 +1,225 @@
+from __future__ import annotations
+
+import logging
+from collections.abc import Callable, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from decimal import Decimal
+from typing import NamedTuple
+
+import pandas as pd
+
+from suite_trading.domain.event import Event
+from suite_trading.domain.monetary.currency import Currency
+from suite_trading.platform.broker.sim.sim_broker import SimBroker
+from suite_trading.platform.engine.trading_engine import TradingEngine
+from suite_trading.strategy.strategy import Strategy
+
+logger = logging.getLogger(__name__)
+
+
+class FillModelEnsembleRun(NamedTuple):
+    """Outcome of one backtest run of `FillModelEnsemble` for one fill-model $seed."""
+
+    seed: int
+    pnl: float
+    max_drawdown: float
+    fill_count: int
+    traded_volume: float
+    commission: float
+
+
+class FillModelEnsembleResult(NamedTuple):
+    """Runs of `FillModelEnsemble.run`, one per seed, in the order the seeds were given."""
+
+    currency: Currency
+    runs: tuple[FillModelEnsembleRun, ...]
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """Return one row per seed (seed, pnl, max_drawdown, fill_count, traded_volume, commission)."""
+        return pd.DataFrame(self.runs, columns=list(FillModelEnsembleRun._fields))
+
+    def describe(self) -> pd.DataFrame:
+        """Return the distribution (count, mean, std, min, quartiles, max) of each metric across seeds."""
+        return self.to_dataframe().drop(columns="seed").describe()
+
+
+class FillModelEnsemble:
+    """Replays one recorded event stream against many fill-model seeds in parallel worker processes.
+
+    Use it to measure how sensitive a strategy is to stochastic fills (e.g. `DistributionFillModel`
+    slippage) without decoding market data again for every seed. $events are decoded once by the
+    caller and handed to each worker process once (not per seed); every run only replays them.
+
+    Per seed, a worker builds a fresh `TradingEngine`, a `SimBroker` via $build_broker(seed) and a
+    Strategy via $build_strategy(events, broker), runs the backtest and reports PnL, max drawdown,
+    fills, traded volume and commission in $currency.
+
+    Notes:
+        - $build_broker and $build_strategy must be picklable (module-level functions or
+          `functools.partial` of them) because they are sent to worker processes.
+        - The broker must be created with $equity_sample_interval; max drawdown is taken from its
+          sampled equity curve (plus the final equity).
+        - Strategies must treat $events as read-only (e.g. wrap them in a new
+          `FixedSequenceEventFeed`), because all runs of one worker share them.
+
+    Example:
+        def build_broker(seed: int) -> SimBroker:
+            broker = SimBroker(fill_model=DistributionFillModel(rng_seed=seed), equity_sample_interval=timedelta(minutes=1))
+            broker.get_account().add_funds(Money(100_000, USD))
+            return broker
+
+        def build_strategy(events: Sequence[Event], broker: SimBroker) -> Strategy:
+            return MyStrategy("my_strategy", broker, events)
+
+        ensemble = FillModelEnsemble(events, build_broker=build_broker, build_strategy=build_strategy, currency=USD)
+        result = ensemble.run(seeds=range(100))
+        print(result.describe())
+    """
+
+    # region Init
+
+    def __init__(
+        self,
+        events: Sequence[Event],
+        *,
+        build_broker: Callable[[int], SimBroker],
+        build_strategy: Callable[[Sequence[Event], SimBroker], Strategy],
+        currency: Currency,
+        max_workers: int | None = None,
+    ) -> None:
+        """Create an ensemble runner.
+
+        Args:
+            events: Recorded events, already decoded, replayed unchanged for every seed.
+            build_broker: Creates the funded SimBroker (with its fill model) for one seed.
+            build_strategy: Creates the Strategy for one run from $events and the run's broker.
+            currency: Currency in which PnL, drawdown and commission are reported.
+            max_workers: Number of worker processes. If None, uses the number of CPUs. If 1, runs
+                all seeds in the calling process (useful for debugging).
+
+        Raises:
+            ValueError: If $max_workers is not positive.
+        """
+        # Raise: need at least one worker
+        if max_workers is not None and max_workers <= 0:
+            raise ValueError(f"Cannot create `FillModelEnsemble` because $max_workers ({max_workers}) is not positive")
+
+        self._events: tuple[Event, ...] = tuple(events)
+        self._build_broker = build_broker
+        self._build_strategy = build_strategy
+        self._currency = currency
+        self._max_workers = max_workers
+
+    # endregion
+
+    # region Main
+
+    def run(self, seeds: Sequence[int]) -> FillModelEnsembleResult:
+        """Run one backtest per seed in $seeds and return their outcomes in the same order."""
+        seeds = list(seeds)
+        job = _EnsembleJob(self._events, self._build_broker, self._build_strategy, self._currency)
+        logger.info(f"Running FillModelEnsemble: {len(seeds)} seed(s), {len(self._events)} event(s), $max_workers={self._max_workers}")
+
+        if self._max_workers == 1:
+            runs = [job.run_seed(seed) for seed in seeds]
+        else:
+            # Send the job (with all events) to each worker once; tasks then carry only a seed
+            with ProcessPoolExecutor(max_workers=self._max_workers, initializer=_init_worker, initargs=(job,)) as executor:
+                runs = list(executor.map(_run_seed_in_worker, seeds))
+
+        result = FillModelEnsembleResult(currency=self._currency, runs=tuple(runs))
+        return result
+
+    # endregion
+
+    # region Properties
+
+    @property
+    def event_count(self) -> int:
+        return len(self._events)
+
+    @property
+    def currency(self) -> Currency:
+        return self._currency
+
+    # endregion
+
+
+class _EnsembleJob:
+    """Everything a worker needs to run the ensemble for any seed."""
+
+    __slots__ = ("events", "build_broker", "build_strategy", "currency")
+
+    def __init__(
+        self,
+        events: tuple[Event, ...],
+        build_broker: Callable[[int], SimBroker],
+        build_strategy: Callable[[Sequence[Event], SimBroker], Strategy],
+        currency: Currency,
+    ) -> None:
+        self.events = events
+        self.build_broker = build_broker
+        self.build_strategy = build_strategy
+        self.currency = currency
+
+    def run_seed(self, seed: int) -> FillModelEnsembleRun:
+        """Run the full backtest for $seed and summarize it."""
+        broker = self.build_broker(seed)
+        valuation = broker.valuation
+
+        # Raise: drawdown needs the broker's equity curve
+        if valuation is None:
+            raise ValueError(f"Cannot run `FillModelEnsemble` for $seed={seed} because the SimBroker from $build_broker has no valuation; create it with $equity_sample_interval")
+
+        currency = self.currency
+        account = broker.get_account()
+        initial_equity = valuation.compute_equity_by_currency(account).get(currency, Decimal("0"))
+
+        engine = TradingEngine(keep_order_fills=False)
+        engine.add_broker("sim_broker", broker)
+        engine.add_strategy(self.build_strategy(self.events, broker))
+        engine.start()
+
+        # Summarize equity: sampled drawdowns plus the final equity against the sampled peak
+        final_equity = float(valuation.compute_equity_by_currency(account).get(currency, Decimal("0")))
+        equity_curve = valuation.equity_curve_to_dataframe()
+        equity_curve = equity_curve[equity_curve["currency"] == currency.code]
+        peak_equity = max([float(initial_equity), final_equity, *equity_curve["equity"].tolist()])
+        max_drawdown = max([peak_equity - final_equity, *equity_curve["drawdown"].tolist()])
+
+        # Summarize fills and fees
+        fills = broker.ledger.fills_to_dataframe()
+        fees = broker.ledger.fees_to_dataframe()
+        commission = float(fees.loc[fees["currency"] == currency.code, "amount"].sum()) if len(fees) else 0.0
+
+        result = FillModelEnsembleRun(
+            seed=seed,
+            pnl=final_equity - float(initial_equity),
+            max_drawdown=max_drawdown,
+            fill_count=len(fills),
+            traded_volume=float(fills["signed_qty"].abs().sum()) if len(fills) else 0.0,
+            commission=commission,
+        )
+        return result
+
+
+# region Worker
+
+_worker_job: _EnsembleJob | None = None
+
+
+def _init_worker(job: _EnsembleJob) -> None:
+    """Keep $job (with the shared read-only events) for all seeds run by this worker process."""
+    global _worker_job
+    _worker_job = job
+
+
+def _run_seed_in_worker(seed: int) -> FillModelEnsembleRun:
+    # Raise: worker was not initialized by `FillModelEnsemble.run`
+    if _worker_job is None:
+        raise RuntimeError("Cannot call `_run_seed_in_worker` because the worker process was not initialized with `_init_worker`")
+
+    return _worker_job.run_seed(seed)
+
+
+# endregion
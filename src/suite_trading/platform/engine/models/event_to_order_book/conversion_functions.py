@@ -1,11 +1,11 @@
 from __future__ import annotations
 
-from datetime import datetime
 from decimal import Decimal
 
 from suite_trading.domain.market_data.bar.bar import Bar
 from suite_trading.domain.market_data.tick.trade_tick import TradeTick
 from suite_trading.domain.market_data.tick.quote_tick import QuoteTick
+from suite_trading.domain.market_data.order_book.ohlc_price_trajectory import compute_ohlc_timestamps
 from suite_trading.domain.market_data.order_book.order_book import OrderBook, BookLevel
 
 
@@ -23,34 +23,48 @@ def bar_to_order_books(bar: Bar) -> list[OrderBook]:
 
     Each book has zero spread (bid=ask) at the respective OHLC price.
 
+    Notes:
+        Time offsets are cached per bar duration and each book shares one immutable levels tuple
+        between bids and asks. Use `OhlcPriceTrajectory.from_bar` to match the same 4 points
+        without building OrderBooks up front.
+
     Args:
         bar: Bar to convert to OrderBooks.
 
     Returns:
         list[OrderBook]: Four zero-spread OrderBooks at OHLC prices.
     """
-    duration = bar.end_dt - bar.start_dt
-
-    # Timestamp distribution
-    t_open = bar.start_dt
-    t_high = bar.start_dt + duration / 3
-    t_low = bar.start_dt + 2 * duration / 3
-    t_close = bar.end_dt
+    instrument = bar.instrument
+    volume = bar.volume if bar.volume is not None else Decimal("0")
+    t_open, t_high, t_low, t_close = compute_ohlc_timestamps(bar.start_dt, bar.end_dt)
 
-    # Helper to create zero-spread book
-    def make_book(price: Decimal, timestamp: datetime) -> OrderBook:
-        volume = bar.volume if bar.volume is not None else Decimal("0")
-        level = BookLevel(price=price, volume=volume)
-        return OrderBook(instrument=bar.instrument, timestamp=timestamp, bids=[level], asks=[level])
+    open_levels = (BookLevel(bar.open, volume),)
+    high_levels = (BookLevel(bar.high, volume),)
+    low_levels = (BookLevel(bar.low, volume),)
+    close_levels = (BookLevel(bar.close, volume),)
 
     return [
-        make_book(bar.open, t_open),
-        make_book(bar.high, t_high),
-        make_book(bar.low, t_low),
-        make_book(bar.close, t_close),
+        OrderBook(instrument, t_open, open_levels, open_levels),
+        OrderBook(instrument, t_high, high_levels, high_levels),
+        OrderBook(instrument, t_low, low_levels, low_levels),
+        OrderBook(instrument, t_close, close_levels, close_levels),
     ]
 
 
+def bar_close_to_order_book(bar: Bar) -> OrderBook:
+    """Convert Bar to the zero-spread OrderBook of its close (the last of `bar_to_order_books`).
+
+    Args:
+        bar: Bar to convert.
+
+    Returns:
+        OrderBook: Zero-spread OrderBook at close price, timestamped at $bar.end_dt.
+    """
+    volume = bar.volume if bar.volume is not None else Decimal("0")
+    levels = (BookLevel(bar.close, volume),)
+    return OrderBook(bar.instrument, bar.end_dt, levels, levels)
+
+
 def trade_tick_to_order_book(tick: TradeTick) -> OrderBook:
     """Convert TradeTick to zero-spread OrderBook.
 
@@ -1,29 +1,147 @@
 from __future__ import annotations
 
+from collections.abc import Callable
+from typing import NamedTuple
+
 from suite_trading.domain.event import Event
+from suite_trading.domain.instrument import Instrument
 from suite_trading.domain.market_data.bar.bar_event import BarEvent
+from suite_trading.domain.market_data.order_book.incremental_order_book import IncrementalOrderBook
+from suite_trading.domain.market_data.order_book.order_book_delta_event import OrderBookDeltaEvent
 from suite_trading.domain.market_data.order_book.order_book_event import OrderBookEvent
 from suite_trading.domain.market_data.tick.trade_tick_event import TradeTickEvent
 from suite_trading.domain.market_data.tick.quote_tick_event import QuoteTickEvent
+from suite_trading.domain.market_data.order_book.ohlc_price_trajectory import OhlcPriceTrajectory
 from suite_trading.domain.market_data.order_book.order_book import OrderBook
 from suite_trading.platform.engine.models.event_to_order_book.conversion_functions import (
+    bar_close_to_order_book,
     bar_to_order_books,
     trade_tick_to_order_book,
     quote_tick_to_order_book,
 )
-from suite_trading.platform.engine.models.event_to_order_book.protocol import EventToOrderBookConverter
+from suite_trading.platform.engine.models.intrabar_path.protocol import IntrabarPathModel
+from suite_trading.platform.engine.models.event_to_order_book.protocol import (
+    DeferredConversionConverter,
+    EventConversion,
+    EventConversionResolver,
+    EventToOrderBookConverter,
+    PriceTrajectoryConverter,
+)
+
+_UNRESOLVED = object()
+
+# Methods the engine calls per event when a converter cannot resolve conversions by event class
+_PER_EVENT_METHOD_NAMES = ("can_convert", "convert_to_order_books", "get_instrument", "defer_conversion", "convert_to_price_trajectory")
+
+
+class _EventTypeHandlers(NamedTuple):
+    """Registered conversion functions of one event class (without deferral bookkeeping)."""
 
+    get_instrument: Callable[[Event], Instrument]
+    convert_to_order_books: Callable[[Event], list[OrderBook]]
+    convert_to_latest_order_book: Callable[[Event], OrderBook]
+    convert_to_price_trajectory: Callable[[Event], OhlcPriceTrajectory] | None
+    on_defer: Callable[[Event], None] | None
 
-class DefaultEventToOrderBookConverter(EventToOrderBookConverter):
+
+class DefaultEventToOrderBookConverter(EventToOrderBookConverter, DeferredConversionConverter, PriceTrajectoryConverter, EventConversionResolver):
     """Default implementation of `EventToOrderBookConverter`.
 
     Converts market‑data events to OrderBook snapshot(s):
-    - BarEvent → 4 OrderBooks (OHLC)
+    - BarEvent → 4 OrderBooks (OHLC), or one `OhlcPriceTrajectory` via `convert_to_price_trajectory`
     - TradeTickEvent → 1 zero‑spread OrderBook
     - QuoteTickEvent → 1 level‑1 OrderBook
-    - OrderBookEvent → 1 OrderBook (pass-through)
+    - OrderBookEvent → 1 OrderBook (pass-through; also re-seeds the incremental book of its Instrument)
+    - OrderBookDeltaEvent → 1 OrderBook (snapshot of the per-Instrument `IncrementalOrderBook`
+      after applying the deltas)
+
+    Set $intrabar_path_model to replace the fixed O→H→L→C bar decomposition with another (e.g.
+    precomputed) path per bar.
+
+    Dispatch goes through a registry keyed by exact event class. Use `register_event_type` to
+    convert custom event types. Subclasses of a registered class use the conversion of their
+    nearest registered base class. Converter subclasses that override a per-event method (for
+    example `can_convert` to filter events) are called per event, like any other converter.
+
+    Notes:
+        Delta events are stateful: this converter keeps one `IncrementalOrderBook` per Instrument,
+        so use one converter instance per TradingEngine. Deferred delta events are still applied
+        to the incremental book; only the snapshot is skipped.
     """
 
+    # region Init
+
+    def __init__(self, *, intrabar_path_model: IntrabarPathModel | None = None) -> None:
+        """Create the default converter.
+
+        Args:
+            intrabar_path_model: Decides the path of each Bar (see `IntrabarPathModel`). If None,
+                bars use the fixed O→H→L→C decomposition of `bar_to_order_books`.
+        """
+        self._intrabar_path_model = intrabar_path_model
+
+        self._incremental_order_book_by_instrument: dict[Instrument, IncrementalOrderBook] = {}
+        # Latest full snapshot per Instrument without a delta stream yet; seeds the first incremental book
+        self._seed_order_book_by_instrument: dict[Instrument, OrderBook] = {}
+        # Latest deferred (not converted) event per Instrument; dropped when the Instrument is converted again
+        self._deferred_event_by_instrument: dict[Instrument, Event] = {}
+
+        # REGISTRY: handlers per registered event class, and resolved conversions per exact class
+        self._handlers_by_event_class: dict[type[Event], _EventTypeHandlers] = {}
+        self._conversion_by_event_class: dict[type[Event], EventConversion | None] = {}
+        # Subclasses overriding a per-event method must see every call, so they cannot resolve by class
+        self._can_resolve_by_event_class = all(getattr(type(self), name) is getattr(DefaultEventToOrderBookConverter, name) for name in _PER_EVENT_METHOD_NAMES)
+
+        self._register_builtin_event_types()
+
+    # endregion
+
+    # region Main
+
+    def register_event_type(
+        self,
+        event_class: type[Event],
+        *,
+        get_instrument: Callable[[Event], Instrument],
+        convert_to_order_books: Callable[[Event], list[OrderBook]],
+        convert_to_latest_order_book: Callable[[Event], OrderBook] | None = None,
+        convert_to_price_trajectory: Callable[[Event], OhlcPriceTrajectory] | None = None,
+    ) -> None:
+        """Register how events of $event_class (and its subclasses) are converted.
+
+        Register custom types before the TradingEngine starts; a later registration replaces the
+        conversion of $event_class.
+
+        Args:
+            event_class: Event class to convert.
+            get_instrument: Returns the Instrument of an event.
+            convert_to_order_books: Converts an event to OrderBook snapshot(s).
+            convert_to_latest_order_book: Builds the latest OrderBook of a deferred event. If None,
+                the last OrderBook from $convert_to_order_books is used.
+            convert_to_price_trajectory: Converts an event to an `OhlcPriceTrajectory`; leave None
+                if the type has no trajectory form.
+        """
+        if convert_to_latest_order_book is None:
+
+            def convert_to_latest_order_book(event: Event) -> OrderBook:
+                return convert_to_order_books(event)[-1]
+
+        self._handlers_by_event_class[event_class] = _EventTypeHandlers(get_instrument, convert_to_order_books, convert_to_latest_order_book, convert_to_price_trajectory, None)
+        # Resolutions of $event_class and its subclasses may change
+        self._conversion_by_event_class.clear()
+
+    # endregion
+
+    # region Properties
+
+    @property
+    def intrabar_path_model(self) -> IntrabarPathModel | None:
+        return self._intrabar_path_model
+
+    # endregion
+
+    # region Protocol EventToOrderBookConverter
+
     def can_convert(self, event: Event) -> bool:
         """Implements: EventToOrderBookConverter.can_convert
 
@@ -33,9 +151,9 @@ class DefaultEventToOrderBookConverter(EventToOrderBookConverter):
             event: Event to check.
 
         Returns:
-            True if $event is BarEvent, TradeTickEvent, QuoteTickEvent or OrderBookEvent.
+            True if the class of $event (or one of its bases) is registered.
         """
-        return isinstance(event, (BarEvent, TradeTickEvent, QuoteTickEvent, OrderBookEvent))
+        return self._resolve_conversion(event.__class__) is not None
 
     def convert_to_order_books(self, event: Event) -> list[OrderBook]:
         """Implements: EventToOrderBookConverter.convert_to_order_books
@@ -48,13 +166,227 @@ class DefaultEventToOrderBookConverter(EventToOrderBookConverter):
         Returns:
             OrderBook snapshot(s) representing the event; empty list if unsupported.
         """
-        if isinstance(event, BarEvent):
-            return bar_to_order_books(event.bar)
-        elif isinstance(event, TradeTickEvent):
-            return [trade_tick_to_order_book(event.trade_tick)]
-        elif isinstance(event, QuoteTickEvent):
-            return [quote_tick_to_order_book(event.quote_tick)]
-        elif isinstance(event, OrderBookEvent):
-            return [event.order_book]
-        else:
+        conversion = self._resolve_conversion(event.__class__)
+
+        # Skip: unsupported event type
+        if conversion is None:
             return []
+
+        return conversion.convert_to_order_books(event)
+
+    # endregion
+
+    # region Protocol DeferredConversionConverter
+
+    def get_instrument(self, event: Event) -> Instrument:
+        """Implements: DeferredConversionConverter.get_instrument
+
+        Return the Instrument whose OrderBook snapshot(s) $event would produce.
+
+        Raises:
+            ValueError: If $event cannot be converted.
+        """
+        return self._get_conversion(event).get_instrument(event)
+
+    def defer_conversion(self, event: Event) -> None:
+        """Implements: DeferredConversionConverter.defer_conversion
+
+        Remember $event as the latest one of its Instrument. Order book events still update the
+        per-Instrument incremental book, without building a snapshot.
+
+        Raises:
+            ValueError: If $event cannot be converted.
+        """
+        self._get_conversion(event).defer_conversion(event)
+
+    def get_latest_order_book(self, instrument: Instrument) -> OrderBook | None:
+        """Implements: DeferredConversionConverter.get_latest_order_book
+
+        Build the OrderBook of the latest deferred event of $instrument (for bars, the close).
+        """
+        event = self._deferred_event_by_instrument.pop(instrument, None)
+
+        # Skip: nothing deferred for $instrument since its last conversion
+        if event is None:
+            return None
+
+        return self._find_handlers(event.__class__).convert_to_latest_order_book(event)
+
+    # endregion
+
+    # region Protocol PriceTrajectoryConverter
+
+    def convert_to_price_trajectory(self, event: Event) -> OhlcPriceTrajectory | None:
+        """Implements: PriceTrajectoryConverter.convert_to_price_trajectory
+
+        Convert $event to its OHLC trajectory (bars); other events have no trajectory form.
+        """
+        conversion = self._resolve_conversion(event.__class__)
+
+        # Skip: unsupported event type or no trajectory form
+        if conversion is None or conversion.convert_to_price_trajectory is None:
+            return None
+
+        return conversion.convert_to_price_trajectory(event)
+
+    # endregion
+
+    # region Protocol EventConversionResolver
+
+    def resolve_conversion(self, event_class: type[Event]) -> EventConversion | None:
+        """Implements: EventConversionResolver.resolve_conversion
+
+        Return conversion functions for events of exactly $event_class (built once, then cached).
+        Returns None for subclasses that override a per-event method, so their overrides are
+        called for every event.
+        """
+        # Skip: overridden methods (for example `can_convert`) must decide per event
+        if not self._can_resolve_by_event_class:
+            return None
+
+        return self._resolve_conversion(event_class)
+
+    # endregion
+
+    # region Utilities
+
+    def _resolve_conversion(self, event_class: type[Event]) -> EventConversion | None:
+        """Return own (never overridden) conversion functions for exactly $event_class (cached)."""
+        result = self._conversion_by_event_class.get(event_class, _UNRESOLVED)
+        if result is _UNRESOLVED:
+            handlers = self._find_handlers(event_class)
+            result = self._conversion_by_event_class[event_class] = None if handlers is None else self._build_conversion(handlers)
+        return result
+
+    def _get_conversion(self, event: Event) -> EventConversion:
+        result = self._resolve_conversion(event.__class__)
+
+        # Raise: $event type is not registered
+        if result is None:
+            raise ValueError(f"Cannot convert $event (class {event.__class__.__name__}) to OrderBook because its class is not registered; use `register_event_type`")
+
+        return result
+
+    def _find_handlers(self, event_class: type[Event]) -> _EventTypeHandlers | None:
+        """Return handlers of $event_class or of its nearest registered base class."""
+        handlers_by_event_class = self._handlers_by_event_class
+        result = next((handlers_by_event_class[cls] for cls in event_class.__mro__ if cls in handlers_by_event_class), None)
+        return result
+
+    def _build_conversion(self, handlers: _EventTypeHandlers) -> EventConversion:
+        """Wrap $handlers with the deferral bookkeeping shared by all event types."""
+        deferred_event_by_instrument = self._deferred_event_by_instrument
+        get_instrument = handlers.get_instrument
+        handle_convert_to_order_books = handlers.convert_to_order_books
+        handle_convert_to_price_trajectory = handlers.convert_to_price_trajectory
+        on_defer = handlers.on_defer
+
+        def convert_to_order_books(event: Event) -> list[OrderBook]:
+            # A newer conversion replaces the deferred event of the same Instrument
+            if deferred_event_by_instrument:
+                deferred_event_by_instrument.pop(get_instrument(event), None)
+            return handle_convert_to_order_books(event)
+
+        def defer_conversion(event: Event) -> None:
+            if on_defer is not None:
+                on_defer(event)
+            deferred_event_by_instrument[get_instrument(event)] = event
+
+        convert_to_price_trajectory = None
+        if handle_convert_to_price_trajectory is not None:
+
+            def convert_to_price_trajectory(event: Event) -> OhlcPriceTrajectory:
+                if deferred_event_by_instrument:
+                    deferred_event_by_instrument.pop(get_instrument(event), None)
+                return handle_convert_to_price_trajectory(event)
+
+        result = EventConversion(get_instrument, convert_to_order_books, defer_conversion, convert_to_price_trajectory)
+        return result
+
+    def _register_builtin_event_types(self) -> None:
+        handlers_by_event_class = self._handlers_by_event_class
+        intrabar_path_model = self._intrabar_path_model
+
+        def convert_bar_to_order_books(event: BarEvent) -> list[OrderBook]:
+            if intrabar_path_model is None:
+                return bar_to_order_books(event.bar)
+            return intrabar_path_model.get_trajectory(event.bar).list_order_books()
+
+        def convert_bar_to_price_trajectory(event: BarEvent) -> OhlcPriceTrajectory:
+            if intrabar_path_model is None:
+                return OhlcPriceTrajectory.from_bar(event.bar)
+            return intrabar_path_model.get_trajectory(event.bar)
+
+        handlers_by_event_class[BarEvent] = _EventTypeHandlers(
+            get_instrument=lambda event: event.bar.instrument,
+            convert_to_order_books=convert_bar_to_order_books,
+            # Every path ends at the close at `Bar.end_dt`
+            convert_to_latest_order_book=lambda event: bar_close_to_order_book(event.bar),
+            convert_to_price_trajectory=convert_bar_to_price_trajectory,
+            on_defer=None,
+        )
+        handlers_by_event_class[TradeTickEvent] = _EventTypeHandlers(
+            get_instrument=lambda event: event.trade_tick.instrument,
+            convert_to_order_books=lambda event: [trade_tick_to_order_book(event.trade_tick)],
+            convert_to_latest_order_book=lambda event: trade_tick_to_order_book(event.trade_tick),
+            convert_to_price_trajectory=None,
+            on_defer=None,
+        )
+        handlers_by_event_class[QuoteTickEvent] = _EventTypeHandlers(
+            get_instrument=lambda event: event.quote_tick.instrument,
+            convert_to_order_books=lambda event: [quote_tick_to_order_book(event.quote_tick)],
+            convert_to_latest_order_book=lambda event: quote_tick_to_order_book(event.quote_tick),
+            convert_to_price_trajectory=None,
+            on_defer=None,
+        )
+        handlers_by_event_class[OrderBookEvent] = _EventTypeHandlers(
+            get_instrument=lambda event: event.order_book.instrument,
+            convert_to_order_books=self._convert_order_book_event,
+            convert_to_latest_order_book=lambda event: event.order_book,
+            convert_to_price_trajectory=None,
+            on_defer=self._reseed_incremental_order_book,
+        )
+        handlers_by_event_class[OrderBookDeltaEvent] = _EventTypeHandlers(
+            get_instrument=lambda event: event.instrument,
+            convert_to_order_books=lambda event: [self._apply_order_book_delta_event(event)],
+            convert_to_latest_order_book=lambda event: self._incremental_order_book_by_instrument[event.instrument].get_snapshot(),
+            convert_to_price_trajectory=None,
+            on_defer=lambda event: self._get_or_create_incremental_order_book(event).apply_deltas(event.deltas, event.timestamp),
+        )
+
+    def _convert_order_book_event(self, event: OrderBookEvent) -> list[OrderBook]:
+        self._reseed_incremental_order_book(event)
+        return [event.order_book]
+
+    def _apply_order_book_delta_event(self, event: OrderBookDeltaEvent) -> OrderBook:
+        """Apply $event to the incremental book of its Instrument and return the updated snapshot."""
+        incremental_order_book = self._get_or_create_incremental_order_book(event)
+        incremental_order_book.apply_deltas(event.deltas, event.timestamp)
+        result = incremental_order_book.get_snapshot()
+        return result
+
+    def _get_or_create_incremental_order_book(self, event: OrderBookDeltaEvent) -> IncrementalOrderBook:
+        """Return the incremental book of $event.instrument, creating it from the seed snapshot if needed."""
+        result = self._incremental_order_book_by_instrument.get(event.instrument)
+        if result is None:
+            seed_order_book = self._seed_order_book_by_instrument.pop(event.instrument, None)
+            if seed_order_book is None:
+                result = IncrementalOrderBook(event.instrument, event.timestamp)
+            else:
+                result = IncrementalOrderBook.from_order_book(seed_order_book)
+            self._incremental_order_book_by_instrument[event.instrument] = result
+        return result
+
+    def _reseed_incremental_order_book(self, event: OrderBookEvent) -> None:
+        """Replace the incremental book state with the full snapshot in $event (or remember it as a seed)."""
+        order_book = event.order_book
+        incremental_order_book = self._incremental_order_book_by_instrument.get(order_book.instrument)
+
+        # Skip: no delta stream for this Instrument yet; keep the snapshot to seed it later
+        if incremental_order_book is None:
+            self._seed_order_book_by_instrument[order_book.instrument] = order_book
+            return
+
+        incremental_order_book.reset(order_book)
+
+    # endregion
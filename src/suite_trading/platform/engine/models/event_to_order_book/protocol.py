@@ -1,8 +1,11 @@
 from __future__ import annotations
 
-from typing import Protocol
+from collections.abc import Callable
+from typing import NamedTuple, Protocol, runtime_checkable
 
 from suite_trading.domain.event import Event
+from suite_trading.domain.instrument import Instrument
+from suite_trading.domain.market_data.order_book.ohlc_price_trajectory import OhlcPriceTrajectory
 from suite_trading.domain.market_data.order_book.order_book import OrderBook
 
 
@@ -22,6 +25,8 @@ class EventToOrderBookConverter(Protocol):
           negative values.
         - Bar events typically produce 4 OrderBooks (OHLC decomposition).
         - Trade/quote ticks produce single OrderBooks.
+        - Converters may also implement `DeferredConversionConverter`, so the engine can skip
+          conversion while no broker needs OrderBooks; otherwise every event is converted.
     """
 
     def can_convert(self, event: Event) -> bool:
@@ -45,3 +50,112 @@ class EventToOrderBookConverter(Protocol):
             OrderBook snapshot(s) representing the event; empty list if unsupported.
         """
         ...
+
+
+@runtime_checkable
+class DeferredConversionConverter(Protocol):
+    """Converters that can defer conversion while no broker needs OrderBooks (optional).
+
+    When no broker needs OrderBooks for an Instrument, the `TradingEngine` calls `defer_conversion`
+    instead of `convert_to_order_books` and later asks for `get_latest_order_book` only if an
+    order for that Instrument is submitted. Converters without this protocol convert every event.
+    """
+
+    def get_instrument(self, event: Event) -> Instrument:
+        """Return the Instrument whose OrderBook snapshot(s) $event would produce.
+
+        Args:
+            event: Convertible event (see `EventToOrderBookConverter.can_convert`).
+
+        Returns:
+            Instrument of $event.
+        """
+        ...
+
+    def defer_conversion(self, event: Event) -> None:
+        """Record $event without building OrderBook snapshot(s).
+
+        Stateful converters must still update their internal state here, so later conversions
+        stay consistent.
+
+        Args:
+            event: Convertible event (see `EventToOrderBookConverter.can_convert`) that no broker needs OrderBooks for now.
+        """
+        ...
+
+    def get_latest_order_book(self, instrument: Instrument) -> OrderBook | None:
+        """Build the latest OrderBook snapshot for events of $instrument deferred since its last conversion.
+
+        Args:
+            instrument: Instrument to build the OrderBook for.
+
+        Returns:
+            Latest OrderBook of $instrument, or None if nothing was deferred since the last conversion.
+        """
+        ...
+
+
+@runtime_checkable
+class PriceTrajectoryConverter(Protocol):
+    """Converters that can turn bar-like events into an `OhlcPriceTrajectory` instead of OrderBook(s).
+
+    The `TradingEngine` asks for a trajectory first; brokers implementing
+    `PriceTrajectoryProcessor` then match its points directly, and OrderBook(s) are built only
+    for points that need them. Matching results are identical to `convert_to_order_books`.
+    """
+
+    def convert_to_price_trajectory(self, event: Event) -> OhlcPriceTrajectory | None:
+        """Convert $event to an `OhlcPriceTrajectory`, like `convert_to_order_books` would.
+
+        Args:
+            event: Convertible event (see `EventToOrderBookConverter.can_convert`).
+
+        Returns:
+            Trajectory of $event, or None if $event has no trajectory form (use
+            `convert_to_order_books` instead).
+        """
+        ...
+
+
+class EventConversion(NamedTuple):
+    """Conversion functions for one exact event class, resolved once by an `EventConversionResolver`.
+
+    The functions behave like the converter methods of the same name (including deferral
+    bookkeeping), so the engine can call them directly without per-event type dispatch.
+
+    Attributes:
+        get_instrument: Returns the Instrument of an event; None if events cannot be deferred.
+        convert_to_order_books: Converts an event to OrderBook snapshot(s).
+        defer_conversion: Records an event without building OrderBook snapshot(s); None if events
+            cannot be deferred (they are always converted).
+        convert_to_price_trajectory: Converts an event to an `OhlcPriceTrajectory`; None if
+            the event class has no trajectory form.
+    """
+
+    get_instrument: Callable[[Event], Instrument] | None
+    convert_to_order_books: Callable[[Event], list[OrderBook]]
+    defer_conversion: Callable[[Event], None] | None
+    convert_to_price_trajectory: Callable[[Event], OhlcPriceTrajectory] | None = None
+
+
+@runtime_checkable
+class EventConversionResolver(Protocol):
+    """Converters that decide convertibility by event class alone and can hand out direct functions.
+
+    The `TradingEngine` resolves each event class once per EventFeed and then calls the returned
+    `EventConversion` functions for every event of that class (one dict lookup per event).
+    Converters without this protocol, and event classes resolved to None, are asked
+    `can_convert` for every event.
+    """
+
+    def resolve_conversion(self, event_class: type[Event]) -> EventConversion | None:
+        """Return conversion functions for events of exactly $event_class.
+
+        Args:
+            event_class: Concrete class of the events to convert.
+
+        Returns:
+            Conversion functions, or None if convertibility of $event_class events must be
+            decided per event with `can_convert`.
+        """
+        ...
@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+import numpy as np
+
+from suite_trading.domain.market_data.bar.bar import Bar
+from suite_trading.domain.market_data.order_book.ohlc_price_trajectory import OhlcPriceTrajectory
+
+from .precomputed import PrecomputedIntrabarPathModel
+
+
+class BrownianBridgeIntrabarPathModel(PrecomputedIntrabarPathModel):
+    """Random $steps-step path from open to close that stays within [low, high] and touches both.
+
+    Per bar, a standard Brownian bridge is drawn, stretched to the bar's high-low range and
+    laid over the straight open → close line. The interior steps where it peaks and bottoms are
+    set to the exact high and low; all other steps are rounded to the Instrument's price
+    increment and clipped to [low, high], so high and low are each reached at least once (other
+    steps, including open and close, may round or clip onto them too). Points are evenly spaced in time between
+    `Bar.start_dt` and `Bar.end_dt`.
+
+    Paths of a whole series are drawn in one NumPy batch by `precompute`. Results are
+    reproducible for the same $seed and the same sequence of `precompute` calls.
+    """
+
+    __slots__ = ("_steps", "_seed", "_rng", "_offsets_by_duration")
+
+    # region Init
+
+    def __init__(self, steps: int = 16, seed: int | None = None) -> None:
+        """Create a Brownian-bridge path model.
+
+        Args:
+            steps: Number of time steps per bar; the path has $steps + 1 points.
+            seed: Seed of the random generator. If None, paths are not reproducible.
+
+        Raises:
+            ValueError: If $steps is less than 3 (high and low need their own interior steps).
+        """
+        super().__init__()
+
+        # Raise: open, high, low and close need distinct steps
+        if steps < 3:
+            raise ValueError(f"Cannot create `BrownianBridgeIntrabarPathModel` because $steps ({steps}) is less than 3")
+
+        self._steps = steps
+        self._seed = seed
+        self._rng = np.random.default_rng(seed)
+        # Step offsets from bar start, per bar duration
+        self._offsets_by_duration: dict[timedelta, tuple[timedelta, ...]] = {}
+
+    # endregion
+
+    # region Properties
+
+    @property
+    def steps(self) -> int:
+        return self._steps
+
+    @property
+    def seed(self) -> int | None:
+        return self._seed
+
+    # endregion
+
+    # region Utilities
+
+    def _compute_trajectories(self, bars: list[Bar]) -> list[OhlcPriceTrajectory]:
+        # Skip: nothing to draw
+        if not bars:
+            return []
+
+        steps = self._steps
+        bar_count = len(bars)
+        row_indexes = np.arange(bar_count)
+
+        # Bar prices in units of price increment (floats are fine for shaping; exact prices are restored below)
+        increments = [bar.instrument.price_increment for bar in bars]
+        opens = np.array([float(bar.open / increment) for bar, increment in zip(bars, increments)])
+        highs = np.array([float(bar.high / increment) for bar, increment in zip(bars, increments)])
+        lows = np.array([float(bar.low / increment) for bar, increment in zip(bars, increments)])
+        closes = np.array([float(bar.close / increment) for bar, increment in zip(bars, increments)])
+
+        # Standard Brownian bridges from 0 to 0, one row per bar
+        walks = np.zeros((bar_count, steps + 1))
+        np.cumsum(self._rng.standard_normal((bar_count, steps)), axis=1, out=walks[:, 1:])
+        times = np.linspace(0.0, 1.0, steps + 1)
+        bridges = walks - times * walks[:, -1:]
+
+        # Stretch each bridge to the bar range and lay it over the open → close line
+        bridge_ranges = bridges.max(axis=1) - bridges.min(axis=1)
+        scales = (highs - lows) / np.where(bridge_ranges > 0, bridge_ranges, 1.0)
+        paths = opens[:, None] + (closes - opens)[:, None] * times + bridges * scales[:, None]
+
+        # Interior steps that become the exact high and low (distinct even for flat paths)
+        high_steps = 1 + np.argmax(paths[:, 1:-1], axis=1)
+        low_steps = 1 + np.argmin(paths[:, 1:-1], axis=1)
+        same_steps = high_steps == low_steps
+        low_steps[same_steps] = np.where(high_steps[same_steps] == 1, 2, 1)
+
+        tick_paths = np.clip(np.rint(paths), np.ceil(lows)[:, None], np.floor(highs)[:, None])
+        tick_paths[row_indexes, high_steps] = highs
+        tick_paths[row_indexes, low_steps] = lows
+        tick_rows = tick_paths.astype(np.int64).tolist()
+
+        # Build trajectories with exact Decimal prices for open, high, low and close
+        zero = Decimal("0")
+        result = []
+        for bar, increment, ticks, high_step, low_step in zip(bars, increments, tick_rows, high_steps.tolist(), low_steps.tolist()):
+            prices = [increment * tick for tick in ticks]
+            prices[0], prices[high_step], prices[low_step], prices[-1] = bar.open, bar.high, bar.low, bar.close
+            volume = bar.volume if bar.volume is not None else zero
+            result.append(OhlcPriceTrajectory(bar.instrument, self._compute_timestamps(bar.start_dt, bar.end_dt), tuple(prices), volume))
+        return result
+
+    def _compute_timestamps(self, start_dt: datetime, end_dt: datetime) -> tuple[datetime, ...]:
+        duration = end_dt - start_dt
+        offsets = self._offsets_by_duration.get(duration)
+        if offsets is None:
+            steps = self._steps
+            offsets = self._offsets_by_duration[duration] = tuple(step * duration / steps for step in range(1, steps))
+
+        result = (start_dt, *(start_dt + offset for offset in offsets), end_dt)
+        return result
+
+    # endregion
+
+    # region Magic
+
+    def __str__(self) -> str:
+        return f"{self.__class__.__name__}(steps={self._steps}, seed={self._seed}, precomputed={self.precomputed_count})"
+
+    # endregion
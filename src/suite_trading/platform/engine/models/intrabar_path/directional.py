@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+from decimal import Decimal
+
+from suite_trading.domain.market_data.bar.bar import Bar
+from suite_trading.domain.market_data.order_book.ohlc_price_trajectory import OhlcPriceTrajectory, compute_ohlc_timestamps
+
+from .precomputed import PrecomputedIntrabarPathModel
+
+
+class DirectionalIntrabarPathModel(PrecomputedIntrabarPathModel):
+    """Four-point path whose extreme order follows the bar's direction.
+
+    An up bar (close > open) goes open → low → high → close, any other bar open → high →
+    low → close. The extreme farther from the close is reached first, which avoids the fixed
+    O→H→L→C path filling both a buy stop above and a sell stop below in the wrong order.
+    Timestamps are the same as in `bar_to_order_books`.
+    """
+
+    __slots__ = ()
+
+    # region Utilities
+
+    def _compute_trajectories(self, bars: list[Bar]) -> list[OhlcPriceTrajectory]:
+        zero = Decimal("0")
+        result = []
+        for bar in bars:
+            prices = (bar.open, bar.low, bar.high, bar.close) if bar.close > bar.open else (bar.open, bar.high, bar.low, bar.close)
+            volume = bar.volume if bar.volume is not None else zero
+            result.append(OhlcPriceTrajectory(bar.instrument, compute_ohlc_timestamps(bar.start_dt, bar.end_dt), prices, volume))
+        return result
+
+    # endregion
@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+from bisect import bisect_right
+from collections.abc import Sequence
+from datetime import datetime
+from decimal import Decimal
+
+from suite_trading.domain.instrument import Instrument
+from suite_trading.domain.market_data.bar.bar import Bar
+from suite_trading.domain.market_data.order_book.ohlc_price_trajectory import OhlcPriceTrajectory
+
+from .directional import DirectionalIntrabarPathModel
+from .precomputed import PrecomputedIntrabarPathModel
+from .protocol import IntrabarPathModel
+
+
+class LowerTimeframeIntrabarPathModel(PrecomputedIntrabarPathModel):
+    """Path that follows the lower-timeframe bars inside each bar.
+
+    The path of a bar is the concatenated paths (by $lower_path_model) of all $lower_bars of the
+    same Instrument that lie within [`Bar.start_dt`, `Bar.end_dt`]. It is framed by the bar's
+    own open and close, so it always starts and ends like the bar; consecutive duplicate points
+    (a lower bar's close and the next one's open at the same time and price) are merged.
+
+    Bars without lower-timeframe data fall back to $fallback_path_model.
+
+    Example:
+        model = LowerTimeframeIntrabarPathModel(one_minute_bars)
+        model.precompute(five_minute_bars)
+        converter = DefaultEventToOrderBookConverter(intrabar_path_model=model)
+    """
+
+    __slots__ = ("_lower_path_model", "_fallback_path_model", "_lower_bars_by_instrument", "_lower_end_dts_by_instrument")
+
+    # region Init
+
+    def __init__(
+        self,
+        lower_bars: Sequence[Bar],
+        *,
+        lower_path_model: IntrabarPathModel | None = None,
+        fallback_path_model: IntrabarPathModel | None = None,
+    ) -> None:
+        """Create a lower-timeframe path model.
+
+        Args:
+            lower_bars: Lower-timeframe bars of any Instrument(s); any order.
+            lower_path_model: Path model for each lower bar. If None, `DirectionalIntrabarPathModel`.
+            fallback_path_model: Path model for bars without lower bars. If None, `DirectionalIntrabarPathModel`.
+        """
+        super().__init__()
+        self._lower_path_model: IntrabarPathModel = lower_path_model or DirectionalIntrabarPathModel()
+        self._fallback_path_model: IntrabarPathModel = fallback_path_model or DirectionalIntrabarPathModel()
+
+        # Lower bars per Instrument, sorted by end time (plus their end times for bisect)
+        lower_bars_by_instrument: dict[Instrument, list[Bar]] = {}
+        for bar in lower_bars:
+            lower_bars_by_instrument.setdefault(bar.instrument, []).append(bar)
+        for instrument_bars in lower_bars_by_instrument.values():
+            instrument_bars.sort(key=lambda bar: bar.end_dt)
+        self._lower_bars_by_instrument = lower_bars_by_instrument
+        self._lower_end_dts_by_instrument: dict[Instrument, list[datetime]] = {instrument: [bar.end_dt for bar in instrument_bars] for instrument, instrument_bars in lower_bars_by_instrument.items()}
+
+        # Lower-bar paths are reused by every bar that contains them, so compute them in one batch
+        self._lower_path_model.precompute([bar for instrument_bars in lower_bars_by_instrument.values() for bar in instrument_bars])
+
+    # endregion
+
+    # region Properties
+
+    @property
+    def lower_path_model(self) -> IntrabarPathModel:
+        return self._lower_path_model
+
+    @property
+    def fallback_path_model(self) -> IntrabarPathModel:
+        return self._fallback_path_model
+
+    # endregion
+
+    # region Utilities
+
+    def _compute_trajectories(self, bars: list[Bar]) -> list[OhlcPriceTrajectory]:
+        zero = Decimal("0")
+        result = []
+        for bar in bars:
+            lower_bars = self._list_lower_bars(bar)
+
+            # Fallback: no lower-timeframe data inside $bar
+            if not lower_bars:
+                result.append(self._fallback_path_model.get_trajectory(bar))
+                continue
+
+            # Frame the lower-bar points by the bar's own open and close, merging duplicates
+            points: list[tuple[datetime, Decimal]] = [(bar.start_dt, bar.open)]
+            get_lower_trajectory = self._lower_path_model.get_trajectory
+            for lower_bar in lower_bars:
+                lower_trajectory = get_lower_trajectory(lower_bar)
+                for point in zip(lower_trajectory.timestamps, lower_trajectory.prices):
+                    if point != points[-1]:
+                        points.append(point)
+            if points[-1] != (bar.end_dt, bar.close):
+                points.append((bar.end_dt, bar.close))
+
+            timestamps, prices = zip(*points)
+            volume = bar.volume if bar.volume is not None else zero
+            result.append(OhlcPriceTrajectory(bar.instrument, timestamps, prices, volume))
+        return result
+
+    def _list_lower_bars(self, bar: Bar) -> list[Bar]:
+        """Return lower bars of $bar.instrument within [$bar.start_dt, $bar.end_dt], by end time."""
+        end_dts = self._lower_end_dts_by_instrument.get(bar.instrument)
+
+        # Skip: no lower bars of this Instrument
+        if end_dts is None:
+            return []
+
+        lower_bars = self._lower_bars_by_instrument[bar.instrument]
+        first_index = bisect_right(end_dts, bar.start_dt)
+        last_index = bisect_right(end_dts, bar.end_dt, lo=first_index)
+
+        result = [lower_bar for lower_bar in lower_bars[first_index:last_index] if lower_bar.start_dt >= bar.start_dt]
+        return result
+
+    # endregion
+
+    # region Magic
+
+    def __str__(self) -> str:
+        return f"{self.__class__.__name__}(instruments={len(self._lower_bars_by_instrument)}, precomputed={self.precomputed_count})"
+
+    # endregion
@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+from suite_trading.domain.market_data.bar.bar import Bar
+from suite_trading.domain.market_data.order_book.ohlc_price_trajectory import OhlcPriceTrajectory
+
+from .precomputed import PrecomputedIntrabarPathModel
+
+
+class OhlcIntrabarPathModel(PrecomputedIntrabarPathModel):
+    """Fixed open → high → low → close path at start, 1/3, 2/3 and end of the bar.
+
+    Same decomposition as `bar_to_order_books`, regardless of the bar's direction.
+    """
+
+    __slots__ = ()
+
+    # region Utilities
+
+    def _compute_trajectories(self, bars: list[Bar]) -> list[OhlcPriceTrajectory]:
+        return [OhlcPriceTrajectory.from_bar(bar) for bar in bars]
+
+    # endregion
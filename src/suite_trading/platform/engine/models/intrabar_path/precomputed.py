@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from datetime import datetime
+
+from suite_trading.domain.market_data.bar.bar import Bar
+from suite_trading.domain.market_data.bar.bar_type import BarType
+from suite_trading.domain.market_data.order_book.ohlc_price_trajectory import OhlcPriceTrajectory
+
+from .protocol import IntrabarPathModel
+
+
+class PrecomputedIntrabarPathModel(IntrabarPathModel, ABC):
+    """Base class for path models that compute paths of many bars in one batch and cache them.
+
+    Subclasses only implement `_compute_trajectories` for a list of bars. Paths from
+    `precompute` are cached per bar value (matched by BarType and start time, then by equality)
+    until `clear` is called, so a `BarView` of a `BarSeries` finds the path precomputed for an
+    equal view or Bar. Bars that were not precomputed are computed on request and not cached.
+    """
+
+    __slots__ = ("_trajectory_by_bar_key",)
+
+    # region Init
+
+    def __init__(self) -> None:
+        # CACHE ((bar_type, start_dt) → (bar, trajectory); the Bar is kept to reject a different bar with the same key)
+        self._trajectory_by_bar_key: dict[tuple[BarType, datetime], tuple[Bar, OhlcPriceTrajectory]] = {}
+
+    # endregion
+
+    # region Protocol IntrabarPathModel
+
+    def precompute(self, bars: Sequence[Bar]) -> None:
+        """Implements: IntrabarPathModel.precompute
+
+        Compute paths of all $bars in one batch and cache them.
+        """
+        bars = list(bars)
+        trajectory_by_bar_key = self._trajectory_by_bar_key
+        for bar, trajectory in zip(bars, self._compute_trajectories(bars)):
+            trajectory_by_bar_key[(bar.bar_type, bar.start_dt)] = (bar, trajectory)
+
+    def get_trajectory(self, bar: Bar) -> OhlcPriceTrajectory:
+        """Implements: IntrabarPathModel.get_trajectory
+
+        Return the cached path of $bar, or compute it now if $bar was not precomputed.
+        """
+        cached = self._trajectory_by_bar_key.get((bar.bar_type, bar.start_dt))
+        if cached is not None and cached[0] == bar:
+            return cached[1]
+
+        return self._compute_trajectories([bar])[0]
+
+    # endregion
+
+    # region Main
+
+    def clear(self) -> None:
+        """Drop all precomputed paths."""
+        self._trajectory_by_bar_key.clear()
+
+    # endregion
+
+    # region Properties
+
+    @property
+    def precomputed_count(self) -> int:
+        return len(self._trajectory_by_bar_key)
+
+    # endregion
+
+    # region Utilities
+
+    @abstractmethod
+    def _compute_trajectories(self, bars: list[Bar]) -> list[OhlcPriceTrajectory]:
+        """Return one path per bar of $bars, in the same order."""
+
+    # endregion
+
+    # region Magic
+
+    def __str__(self) -> str:
+        return f"{self.__class__.__name__}(precomputed={len(self._trajectory_by_bar_key)})"
+
+    def __repr__(self) -> str:
+        return self.__str__()
+
+    # endregion
@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+from typing import Protocol
+
+from suite_trading.domain.market_data.bar.bar import Bar
+from suite_trading.domain.market_data.order_book.ohlc_price_trajectory import OhlcPriceTrajectory
+
+
+# region Interface
+
+
+class IntrabarPathModel(Protocol):
+    """Protocol for deciding the price path a Bar takes between its open and close.
+
+    Simulated brokers only see a Bar as the points of its path, so the model decides which of
+    high and low is reached first and how many intermediate prices stop and limit orders can
+    fill at. Every path starts at the open at `Bar.start_dt`, ends at the close at `Bar.end_dt`,
+    visits both high and low, and has ascending timestamps.
+
+    Paths are meant to be computed in bulk: call `precompute` once with a whole bar series
+    before the backtest, so `get_trajectory` only looks the cached path up per event.
+
+    Ready-made models: `OhlcIntrabarPathModel` (fixed O→H→L→C, the default decomposition),
+    `DirectionalIntrabarPathModel` (O→L→H→C for up bars), `BrownianBridgeIntrabarPathModel`
+    (N-step random paths) and `LowerTimeframeIntrabarPathModel` (paths of lower-timeframe bars).
+    """
+
+    def precompute(self, bars: Sequence[Bar]) -> None:
+        """Compute and cache paths of all $bars in one batch.
+
+        Args:
+            bars: Bars whose paths will be requested later.
+        """
+        ...
+
+    def get_trajectory(self, bar: Bar) -> OhlcPriceTrajectory:
+        """Return the path of $bar (cached if precomputed, otherwise computed now).
+
+        Args:
+            bar: Bar to decompose.
+
+        Returns:
+            Price trajectory of $bar.
+        """
+        ...
+
+
+# endregion
@@ -7,15 +7,18 @@ from suite_trading.domain.event import Event
 from suite_trading.platform.event_feed.event_feed import EventFeed
 from suite_trading.strategy.strategy import Strategy
 from suite_trading.platform.market_data.event_feed_provider import EventFeedProvider
-from suite_trading.platform.broker.broker import Broker
-from suite_trading.platform.broker.simulated_broker_protocol import SimulatedBroker
+from suite_trading.platform.broker.broker import Broker, OrderSubmissionValidator
+from suite_trading.platform.broker.trade_ledger import TradeLedger
+from suite_trading.platform.broker.simulated_broker_protocol import OrderBookDemandReporter, PriceTrajectoryProcessor, SimulatedBroker, SimulatedBrokerGroupMember
+from suite_trading.domain.instrument import Instrument
+from suite_trading.domain.market_data.order_book.ohlc_price_trajectory import OhlcPriceTrajectory
 from suite_trading.domain.order.orders import Order
-from suite_trading.domain.order.order_state import OrderAction, OrderStateCategory
+from suite_trading.domain.order.order_state import OrderAction, OrderState, OrderStateCategory
 from suite_trading.strategy.strategy_state_machine import StrategyState, StrategyAction
 from suite_trading.platform.engine.engine_state_machine import EngineState, EngineAction, create_engine_state_machine
 from bidict import bidict
 
-from suite_trading.platform.engine.models.event_to_order_book.protocol import EventToOrderBookConverter
+from suite_trading.platform.engine.models.event_to_order_book.protocol import DeferredConversionConverter, EventConversion, EventConversionResolver, EventToOrderBookConverter, PriceTrajectoryConverter
 from suite_trading.platform.engine.models.event_to_order_book.default_impl import DefaultEventToOrderBookConverter
 
 from suite_trading.utils.state_machine import StateMachine
@@ -25,6 +28,9 @@ from suite_trading.domain.order.order_fill import OrderFill
 
 logger = logging.getLogger(__name__)
 
+# Marks event classes not yet resolved in `EventFeedRegistration.conversion_by_event_class`
+_UNRESOLVED = object()
+
 
 class TradingEngine:
     """Runs multiple trading strategies over a single shared timeline.
@@ -42,8 +48,15 @@ class TradingEngine:
 
     # region Init
 
-    def __init__(self):
-        """Create a new TradingEngine."""
+    def __init__(self, *, keep_order_fills: bool = True):
+        """Create a new TradingEngine.
+
+        Args:
+            keep_order_fills: If True, every `OrderFill` routed to a Strategy is kept for
+                `list_order_fills_for_strategy`. If False, fills are only recorded in the columnar
+                ledger of each Strategy (see `get_ledger_for_strategy`), which keeps memory flat
+                on long runs.
+        """
 
         # Current state
         self._engine_state_machine: StateMachine[EngineState, EngineAction] = create_engine_state_machine()
@@ -56,6 +69,7 @@ class TradingEngine:
 
         # Brokers
         self._brokers_by_name_bidict: bidict[str, Broker] = bidict()
+        self._cached_simulated_brokers: list[SimulatedBroker] | None = None  # Rebuilt after brokers change
 
         # Strategies
         self._strategies_by_name_bidict: bidict[str, Strategy] = bidict()
@@ -66,13 +80,22 @@ class TradingEngine:
 
         # Orders
         self._routing_by_order: dict[Order, StrategyBrokerPair] = {}
+        # Order state updates collected while a batch with coalesced updates runs (None = deliver immediately);
+        # a dict keeps the first-update order and each Order once
+        self._coalesced_order_updates: dict[Order, None] | None = None
+        # OrderFill(s) held back during the same batch, so they reach Strategies after the state updates
+        self._coalesced_order_fills: list[OrderFill] = []
 
         # Order fills
+        self._keep_order_fills = keep_order_fills
         self._order_fills_by_strategy: dict[Strategy, list[OrderFill]] = {}
+        self._ledger_by_strategy: dict[Strategy, TradeLedger] = {}
 
         # MODELS (EVENT → ORDER BOOK)
         # Converter used to transform market‑data `Event`(s) into `OrderBook` snapshot(s)
         self._event_to_order_book_converter: EventToOrderBookConverter = DefaultEventToOrderBookConverter()
+        # Conversion used for every convertible Event when the converter cannot resolve by event class
+        self._fallback_event_conversion: EventConversion | None = None
 
     # endregion
 
@@ -91,6 +114,12 @@ class TradingEngine:
         """
         self._event_to_order_book_converter = converter
 
+        # Conversion functions depend on the converter: drop conversions cached per EventFeed
+        self._fallback_event_conversion = None
+        for event_feeds_by_name in self._event_feeds_by_strategy.values():
+            for registration in event_feeds_by_name.values():
+                registration.conversion_by_event_class.clear()
+
     # endregion
 
     # region EVENT FEED PROVIDERS
@@ -164,6 +193,7 @@ class TradingEngine:
             raise ValueError(f"Cannot call `add_broker` because Broker named ('{name}') is already added to this TradingEngine. Choose a different name.")
 
         self._brokers_by_name_bidict[name] = broker
+        self._cached_simulated_brokers = None
         broker.register_order_event_callbacks(self._route_order_fill_to_strategy, self._route_order_update_to_strategy)
         logger.debug(f"TradingEngine added Broker named '{name}' (class {broker.__class__.__name__})")
 
@@ -183,6 +213,7 @@ class TradingEngine:
             raise KeyError(f"Cannot call `remove_broker` because broker name $name ('{name}') is not added to this TradingEngine. Add the broker using `add_broker` first.")
 
         del self._brokers_by_name_bidict[name]
+        self._cached_simulated_brokers = None
         logger.debug(f"Removed Broker named '{name}'")
 
     def list_broker_names(self) -> list[str]:
@@ -228,6 +259,7 @@ class TradingEngine:
 
         # Set up order_fill tracking for this strategy (keyed by Strategy instance)
         self._order_fills_by_strategy[strategy] = []
+        self._ledger_by_strategy[strategy] = TradeLedger()
 
         # Mark strategy as added
         strategy._state_machine.execute_action(StrategyAction.ADD_STRATEGY_TO_ENGINE)
@@ -326,6 +358,7 @@ class TradingEngine:
         # Remove order_fill tracking for this strategy
         if strategy in self._order_fills_by_strategy:
             del self._order_fills_by_strategy[strategy]
+        self._ledger_by_strategy.pop(strategy, None)
 
         # Remove from strategies' dictionary
         del self._strategies_by_name_bidict[name]
@@ -353,14 +386,37 @@ class TradingEngine:
 
         Raises:
             KeyError: If $strategy_name is not registered in this TradingEngine.
+            ValueError: If this TradingEngine was created with $keep_order_fills=False.
         """
         # Raise: ensure $strategy_name exists in this TradingEngine
         if strategy_name not in self._strategies_by_name_bidict:
             raise KeyError(f"Cannot call `list_order_fills_for_strategy` because Strategy named '{strategy_name}' is not registered in this TradingEngine")
+        # Raise: OrderFill objects are not kept, only their ledger rows
+        if not self._keep_order_fills:
+            raise ValueError(f"Cannot call `list_order_fills_for_strategy` because $keep_order_fills is False; use `get_ledger_for_strategy('{strategy_name}')` instead")
 
         strategy = self._strategies_by_name_bidict[strategy_name]
         return list(self._order_fills_by_strategy.get(strategy, []))
 
+    def get_ledger_for_strategy(self, strategy_name: str) -> TradeLedger:
+        """Return the columnar ledger of all order fills for Strategy named $strategy_name.
+
+        Args:
+            strategy_name: Name of the Strategy to get the ledger for.
+
+        Returns:
+            TradeLedger with one fills-table row per OrderFill, in chronological order.
+
+        Raises:
+            KeyError: If $strategy_name is not registered in this TradingEngine.
+        """
+        # Raise: ensure $strategy_name exists in this TradingEngine
+        if strategy_name not in self._strategies_by_name_bidict:
+            raise KeyError(f"Cannot call `get_ledger_for_strategy` because Strategy named '{strategy_name}' is not registered in this TradingEngine")
+
+        strategy = self._strategies_by_name_bidict[strategy_name]
+        return self._ledger_by_strategy[strategy]
+
     # endregion
 
     # region LIFECYCLE
@@ -476,7 +532,10 @@ class TradingEngine:
         Some EventFeed(s) may be configured via `use_for_simulated_fills` to drive
          fills in simulated brokers . The engine
         applies a per-feed `fill_event_filter` to each Event before converting it
-        to OrderBook snapshot(s) for brokers.
+        to OrderBook snapshot(s) for brokers. Each feed caches the `EventConversion` of every
+        event class it emits, so conversion needs one dict lookup per Event. Conversion is skipped (deferred) when no
+        simulated broker needs OrderBook(s) for the Event's Instrument (see
+        `OrderBookDemandReporter`).
 
         The engine stops automatically when all EventFeed(s) for all strategies are
         finished.
@@ -514,13 +573,27 @@ class TradingEngine:
             # Set current time on global engine timeline
             self._timeline_dt = current_event_dt
 
-            # Decide if this Event should drive  fills in simulated brokers
+            # Decide if this Event should drive fills in simulated brokers (conversion resolved once per feed and event class)
             event_feed_registration = self._event_feeds_by_strategy[strategy][event_feed_name]
-            event_should_drive_simulated_fills = event_feed_registration.fill_event_filter(current_event)
-
             simulated_brokers = self._list_simulated_brokers()
-            if simulated_brokers and event_should_drive_simulated_fills and self._event_to_order_book_converter.can_convert(current_event):
-                order_books = self._event_to_order_book_converter.convert_to_order_books(current_event)
+            conversion = self._get_event_conversion(event_feed_registration, current_event) if simulated_brokers else None
+            if conversion is not None:
+                # Converters that cannot defer convert every Event
+                should_convert_event = conversion.defer_conversion is None or self._any_simulated_broker_needs_order_books(simulated_brokers, conversion.get_instrument(current_event))
+
+                # Defer: no broker has orders for this Instrument, so OrderBook(s) are built only if an order gets submitted
+                if not should_convert_event:
+                    conversion.defer_conversion(current_event)
+                    # OrderBook(s) of deferred Event are never newer than $current_event_dt
+                    if self._last_order_book_ts is None or current_event_dt > self._last_order_book_ts:
+                        self._last_order_book_ts = current_event_dt
+
+                # Bars go as one price trajectory, so brokers build OrderBook(s) only for points that need them
+                trajectory = conversion.convert_to_price_trajectory(current_event) if should_convert_event and conversion.convert_to_price_trajectory is not None else None
+                if trajectory is not None:
+                    self._route_price_trajectory(trajectory, simulated_brokers, strategy, strategy_name)
+
+                order_books = conversion.convert_to_order_books(current_event) if should_convert_event and trajectory is None else []
                 for order_book in order_books:
                     # Skip: ignore stale OrderBook snapshots (defensive)
                     if (self._last_order_book_ts is not None) and (order_book.timestamp < self._last_order_book_ts):
@@ -627,19 +700,9 @@ class TradingEngine:
         if feed_name in event_feeds_by_name_dict:
             raise ValueError("Cannot call `add_event_feed_for_strategy` because event-feed with $feed_name ('{feed_name}') is already used for this strategy. Choose a different name.")
 
-        def _block_all_events_for_simulated_fills(_event: Event) -> bool:
-            return False
-
-        def _pass_all_events_for_simulated_fills(_event: Event) -> bool:
-            return True
-
-        # Normalize $use_for_simulated_fills to a callable so the event loop always works with a simple bool decision per Event
-        if use_for_simulated_fills is False:
-            fill_event_filter = _block_all_events_for_simulated_fills
-        elif use_for_simulated_fills is True:
-            fill_event_filter = _pass_all_events_for_simulated_fills
-        else:
-            fill_event_filter = use_for_simulated_fills
+        # Normalize $use_for_simulated_fills so the event loop calls a filter only for feeds that have one
+        drives_simulated_fills = use_for_simulated_fills is not False
+        fill_event_filter = None if isinstance(use_for_simulated_fills, bool) else use_for_simulated_fills
 
         # Timeline filtering if the engine already processed events (shared global time)
         last_event_time = self._timeline_dt
@@ -647,7 +710,7 @@ class TradingEngine:
             event_feed.remove_events_before(last_event_time)
 
         # Register locally
-        registration = EventFeedRegistration(feed=event_feed, callback=callback, fill_event_filter=fill_event_filter)
+        registration = EventFeedRegistration(feed=event_feed, callback=callback, drives_simulated_fills=drives_simulated_fills, fill_event_filter=fill_event_filter, conversion_by_event_class={})
         event_feeds_by_name_dict[feed_name] = registration
         strategy_name = self._get_strategy_name(strategy)
         logger.info(f"Added EventFeed named '{feed_name}' to Strategy named '{strategy_name}' (class {strategy.__class__.__name__})")
@@ -713,6 +776,9 @@ class TradingEngine:
         order.change_state(OrderAction.SUBMIT)
         self._route_order_update_to_strategy(order)
 
+        # Hand the latest (deferred) OrderBook of $order.instrument to brokers, so $order can be matched immediately
+        self._deliver_deferred_order_book(order.instrument)
+
         # Delegate to broker for registration and acceptance
         broker.submit_order(order)
 
@@ -752,6 +818,120 @@ class TradingEngine:
         strategy, broker = self.get_routing_for_order(order)
         broker.update_order(order)
 
+    def submit_orders(self, orders: list[Order], broker: Broker, strategy: Strategy, *, coalesce_updates: bool = False) -> None:
+        """Send a batch of orders to your broker on behalf of $strategy.
+
+        All $orders are checked before any changes state: duplicates and ownership here, and
+        broker-side checks via `OrderSubmissionValidator` if $broker implements it. The broker
+        receives them in one `Broker.submit_orders` call. If a broker without that protocol
+        still rejects the batch, orders it did not take are DENIED (and the error is re-raised).
+
+        Args:
+            orders: The orders to submit, in submission order.
+            broker: The broker to use.
+            strategy: The Strategy submitting the orders.
+            coalesce_updates: If True, order state updates caused by this call reach each Strategy
+                as one `Strategy.on_order_state_updates` call (each Order once, with its latest
+                state) after the whole batch was sent; OrderFill(s) of the batch follow in fill
+                order via `Strategy.on_order_fill`. If False, updates and fills arrive one by one.
+
+        Raises:
+            ConnectionError: If the broker is not connected.
+            ValueError: If an order is invalid or cannot be submitted, an Order appears twice in
+                $orders, or an Order is owned by another Strategy.
+        """
+        # VALIDATE
+        # Raise: each Order can be submitted once per batch
+        if len(set(orders)) != len(orders):
+            raise ValueError(f"Cannot call `submit_orders` because $orders contain the same Order more than once ({len(orders)} orders)")
+
+        # Raise: do not remap an already submitted order to a different owner
+        routing_by_order = self._routing_by_order
+        for order in orders:
+            existing_route = routing_by_order.get(order)
+            if existing_route is not None and existing_route.strategy is not strategy:
+                owner_name = self._get_strategy_name(existing_route.strategy)
+                raise ValueError(f"Cannot call `submit_orders` because Order $id ('{order.id}') is already owned by Strategy named '{owner_name}'")
+
+        # Raise: broker rejects the batch before any Order changes state
+        if isinstance(broker, OrderSubmissionValidator):
+            broker.validate_orders_for_submission(orders)
+
+        # ACT
+        is_outermost_coalescing_batch = self._begin_coalescing_order_updates(coalesce_updates)
+        try:
+            # Record routing and transition to PENDING_SUBMIT (same as `submit_order`)
+            route = StrategyBrokerPair(strategy=strategy, broker=broker)
+            for order in orders:
+                routing_by_order[order] = route
+                order.change_state(OrderAction.SUBMIT)
+                self._route_order_update_to_strategy(order)
+
+            # Hand the latest (deferred) OrderBook of each Instrument to brokers once
+            for instrument in dict.fromkeys(order.instrument for order in orders):
+                self._deliver_deferred_order_book(instrument)
+
+            try:
+                broker.submit_orders(orders)
+            except Exception:
+                self._deny_orders_not_taken_by_broker(orders, broker)
+                raise
+        finally:
+            if is_outermost_coalescing_batch:
+                self._flush_coalesced_order_updates()
+
+    def cancel_orders(self, orders: list[Order], *, coalesce_updates: bool = False) -> None:
+        """Cancel a batch of orders with their brokers.
+
+        All $orders are checked before any is cancelled. Orders are sent to each broker in one
+        `Broker.cancel_orders` call, keeping their relative order.
+
+        Args:
+            orders: The orders to cancel.
+            coalesce_updates: If True, order state updates caused by this call reach each Strategy
+                as one `Strategy.on_order_state_updates` call (see `submit_orders`).
+
+        Raises:
+            ConnectionError: If a broker is not connected.
+            ValueError: If an order cannot be cancelled.
+            KeyError: If an order was not submitted through this TradingEngine.
+        """
+        orders_by_broker = self._group_orders_by_broker(orders, "cancel_orders")
+
+        is_outermost_coalescing_batch = self._begin_coalescing_order_updates(coalesce_updates)
+        try:
+            for broker, broker_orders in orders_by_broker.items():
+                broker.cancel_orders(broker_orders)
+        finally:
+            if is_outermost_coalescing_batch:
+                self._flush_coalesced_order_updates()
+
+    def update_orders(self, orders: list[Order], *, coalesce_updates: bool = False) -> None:
+        """Change a batch of orders with their brokers.
+
+        All $orders are checked before any is updated. Orders are sent to each broker in one
+        `Broker.update_orders` call, keeping their relative order.
+
+        Args:
+            orders: The orders to update with new parameters.
+            coalesce_updates: If True, order state updates caused by this call reach each Strategy
+                as one `Strategy.on_order_state_updates` call (see `submit_orders`).
+
+        Raises:
+            ConnectionError: If a broker is not connected.
+            ValueError: If an order cannot be updated.
+            KeyError: If an order was not submitted through this TradingEngine.
+        """
+        orders_by_broker = self._group_orders_by_broker(orders, "update_orders")
+
+        is_outermost_coalescing_batch = self._begin_coalescing_order_updates(coalesce_updates)
+        try:
+            for broker, broker_orders in orders_by_broker.items():
+                broker.update_orders(broker_orders)
+        finally:
+            if is_outermost_coalescing_batch:
+                self._flush_coalesced_order_updates()
+
     def get_routing_for_order(self, order: Order) -> StrategyBrokerPair:
         """Get routing information for an order.
 
@@ -825,7 +1005,11 @@ class TradingEngine:
     # region ROUTING (BROKER CALLBACKS)
 
     def _route_order_fill_to_strategy(self, order_fill: OrderFill) -> None:
-        """Route order_fill update to originating Strategy."""
+        """Route order_fill update to originating Strategy (or hold it back while updates are coalesced)."""
+        if self._coalesced_order_updates is not None:
+            self._coalesced_order_fills.append(order_fill)
+            return
+
         strategy, broker = self.get_routing_for_order(order_fill.order)
 
         try:
@@ -835,10 +1019,17 @@ class TradingEngine:
             self._transition_strategy_to_error(strategy, e)
 
         # Store order_fill for later statistics
-        self._order_fills_by_strategy[strategy].append(order_fill)
+        self._ledger_by_strategy[strategy].record_order_fill(order_fill)
+        if self._keep_order_fills:
+            self._order_fills_by_strategy[strategy].append(order_fill)
 
     def _route_order_update_to_strategy(self, order: Order) -> None:
-        """Route order state update to originating Strategy."""
+        """Route order state update to originating Strategy (or collect it while updates are coalesced)."""
+        coalesced_order_updates = self._coalesced_order_updates
+        if coalesced_order_updates is not None:
+            coalesced_order_updates[order] = None
+            return
+
         strategy, broker = self.get_routing_for_order(order)
 
         try:
@@ -851,6 +1042,56 @@ class TradingEngine:
         if order.state_category == OrderStateCategory.TERMINAL:
             self._routing_by_order.pop(order, None)
 
+    def _deny_orders_not_taken_by_broker(self, orders: list[Order], broker: Broker) -> None:
+        """Deny $orders still pending submission that $broker does not track after a failed batch."""
+        for order in orders:
+            # Skip: broker took the order, or it already moved on
+            if order.state != OrderState.PENDING_SUBMIT or broker.get_order(order.id) is not None:
+                continue
+
+            order.change_state(OrderAction.DENY)
+            self._route_order_update_to_strategy(order)
+
+    def _begin_coalescing_order_updates(self, coalesce_updates: bool) -> bool:
+        """Start collecting order state updates if $coalesce_updates is True.
+
+        Returns:
+            bool: True if this call started collecting, so the caller must flush. Nested batches
+            join the collection of the outermost batch.
+        """
+        # Skip: updates are delivered immediately, or an outer batch is already collecting
+        if not coalesce_updates or self._coalesced_order_updates is not None:
+            return False
+
+        self._coalesced_order_updates = {}
+        return True
+
+    def _flush_coalesced_order_updates(self) -> None:
+        """Stop collecting and deliver collected order state updates (one call per Strategy), then held-back fills in fill order."""
+        coalesced_orders = self._coalesced_order_updates or {}
+        coalesced_order_fills = self._coalesced_order_fills
+        self._coalesced_order_updates = None
+        self._coalesced_order_fills = []
+
+        orders_by_strategy: dict[Strategy, list[Order]] = {}
+        for order in coalesced_orders:
+            orders_by_strategy.setdefault(self.get_routing_for_order(order).strategy, []).append(order)
+
+        for strategy, orders in orders_by_strategy.items():
+            try:
+                strategy.on_order_state_updates(orders)
+            except Exception as e:
+                logger.error(f"Error in `Strategy.on_order_state_updates` for Strategy named '{strategy.name}' (class {strategy.__class__.__name__}): {e}")
+                self._transition_strategy_to_error(strategy, e)
+
+        for order_fill in coalesced_order_fills:
+            self._route_order_fill_to_strategy(order_fill)
+
+        # CLEANUP: remove routing info of terminal orders
+        for order in coalesced_orders:
+            if order.state_category == OrderStateCategory.TERMINAL:
+                self._routing_by_order.pop(order, None)
+
     def _transition_strategy_to_error(self, strategy: Strategy, exc: Exception) -> None:
         """Transition Strategy to ERROR and notify via `on_error`."""
         try:
@@ -867,6 +1108,25 @@ class TradingEngine:
 
     # region LOOKUP
 
+    def _group_orders_by_broker(self, orders: list[Order], method_name: str) -> dict[Broker, list[Order]]:
+        """Return $orders grouped by their executing Broker, keeping their relative order.
+
+        Raises:
+            KeyError: If an order was not submitted through this TradingEngine.
+        """
+        routing_by_order = self._routing_by_order
+        result: dict[Broker, list[Order]] = {}
+        for order in orders:
+            route = routing_by_order.get(order)
+
+            # Raise: order must have been submitted through this engine
+            if route is None:
+                raise KeyError(f"Cannot call `{method_name}` because $order (id '{order.id}') was not submitted through this TradingEngine")
+
+            result.setdefault(route.broker, []).append(order)
+
+        return result
+
     def _get_strategy_name(self, strategy: Strategy) -> str:
         try:
             return self._strategies_by_name_bidict.inv[strategy]
@@ -888,11 +1148,112 @@ class TradingEngine:
     def _list_simulated_brokers(self) -> list[SimulatedBroker]:
         """Return list of all simulated brokers
 
+        Accounts that belong to a group (`SimulatedBrokerGroupMember`) are represented by their
+        group, listed once. The list is cached until brokers are added or removed.
+
         Returns:
             list[SimulatedBroker]: list of simulated Brokers that require OrderBook snapshots
             to drive simulated order-price matching and fills.
         """
-        return [broker for broker in self._brokers_by_name_bidict.values() if isinstance(broker, SimulatedBroker)]
+        if self._cached_simulated_brokers is None:
+            simulated_broker_by_id: dict[int, SimulatedBroker] = {}
+            for broker in self._brokers_by_name_bidict.values():
+                if isinstance(broker, SimulatedBrokerGroupMember):
+                    simulated_broker = broker.group
+                elif isinstance(broker, SimulatedBroker):
+                    simulated_broker = broker
+                else:
+                    continue
+                simulated_broker_by_id.setdefault(id(simulated_broker), simulated_broker)
+            self._cached_simulated_brokers = list(simulated_broker_by_id.values())
+
+        return self._cached_simulated_brokers
+
+    # region ORDER BOOK ROUTING
+
+    def _any_simulated_broker_needs_order_books(self, simulated_brokers: list[SimulatedBroker], instrument: Instrument) -> bool:
+        """Return True if any of $simulated_brokers needs OrderBook(s) of $instrument (brokers that cannot tell always do)."""
+        for broker in simulated_brokers:
+            if not isinstance(broker, OrderBookDemandReporter) or broker.needs_order_books(instrument):
+                return True
+        return False
+
+    def _get_event_conversion(self, registration: EventFeedRegistration, event: Event) -> EventConversion | None:
+        """Return conversion functions for $event from $registration's feed, or None if $event does not drive fills."""
+        # Skip: feed does not drive simulated fills, or its filter rejects $event
+        if not registration.drives_simulated_fills:
+            return None
+        fill_event_filter = registration.fill_event_filter
+        if fill_event_filter is not None and not fill_event_filter(event):
+            return None
+
+        converter = self._event_to_order_book_converter
+        if isinstance(converter, EventConversionResolver):
+            conversion_by_event_class = registration.conversion_by_event_class
+            event_class = event.__class__
+            result = conversion_by_event_class.get(event_class, _UNRESOLVED)
+            if result is _UNRESOLVED:
+                result = conversion_by_event_class[event_class] = converter.resolve_conversion(event_class)
+            if result is not None:
+                return result
+
+        # Converter decides per Event; reuse one conversion built from its methods
+        if not converter.can_convert(event):
+            return None
+        return self._get_fallback_event_conversion()
+
+    def _get_fallback_event_conversion(self) -> EventConversion:
+        result = self._fallback_event_conversion
+        if result is None:
+            converter = self._event_to_order_book_converter
+            convert_to_price_trajectory = converter.convert_to_price_trajectory if isinstance(converter, PriceTrajectoryConverter) else None
+            if isinstance(converter, DeferredConversionConverter):
+                result = EventConversion(converter.get_instrument, converter.convert_to_order_books, converter.defer_conversion, convert_to_price_trajectory)
+            else:
+                result = EventConversion(None, converter.convert_to_order_books, None, convert_to_price_trajectory)
+            self._fallback_event_conversion = result
+        return result
+
+    def _route_price_trajectory(self, trajectory: OhlcPriceTrajectory, simulated_brokers: list[SimulatedBroker], strategy: Strategy, strategy_name: str) -> None:
+        """Route points of $trajectory to $simulated_brokers in time order, exactly like its OrderBook(s)."""
+        is_processor_by_broker = [isinstance(broker, PriceTrajectoryProcessor) for broker in simulated_brokers]
+
+        for index, timestamp in enumerate(trajectory.timestamps):
+            # Skip: ignore stale points (defensive)
+            if (self._last_order_book_ts is not None) and (timestamp < self._last_order_book_ts):
+                logger.debug(f"Skipped price trajectory point with timestamp {format_dt(timestamp)} for Strategy named '{strategy_name}' (class {strategy.__class__.__name__}) - older than last processed OrderBook timestamp {format_dt(self._last_order_book_ts)}")
+                continue
+
+            logger.debug(f"Processing price trajectory point with timestamp {format_dt(timestamp)} for Strategy named '{strategy_name}' (class {strategy.__class__.__name__})")
+
+            # Route to simulated brokers for order-price matching (brokers without trajectory support get the OrderBook)
+            for broker, is_processor in zip(simulated_brokers, is_processor_by_broker):
+                broker.set_timeline_dt(timestamp)  # Move broker's time by point
+                if is_processor:
+                    broker.process_price_trajectory_point(trajectory, index)
+                else:
+                    broker.process_order_book(trajectory.get_order_book(index))
+
+            if self._last_order_book_ts is None or timestamp > self._last_order_book_ts:
+                self._last_order_book_ts = timestamp
+
+    def _deliver_deferred_order_book(self, instrument: Instrument) -> None:
+        """Build the latest deferred OrderBook of $instrument and pass it to demand-reporting brokers."""
+        converter = self._event_to_order_book_converter
+
+        # Skip: converter never defers, so brokers already have every OrderBook
+        if not isinstance(converter, DeferredConversionConverter):
+            return
+
+        order_book = converter.get_latest_order_book(instrument)
+
+        # Skip: no Event of $instrument was deferred since its last conversion
+        if order_book is None:
+            return
+
+        for broker in self._list_simulated_brokers():
+            if isinstance(broker, OrderBookDemandReporter):
+                broker.set_latest_order_book(order_book)
 
     # endregion
 
@@ -986,14 +1347,20 @@ class EventFeedRegistration(NamedTuple):
     Attributes:
         feed: The EventFeed instance managed by the engine.
         callback: Strategy callback that receives each Event from this feed.
+        drives_simulated_fills: Whether Event(s) from this feed can drive simulated fills at all.
         fill_event_filter: Callable that decides which Event(s) from this feed
             should drive simulated fills in simulated brokers
             Returns True to enable fill processing for the Event, False to skip it.
+            None if all Event(s) drive simulated fills (when $drives_simulated_fills is True).
+        conversion_by_event_class: `EventConversion` per event class seen on this feed (None
+            for classes that cannot be converted); filled lazily by the engine.
     """
 
     feed: EventFeed
     callback: Callable[[Event], None]
-    fill_event_filter: Callable[[Event], bool]
+    drives_simulated_fills: bool
+    fill_event_filter: Callable[[Event], bool] | None
+    conversion_by_event_class: dict[type[Event], EventConversion | None]
 
 
 # endregion
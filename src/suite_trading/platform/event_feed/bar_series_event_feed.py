@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Callable
+import logging
+
+from suite_trading.domain.event import Event
+from suite_trading.domain.market_data.bar.bar_event import BarEvent
+from suite_trading.domain.market_data.bar.bar_series import BarSeries
+from suite_trading.utils.datetime_tools import require_utc
+
+
+logger = logging.getLogger(__name__)
+
+
+class BarSeriesEventFeed:
+    """Stream historical `BarEvent`(s) from a column-backed `BarSeries`.
+
+    Unlike `FixedSequenceEventFeed`, no events or bars are materialized upfront: each event is
+    built on demand around a lightweight `BarView`, so memory stays proportional to the compact
+    column storage of the series even for multi-year histories.
+
+    Events are emitted with $is_historical=True and $dt_received equal to the bar $end_dt.
+    """
+
+    # region Init
+
+    def __init__(self, series: BarSeries) -> None:
+        """Initialize the feed.
+
+        Args:
+            series (BarSeries): Chronologically ordered bars to stream.
+        """
+        self._series: BarSeries | None = series
+
+        # Internal state
+        self._index_of_next_event: int = 0
+        self._next_bar_event: Event | None = None
+
+        # Listeners of this event-feed
+        self._listeners: dict[str, Callable[[Event], None]] = {}
+
+    # endregion
+
+    # region EventFeed protocol
+
+    def peek(self) -> Event | None:
+        """Implements: EventFeed.peek
+
+        Return the next event without consuming it, or None if none is ready.
+        """
+        if self._series is None:
+            return None
+        if self._next_bar_event is not None:
+            return self._next_bar_event
+        if self._index_of_next_event >= len(self._series):
+            return None
+
+        bar = self._series[self._index_of_next_event]
+        self._next_bar_event = BarEvent(bar=bar, dt_received=bar.end_dt, is_historical=True)
+        return self._next_bar_event
+
+    def pop(self) -> Event | None:
+        """Implements: EventFeed.pop
+
+        Return the next event and advance the feed, or None if none is ready.
+        """
+        event = self.peek()
+        if event is None:
+            return None
+        self._next_bar_event = None
+        self._index_of_next_event += 1
+        return event
+
+    def is_finished(self) -> bool:
+        """Implements: EventFeed.is_finished
+
+        Return True when this feed is at the end and will not produce any more events.
+        """
+        if self._series is None:
+            return True
+        if self._next_bar_event is not None:
+            return False
+
+        result = self._index_of_next_event >= len(self._series)
+        return result
+
+    def close(self) -> None:
+        """Implements: EventFeed.close
+
+        Release resources used by this feed. Idempotent and non-blocking.
+        """
+        if self._series is None:
+            return
+        self._series = None
+        self._next_bar_event = None
+
+    def remove_events_before(self, cutoff_time: datetime) -> None:
+        """Implements: EventFeed.remove_events_before
+
+        Remove all events before $cutoff_time from this event feed (binary search on $end_dt).
+        """
+        require_utc(cutoff_time)
+        if self._series is None:
+            return
+
+        new_index = self._series.find_first_index_at_or_after(cutoff_time)
+        self._index_of_next_event = max(self._index_of_next_event, new_index)
+        self._next_bar_event = None
+
+    def add_listener(self, key: str, listener: Callable[[Event], None]) -> None:
+        """Implements: EventFeed.add_listener
+
+        Register $listener under $key.
+
+        Raises:
+            ValueError: If $key is empty or already registered.
+        """
+        # Raise: ensure $key is non-empty
+        if not key:
+            raise ValueError("Cannot call `add_listener` because $key is empty")
+        # Raise: ensure $key is unique among listeners
+        if key in self._listeners:
+            raise ValueError(f"Cannot call `add_listener` because $key ('{key}') already exists. Use a unique key or call `remove_listener` first.")
+        self._listeners[key] = listener
+
+    def remove_listener(self, key: str) -> None:
+        """Implements: EventFeed.remove_listener
+
+        Unregister listener under $key. Log warning if $key is unknown.
+        """
+        if key not in self._listeners:
+            logger.warning(f"Attempted to remove unknown listener $key ('{key}') from EventFeed (class {self.__class__.__name__})")
+            return
+        del self._listeners[key]
+
+    def list_listeners(self) -> list[Callable[[Event], None]]:
+        """Implements: EventFeed.list_listeners
+
+        Return all registered listeners.
+        """
+        return list(self._listeners.values())
+
+    # endregion
+
+    # region String representations
+
+    def __str__(self) -> str:
+        total = len(self._series) if self._series is not None else 0
+        return f"{self.__class__.__name__}(rows={total}, next_index={self._index_of_next_event})"
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(series={self._series!r}, next_index={self._index_of_next_event!r})"
+
+    # endregion
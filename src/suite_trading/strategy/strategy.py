@@ -400,6 +400,78 @@ class Strategy(ABC):
 
         engine.update_order(order)
 
+    def submit_orders(self, orders: list[Order], broker: Broker, *, coalesce_updates: bool = False) -> None:
+        """Submit a batch of orders for trading (for example a rebalance).
+
+        Allowed only when the strategy is RUNNING. All $orders are validated before any is submitted.
+
+        Args:
+            orders (list[Order]): The orders to submit, in submission order.
+            broker (Broker): The broker to submit the orders to.
+            coalesce_updates (bool): If True, resulting order state updates arrive as one
+                `on_order_state_updates` call after the batch was sent, followed by the batch's
+                `on_order_fill` calls.
+
+        Raises:
+            RuntimeError: If $trading_engine is None or $state is not RUNNING.
+        """
+        engine = self._require_trading_engine()
+
+        # Raise: state must be RUNNING to submit orders
+        if self.state != StrategyState.RUNNING:
+            valid_actions = [a.value for a in self._state_machine.list_valid_actions()]
+            raise RuntimeError(f"Cannot call `submit_orders` because $state ({self.state.name}) is not RUNNING. Valid actions: {valid_actions}")
+
+        engine.submit_orders(orders, broker, self, coalesce_updates=coalesce_updates)
+
+    def cancel_orders(self, orders: list[Order], *, coalesce_updates: bool = False) -> None:
+        """Cancel a batch of existing orders.
+
+        Allowed only when the strategy is RUNNING. All $orders are checked before any is cancelled.
+
+        Args:
+            orders (list[Order]): The orders to cancel.
+            coalesce_updates (bool): If True, resulting order state updates arrive as one
+                `on_order_state_updates` call after the batch was sent, followed by the batch's
+                `on_order_fill` calls.
+
+        Raises:
+            RuntimeError: If $trading_engine is None or $state is not RUNNING.
+            KeyError: If an order was not submitted through this Strategy.
+        """
+        engine = self._require_trading_engine()
+
+        # Raise: state must be RUNNING to cancel orders
+        if self.state != StrategyState.RUNNING:
+            valid_actions = [a.value for a in self._state_machine.list_valid_actions()]
+            raise RuntimeError(f"Cannot call `cancel_orders` because $state ({self.state.name}) is not RUNNING. Valid actions: {valid_actions}")
+
+        engine.cancel_orders(orders, coalesce_updates=coalesce_updates)
+
+    def update_orders(self, orders: list[Order], *, coalesce_updates: bool = False) -> None:
+        """Update a batch of existing orders.
+
+        Allowed only when the strategy is RUNNING. All $orders are checked before any is updated.
+
+        Args:
+            orders (list[Order]): The orders to update with new parameters.
+            coalesce_updates (bool): If True, resulting order state updates arrive as one
+                `on_order_state_updates` call after the batch was sent, followed by the batch's
+                `on_order_fill` calls.
+
+        Raises:
+            RuntimeError: If $trading_engine is None or $state is not RUNNING.
+            KeyError: If an order was not submitted through this Strategy.
+        """
+        engine = self._require_trading_engine()
+
+        # Raise: state must be RUNNING to update orders
+        if self.state != StrategyState.RUNNING:
+            valid_actions = [a.value for a in self._state_machine.list_valid_actions()]
+            raise RuntimeError(f"Cannot call `update_orders` because $state ({self.state.name}) is not RUNNING. Valid actions: {valid_actions}")
+
+        engine.update_orders(orders, coalesce_updates=coalesce_updates)
+
     # endregion
 
     # region Broker callbacks
@@ -420,6 +492,18 @@ class Strategy(ABC):
         """
         logger.debug(f"Strategy named '{self.name}' (class {self.__class__.__name__}) received order state update for Order $id ('{order.id}')")
 
+    def on_order_state_updates(self, orders: list[Order]) -> None:
+        """Called once per batch call with `coalesce_updates=True`, for all $orders that changed.
+
+        Each Order appears once and carries its latest state. By default, this calls
+        `on_order_state_update` for each Order; override it to handle a batch at once.
+
+        Args:
+            orders: The orders that were updated, in order of their first update.
+        """
+        for order in orders:
+            self.on_order_state_update(order)
+
     # endregion
 
     # region Magic
@@ -1,4 +1,8 @@
-from suite_trading.utils.state_machine import State, Action, StateMachine
+from __future__ import annotations
+
+from typing import Final
+
+from suite_trading.utils.state_machine import State, Action, StateMachine, TransitionTable
 
 
 class StrategyState(State):
@@ -46,6 +50,17 @@ class StrategyAction(Action):
     ERROR_OCCURRED = "ERROR_OCCURRED"
 
 
+_STRATEGY_TRANSITION_TABLE: Final[TransitionTable[StrategyState, StrategyAction]] = TransitionTable(
+    {
+        (StrategyState.NEW, StrategyAction.ADD_STRATEGY_TO_ENGINE): StrategyState.ADDED,
+        (StrategyState.ADDED, StrategyAction.START_STRATEGY): StrategyState.RUNNING,
+        (StrategyState.ADDED, StrategyAction.ERROR_OCCURRED): StrategyState.ERROR,
+        (StrategyState.RUNNING, StrategyAction.STOP_STRATEGY): StrategyState.STOPPED,
+        (StrategyState.RUNNING, StrategyAction.ERROR_OCCURRED): StrategyState.ERROR,
+    },
+)
+
+
 def create_strategy_state_machine() -> StateMachine[StrategyState, StrategyAction]:
     """Create a configured StateMachine for Strategy lifecycle management.
 
@@ -53,12 +68,4 @@ def create_strategy_state_machine() -> StateMachine[StrategyState, StrategyActio
         StateMachine[StrategyState, StrategyAction]: A StateMachine instance configured with Strategy transitions,
         starting in NEW state.
     """
-    transitions = {
-        (StrategyState.NEW, StrategyAction.ADD_STRATEGY_TO_ENGINE): StrategyState.ADDED,
-        (StrategyState.ADDED, StrategyAction.START_STRATEGY): StrategyState.RUNNING,
-        (StrategyState.ADDED, StrategyAction.ERROR_OCCURRED): StrategyState.ERROR,
-        (StrategyState.RUNNING, StrategyAction.STOP_STRATEGY): StrategyState.STOPPED,
-        (StrategyState.RUNNING, StrategyAction.ERROR_OCCURRED): StrategyState.ERROR,
-    }
-
-    return StateMachine(StrategyState.NEW, transitions)
+    return StateMachine(StrategyState.NEW, _STRATEGY_TRANSITION_TABLE)
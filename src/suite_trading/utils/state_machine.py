@@ -26,10 +26,70 @@ S = TypeVar("S", bound=State)
 A = TypeVar("A", bound=Action)
 
 
+class TransitionTable(Generic[S, A]):
+    """Immutable, precompiled transition table shared by many `StateMachine` instances.
+
+    Compiles a flat `(from_state, action) -> to_state` mapping into a per-state adjacency
+    table once, so state machines only need to keep their current state. All lookups
+    (`get_next_state`, `list_valid_actions`, `is_terminal`) are O(1).
+
+    Example:
+        ```python
+        ORDER_TRANSITIONS = TransitionTable({(OrderState.INITIALIZED, OrderAction.SUBMIT): OrderState.PENDING_SUBMIT})
+        sm = StateMachine(OrderState.INITIALIZED, ORDER_TRANSITIONS)  # no per-instance copy of transitions
+        ```
+    """
+
+    __slots__ = ("_next_state_by_action_by_state", "_valid_actions_by_state")
+
+    # region Init
+
+    def __init__(self, transitions: dict[tuple[S, A], S]):
+        """Compile $transitions into a per-state adjacency table.
+
+        Args:
+            transitions (dict[tuple[S, A], S]): Dictionary mapping (from_state, action) tuples
+                to target states.
+
+        Raises:
+            ValueError: If transitions dictionary is empty.
+        """
+        if not transitions:
+            raise ValueError("$transitions cannot be empty. At least one transition must be defined.")
+
+        next_state_by_action_by_state: dict[S, dict[A, S]] = {}
+        for (from_state, action), to_state in transitions.items():
+            next_state_by_action_by_state.setdefault(from_state, {})[action] = to_state
+
+        self._next_state_by_action_by_state: dict[S, dict[A, S]] = next_state_by_action_by_state
+        self._valid_actions_by_state: dict[S, tuple[A, ...]] = {state: tuple(next_state_by_action.keys()) for state, next_state_by_action in next_state_by_action_by_state.items()}
+
+    # endregion
+
+    # region Main
+
+    def get_next_state(self, state: S, action: A) -> S | None:
+        """Return the target state for $action from $state, or None if the transition is not defined."""
+        next_state_by_action = self._next_state_by_action_by_state.get(state)
+        if next_state_by_action is None:
+            return None
+        return next_state_by_action.get(action)
+
+    def list_valid_actions(self, state: S) -> tuple[A, ...]:
+        """Return actions that can be executed from $state (empty for terminal states)."""
+        return self._valid_actions_by_state.get(state, ())
+
+    def is_terminal(self, state: S) -> bool:
+        """Return True if no transitions start from $state."""
+        return state not in self._valid_actions_by_state
+
+    # endregion
+
+
 class StateMachine(Generic[S, A]):
     """A simple, elegant state machine implementation.
 
-    This state machine accepts state transition definitions as a dictionary
+    This state machine accepts state transition definitions as a shared `TransitionTable`
     and manages the current state based on actions received. It also provides
     functionality to check if the current state is terminal (has no outgoing transitions).
 
@@ -47,12 +107,14 @@ class StateMachine(Generic[S, A]):
             FILL = "FILL"
             CANCEL = "CANCEL"
 
-        # Define transitions - direct dictionary structure
-        transitions = {
-            (OrderState.PENDING, OrderAction.SUBMIT): OrderState.SUBMITTED,
-            (OrderState.SUBMITTED, OrderAction.FILL): OrderState.FILLED,
-            (OrderState.SUBMITTED, OrderAction.CANCEL): OrderState.CANCELLED,
-        }
+        # Define transitions - compiled once into a shared table
+        transitions = TransitionTable(
+            {
+                (OrderState.PENDING, OrderAction.SUBMIT): OrderState.SUBMITTED,
+                (OrderState.SUBMITTED, OrderAction.FILL): OrderState.FILLED,
+                (OrderState.SUBMITTED, OrderAction.CANCEL): OrderState.CANCELLED,
+            }
+        )
 
         # Create and use the state machine
         sm = StateMachine(OrderState.PENDING, transitions)
@@ -63,22 +125,17 @@ class StateMachine(Generic[S, A]):
         ```
     """
 
-    def __init__(self, initial_state: S, transitions: dict[tuple[S, A], S]):
+    __slots__ = ("_current_state", "_table")
+
+    def __init__(self, initial_state: S, transitions: TransitionTable[S, A]):
         """Initialize the state machine.
 
         Args:
             initial_state (S): The initial state of the machine.
-            transitions (dict[tuple[S, A], S]): Dictionary mapping
-                (from_state, action) tuples to target states.
-
-        Raises:
-            ValueError: If transitions dictionary is empty.
+            transitions (TransitionTable[S, A]): Shared precompiled transition table.
         """
-        if not transitions:
-            raise ValueError("$transitions cannot be empty. At least one transition must be defined.")
-
         self._current_state = initial_state
-        self._transitions = transitions
+        self._table: TransitionTable[S, A] = transitions
 
     @property
     def current_state(self) -> S:
@@ -98,15 +155,15 @@ class StateMachine(Generic[S, A]):
         Returns:
             bool: True if the action can be executed, False otherwise.
         """
-        return (self._current_state, action) in self._transitions
+        return self._table.get_next_state(self._current_state, action) is not None
 
-    def list_valid_actions(self) -> list[A]:
+    def list_valid_actions(self) -> tuple[A, ...]:
         """Get all valid actions from the current state.
 
         Returns:
-            list[A]: List of actions that can be executed from current state.
+            tuple[A, ...]: Actions that can be executed from current state.
         """
-        return [action for (state, action) in self._transitions.keys() if state == self._current_state]
+        return self._table.list_valid_actions(self._current_state)
 
     def execute_action(self, action: A) -> S:
         """Execute an action and transition to the new state.
@@ -120,15 +177,15 @@ class StateMachine(Generic[S, A]):
         Raises:
             ValueError: If the action is not valid from the current state.
         """
-        key = (self._current_state, action)
+        next_state = self._table.get_next_state(self._current_state, action)
 
-        if key not in self._transitions:
+        if next_state is None:
             valid_actions = [a.value for a in self.list_valid_actions()]
             raise ValueError(
                 f"Invalid $action '{action.value}' from $_current_state '{self._current_state.value}'. Valid actions are: {valid_actions}",
             )
 
-        self._current_state = self._transitions[key]
+        self._current_state = next_state
         return self._current_state
 
     def is_in_terminal_state(self) -> bool:
@@ -140,7 +197,7 @@ class StateMachine(Generic[S, A]):
         Returns:
             bool: True if the current state is terminal, False otherwise.
         """
-        return len(self.list_valid_actions()) == 0
+        return self._table.is_terminal(self._current_state)
 
     def reset(self, new_state: S):
         """Reset the state machine to a specific state.
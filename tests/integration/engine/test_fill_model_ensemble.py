@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+from datetime import timedelta
+from decimal import Decimal
+
+import pytest
+
+from suite_trading.domain.event import Event
+from suite_trading.domain.market_data.bar.bar_event import wrap_bars_to_events
+from suite_trading.domain.monetary.currency_registry import USD
+from suite_trading.domain.monetary.money import Money
+from suite_trading.domain.order.orders import MarketOrder
+from suite_trading.platform.broker.sim.models.fee.fixed_fee import FixedFeeModel
+from suite_trading.platform.broker.sim.models.fill.distribution import DistributionFillModel
+from suite_trading.platform.broker.sim.sim_broker import SimBroker
+from suite_trading.platform.engine.fill_model_ensemble import FillModelEnsemble
+from suite_trading.platform.event_feed.fixed_sequence_event_feed import FixedSequenceEventFeed
+from suite_trading.strategy.strategy import Strategy
+from suite_trading.utils.data_generation.assistant import DGA
+
+
+class _AlternatingStrategy(Strategy):
+    """Buys 1 on every 4th event and sells it 2 events later."""
+
+    def __init__(self, name: str, broker: SimBroker, events: Sequence[Event]) -> None:
+        super().__init__(name)
+        self._broker = broker
+        self._events = events
+        self._event_count = 0
+
+    def on_start(self) -> None:
+        self.add_event_feed("bars", FixedSequenceEventFeed(self._events), use_for_simulated_fills=True)
+
+    def on_event(self, event) -> None:
+        if self._event_count % 4 == 0:
+            self.submit_order(MarketOrder(event.bar.instrument, 1), self._broker)
+        elif self._event_count % 4 == 2:
+            self.submit_order(MarketOrder(event.bar.instrument, -1), self._broker)
+        self._event_count += 1
+
+
+def _build_broker(seed: int) -> SimBroker:
+    fill_model = DistributionFillModel(market_fill_adjustment_distribution={-2: Decimal("0.3"), 0: Decimal("0.4"), 1: Decimal("0.3")}, rng_seed=seed)
+    broker = SimBroker(fill_model=fill_model, fee_model=FixedFeeModel(Money(Decimal("1"), USD)), equity_sample_interval=timedelta(minutes=1))
+    broker.get_account().add_funds(Money(Decimal("1000000"), USD))
+    return broker
+
+
+def _build_strategy(events: Sequence[Event], broker: SimBroker) -> Strategy:
+    return _AlternatingStrategy("alternating", broker, events)
+
+
+def _create_events() -> list[Event]:
+    return list(wrap_bars_to_events(DGA.bar.create_series(num_bars=40)))
+
+
+def test_ensemble_runs_seeds_in_workers_like_in_process():
+    events = _create_events()
+    seeds = [1, 2, 3, 4]
+
+    in_process = FillModelEnsemble(events, build_broker=_build_broker, build_strategy=_build_strategy, currency=USD, max_workers=1).run(seeds)
+    in_workers = FillModelEnsemble(events, build_broker=_build_broker, build_strategy=_build_strategy, currency=USD, max_workers=2).run(seeds)
+
+    assert in_workers == in_process
+    assert [run.seed for run in in_process.runs] == seeds
+    assert all(run.fill_count == 20 for run in in_process.runs)
+    assert all(run.commission == pytest.approx(20.0) for run in in_process.runs)
+    # Slippage differs per seed
+    assert len({run.pnl for run in in_process.runs}) > 1
+
+
+def test_ensemble_result_describes_metrics_across_seeds():
+    result = FillModelEnsemble(_create_events(), build_broker=_build_broker, build_strategy=_build_strategy, currency=USD, max_workers=1).run(range(5))
+
+    summary = result.describe()
+
+    assert list(result.to_dataframe()["seed"]) == [0, 1, 2, 3, 4]
+    assert list(summary.columns) == ["pnl", "max_drawdown", "fill_count", "traded_volume", "commission"]
+    assert summary.loc["count", "pnl"] == 5
+    assert (result.to_dataframe()["max_drawdown"] >= 0).all()
+
+
+def test_ensemble_requires_broker_with_valuation():
+    ensemble = FillModelEnsemble(_create_events(), build_broker=lambda seed: SimBroker(), build_strategy=_build_strategy, currency=USD, max_workers=1)
+
+    with pytest.raises(ValueError):
+        ensemble.run([1])
@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+from suite_trading.domain.market_data.tick.quote_tick_event import QuoteTickEvent
+from suite_trading.domain.order.order_fill import OrderFill
+from suite_trading.domain.order.order_state import OrderState
+from suite_trading.domain.order.orders import LimitOrder, MarketOrder, Order, TimeInForce
+from suite_trading.platform.broker.sim.models.fill.distribution import DistributionFillModel
+from suite_trading.platform.broker.sim.sim_broker import SimBroker
+from suite_trading.platform.engine.trading_engine import TradingEngine
+from suite_trading.platform.event_feed.fixed_sequence_event_feed import FixedSequenceEventFeed
+from suite_trading.strategy.strategy import Strategy
+from suite_trading.utils.data_generation.assistant import DGA
+
+TS = datetime(2025, 1, 1, 10, 0, 0, tzinfo=timezone.utc)
+
+
+class _BatchStrategy(Strategy):
+    """Runs $action once on the first event and records single and coalesced order state updates."""
+
+    def __init__(self, name: str, broker: SimBroker, action) -> None:
+        super().__init__(name)
+        self._broker = broker
+        self._action = action
+        self._is_done = False
+        self.single_updates: list[tuple[str, OrderState]] = []
+        self.batch_updates: list[list[tuple[str, OrderState]]] = []
+        self.callback_names: list[str] = []
+
+    def on_start(self) -> None:
+        tick = DGA.quote_tick.from_strings(DGA.instrument.future_es(), "99@10", "101@10", TS)
+        self.add_event_feed("q", FixedSequenceEventFeed([QuoteTickEvent(tick, TS)]), use_for_simulated_fills=True)
+
+    def on_event(self, event) -> None:
+        if not self._is_done:
+            self._is_done = True
+            self._action(self, self._broker)
+
+    def on_order_state_update(self, order: Order) -> None:
+        self.single_updates.append((order.id, order.state))
+
+    def on_order_state_updates(self, orders: list[Order]) -> None:
+        self.batch_updates.append([(order.id, order.state) for order in orders])
+        self.callback_names.append("on_order_state_updates")
+
+    def on_order_fill(self, order_fill: OrderFill) -> None:
+        self.callback_names.append("on_order_fill")
+
+
+def _run(action) -> tuple[_BatchStrategy, SimBroker, TradingEngine]:
+    fill_model = DistributionFillModel(market_fill_adjustment_distribution={0: Decimal("1")}, limit_on_touch_fill_probability=Decimal("1"), rng_seed=42)
+    broker = SimBroker(fill_model=fill_model)
+    engine = TradingEngine()
+    strategy = _BatchStrategy("batch", broker, action)
+    engine.add_broker("sim", broker)
+    engine.add_strategy(strategy)
+    engine.start()
+    return strategy, broker, engine
+
+
+def test_coalesced_submit_delivers_one_notification_with_latest_states():
+    es = DGA.instrument.future_es()
+    orders = [MarketOrder(es, 1), LimitOrder(es, 1, Decimal("90")), LimitOrder(es, -1, Decimal("110"))]
+
+    strategy, broker, _ = _run(lambda strategy, broker: strategy.submit_orders(orders, broker, coalesce_updates=True))
+
+    assert strategy.single_updates == []
+    assert strategy.batch_updates == [[(orders[0].id, OrderState.FILLED), (orders[1].id, OrderState.WORKING), (orders[2].id, OrderState.WORKING)]]
+    assert broker.list_active_orders() == orders[1:]
+
+
+def test_coalesced_submit_delivers_fills_after_state_updates():
+    es = DGA.instrument.future_es()
+    orders = [MarketOrder(es, 1), MarketOrder(es, -2)]
+
+    strategy, _, engine = _run(lambda strategy, broker: strategy.submit_orders(orders, broker, coalesce_updates=True))
+
+    assert strategy.callback_names == ["on_order_state_updates", "on_order_fill", "on_order_fill"]
+    assert [order_fill.order for order_fill in engine.list_order_fills_for_strategy("batch")] == orders
+
+
+def test_uncoalesced_batch_delivers_updates_one_by_one():
+    es = DGA.instrument.future_es()
+    orders = [LimitOrder(es, 1, Decimal("90")), LimitOrder(es, 1, Decimal("91"))]
+
+    def action(strategy: _BatchStrategy, broker: SimBroker) -> None:
+        strategy.submit_orders(orders, broker)
+        strategy.single_updates.clear()
+        strategy.cancel_orders(orders)
+
+    strategy, _, _ = _run(action)
+
+    assert strategy.batch_updates == []
+    assert strategy.single_updates == [
+        (orders[0].id, OrderState.PENDING_CANCEL),
+        (orders[0].id, OrderState.CANCELLED),
+        (orders[1].id, OrderState.PENDING_CANCEL),
+        (orders[1].id, OrderState.CANCELLED),
+    ]
+
+
+def test_duplicate_order_rejects_whole_batch_before_any_submission():
+    es = DGA.instrument.future_es()
+    valid_order = LimitOrder(es, 1, Decimal("90"))
+    errors: list[Exception] = []
+
+    def action(strategy: _BatchStrategy, broker: SimBroker) -> None:
+        try:
+            strategy.submit_orders([valid_order, valid_order], broker)
+        except ValueError as e:
+            errors.append(e)
+
+    _, broker, _ = _run(action)
+
+    assert len(errors) == 1
+    assert valid_order.state == OrderState.INITIALIZED
+    assert broker.list_active_orders() == []
+
+
+def test_order_rejected_by_broker_leaves_whole_batch_untouched():
+    es = DGA.instrument.future_es()
+    valid_order = LimitOrder(es, 1, Decimal("90"))
+    expired_order = LimitOrder(es, 1, Decimal("91"), time_in_force=TimeInForce.GTD, good_till_dt=TS - timedelta(minutes=1))
+    errors: list[Exception] = []
+
+    def action(strategy: _BatchStrategy, broker: SimBroker) -> None:
+        try:
+            strategy.submit_orders([valid_order, expired_order], broker, coalesce_updates=True)
+        except ValueError as e:
+            errors.append(e)
+
+    strategy, broker, engine = _run(action)
+
+    assert len(errors) == 1 and "`submit_orders`" in str(errors[0])
+    assert valid_order.state == expired_order.state == OrderState.INITIALIZED
+    assert strategy.batch_updates == [] and strategy.single_updates == []
+    assert engine._routing_by_order == {}
+    assert broker.list_active_orders() == []
+
+
+def test_orders_not_taken_by_broker_are_denied_when_batch_fails_late():
+    class _LateRejectingSimBroker(SimBroker):
+        """Skips up-front checks, so the batch fails only inside `submit_orders`."""
+
+        def validate_orders_for_submission(self, orders: list[Order]) -> None:
+            pass
+
+    es = DGA.instrument.future_es()
+    valid_order = LimitOrder(es, 1, Decimal("90"))
+    expired_order = LimitOrder(es, 1, Decimal("91"), time_in_force=TimeInForce.GTD, good_till_dt=TS - timedelta(minutes=1))
+    broker = _LateRejectingSimBroker()
+    engine = TradingEngine()
+    strategy = _BatchStrategy("batch", broker, lambda strategy, broker: strategy.submit_orders([valid_order, expired_order], broker, coalesce_updates=True))
+    engine.add_broker("sim", broker)
+    engine.add_strategy(strategy)
+    engine.start()
+
+    assert valid_order.state == expired_order.state == OrderState.DENIED
+    assert strategy.batch_updates == [[(valid_order.id, OrderState.DENIED), (expired_order.id, OrderState.DENIED)]]
+    assert engine._routing_by_order == {}
@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+from datetime import datetime
+from decimal import Decimal
+
+from suite_trading.domain.event import Event
+from suite_trading.domain.instrument import Instrument
+from suite_trading.domain.market_data.bar.bar_event import BarEvent, wrap_bars_to_events
+from suite_trading.domain.market_data.order_book.order_book import BookLevel, OrderBook
+from suite_trading.domain.order.orders import LimitOrder
+from suite_trading.platform.broker.sim.models.fill.distribution import DistributionFillModel
+from suite_trading.platform.broker.sim.sim_broker import SimBroker
+from suite_trading.platform.engine.models.event_to_order_book.default_impl import DefaultEventToOrderBookConverter
+from suite_trading.platform.engine.trading_engine import TradingEngine
+from suite_trading.platform.event_feed.fixed_sequence_event_feed import FixedSequenceEventFeed
+from suite_trading.strategy.strategy import Strategy
+from suite_trading.utils.data_generation.assistant import DGA
+from suite_trading.utils.datetime_tools import make_utc
+
+
+class _MidPriceEvent(Event):
+    """Custom market-data event: one mid price with unlimited size."""
+
+    def __init__(self, instrument: Instrument, price: Decimal, dt: datetime) -> None:
+        super().__init__(dt_event=dt, dt_received=dt)
+        self.instrument = instrument
+        self.price = price
+
+
+def _mid_price_to_order_books(event: _MidPriceEvent) -> list[OrderBook]:
+    levels = (BookLevel(event.price, Decimal("1000")),)
+    return [OrderBook(event.instrument, event.dt_event, levels, levels)]
+
+
+class _BuyLimitStrategy(Strategy):
+    """Submits one buy limit at $limit_price on the first event."""
+
+    def __init__(self, name: str, broker: SimBroker, events: list[Event], limit_price: Decimal) -> None:
+        super().__init__(name)
+        self._broker = broker
+        self._events = events
+        self._limit_price = limit_price
+        self._is_submitted = False
+
+    def on_start(self) -> None:
+        self.add_event_feed("mid_prices", FixedSequenceEventFeed(self._events), use_for_simulated_fills=True)
+
+    def on_event(self, event) -> None:
+        if not self._is_submitted:
+            self.submit_order(LimitOrder(event.instrument, 1, self._limit_price), self._broker)
+            self._is_submitted = True
+
+
+def test_registered_custom_event_type_drives_simulated_fills():
+    instrument = DGA.instrument.equity_aapl()
+    events = [_MidPriceEvent(instrument, Decimal(price), make_utc(2025, 1, 1, 12, 0, index)) for index, price in enumerate(["100.00", "99.50", "98.90", "98.00"])]
+    converter = DefaultEventToOrderBookConverter()
+    converter.register_event_type(_MidPriceEvent, get_instrument=lambda event: event.instrument, convert_to_order_books=_mid_price_to_order_books)
+
+    engine = TradingEngine()
+    broker = SimBroker(fill_model=DistributionFillModel(market_fill_adjustment_distribution={0: Decimal("1")}, limit_on_touch_fill_probability=Decimal("1"), rng_seed=1))
+    engine.add_broker("sim", broker)
+    engine.set_order_book_converter(converter)
+    engine.add_strategy(_BuyLimitStrategy("custom", broker, events, Decimal("99.00")))
+    engine.start()
+
+    order_fills = engine.list_order_fills_for_strategy("custom")
+    assert [order_fill.price for order_fill in order_fills] == [Decimal("98.90")]
+
+
+def test_conversion_is_resolved_once_per_event_class():
+    class _FlaggedBarEvent(BarEvent):
+        pass
+
+    converter = DefaultEventToOrderBookConverter()
+    event = next(iter(wrap_bars_to_events(DGA.bar.create_series(num_bars=2))))
+
+    conversion = converter.resolve_conversion(BarEvent)
+
+    assert converter.resolve_conversion(BarEvent) is conversion
+    assert converter.resolve_conversion(_MidPriceEvent) is None
+    assert not converter.can_convert(_MidPriceEvent(event.bar.instrument, Decimal("1"), event.dt_event))
+    # Subclasses use the conversion of their nearest registered base class
+    assert converter.resolve_conversion(_FlaggedBarEvent) is not None
+    assert conversion.get_instrument(event) == event.bar.instrument
+    assert len(conversion.convert_to_order_books(event)) == 4
+    assert len(conversion.convert_to_price_trajectory(event)) == 4
+
+
+def test_converter_subclass_overriding_can_convert_filters_events():
+    class _AboveConverter(DefaultEventToOrderBookConverter):
+        """Drives fills only with mid prices above 99."""
+
+        def can_convert(self, event: Event) -> bool:
+            return super().can_convert(event) and event.price > Decimal("99")
+
+    instrument = DGA.instrument.equity_aapl()
+    events = [_MidPriceEvent(instrument, Decimal(price), make_utc(2025, 1, 1, 12, 0, index)) for index, price in enumerate(["100.00", "98.90", "99.50", "98.00"])]
+    converter = _AboveConverter()
+    converter.register_event_type(_MidPriceEvent, get_instrument=lambda event: event.instrument, convert_to_order_books=_mid_price_to_order_books)
+
+    engine = TradingEngine()
+    broker = SimBroker(fill_model=DistributionFillModel(market_fill_adjustment_distribution={0: Decimal("1")}, limit_on_touch_fill_probability=Decimal("1"), rng_seed=1))
+    engine.add_broker("sim", broker)
+    engine.set_order_book_converter(converter)
+    engine.add_strategy(_BuyLimitStrategy("filtered", broker, events, Decimal("99.00")))
+    engine.start()
+
+    # Overridden `can_convert` is honored: prices at or below 99 never reach the broker
+    assert converter.resolve_conversion(_MidPriceEvent) is None
+    assert engine.list_order_fills_for_strategy("filtered") == []
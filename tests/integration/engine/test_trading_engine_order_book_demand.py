@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+from decimal import Decimal
+
+from suite_trading.domain.event import Event
+from suite_trading.domain.market_data.order_book.order_book import OrderBook
+from suite_trading.domain.market_data.tick.quote_tick_event import QuoteTickEvent
+from suite_trading.domain.order.orders import LimitOrder, MarketOrder, Order
+from suite_trading.platform.broker.sim.models.fill.distribution import DistributionFillModel
+from suite_trading.platform.broker.sim.sim_broker import SimBroker
+from suite_trading.platform.engine.models.event_to_order_book.default_impl import DefaultEventToOrderBookConverter
+from suite_trading.platform.engine.models.event_to_order_book.protocol import EventToOrderBookConverter
+from suite_trading.platform.engine.trading_engine import TradingEngine
+from suite_trading.platform.event_feed.fixed_sequence_event_feed import FixedSequenceEventFeed
+from suite_trading.strategy.strategy import Strategy
+from suite_trading.utils.data_generation.assistant import DGA
+from suite_trading.utils.datetime_tools import make_utc
+
+
+class _CountingConverter(DefaultEventToOrderBookConverter):
+    """Default converter that counts events converted to OrderBook(s)."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.converted_event_count = 0
+
+    def convert_to_order_books(self, event: Event) -> list[OrderBook]:
+        self.converted_event_count += 1
+        return super().convert_to_order_books(event)
+
+
+class _EagerConverter(EventToOrderBookConverter):
+    """Converter with only the two required methods (no deferral support)."""
+
+    def __init__(self) -> None:
+        self._converter = DefaultEventToOrderBookConverter()
+        self.converted_event_count = 0
+
+    def can_convert(self, event: Event) -> bool:
+        return self._converter.can_convert(event)
+
+    def convert_to_order_books(self, event: Event) -> list[OrderBook]:
+        self.converted_event_count += 1
+        return self._converter.convert_to_order_books(event)
+
+
+class _SubmitOnceStrategy(Strategy):
+    """Submits one order created by $order_factory when the event at $submit_index arrives."""
+
+    def __init__(self, name: str, broker: SimBroker, events: list[QuoteTickEvent], submit_index: int, order_factory) -> None:
+        super().__init__(name)
+        self._broker = broker
+        self._events = events
+        self._submit_index = submit_index
+        self._order_factory = order_factory
+        self._event_count = 0
+
+    def on_start(self) -> None:
+        self.add_event_feed("quotes", FixedSequenceEventFeed(self._events), use_for_simulated_fills=True)
+
+    def on_event(self, event) -> None:
+        if self._event_count == self._submit_index:
+            self.submit_order(self._order_factory(), self._broker)
+        self._event_count += 1
+
+
+def _create_quote_tick_events(asks: list[str]) -> list[QuoteTickEvent]:
+    instrument = DGA.instrument.equity_aapl()
+    result = []
+    for index, ask in enumerate(asks):
+        ts = make_utc(2025, 1, 1, 12, 0, index)
+        bid = str(Decimal(ask) - Decimal("0.05"))
+        result.append(QuoteTickEvent(DGA.quote_tick.from_strings(instrument, f"{bid}@5", f"{ask}@5", ts), ts))
+    return result
+
+
+def _run(events: list[QuoteTickEvent], submit_index: int, order_factory, converter: EventToOrderBookConverter | None = None) -> tuple[TradingEngine, EventToOrderBookConverter]:
+    engine = TradingEngine()
+    broker = SimBroker(fill_model=DistributionFillModel(market_fill_adjustment_distribution={0: Decimal("1")}, limit_on_touch_fill_probability=Decimal("1"), rng_seed=42))
+    converter = converter if converter is not None else _CountingConverter()
+    engine.add_broker("sim", broker)
+    engine.set_order_book_converter(converter)
+    engine.add_strategy(_SubmitOnceStrategy("demand", broker, events, submit_index, order_factory))
+    engine.start()
+    return engine, converter
+
+
+def test_events_are_converted_only_while_orders_are_active():
+    events = _create_quote_tick_events(["100.00", "100.00", "99.50", "98.90", "98.00"])
+    instrument = events[0].quote_tick.instrument
+
+    def create_order() -> Order:
+        return LimitOrder(instrument, 1, Decimal("99.00"))
+
+    engine, converter = _run(events, submit_index=1, order_factory=create_order)
+
+    # Only the two quotes after submission (until the fill at 98.90) are converted
+    assert converter.converted_event_count == 2
+    order_fills = engine.list_order_fills_for_strategy("demand")
+    assert [order_fill.price for order_fill in order_fills] == [Decimal("98.90")]
+
+
+def test_order_submitted_while_flat_matches_latest_deferred_event():
+    events = _create_quote_tick_events(["100.00", "101.00", "102.00", "103.00"])
+    instrument = events[0].quote_tick.instrument
+
+    def create_order() -> Order:
+        return MarketOrder(instrument, 1)
+
+    engine, converter = _run(events, submit_index=2, order_factory=create_order)
+
+    assert converter.converted_event_count == 0
+    order_fills = engine.list_order_fills_for_strategy("demand")
+    assert [order_fill.price for order_fill in order_fills] == [Decimal("102.00")]
+
+
+def test_converter_without_deferral_converts_every_event():
+    events = _create_quote_tick_events(["100.00", "101.00", "102.00", "103.00"])
+    instrument = events[0].quote_tick.instrument
+
+    def create_order() -> Order:
+        return MarketOrder(instrument, 1)
+
+    engine, converter = _run(events, submit_index=2, order_factory=create_order, converter=_EagerConverter())
+
+    assert converter.converted_event_count == 4
+    order_fills = engine.list_order_fills_for_strategy("demand")
+    assert [order_fill.price for order_fill in order_fills] == [Decimal("102.00")]
@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+from datetime import timedelta
+from decimal import Decimal
+
+from suite_trading.domain.event import Event
+from suite_trading.domain.instrument import Instrument
+from suite_trading.domain.market_data.bar.bar_event import BarEvent, wrap_bars_to_events
+from suite_trading.domain.market_data.order_book.ohlc_price_trajectory import OhlcPriceTrajectory
+from suite_trading.domain.market_data.order_book.order_book import OrderBook
+from suite_trading.domain.monetary.currency_registry import USD
+from suite_trading.domain.monetary.money import Money
+from suite_trading.domain.order.orders import LimitOrder, MarketOrder, StopMarketOrder
+from suite_trading.platform.broker.sim.models.fill.distribution import DistributionFillModel
+from suite_trading.platform.broker.sim.sim_broker import SimBroker
+from suite_trading.platform.engine.models.event_to_order_book.conversion_functions import bar_to_order_books
+from suite_trading.platform.engine.models.event_to_order_book.default_impl import DefaultEventToOrderBookConverter
+from suite_trading.platform.engine.models.event_to_order_book.protocol import DeferredConversionConverter, EventToOrderBookConverter
+from suite_trading.platform.engine.models.intrabar_path.directional import DirectionalIntrabarPathModel
+from suite_trading.platform.engine.models.intrabar_path.ohlc import OhlcIntrabarPathModel
+from suite_trading.platform.engine.trading_engine import TradingEngine
+from suite_trading.platform.event_feed.fixed_sequence_event_feed import FixedSequenceEventFeed
+from suite_trading.strategy.strategy import Strategy
+from suite_trading.utils.data_generation.assistant import DGA
+
+
+class _OrderBookOnlyConverter(EventToOrderBookConverter, DeferredConversionConverter):
+    """Default converter without trajectory support, so the engine routes 4 OrderBooks per bar."""
+
+    def __init__(self) -> None:
+        self._converter = DefaultEventToOrderBookConverter()
+
+    def can_convert(self, event: Event) -> bool:
+        return self._converter.can_convert(event)
+
+    def convert_to_order_books(self, event: Event) -> list[OrderBook]:
+        return self._converter.convert_to_order_books(event)
+
+    def get_instrument(self, event: Event) -> Instrument:
+        return self._converter.get_instrument(event)
+
+    def defer_conversion(self, event: Event) -> None:
+        self._converter.defer_conversion(event)
+
+    def get_latest_order_book(self, instrument: Instrument) -> OrderBook | None:
+        return self._converter.get_latest_order_book(instrument)
+
+
+class _BracketingStrategy(Strategy):
+    """Every 3rd bar places a near limit buy, a protective stop sell, a breakout stop buy and a
+    far limit that never fills; every 7th bar flattens with a market order."""
+
+    def __init__(self, name: str, broker: SimBroker, events: list[BarEvent]) -> None:
+        super().__init__(name)
+        self._broker = broker
+        self._events = events
+        self._event_count = 0
+
+    def on_start(self) -> None:
+        self.add_event_feed("bars", FixedSequenceEventFeed(self._events), use_for_simulated_fills=True)
+
+    def on_event(self, event) -> None:
+        bar = event.bar
+        instrument = bar.instrument
+        if self._event_count % 3 == 0:
+            self.submit_order(LimitOrder(instrument, 1, bar.close - Decimal("0.15")), self._broker)
+            self.submit_order(StopMarketOrder(instrument, -1, bar.close - Decimal("0.20")), self._broker)
+            self.submit_order(StopMarketOrder(instrument, 1, bar.close + Decimal("0.30")), self._broker)
+            self.submit_order(LimitOrder(instrument, 1, bar.close - Decimal("5.00")), self._broker)
+        if self._event_count % 7 == 6:
+            position = self._broker.get_position(instrument)
+            if position is not None and position.signed_qty != 0:
+                self.submit_order(MarketOrder(instrument, -position.signed_qty), self._broker)
+        self._event_count += 1
+
+
+def _create_events() -> list[BarEvent]:
+    return list(wrap_bars_to_events(DGA.bar.create_series(num_bars=60)))
+
+
+def _run(converter: EventToOrderBookConverter, events: list[BarEvent] | None = None) -> tuple[list[tuple], list[tuple]]:
+    events = events if events is not None else _create_events()
+    fill_model = DistributionFillModel(market_fill_adjustment_distribution={-1: Decimal("0.3"), 0: Decimal("0.5"), 1: Decimal("0.2")}, rng_seed=7)
+    broker = SimBroker(fill_model=fill_model, equity_sample_interval=timedelta(minutes=2))
+    broker.get_account().add_funds(Money(Decimal("1000000"), USD))
+
+    engine = TradingEngine()
+    engine.add_broker("sim", broker)
+    engine.set_order_book_converter(converter)
+    engine.add_strategy(_BracketingStrategy("bracketing", broker, events))
+    engine.start()
+
+    fills = [(order_fill.timestamp, order_fill.signed_quantity, order_fill.price) for order_fill in engine.list_order_fills_for_strategy("bracketing")]
+    equity_curve = [tuple(row) for row in broker.valuation.equity_curve_to_dataframe().itertuples(index=False)]
+    return fills, equity_curve
+
+
+def test_trajectory_path_matches_four_order_book_decomposition():
+    trajectory_fills, trajectory_equity_curve = _run(DefaultEventToOrderBookConverter())
+    order_book_fills, order_book_equity_curve = _run(_OrderBookOnlyConverter())
+
+    assert len(order_book_fills) > 10
+    assert trajectory_fills == order_book_fills
+    assert trajectory_equity_curve == order_book_equity_curve
+
+
+def test_trajectory_order_books_equal_bar_to_order_books():
+    for bar in DGA.bar.create_series(num_bars=3):
+        expected = bar_to_order_books(bar)
+        trajectory = OhlcPriceTrajectory.from_bar(bar)
+
+        actual = trajectory.list_order_books()
+
+        assert len(trajectory) == 4
+        assert [(book.timestamp, book.list_bids(), book.list_asks()) for book in actual] == [(book.timestamp, book.list_bids(), book.list_asks()) for book in expected]
+        # Built once per point, then reused
+        assert trajectory.get_order_book(2) is actual[2]
+
+
+def test_intrabar_path_model_drives_fills_from_precomputed_paths():
+    events = _create_events()
+    ohlc_model = OhlcIntrabarPathModel()
+    ohlc_model.precompute([event.bar for event in events])
+    directional_model = DirectionalIntrabarPathModel()
+    directional_model.precompute([event.bar for event in events])
+
+    default_fills, _ = _run(DefaultEventToOrderBookConverter(), events)
+    ohlc_fills, _ = _run(DefaultEventToOrderBookConverter(intrabar_path_model=ohlc_model), events)
+    directional_fills, _ = _run(DefaultEventToOrderBookConverter(intrabar_path_model=directional_model), events)
+
+    assert ohlc_fills == default_fills
+    # Up bars now visit the low before the high, so fills differ
+    assert directional_fills != default_fills
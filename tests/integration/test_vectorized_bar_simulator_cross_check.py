@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+import math
+from decimal import Decimal
+
+import pytest
+
+from suite_trading.domain.market_data.bar.bar import Bar
+from suite_trading.domain.market_data.bar.bar_event import BarEvent, wrap_bars_to_events
+from suite_trading.domain.monetary.currency_registry import USD
+from suite_trading.domain.monetary.money import Money
+from suite_trading.domain.order.orders import LimitOrder, MarketOrder
+from suite_trading.platform.broker.sim.models.fee.fixed_fee import FixedFeeModel
+from suite_trading.platform.broker.sim.models.fill.distribution import DistributionFillModel
+from suite_trading.platform.broker.sim.models.margin.fixed_ratio import FixedRatioMarginModel
+from suite_trading.platform.broker.sim.sim_broker import SimBroker
+from suite_trading.platform.broker.sim.vectorized_bar_simulator import VectorizedBarBacktestResult, VectorizedBarSimulator
+from suite_trading.platform.engine.trading_engine import TradingEngine
+from suite_trading.platform.event_feed.fixed_sequence_event_feed import FixedSequenceEventFeed
+from suite_trading.strategy.strategy import Strategy
+from suite_trading.utils.data_generation.assistant import DGA
+from suite_trading.utils.data_generation.price_patterns import sine_wave
+
+NUM_BARS = 60
+TARGET_PATTERN = [1, 1, 3, 0, -2, -2, 2, 5, 0, -1, -4, 1]
+LIMIT_OFFSETS = [None, "0.05", "0.30", None, "0.10", "0.00", "0.20", "0.50", None, "0.15", "0.02", "0.40"]
+
+
+class _TargetPositionStrategy(Strategy):
+    """Moves the position to $targets[i] at the close of bar i, like `VectorizedBarSimulator`."""
+
+    def __init__(self, name: str, broker: SimBroker, bars: list[Bar], targets: list[int], limit_prices: list[Decimal | None]) -> None:
+        super().__init__(name)
+        self._broker = broker
+        self._bars = bars
+        self._targets = targets
+        self._limit_prices = limit_prices
+        self._bar_index = 0
+        self.signed_positions: list[Decimal] = []
+
+    def on_start(self) -> None:
+        self.add_event_feed("bars", FixedSequenceEventFeed(wrap_bars_to_events(self._bars)), use_for_simulated_fills=True)
+
+    def on_event(self, event) -> None:
+        if not isinstance(event, BarEvent):
+            return
+
+        # Limit orders live for one bar
+        for order in self._broker.list_active_orders():
+            self.cancel_order(order)
+
+        instrument = event.bar.instrument
+        signed_qty = self._targets[self._bar_index] - self._broker.get_signed_position_qty(instrument)
+        if signed_qty != 0:
+            limit_price = self._limit_prices[self._bar_index]
+            order = MarketOrder(instrument, signed_qty) if limit_price is None else LimitOrder(instrument, signed_qty, limit_price)
+            self.submit_order(order, self._broker)
+
+        self.signed_positions.append(self._broker.get_signed_position_qty(instrument))
+        self._bar_index += 1
+
+
+def _create_bars() -> list[Bar]:
+    first_bar = DGA.bar.create(volume=Decimal("1000"))
+    return DGA.bar.create_series(first_bar=first_bar, num_bars=NUM_BARS, price_pattern_func=lambda x: sine_wave(x, amplitude=0.02, frequency=0.4))
+
+
+def _create_limit_prices(bars: list[Bar], targets: list[int]) -> list[Decimal | None]:
+    """Place limits below the close for buys and above it for sells (some rest, some fill at once)."""
+    result = []
+    position = 0
+    for index, bar in enumerate(bars):
+        offset = LIMIT_OFFSETS[index % len(LIMIT_OFFSETS)]
+        is_buy = targets[index] > position
+        result.append(None if offset is None else bar.close - Decimal(offset) if is_buy else bar.close + Decimal(offset))
+        position = targets[index]
+    return result
+
+
+def _run_sim_broker(bars, targets, limit_prices, *, fee_model, margin_model, funds) -> tuple[SimBroker, _TargetPositionStrategy]:
+    fill_model = DistributionFillModel(market_fill_adjustment_distribution={0: Decimal("1")}, limit_on_touch_fill_probability=Decimal("1"), rng_seed=42)
+    broker = SimBroker(fill_model=fill_model, fee_model=fee_model, margin_model=margin_model)
+    broker.get_account().add_funds(Money(funds, USD))
+    strategy = _TargetPositionStrategy("targets", broker, bars, targets, limit_prices)
+
+    engine = TradingEngine()
+    engine.add_broker("sim", broker)
+    engine.add_strategy(strategy)
+    engine.start()
+    return broker, strategy
+
+
+def _run_vectorized(bars, targets, limit_prices, *, fee_model, margin_model, funds) -> VectorizedBarBacktestResult:
+    simulator = VectorizedBarSimulator(bars[0].instrument, fee_model=fee_model, margin_model=margin_model, initial_funds=funds)
+    columns = [[float(getattr(bar, field)) for bar in bars] for field in ("open", "high", "low", "close")]
+    limits = None if limit_prices is None else [math.nan if price is None else float(price) for price in limit_prices]
+    return simulator.run(*columns, targets, limit_prices=limits)
+
+
+@pytest.mark.parametrize(
+    ("use_limit_orders", "funds"),
+    [
+        (False, Decimal("100000")),
+        (True, Decimal("100000")),
+        (False, Decimal("150")),  # Margin calls reject some fills
+        (True, Decimal("150")),
+    ],
+)
+def test_vectorized_simulator_matches_sim_broker(use_limit_orders: bool, funds: Decimal):
+    bars = _create_bars()
+    targets = [TARGET_PATTERN[index % len(TARGET_PATTERN)] for index in range(NUM_BARS)]
+    limit_prices = _create_limit_prices(bars, targets) if use_limit_orders else [None] * NUM_BARS
+    fee_model = FixedFeeModel(Money(Decimal("0.25"), USD))
+    margin_model = FixedRatioMarginModel(initial_margin_ratio=Decimal("0.5"), maint_margin_ratio=Decimal("0.4"))
+
+    broker, strategy = _run_sim_broker(bars, targets, limit_prices, fee_model=fee_model, margin_model=margin_model, funds=funds)
+    result = _run_vectorized(bars, targets, limit_prices if use_limit_orders else None, fee_model=fee_model, margin_model=margin_model, funds=funds)
+
+    # Fills
+    order_fills = broker._order_fill_history
+    assert len(order_fills) > 0
+    assert [float(fill.price) for fill in order_fills] == pytest.approx(result.fill_prices.tolist())
+    assert [float(fill.signed_quantity) for fill in order_fills] == result.fill_signed_qtys.tolist()
+    assert [float(fill.commission.value) for fill in order_fills] == pytest.approx(result.fill_commissions.tolist())
+
+    # Per-bar positions and final account state
+    assert [float(qty) for qty in strategy.signed_positions] == result.signed_positions.tolist()
+    account = broker.get_account()
+    assert float(sum(fee.amount.value for fee in account.list_paid_fees())) == pytest.approx(result.cumulative_fees[-1])
+    blocked_margins = account.get_blocked_margins(bars[0].instrument)
+    assert float(blocked_margins.maintenance.value) == pytest.approx(result.blocked_maint_margins[-1])
+    assert float(account.get_funds(USD).value) == pytest.approx(float(funds) - result.cumulative_fees[-1] - result.blocked_maint_margins[-1])
+
+
+def test_vectorized_market_path_matches_bar_by_bar_path():
+    bars = _create_bars()
+    targets = [TARGET_PATTERN[index % len(TARGET_PATTERN)] for index in range(NUM_BARS)]
+    simulator = VectorizedBarSimulator(bars[0].instrument, fee_model=FixedFeeModel(Money(Decimal("0.25"), USD)), initial_funds=1_000)
+    columns = [[float(getattr(bar, field)) for bar in bars] for field in ("open", "high", "low", "close")]
+    signals = [index % 3 != 1 for index in range(NUM_BARS)]
+
+    vectorized = simulator.run(*columns, targets, signals=signals)
+    bar_by_bar = simulator.run(*columns, targets, signals=signals, limit_prices=[math.nan, 0.0] + [math.nan] * (NUM_BARS - 2))
+
+    # The 0.0 limit at bar 1 is never signalled, so both runs submit only market orders
+    for vectorized_column, bar_by_bar_column in zip(vectorized, bar_by_bar):
+        assert vectorized_column.tolist() == pytest.approx(bar_by_bar_column.tolist())
+    assert vectorized.bars_to_dataframe()["equity"].iloc[-1] == pytest.approx(bar_by_bar.equity[-1])
@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+import pytest
+
+from suite_trading.domain.market_data.bar.aggregation.time_bar_aggregator import TimeBarAggregator
+from suite_trading.domain.market_data.bar.bar import Bar
+from suite_trading.domain.market_data.bar.bar_event import BarEvent, wrap_bars_to_events
+from suite_trading.domain.market_data.bar.bar_series import BarSeries, BarView
+from suite_trading.domain.market_data.bar.bar_unit import BarUnit
+from suite_trading.indicators.library.atr import ATR
+from suite_trading.platform.event_feed.bar_series_event_feed import BarSeriesEventFeed
+from suite_trading.utils.data_generation.assistant import DGA
+
+
+def _bars(num_bars: int = 10) -> list[Bar]:
+    return DGA.bar.create_series(num_bars=num_bars)
+
+
+def test_bar_views_match_source_bars():
+    bars = _bars()
+    series = BarSeries.from_bars(bars)
+
+    assert len(series) == len(bars)
+    for bar, view in zip(bars, series):
+        assert isinstance(view, BarView)
+        assert isinstance(view, Bar)
+        assert view == bar
+        assert view.is_partial == bar.is_partial
+        assert view.instrument == bar.instrument
+
+    assert series[-1] == bars[-1]
+    assert series.get_bar(0) == bars[0]
+    assert type(series.get_bar(0)) is Bar
+
+
+def test_columns_use_fixed_bytes_per_bar():
+    series = BarSeries.from_bars(_bars(100))
+
+    # 7 int64 columns + 1 byte partial flag
+    assert series.nbytes == 100 * 57
+
+
+def test_append_rejects_precision_loss_and_out_of_order_bars():
+    bars = _bars(3)
+    series = BarSeries.from_bars(bars[1:])
+    first = bars[0]
+
+    with pytest.raises(ValueError):
+        series.append_bar(first)
+
+    with pytest.raises(ValueError):
+        series.append(first.start_dt + timedelta(days=1), first.end_dt + timedelta(days=1), Decimal("100.001"), Decimal("101"), Decimal("99"), Decimal("100"), None)
+
+
+def test_append_rejects_out_of_range_value_without_desyncing_columns():
+    bars = _bars(2)
+    series = BarSeries.from_bars(bars[:1])
+    bar = bars[1]
+
+    with pytest.raises(ValueError):
+        series.append(bar.start_dt, bar.end_dt, bar.open, bar.high, bar.low, bar.close, Decimal("1e30"))
+
+    assert len(series) == 1
+    assert series.nbytes == 57
+    series.append_bar(bar)
+    assert series[-1] == bar
+
+
+def test_none_volume_round_trips():
+    bar = _bars(2)[0]
+    series = BarSeries(bar.bar_type)
+    series.append(bar.start_dt, bar.end_dt, bar.open, bar.high, bar.low, bar.close, None)
+
+    assert series[0].volume is None
+
+
+def test_aggregator_and_indicator_accept_bar_views():
+    first_bar = DGA.bar.create(end_dt=datetime(2025, 1, 2, 0, 1, tzinfo=timezone.utc))
+    bars = DGA.bar.create_series(first_bar=first_bar, num_bars=10)
+    series = BarSeries.from_bars(bars)
+
+    expected: list[BarEvent] = []
+    aggregator = TimeBarAggregator(unit=BarUnit.MINUTE, size=5, on_emit_callback=expected.append)
+    for event in wrap_bars_to_events(bars):
+        aggregator.add_event(event)
+
+    actual: list[BarEvent] = []
+    aggregator = TimeBarAggregator(unit=BarUnit.MINUTE, size=5, on_emit_callback=actual.append)
+    for event in wrap_bars_to_events(series):
+        aggregator.add_event(event)
+
+    assert [e.bar for e in actual] == [e.bar for e in expected]
+
+    atr_from_bars, atr_from_views = ATR(period=3), ATR(period=3)
+    for bar, view in zip(bars, series):
+        atr_from_bars.update(bar)
+        atr_from_views.update(view)
+    assert atr_from_views.value == atr_from_bars.value
+
+
+def test_bar_series_event_feed_streams_and_skips_old_events():
+    bars = _bars(10)
+    feed = BarSeriesEventFeed(BarSeries.from_bars(bars))
+
+    first_event = feed.pop()
+    assert first_event.bar == bars[0]
+    assert first_event.dt_received == bars[0].end_dt
+
+    feed.remove_events_before(bars[5].end_dt)
+    assert feed.peek().bar == bars[5]
+
+    remaining = []
+    while not feed.is_finished():
+        remaining.append(feed.pop().bar)
+    assert remaining == bars[5:]
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+import pytest
+
+from suite_trading.domain.market_data.order_book.incremental_order_book import IncrementalOrderBook
+from suite_trading.domain.market_data.order_book.order_book import BookLevel
+from suite_trading.domain.market_data.order_book.order_book_delta import BookDelta, BookDeltaAction, BookSide
+from suite_trading.domain.market_data.order_book.order_book_delta_event import OrderBookDeltaEvent
+from suite_trading.domain.market_data.order_book.order_book_event import OrderBookEvent
+from suite_trading.platform.engine.models.event_to_order_book.default_impl import DefaultEventToOrderBookConverter
+from suite_trading.utils.data_generation.assistant import DGA
+
+TS = datetime(2025, 1, 2, 10, 0, tzinfo=timezone.utc)
+ADD, MODIFY, DELETE = BookDeltaAction.ADD, BookDeltaAction.MODIFY, BookDeltaAction.DELETE
+BID, ASK = BookSide.BID, BookSide.ASK
+
+
+def _level(price: str, volume: str) -> BookLevel:
+    return BookLevel(Decimal(price), Decimal(volume))
+
+
+def test_deltas_keep_ladders_sorted_best_first():
+    book = IncrementalOrderBook(DGA.instrument.equity_aapl(), TS)
+    book.apply_deltas(
+        [
+            BookDelta(BID, ADD, Decimal("99"), Decimal("5")),
+            BookDelta(BID, ADD, Decimal("100"), Decimal("3")),
+            BookDelta(BID, ADD, Decimal("98"), Decimal("7")),
+            BookDelta(ASK, ADD, Decimal("102"), Decimal("4")),
+            BookDelta(ASK, ADD, Decimal("101"), Decimal("2")),
+        ],
+        TS,
+    )
+
+    snapshot = book.get_snapshot()
+    assert snapshot.bids == (_level("100", "3"), _level("99", "5"), _level("98", "7"))
+    assert snapshot.asks == (_level("101", "2"), _level("102", "4"))
+    assert book.get_snapshot() is snapshot
+
+    book.apply_deltas([BookDelta(BID, DELETE, Decimal("100")), BookDelta(ASK, MODIFY, Decimal("101"), Decimal("9")), BookDelta(ASK, MODIFY, Decimal("102"), Decimal("0"))], TS + timedelta(seconds=1))
+
+    updated = book.get_snapshot()
+    assert updated is not snapshot
+    assert updated.timestamp == TS + timedelta(seconds=1)
+    assert updated.best_bid == _level("99", "5")
+    assert updated.asks == (_level("101", "9"),)
+
+
+def test_inconsistent_deltas_raise():
+    book = IncrementalOrderBook(DGA.instrument.equity_aapl(), TS)
+    book.apply_deltas([BookDelta(BID, ADD, Decimal("99"), Decimal("5"))], TS)
+
+    with pytest.raises(ValueError):
+        book.apply_deltas([BookDelta(BID, ADD, Decimal("99"), Decimal("1"))], TS)
+    with pytest.raises(ValueError):
+        book.apply_deltas([BookDelta(ASK, MODIFY, Decimal("101"), Decimal("1"))], TS)
+    with pytest.raises(ValueError):
+        book.apply_deltas([BookDelta(ASK, DELETE, Decimal("101"))], TS)
+    with pytest.raises(ValueError):
+        book.apply_deltas([], TS - timedelta(seconds=1))
+
+
+def test_rejected_batch_leaves_book_unchanged():
+    book = IncrementalOrderBook(DGA.instrument.equity_aapl(), TS)
+    book.apply_deltas([BookDelta(BID, ADD, Decimal("99"), Decimal("5")), BookDelta(ASK, ADD, Decimal("101"), Decimal("4"))], TS)
+    snapshot = book.get_snapshot()
+
+    # Valid deltas ahead of the invalid one must not be applied either
+    with pytest.raises(ValueError):
+        book.apply_deltas([BookDelta(BID, ADD, Decimal("100"), Decimal("1")), BookDelta(ASK, DELETE, Decimal("101")), BookDelta(ASK, MODIFY, Decimal("101"), Decimal("2"))], TS + timedelta(seconds=1))
+
+    assert book.timestamp == TS
+    assert book.get_snapshot() is snapshot
+    assert book.get_snapshot().bids == (_level("99", "5"),) and book.get_snapshot().asks == (_level("101", "4"),)
+
+    # Deltas are validated in order: a level added earlier in the batch can be modified later
+    book.apply_deltas([BookDelta(BID, ADD, Decimal("100"), Decimal("1")), BookDelta(BID, MODIFY, Decimal("100"), Decimal("3"))], TS + timedelta(seconds=1))
+    assert book.best_bid == _level("100", "3")
+
+
+def test_converter_applies_deltas_on_top_of_last_snapshot():
+    instrument = DGA.instrument.equity_aapl()
+    snapshot = DGA.order_book.from_strings(instrument, bids=["99@10"], asks=["101@5"], timestamp=TS)
+    converter = DefaultEventToOrderBookConverter()
+
+    converter.convert_to_order_books(OrderBookEvent(snapshot, TS, is_historical=True))
+    delta_ts = TS + timedelta(milliseconds=1)
+    delta_event = OrderBookDeltaEvent(instrument, delta_ts, [BookDelta(ASK, ADD, Decimal("100.5"), Decimal("1"))], delta_ts, is_historical=True)
+
+    assert converter.can_convert(delta_event)
+    (order_book,) = converter.convert_to_order_books(delta_event)
+    assert order_book.bids == (_level("99", "10"),)
+    assert order_book.asks == (_level("100.5", "1"), _level("101", "5"))
+    assert order_book.timestamp == delta_ts
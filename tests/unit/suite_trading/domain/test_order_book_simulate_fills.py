@@ -74,3 +74,40 @@ class TestOrderBookSimulateFills:
 
         fills = book.simulate_fills(target_signed_qty=Decimal("1"))
         assert [(f.signed_qty, f.price) for f in fills] == [(Decimal("1"), Decimal("-5"))]
+
+
+class TestOrderBookDepthQueries:
+    """Prefix-sum depth queries agree with a straightforward walk over levels."""
+
+    def _book(self) -> OrderBook:
+        instr = TestOrderBookSimulateFills()._instrument()
+        ts = datetime(2025, 1, 1, 10, 0, 0, tzinfo=timezone.utc)
+        bids = (BookLevel(Decimal("99"), Decimal("4")), BookLevel(Decimal("98"), Decimal("0")), BookLevel(Decimal("97"), Decimal("6")))
+        asks = (BookLevel(Decimal("100"), Decimal("10")), BookLevel(Decimal("101"), Decimal("5")), BookLevel(Decimal("103"), Decimal("5")))
+        return OrderBook(instr, ts, bids=bids, asks=asks)
+
+    def test_fillable_qty_within_price_band(self):
+        book = self._book()
+
+        assert book.compute_fillable_qty(True) == Decimal("20")
+        assert book.compute_fillable_qty(True, max_price=Decimal("101")) == Decimal("15")
+        assert book.compute_fillable_qty(True, min_price=Decimal("100.5"), max_price=Decimal("102")) == Decimal("5")
+        assert book.compute_fillable_qty(False, min_price=Decimal("98")) == Decimal("4")
+        assert book.compute_fillable_qty(False, min_price=Decimal("99.5")) == Decimal("0")
+
+    def test_vwap_and_price_at_depth(self):
+        book = self._book()
+
+        assert book.compute_vwap_for_qty(Decimal("12")) == (Decimal("100") * 10 + Decimal("101") * 2) / 12
+        assert book.compute_vwap_for_qty(Decimal("-5")) == (Decimal("99") * 4 + Decimal("97")) / 5
+        assert book.compute_vwap_for_qty(Decimal("21")) is None
+        assert book.get_price_at_depth(True, Decimal("10")) == Decimal("100")
+        assert book.get_price_at_depth(True, Decimal("16")) == Decimal("103")
+        assert book.get_price_at_depth(False, Decimal("5")) == Decimal("97")
+
+    def test_sell_limit_skips_zero_volume_levels(self):
+        book = self._book()
+
+        fills = book.simulate_fills(target_signed_qty=Decimal("-20"), min_price=Decimal("97"))
+
+        assert [(f.price, f.signed_qty) for f in fills] == [(Decimal("99"), Decimal("-4")), (Decimal("97"), Decimal("-6"))]
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from decimal import Decimal
+
+from suite_trading.domain.monetary.currency_registry import USD
+from suite_trading.domain.monetary.money import Money
+from suite_trading.domain.order.order_state import OrderAction, OrderState
+from suite_trading.domain.order.orders import MarketOrder
+from suite_trading.utils.data_generation.assistant import DGA
+
+TS = datetime(2025, 1, 2, 10, 0, tzinfo=timezone.utc)
+
+
+def _create_working_sell_order(signed_qty: int) -> MarketOrder:
+    order = MarketOrder(DGA.instrument.future_es(), signed_qty)
+    for action in (OrderAction.SUBMIT, OrderAction.ACCEPT, OrderAction.ACCEPT):
+        order.change_state(action)
+    return order
+
+
+def test_running_fill_aggregates_match_fills():
+    order = _create_working_sell_order(-3)
+
+    assert order.is_unfilled
+    assert order.average_fill_price is None
+    assert order.total_commissions == ()
+
+    order.add_fill(Decimal("-1"), Decimal("100.00"), TS, Money("1.5", USD))
+    order.add_fill(Decimal("-2"), Decimal("101.50"), TS, Money("3", USD))
+
+    assert order.state == OrderState.FILLED
+    assert order.is_fully_filled
+    assert order.abs_filled_quantity == Decimal("3")
+    assert order.signed_filled_quantity == Decimal("-3")
+    assert order.signed_unfilled_quantity == Decimal("0")
+    assert order.average_fill_price == (Decimal("100.00") + 2 * Decimal("101.50")) / 3
+    assert order.total_commissions == (Money("4.5", USD),)
+
+
+def test_list_fills_returns_cached_snapshot_that_cannot_change_order():
+    order = _create_working_sell_order(-2)
+    fills_before = order.list_fills()
+
+    first_fill = order.add_fill(Decimal("-1"), Decimal("100"), TS, Money("0", USD))
+
+    assert order.is_partially_filled
+    assert fills_before == ()
+    assert order.list_fills() == (first_fill,)
+    # Cached until the next fill: repeated reads do not copy
+    assert order.list_fills() is order.list_fills()
@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from typing import Callable
+
+import pytest
+
+from suite_trading.domain.order.order_state import OrderAction
+from suite_trading.domain.order.orders import Order
+from suite_trading.platform.broker.sim.sim_broker import SimBroker
+
+
+@pytest.fixture
+def sim_start_dt() -> datetime:
+    """Simulated time at which brokers from `create_connected_broker` start."""
+    return datetime(2025, 1, 2, 10, 0, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def create_connected_broker(sim_start_dt: datetime) -> Callable[..., SimBroker]:
+    """Return a factory of connected `SimBroker`(s) at $sim_start_dt; keyword arguments go to `SimBroker`."""
+
+    def create(**kwargs) -> SimBroker:
+        broker = SimBroker(**kwargs)
+        broker.connect()
+        broker.set_timeline_dt(sim_start_dt)
+        return broker
+
+    return create
+
+
+@pytest.fixture
+def submit() -> Callable[[SimBroker, Order], Order]:
+    """Return a function that submits an Order directly to a `SimBroker` (without TradingEngine)."""
+
+    def submit_order(broker: SimBroker, order: Order) -> Order:
+        order.change_state(OrderAction.SUBMIT)
+        broker.submit_order(order)
+        return order
+
+    return submit_order
@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from decimal import Decimal
+
+import pytest
+
+from suite_trading.domain.market_data.order_book.order_book import ProposedFill
+from suite_trading.domain.monetary.currency_registry import USD
+from suite_trading.domain.monetary.money import Money
+from suite_trading.domain.order.order_state import OrderAction
+from suite_trading.domain.order.order_fill import OrderFill
+from suite_trading.domain.order.orders import MarketOrder, Order
+from suite_trading.platform.broker.sim.models.fee.fee_context import FeeContext
+from suite_trading.platform.broker.sim.models.fee.fixed_fee import FixedFeeModel
+from suite_trading.platform.broker.sim.models.fee.protocol import FeeModel, IncrementalFeeModel
+from suite_trading.platform.broker.sim.models.fee.tiered_volume import TieredVolumeFeeModel
+from suite_trading.platform.broker.sim.sim_broker import SimBroker
+from suite_trading.utils.data_generation.assistant import DGA
+
+JAN = datetime(2025, 1, 15, 10, 0, tzinfo=timezone.utc)
+FEB = datetime(2025, 2, 3, 10, 0, tzinfo=timezone.utc)
+
+
+def _build_fee_model(*, is_per_instrument: bool = False) -> TieredVolumeFeeModel:
+    return TieredVolumeFeeModel(tiers=[(0, "0.01"), (100, "0.005")], currency=USD, is_per_instrument=is_per_instrument)
+
+
+def test_fee_context_keeps_running_totals_per_instrument_and_month():
+    aapl = DGA.instrument.equity_aapl()
+    fee_context = FeeContext()
+
+    fee_context.record_fill(aapl, Decimal("10"), Decimal("100"), JAN)
+    fee_context.record_fill(aapl, Decimal("-4"), Decimal("101"), FEB)
+    copy = fee_context.copy()
+    copy.record_fill(aapl, Decimal("50"), Decimal("100"), FEB)
+
+    assert fee_context.fill_count == 2
+    assert fee_context.get_volume() == Decimal("14")
+    assert fee_context.get_volume(aapl) == Decimal("14")
+    assert fee_context.get_notional() == Decimal("1404")
+    assert fee_context.get_period_volume(JAN) == Decimal("10")
+    assert fee_context.get_period_notional(FEB, aapl) == Decimal("404")
+    assert copy.get_period_volume(FEB) == Decimal("54")
+
+
+def test_tiered_fee_model_selects_tier_by_monthly_volume():
+    aapl = DGA.instrument.equity_aapl()
+    fee_model = _build_fee_model()
+    fee_context = FeeContext()
+    order = MarketOrder(aapl, 10)
+
+    assert fee_model.compute_commission_with_context(ProposedFill(Decimal("10"), Decimal("100"), JAN), order, fee_context) == Money(Decimal("0.10"), USD)
+
+    fee_context.record_fill(aapl, Decimal("100"), Decimal("100"), JAN)
+    # Sub-cent per-unit fee is kept; only the total is rounded
+    assert fee_model.compute_commission_with_context(ProposedFill(Decimal("10"), Decimal("100"), JAN), order, fee_context) == Money(Decimal("0.05"), USD)
+    # New month starts again in the first tier
+    assert fee_model.compute_commission_with_context(ProposedFill(Decimal("10"), Decimal("100"), FEB), order, fee_context) == Money(Decimal("0.10"), USD)
+
+
+def test_tiered_fee_model_counts_volume_per_instrument_if_requested():
+    aapl = DGA.instrument.equity_aapl()
+    other = DGA.instrument.future_es()
+    fee_context = FeeContext()
+    fee_context.record_fill(other, Decimal("200"), Decimal("5000"), JAN)
+    order = MarketOrder(aapl, 10)
+    proposed_fill = ProposedFill(Decimal("10"), Decimal("100"), JAN)
+
+    assert _build_fee_model().compute_commission_with_context(proposed_fill, order, fee_context) == Money(Decimal("0.05"), USD)
+    assert _build_fee_model(is_per_instrument=True).compute_commission_with_context(proposed_fill, order, fee_context) == Money(Decimal("0.10"), USD)
+
+
+@pytest.mark.parametrize(
+    "tiers",
+    [
+        [],
+        [(10, "0.01")],
+        [(0, "0.01"), (0, "0.005")],
+        [(0, "0.01"), (100, "-0.005")],
+    ],
+)
+def test_tiered_fee_model_rejects_invalid_tiers(tiers):
+    with pytest.raises(ValueError):
+        TieredVolumeFeeModel(tiers=tiers, currency=USD)
+
+
+def test_sim_broker_charges_tiered_commission_from_running_totals():
+    broker = SimBroker(fee_model=_build_fee_model(), keep_order_fills=False)
+    broker.connect()
+    broker.get_account().add_funds(Money(Decimal("100000"), USD))
+    broker.set_timeline_dt(JAN)
+    aapl = DGA.instrument.equity_aapl()
+    broker.process_order_book(DGA.order_book.from_strings(aapl, bids=["99@1000"], asks=["100@1000"], timestamp=JAN))
+
+    for signed_qty in (100, -10):
+        order = MarketOrder(aapl, signed_qty)
+        order.change_state(OrderAction.SUBMIT)
+        broker.submit_order(order)
+
+    assert broker.ledger.fees_to_dataframe()["amount"].tolist() == [Decimal("1"), Decimal("0.05")]
+
+
+def test_tiered_fee_model_computes_same_commission_from_previous_order_fills():
+    aapl = DGA.instrument.equity_aapl()
+    order = MarketOrder(aapl, 10)
+    previous_order_fills = [OrderFill(order=MarketOrder(aapl, 100), signed_qty=Decimal("100"), price=Decimal("100"), timestamp=JAN, commission=Money(Decimal("1"), USD), id="F1")]
+
+    assert _build_fee_model().compute_commission(ProposedFill(Decimal("10"), Decimal("100"), JAN), order, previous_order_fills) == Money(Decimal("0.05"), USD)
+
+
+class _HistoryFeeModel(FeeModel):
+    """FeeModel written against the history-based protocol: 1 USD plus 1 USD per previous fill."""
+
+    def compute_commission(self, proposed_fill: ProposedFill, order: Order, previous_order_fills) -> Money:
+        return Money(Decimal(1 + len(previous_order_fills)), USD)
+
+
+def test_sim_broker_passes_previous_order_fills_to_fee_models():
+    broker = SimBroker(fee_model=_HistoryFeeModel())
+    broker.connect()
+    broker.get_account().add_funds(Money(Decimal("100000"), USD))
+    broker.set_timeline_dt(JAN)
+    aapl = DGA.instrument.equity_aapl()
+    broker.process_order_book(DGA.order_book.from_strings(aapl, bids=["99@1000"], asks=["100@1000"], timestamp=JAN))
+
+    for signed_qty in (10, -10, 10):
+        order = MarketOrder(aapl, signed_qty)
+        order.change_state(OrderAction.SUBMIT)
+        broker.submit_order(order)
+
+    assert broker.ledger.fees_to_dataframe()["amount"].tolist() == [Decimal("1"), Decimal("2"), Decimal("3")]
+
+
+def test_sim_broker_without_kept_order_fills_rejects_history_based_fee_model():
+    with pytest.raises(ValueError):
+        SimBroker(fee_model=_HistoryFeeModel(), keep_order_fills=False)
+
+    # FixedFeeModel needs no history, so it is accepted
+    assert isinstance(FixedFeeModel(Money(Decimal("0.5"), USD)), IncrementalFeeModel)
+    SimBroker(fee_model=FixedFeeModel(Money(Decimal("0.5"), USD)), keep_order_fills=False)
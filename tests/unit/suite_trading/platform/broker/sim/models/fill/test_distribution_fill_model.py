@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from decimal import Decimal
 from datetime import datetime, timezone
+import random
 
 import pytest
 
@@ -10,6 +11,7 @@ from suite_trading.domain.order.orders import MarketOrder, LimitOrder, StopMarke
 from suite_trading.domain.market_data.order_book.order_book import OrderBook, ProposedFill, BookLevel
 from suite_trading.domain.instrument import Instrument, AssetClass
 from suite_trading.domain.monetary.currency import Currency, CurrencyType
+from suite_trading.utils.numeric_tools import as_decimal
 
 
 @pytest.fixture
@@ -283,6 +285,51 @@ def test_reproducibility_different_seeds_different_sequences(instrument, order_b
     assert results1 != results2
 
 
+def test_bisect_sampler_matches_linear_cumulative_walk(instrument, order_book):
+    """Precomputed cumulative table picks the same outcome as walking the weights for each draw."""
+    distribution = {1: Decimal("0.10"), -1: Decimal("0.40"), 0: Decimal("0.45")}  # Sums to 0.95: last key absorbs the rest
+    model = DistributionFillModel(market_fill_adjustment_distribution=distribution, rng_seed=7)
+    reference_rng = random.Random(7)
+
+    for _ in range(500):
+        random_value = as_decimal(reference_rng.random())
+        expected_ticks = 0
+        cumulative_weight = Decimal("0")
+        for ticks, weight in sorted(distribution.items()):
+            cumulative_weight += weight
+            if random_value <= cumulative_weight:
+                expected_ticks = ticks
+                break
+
+        assert model._sample_adjustment_ticks(instrument) == expected_ticks
+
+
+def test_block_rng_is_reproducible_per_instrument_regardless_of_interleaving(instrument, order_book):
+    """With $rng_block_size, each Instrument draws from its own substream."""
+    other_instrument = Instrument(name="GBPUSD@FOREX", exchange="FOREX", asset_class=AssetClass.FUTURE, price_increment=Decimal("0.0001"), qty_increment=Decimal("1"), contract_size=Decimal("1"), contract_unit="unit", quote_currency=instrument.quote_currency)
+    distribution = {-1: Decimal("0.5"), 1: Decimal("0.5")}
+    model1 = DistributionFillModel(market_fill_adjustment_distribution=distribution, rng_seed=5, rng_block_size=16)
+    model2 = DistributionFillModel(market_fill_adjustment_distribution=distribution, rng_seed=5, rng_block_size=16)
+
+    # Model 1 alternates Instrument(s), model 2 draws all of one Instrument first
+    results1 = {instrument: [], other_instrument: []}
+    for _ in range(40):
+        for current_instrument in (instrument, other_instrument):
+            results1[current_instrument].append(model1._sample_adjustment_ticks(current_instrument))
+    results2 = {current_instrument: [model2._sample_adjustment_ticks(current_instrument) for _ in range(40)] for current_instrument in (other_instrument, instrument)}
+
+    assert results1 == results2
+    assert results1[instrument] != results1[other_instrument]
+    assert set(results1[instrument]) == {-1, 1}
+
+
+@pytest.mark.parametrize("distribution", [{}, {0: Decimal("1.2"), -1: Decimal("-0.2")}])
+def test_invalid_distribution_raises(distribution):
+    """Empty distributions and negative weights are rejected at construction."""
+    with pytest.raises(ValueError):
+        DistributionFillModel(market_fill_adjustment_distribution=distribution)
+
+
 # endregion
 
 # region Edge Case Tests
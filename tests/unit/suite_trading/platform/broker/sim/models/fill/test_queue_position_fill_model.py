@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+import pytest
+
+from suite_trading.domain.instrument import AssetClass, Instrument
+from suite_trading.domain.market_data.order_book.order_book import BookLevel, OrderBook
+from suite_trading.domain.monetary.currency import Currency, CurrencyType
+from suite_trading.domain.order.orders import LimitOrder, MarketOrder
+from suite_trading.platform.broker.sim.models.fill.distribution import DistributionFillModel
+from suite_trading.platform.broker.sim.models.fill.queue_position import QueuePositionFillModel
+from suite_trading.platform.broker.sim.order_matching import compile_order_matching_record, simulate_fills_for_record
+
+LIMIT_PRICE = Decimal("1.1000")
+
+
+@pytest.fixture
+def instrument():
+    usd = Currency("USD", 2, "US Dollar", CurrencyType.FIAT)
+    return Instrument(name="EURUSD@FOREX", exchange="FOREX", asset_class=AssetClass.FUTURE, price_increment=Decimal("0.0001"), qty_increment=Decimal("1"), contract_size=Decimal("1"), contract_unit="unit", quote_currency=usd)
+
+
+def _book(instrument: Instrument, seconds: int, bid: tuple[str, str], ask: tuple[str, str]) -> OrderBook:
+    timestamp = datetime(2025, 1, 1, 10, 0, 0, tzinfo=timezone.utc) + timedelta(seconds=seconds)
+    bids = [BookLevel(price=Decimal(bid[0]), volume=Decimal(bid[1]))]
+    asks = [BookLevel(price=Decimal(ask[0]), volume=Decimal(ask[1]))]
+    return OrderBook(instrument=instrument, timestamp=timestamp, bids=bids, asks=asks)
+
+
+def _trade(instrument: Instrument, seconds: int, price: str, volume: str) -> OrderBook:
+    """Build the zero-spread OrderBook a TradeTick is converted to."""
+    timestamp = datetime(2025, 1, 1, 10, 0, 0, tzinfo=timezone.utc) + timedelta(seconds=seconds)
+    level = BookLevel(price=Decimal(price), volume=Decimal(volume))
+    return OrderBook(instrument=instrument, timestamp=timestamp, bids=[level], asks=[level])
+
+
+def _apply(model: QueuePositionFillModel, order: LimitOrder, order_book: OrderBook) -> Decimal:
+    """Apply $model to proposed fills of $order against $order_book; return accepted quantity."""
+    accepted_fills = model.apply_fill_policy(order, order_book, simulate_fills_for_record(compile_order_matching_record(order), order_book))
+    return sum((proposed_fill.abs_qty for proposed_fill in accepted_fills), Decimal("0"))
+
+
+def test_on_touch_fills_wait_until_queue_ahead_has_traded(instrument):
+    model = QueuePositionFillModel()
+    order = LimitOrder(instrument=instrument, signed_qty=10, limit_price=LIMIT_PRICE)
+
+    # Join the queue behind 30 visible at the bid
+    assert _apply(model, order, _book(instrument, 0, ("1.1000", "30"), ("1.1001", "50"))) == 0
+    assert model.get_qty_ahead(order) == Decimal("30")
+
+    # 20 print at the limit: still 10 ahead
+    assert _apply(model, order, _trade(instrument, 1, "1.1000", "20")) == 0
+    assert model.get_qty_ahead(order) == Decimal("10")
+
+    # Depth snapshot confirming the print does not count it again
+    assert _apply(model, order, _book(instrument, 2, ("1.1000", "10"), ("1.1001", "50"))) == 0
+    assert model.get_qty_ahead(order) == Decimal("10")
+
+    # 6 more leave the bid without a print: 4 ahead
+    assert _apply(model, order, _book(instrument, 3, ("1.1000", "4"), ("1.1001", "50"))) == 0
+    assert model.get_qty_ahead(order) == Decimal("4")
+
+    # 9 print: 4 consume the queue, 5 fill us
+    assert _apply(model, order, _trade(instrument, 4, "1.1000", "9")) == Decimal("5")
+    assert model.get_qty_ahead(order) == 0
+
+
+def test_repeated_identical_snapshots_do_not_count_as_traded(instrument):
+    model = QueuePositionFillModel()
+    order = LimitOrder(instrument=instrument, signed_qty=10, limit_price=LIMIT_PRICE)
+
+    # Static 100x50 book with the ask at our limit, repeated: resting opposite-side volume is not a trade
+    for seconds in range(5):
+        assert _apply(model, order, _book(instrument, seconds, ("1.0999", "100"), ("1.1000", "50"))) == 0
+
+    # Only a real print at the limit fills us
+    assert _apply(model, order, _trade(instrument, 5, "1.1000", "50")) == Decimal("10")
+
+
+def test_traded_through_level_releases_everything(instrument):
+    model = QueuePositionFillModel()
+    order = LimitOrder(instrument=instrument, signed_qty=10, limit_price=LIMIT_PRICE)
+    _apply(model, order, _book(instrument, 0, ("1.1000", "500"), ("1.1001", "50")))
+
+    accepted_qty = _apply(model, order, OrderBook(instrument, datetime(2025, 1, 1, 10, 0, 1, tzinfo=timezone.utc), [BookLevel(Decimal("1.0998"), Decimal("5"))], [BookLevel(Decimal("1.0999"), Decimal("4")), BookLevel(Decimal("1.1000"), Decimal("50"))]))
+
+    assert accepted_qty == Decimal("10")
+
+
+def test_own_orders_queue_fifo_and_each_snapshot_counts_once(instrument):
+    model = QueuePositionFillModel()
+    first = LimitOrder(instrument=instrument, signed_qty=10, limit_price=LIMIT_PRICE)
+    second = LimitOrder(instrument=instrument, signed_qty=10, limit_price=LIMIT_PRICE)
+    arrival_book = _book(instrument, 0, ("1.1000", "5"), ("1.1001", "50"))
+    _apply(model, first, arrival_book)
+    _apply(model, second, arrival_book)
+    assert model.get_qty_ahead(second) == Decimal("15")
+
+    # 20 print at the limit: 5 ahead, 10 to $first, 5 to $second
+    trade_book = _trade(instrument, 1, "1.1000", "20")
+    assert _apply(model, first, trade_book) == Decimal("10")
+    assert _apply(model, second, trade_book) == Decimal("5")
+
+
+def test_order_does_not_fill_from_snapshot_it_arrived_on(instrument):
+    model = QueuePositionFillModel()
+    order = LimitOrder(instrument=instrument, signed_qty=10, limit_price=LIMIT_PRICE)
+
+    # Arrives on a print with nothing visible ahead
+    assert _apply(model, order, _trade(instrument, 0, "1.1000", "20")) == 0
+    assert _apply(model, order, _trade(instrument, 1, "1.1000", "20")) == Decimal("10")
+
+
+def test_market_orders_pass_through_or_use_market_fill_model(instrument):
+    order_book = _book(instrument, 0, ("1.0999", "30"), ("1.1000", "20"))
+    order = MarketOrder(instrument=instrument, signed_qty=10)
+    proposed_fills = simulate_fills_for_record(compile_order_matching_record(order), order_book)
+
+    assert QueuePositionFillModel().apply_fill_policy(order, order_book, proposed_fills) == proposed_fills
+
+    slippage_model = DistributionFillModel(market_fill_adjustment_distribution={-1: Decimal("1")})
+    actual_fills = QueuePositionFillModel(market_fill_model=slippage_model).apply_fill_policy(order, order_book, proposed_fills)
+    assert [proposed_fill.price for proposed_fill in actual_fills] == [Decimal("1.1001")]
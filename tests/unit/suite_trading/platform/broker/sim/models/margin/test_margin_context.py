@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from decimal import Decimal
+
+import pytest
+
+from suite_trading.domain.monetary.currency_registry import USD
+from suite_trading.domain.monetary.money import Money
+from suite_trading.domain.order.order_enums import TimeInForce
+from suite_trading.domain.order.order_state import OrderAction, OrderState
+from suite_trading.domain.order.orders import MarketOrder
+from suite_trading.platform.broker.sim.models.fee.fixed_fee import FixedFeeModel
+from suite_trading.platform.broker.sim.models.margin.fixed_ratio import FixedRatioMarginModel
+from suite_trading.platform.broker.sim.sim_broker import SimBroker
+from suite_trading.utils.data_generation.assistant import DGA
+
+TS = datetime(2025, 1, 2, 10, 0, tzinfo=timezone.utc)
+
+
+class _PlainMarginModel:
+    """Delegates to FixedRatioMarginModel without providing a MarginContext."""
+
+    def __init__(self, margin_model: FixedRatioMarginModel) -> None:
+        self._margin_model = margin_model
+
+    def compute_initial_margin(self, order_book, signed_qty):
+        return self._margin_model.compute_initial_margin(order_book, signed_qty)
+
+    def compute_maintenance_margin(self, order_book, signed_qty):
+        return self._margin_model.compute_maintenance_margin(order_book, signed_qty)
+
+
+@pytest.mark.parametrize("signed_qty", [Decimal("0"), Decimal("1"), Decimal("-7"), Decimal("333")])
+def test_margin_context_matches_margin_model(signed_qty):
+    es = DGA.instrument.future_es()
+    order_book = DGA.order_book.from_strings(es, bids=["5000.25@10"], asks=["5000.50@10"], timestamp=TS)
+    margin_model = FixedRatioMarginModel(Decimal("0.073"), Decimal("0.0511"))
+
+    margin_context = margin_model.build_margin_context(order_book)
+
+    assert Money(margin_context.compute_initial_margin_value(signed_qty), margin_context.currency) == margin_model.compute_initial_margin(order_book, signed_qty)
+    assert Money(margin_context.compute_maint_margin_value(signed_qty), margin_context.currency) == margin_model.compute_maintenance_margin(order_book, signed_qty)
+
+
+@pytest.mark.parametrize(("funds", "expected_state"), [("100", OrderState.EXPIRED), ("228", OrderState.EXPIRED), ("229", OrderState.FILLED), ("300", OrderState.FILLED)])
+def test_fok_funding_check_with_margin_context_matches_generic_path(funds, expected_state):
+    margin_model = FixedRatioMarginModel(Decimal("0.1"), Decimal("0.05"))
+    states = []
+    for model in (margin_model, _PlainMarginModel(margin_model)):
+        broker = SimBroker(fee_model=FixedFeeModel(Money(Decimal("1"), USD)), margin_model=model)
+        broker.connect()
+        broker.get_account().add_funds(Money(Decimal(funds), USD))
+        broker.set_timeline_dt(TS)
+        aapl = DGA.instrument.equity_aapl()
+        broker.process_order_book(DGA.order_book.from_strings(aapl, bids=["99@10"], asks=["100@10", "101@10", "102@10"], timestamp=TS))
+
+        order = MarketOrder(aapl, 30, time_in_force=TimeInForce.FOK)
+        order.change_state(OrderAction.SUBMIT)
+        broker.submit_order(order)
+        states.append((order.state, broker.get_account().get_funds(USD)))
+
+    assert states[0] == states[1]
+    assert states[0][0] == expected_state
+
+
+def test_sim_broker_reuses_margin_context_while_order_book_is_unchanged():
+    broker = SimBroker(margin_model=FixedRatioMarginModel(Decimal("0.1"), Decimal("0.05")))
+    broker.connect()
+    broker.get_account().add_funds(Money(Decimal("100000"), USD))
+    broker.set_timeline_dt(TS)
+    aapl = DGA.instrument.equity_aapl()
+    order_book = DGA.order_book.from_strings(aapl, bids=["99@100"], asks=["100@100"], timestamp=TS)
+    broker.process_order_book(order_book)
+
+    for signed_qty in (5, 5):
+        order = MarketOrder(aapl, signed_qty)
+        order.change_state(OrderAction.SUBMIT)
+        broker.submit_order(order)
+        margin_context = broker._margin_context_by_instrument[aapl]
+
+        assert margin_context.order_book is order_book
+        assert margin_context.maint_margin_per_unit == Decimal("4.975")
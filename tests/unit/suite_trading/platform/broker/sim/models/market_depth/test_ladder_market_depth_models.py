@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from decimal import Decimal
+
+import pytest
+
+from suite_trading.domain.market_data.order_book.order_book import BookLevel
+from suite_trading.platform.broker.sim.models.market_depth.composite import CompositeMarketDepthModel
+from suite_trading.platform.broker.sim.models.market_depth.max_levels import MaxLevelsMarketDepthModel
+from suite_trading.platform.broker.sim.models.market_depth.participation_cap import ParticipationCapMarketDepthModel
+from suite_trading.platform.broker.sim.models.market_depth.spread_widening import SpreadWideningMarketDepthModel
+from suite_trading.platform.broker.sim.models.market_depth.volume_scaling import VolumeScalingMarketDepthModel
+from suite_trading.platform.broker.sim.sim_broker_group import SimBrokerGroup
+from suite_trading.utils.data_generation.assistant import DGA
+
+TS = datetime(2025, 1, 2, 10, 0, tzinfo=timezone.utc)
+
+
+def _create_order_book():
+    aapl = DGA.instrument.equity_aapl()
+    return DGA.order_book.from_strings(aapl, bids=["99.00@10", "98.99@20", "98.98@30"], asks=["99.01@5", "99.02@15", "99.03@40"], timestamp=TS)
+
+
+def _levels(levels) -> list[tuple[str, str]]:
+    return [(str(level.price), str(level.volume)) for level in levels]
+
+
+def test_volume_scaling_multiplies_every_level():
+    result = VolumeScalingMarketDepthModel("0.5").customize_matching_liquidity(_create_order_book())
+
+    assert [level.volume for level in result.bids] == [Decimal("5"), Decimal("10"), Decimal("15")]
+    assert [level.price for level in result.asks] == [Decimal("99.01"), Decimal("99.02"), Decimal("99.03")]
+
+
+def test_max_levels_keeps_best_levels():
+    result = MaxLevelsMarketDepthModel(2).customize_matching_liquidity(_create_order_book())
+
+    assert len(result.bids) == 2
+    assert result.asks[-1] == BookLevel(Decimal("99.02"), Decimal("15"))
+
+
+def test_spread_widening_moves_both_sides_by_ticks():
+    result = SpreadWideningMarketDepthModel(2).customize_matching_liquidity(_create_order_book())
+
+    assert result.best_bid.price == Decimal("98.98")
+    assert result.best_ask.price == Decimal("99.03")
+    assert result.spread_in_ticks == 5
+
+
+def test_participation_cap_truncates_best_first():
+    result = ParticipationCapMarketDepthModel("0.5", max_volume=20).customize_matching_liquidity(_create_order_book())
+
+    # Bids: 50% of 60 = 30, capped to 20; asks: 50% of 60 = 30, capped to 20
+    assert _levels(result.bids) == [("99.00", "10"), ("98.99", "10")]
+    assert _levels(result.asks) == [("99.01", "5"), ("99.02", "15")]
+
+
+def test_participation_cap_with_zero_rate_empties_book():
+    result = ParticipationCapMarketDepthModel(0).customize_matching_liquidity(_create_order_book())
+
+    assert result.is_empty
+
+
+def test_composite_matches_chained_models_and_memoizes_per_snapshot():
+    order_book = _create_order_book()
+    composite = CompositeMarketDepthModel([MaxLevelsMarketDepthModel(2), SpreadWideningMarketDepthModel(1), VolumeScalingMarketDepthModel(2)])
+
+    chained = order_book
+    for model in (MaxLevelsMarketDepthModel(2), SpreadWideningMarketDepthModel(1), VolumeScalingMarketDepthModel(2)):
+        chained = model.customize_matching_liquidity(chained)
+    result = composite.customize_matching_liquidity(order_book)
+
+    assert result == chained
+    assert composite.customize_matching_liquidity(order_book) is result
+    # A new snapshot (even with equal content) is customized again
+    assert composite.customize_matching_liquidity(_create_order_book()) is not result
+
+
+def test_groups_with_same_model_share_one_customized_order_book():
+    depth_model = VolumeScalingMarketDepthModel(3)
+    first_group, second_group = SimBrokerGroup(depth_model=depth_model), SimBrokerGroup(depth_model=depth_model)
+    order_book = _create_order_book()
+
+    first_group.set_latest_order_book(order_book)
+    second_group.set_latest_order_book(order_book)
+
+    assert first_group._get_latest_order_book(order_book.instrument) is second_group._get_latest_order_book(order_book.instrument)
+
+
+@pytest.mark.parametrize(
+    "create_model",
+    [
+        lambda: VolumeScalingMarketDepthModel(-1),
+        lambda: MaxLevelsMarketDepthModel(0),
+        lambda: SpreadWideningMarketDepthModel(-1),
+        lambda: ParticipationCapMarketDepthModel("1.5"),
+        lambda: ParticipationCapMarketDepthModel("0.5", max_volume=-1),
+        lambda: CompositeMarketDepthModel([]),
+    ],
+)
+def test_invalid_configuration_raises(create_model):
+    with pytest.raises(ValueError):
+        create_model()
+
+
+def _create_es_order_book():
+    es = DGA.instrument.future_es()
+    return DGA.order_book.from_strings(es, bids=["4999.75@7", "4999.50@3"], asks=["5000.00@7", "5000.25@3"], timestamp=TS)
+
+
+def test_volume_scaling_rounds_down_to_qty_increment_and_drops_empty_levels():
+    result = VolumeScalingMarketDepthModel("0.5").customize_matching_liquidity(_create_es_order_book())
+
+    # 7 × 0.5 = 3.5 → 3; 3 × 0.5 = 1.5 → 1
+    assert _levels(result.bids) == [("4999.75", "3"), ("4999.50", "1")]
+
+    # 7 × 0.05 = 0.35 would snap to a zero fill: the level is dropped
+    assert VolumeScalingMarketDepthModel("0.05").customize_matching_liquidity(_create_es_order_book()).is_empty
+
+
+def test_participation_cap_never_exceeds_cap_after_rounding():
+    # 10% of 10 = 1; 5% of 10 = 0.5 → 0 (nothing to fill instead of a zero or oversized fill)
+    assert _levels(ParticipationCapMarketDepthModel("0.1").customize_matching_liquidity(_create_es_order_book()).asks) == [("5000.00", "1")]
+    assert ParticipationCapMarketDepthModel("0.05").customize_matching_liquidity(_create_es_order_book()).is_empty
+
+    # 25% of 10 = 2.5 → 2 (never rounded up)
+    result = ParticipationCapMarketDepthModel("0.25").customize_matching_liquidity(_create_es_order_book())
+    assert _levels(result.bids) == [("4999.75", "2")]
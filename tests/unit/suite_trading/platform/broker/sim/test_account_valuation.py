@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+from suite_trading.domain.monetary.currency_registry import USD
+from suite_trading.domain.monetary.money import Money
+from suite_trading.domain.order.order_state import OrderAction
+from suite_trading.domain.order.orders import MarketOrder
+from suite_trading.platform.broker.sim.models.fill.distribution import DistributionFillModel
+from suite_trading.platform.broker.sim.sim_broker import SimBroker
+from suite_trading.utils.data_generation.assistant import DGA
+
+TS = datetime(2025, 1, 2, 10, 0, tzinfo=timezone.utc)
+MINUTE = timedelta(minutes=1)
+
+
+def _create_valued_broker() -> SimBroker:
+    fill_model = DistributionFillModel(market_fill_adjustment_distribution={0: Decimal("1")}, limit_on_touch_fill_probability=Decimal("1"), rng_seed=42)
+    broker = SimBroker(fill_model=fill_model, equity_sample_interval=MINUTE)
+    broker.connect()
+    broker.get_account().add_funds(Money(Decimal("10000"), USD))
+    return broker
+
+
+def _process_price(broker: SimBroker, price: str, timestamp: datetime) -> None:
+    broker.set_timeline_dt(timestamp)
+    broker.process_order_book(DGA.order_book.from_strings(DGA.instrument.equity_aapl(), bids=[f"{price}@10"], asks=[f"{price}@10"], timestamp=timestamp))
+
+
+def _submit_market_order(broker: SimBroker, signed_qty: int) -> None:
+    order = MarketOrder(DGA.instrument.equity_aapl(), signed_qty)
+    order.change_state(OrderAction.SUBMIT)
+    broker.submit_order(order)
+
+
+def test_equity_curve_marks_open_position_and_tracks_drawdown():
+    broker = _create_valued_broker()
+    aapl = DGA.instrument.equity_aapl()
+
+    _process_price(broker, "100", TS)
+    _submit_market_order(broker, 2)
+    _process_price(broker, "105", TS + MINUTE)
+    _process_price(broker, "104", TS + MINUTE + timedelta(seconds=10))  # Marks only; no sample is due yet
+    assert broker.valuation.get_unrealized_pnl(aapl) == Decimal("8")
+    _process_price(broker, "95", TS + 2 * MINUTE)
+    _submit_market_order(broker, -2)
+    broker.set_timeline_dt(TS + 3 * MINUTE)
+
+    curve = broker.valuation.equity_curve_to_dataframe()
+    assert curve["equity"].tolist() == [10000.0, 10010.0, 9990.0, 9990.0]
+    assert curve["unrealized_pnl"].tolist() == [0.0, 10.0, -10.0, 0.0]
+    assert curve["drawdown"].tolist() == [0.0, 0.0, 20.0, 20.0]
+    assert curve["timestamp"].iloc[-1] == TS + 3 * MINUTE
+
+
+def test_open_position_keeps_order_books_flowing_without_active_orders():
+    broker = _create_valued_broker()
+    aapl = DGA.instrument.equity_aapl()
+    _process_price(broker, "100", TS)
+    assert broker.needs_order_books(aapl) is False
+
+    _submit_market_order(broker, 1)
+
+    assert broker.list_active_orders() == []
+    assert broker.needs_order_books(aapl) is True
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from decimal import Decimal
+
+import pytest
+
+from suite_trading.domain.order.order_state import OrderAction, OrderState
+from suite_trading.domain.order.orders import LimitOrder, MarketOrder, Order, StopLimitOrder, StopMarketOrder
+from suite_trading.platform.broker.sim.order_matching import (
+    compile_order_matching_record,
+    compute_fillable_qty_for_record,
+    should_trigger_stop_record,
+    simulate_fills_for_record,
+)
+from suite_trading.platform.broker.sim.sim_broker import SimBroker
+from suite_trading.utils.data_generation.assistant import DGA
+
+TS = datetime(2025, 1, 2, 10, 0, tzinfo=timezone.utc)
+
+
+def _arm_stop(order: Order) -> Order:
+    order.change_state(OrderAction.SUBMIT)
+    order.change_state(OrderAction.ARM_TRIGGER)
+    return order
+
+
+@pytest.mark.parametrize(
+    "signed_qty, expected_by_limit_price",
+    [
+        # limit price (None = market) → (expected fills as (price, signed_qty), fillable qty)
+        (5, {None: ([("100", "3"), ("101", "2")], "7"), "100": ([("100", "3")], "3"), "99": ([], "0"), "101": ([("100", "3"), ("101", "2")], "7")}),
+        (-5, {None: ([("99", "-3"), ("98", "-2")], "7"), "100": ([], "0"), "99": ([("99", "-3")], "3"), "98": ([("99", "-3"), ("98", "-2")], "7")}),
+    ],
+)
+def test_record_kernel_fills_within_limit_price(signed_qty, expected_by_limit_price):
+    aapl = DGA.instrument.equity_aapl()
+    order_book = DGA.order_book.from_strings(aapl, bids=["99@3", "98@4"], asks=["100@3", "101@4"], timestamp=TS)
+
+    for limit_price, (expected_fills, expected_fillable_qty) in expected_by_limit_price.items():
+        order = MarketOrder(aapl, signed_qty) if limit_price is None else LimitOrder(aapl, signed_qty, Decimal(limit_price))
+        record = compile_order_matching_record(order)
+
+        actual_fills = [(proposed_fill.price, proposed_fill.signed_qty) for proposed_fill in simulate_fills_for_record(record, order_book)]
+        assert actual_fills == [(Decimal(price), Decimal(qty)) for price, qty in expected_fills]
+        assert compute_fillable_qty_for_record(record, order_book) == Decimal(expected_fillable_qty)
+
+
+def test_stop_limit_record_uses_its_limit_price():
+    aapl = DGA.instrument.equity_aapl()
+    order_book = DGA.order_book.from_strings(aapl, bids=["99@3", "98@4"], asks=["100@3", "101@4"], timestamp=TS)
+    record = compile_order_matching_record(StopLimitOrder(aapl, 5, stop_price=Decimal("100"), limit_price=Decimal("100")))
+
+    assert [(proposed_fill.price, proposed_fill.signed_qty) for proposed_fill in simulate_fills_for_record(record, order_book)] == [(Decimal("100"), Decimal("3"))]
+
+
+@pytest.mark.parametrize("signed_qty, triggering_stop_prices", [(5, {"98", "99", "100"}), (-5, {"99", "100", "101"})])
+def test_stop_record_triggers_on_opposite_best_price(signed_qty, triggering_stop_prices):
+    aapl = DGA.instrument.equity_aapl()
+    order_book = DGA.order_book.from_strings(aapl, bids=["99@3", "98@4"], asks=["100@3", "101@4"], timestamp=TS)
+    one_sided_book = DGA.order_book.from_strings(aapl, bids=["99@3"] if signed_qty > 0 else [], asks=[] if signed_qty > 0 else ["100@3"], timestamp=TS)
+
+    for stop_price in ["98", "99", "100", "101"]:
+        record = compile_order_matching_record(_arm_stop(StopMarketOrder(aapl, signed_qty, Decimal(stop_price))))
+        assert record.is_trigger_pending
+        assert should_trigger_stop_record(record, order_book) == (stop_price in triggering_stop_prices)
+        # Missing quote side never triggers
+        assert not should_trigger_stop_record(record, one_sided_book)
+
+
+def test_record_follows_partial_fills_and_stop_trigger():
+    broker = SimBroker()
+    broker.connect()
+    broker.set_timeline_dt(TS)
+    aapl = DGA.instrument.equity_aapl()
+    order = StopLimitOrder(aapl, 10, stop_price=Decimal("100"), limit_price=Decimal("101"))
+    order.change_state(OrderAction.SUBMIT)
+    broker.submit_order(order)
+    assert broker.group._get_matching_record(order).is_trigger_pending
+
+    broker.process_order_book(DGA.order_book.from_strings(aapl, bids=["99@10"], asks=["100@4"], timestamp=TS))
+
+    record = broker.group._get_matching_record(order)
+    assert order.state == OrderState.PARTIALLY_FILLED
+    assert not record.is_trigger_pending
+    assert record.abs_unfilled_qty == order.abs_unfilled_quantity == Decimal("6")
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+from suite_trading.domain.order.order_enums import TimeInForce
+from suite_trading.domain.order.order_state import OrderState
+from suite_trading.domain.order.orders import LimitOrder
+from suite_trading.utils.data_generation.assistant import DGA
+
+
+def test_gtd_and_day_orders_expire_in_deadline_order(create_connected_broker, submit, sim_start_dt):
+    broker = create_connected_broker()
+    aapl = DGA.instrument.equity_aapl()
+    late_gtd = submit(broker, LimitOrder(aapl, 1, Decimal("90"), time_in_force=TimeInForce.GTD, good_till_dt=sim_start_dt + timedelta(days=3)))
+    day = submit(broker, LimitOrder(aapl, 1, Decimal("90"), time_in_force=TimeInForce.DAY))
+    gtc = submit(broker, LimitOrder(aapl, 1, Decimal("90")))
+
+    broker.set_timeline_dt(sim_start_dt + timedelta(hours=1))
+    assert day.state == OrderState.WORKING
+
+    broker.set_timeline_dt(datetime(2025, 1, 3, tzinfo=timezone.utc))
+    assert day.state == OrderState.EXPIRED
+    assert late_gtd.state == OrderState.WORKING
+    assert len(broker.group._expiry_heap) == 1
+
+    broker.set_timeline_dt(sim_start_dt + timedelta(days=3))
+    assert late_gtd.state == OrderState.EXPIRED
+    assert broker.list_active_orders() == [gtc]
+    assert broker.group._expiry_heap == []
+
+
+def test_stale_expiry_entries_of_cancelled_orders_are_skipped(create_connected_broker, submit, sim_start_dt):
+    broker = create_connected_broker()
+    aapl = DGA.instrument.equity_aapl()
+    order = submit(broker, LimitOrder(aapl, 1, Decimal("90"), time_in_force=TimeInForce.GTD, good_till_dt=sim_start_dt + timedelta(hours=1)))
+
+    broker.cancel_order(order)
+    broker.set_timeline_dt(sim_start_dt + timedelta(hours=2))
+
+    assert order.state == OrderState.CANCELLED
+    assert broker.group._expiry_heap == []
+
+
+def test_expiry_heap_is_compacted_when_most_entries_are_dead(create_connected_broker, submit, sim_start_dt):
+    broker = create_connected_broker()
+    aapl = DGA.instrument.equity_aapl()
+    orders = [submit(broker, LimitOrder(aapl, 1, Decimal("90"), time_in_force=TimeInForce.GTD, good_till_dt=sim_start_dt + timedelta(hours=1))) for _ in range(10)]
+
+    # Dead entries stay until they exceed half of the heap
+    for order in orders[:5]:
+        broker.cancel_order(order)
+    assert len(broker.group._expiry_heap) == 10
+
+    broker.cancel_order(orders[5])
+    assert [entry[2] for entry in sorted(broker.group._expiry_heap)] == orders[6:]
+
+    broker.set_timeline_dt(sim_start_dt + timedelta(hours=2))
+    assert all(order.state == OrderState.EXPIRED for order in orders[6:])
+    assert broker.group._expiry_heap == []
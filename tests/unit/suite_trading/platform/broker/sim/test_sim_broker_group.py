@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+from decimal import Decimal
+
+import pytest
+
+from suite_trading.domain.market_data.order_book.order_book import OrderBook
+from suite_trading.domain.order.order_state import OrderAction, OrderState
+from suite_trading.domain.order.orders import LimitOrder
+from suite_trading.platform.broker.sim.sim_broker import SimBroker
+from suite_trading.platform.broker.sim.sim_broker_group import SimBrokerGroup
+from suite_trading.platform.engine.trading_engine import TradingEngine
+from suite_trading.utils.data_generation.assistant import DGA
+
+
+class _CountingDepthModel:
+    def __init__(self) -> None:
+        self.call_count = 0
+
+    def customize_matching_liquidity(self, order_book: OrderBook) -> OrderBook:
+        self.call_count += 1
+        return order_book
+
+
+def test_group_customizes_once_and_keeps_accounts_isolated(create_connected_broker, submit, sim_start_dt):
+    depth_model = _CountingDepthModel()
+    group = SimBrokerGroup(depth_model=depth_model)
+    first, second, idle = [create_connected_broker(group=group) for _ in range(3)]
+    aapl = DGA.instrument.equity_aapl()
+    first_order = submit(first, LimitOrder(aapl, 2, Decimal("100")))
+    second_order = submit(second, LimitOrder(aapl, -1, Decimal("90")))
+
+    group.process_order_book(DGA.order_book.from_strings(aapl, bids=["98@10"], asks=["99@10"], timestamp=sim_start_dt))
+
+    assert depth_model.call_count == 1
+    assert first_order.state == OrderState.FILLED
+    assert second_order.state == OrderState.FILLED
+    assert first.get_signed_position_qty(aapl) == Decimal("2")
+    assert second.get_signed_position_qty(aapl) == Decimal("-1")
+    assert idle.list_open_positions() == []
+    assert first.has_open_position(aapl) and not idle.has_open_position(aapl)
+    assert group.needs_order_books(aapl) is False
+
+
+def test_grouped_account_matches_like_standalone_broker(create_connected_broker, submit, sim_start_dt):
+    aapl = DGA.instrument.equity_aapl()
+    order_books = [
+        DGA.order_book.from_strings(aapl, bids=["100@5"], asks=["101@5"], timestamp=sim_start_dt),
+        DGA.order_book.from_strings(aapl, bids=["97@5"], asks=["98@2", "99@5"], timestamp=sim_start_dt),
+    ]
+
+    standalone = create_connected_broker()
+    grouped = create_connected_broker(group=SimBrokerGroup())
+
+    fills_by_broker = {}
+    for broker in (standalone, grouped):
+        submit(broker, LimitOrder(aapl, 4, Decimal("99")))
+        for order_book in order_books:
+            broker.process_order_book(order_book)
+        fills_by_broker[broker] = [(fill.price, fill.signed_quantity) for fill in broker._order_fill_history]
+
+    assert fills_by_broker[grouped] == fills_by_broker[standalone]
+    assert fills_by_broker[grouped]
+
+
+def test_order_ids_must_be_unique_within_group(create_connected_broker, submit):
+    group = SimBrokerGroup()
+    first, second = create_connected_broker(group=group), create_connected_broker(group=group)
+    aapl = DGA.instrument.equity_aapl()
+    submit(first, LimitOrder(aapl, 1, Decimal("90"), id="same"))
+
+    order = LimitOrder(aapl, 1, Decimal("90"), id="same")
+    order.change_state(OrderAction.SUBMIT)
+    with pytest.raises(ValueError):
+        second.submit_order(order)
+
+
+def test_engine_drives_each_group_once():
+    engine = TradingEngine()
+    group = SimBrokerGroup()
+    for index in range(3):
+        engine.add_broker(f"sim_{index}", SimBroker(group=group))
+    standalone = SimBroker()
+    engine.add_broker("standalone", standalone)
+
+    assert engine._list_simulated_brokers() == [group, standalone.group]
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+import pytest
+
+from suite_trading.domain.market_data.order_book.order_book import BookLevel, OrderBook
+from suite_trading.domain.order.order_state import OrderAction, OrderState
+from suite_trading.domain.order.orders import LimitOrder
+from suite_trading.platform.broker.sim.models.latency.distribution import DistributionLatencyModel
+from suite_trading.platform.broker.sim.models.latency.fixed import FixedLatencyModel
+from suite_trading.platform.broker.sim.sim_broker import SimBroker
+from suite_trading.utils.data_generation.assistant import DGA
+
+MS = timedelta(milliseconds=1)
+
+
+def _process_book(broker: SimBroker, dt: datetime, price: str) -> None:
+    levels = (BookLevel(Decimal(price), Decimal("100")),)
+    broker.set_timeline_dt(dt)
+    broker.process_order_book(OrderBook(DGA.instrument.equity_aapl(), dt, levels, levels))
+
+
+def test_submission_goes_live_only_after_its_latency(create_connected_broker, submit, sim_start_dt):
+    broker = create_connected_broker(latency_model=FixedLatencyModel(submit_latency=5 * MS))
+    order = submit(broker, LimitOrder(DGA.instrument.equity_aapl(), 1, Decimal("100")))
+
+    assert order.state == OrderState.PENDING_SUBMIT
+    assert broker.list_active_orders() == []
+    assert broker.needs_order_books(order.instrument)
+
+    # Price touches the limit while the order is still in flight: no fill
+    _process_book(broker, sim_start_dt + 2 * MS, "100")
+    assert order.state == OrderState.PENDING_SUBMIT
+
+    broker.set_timeline_dt(sim_start_dt + 5 * MS)
+    assert order.state == OrderState.WORKING
+    assert order.submitted_dt == sim_start_dt + 5 * MS
+    assert broker.group._request_heap == []
+
+
+def test_order_can_fill_while_its_cancel_is_in_flight(create_connected_broker, submit, sim_start_dt):
+    broker = create_connected_broker(latency_model=FixedLatencyModel(submit_latency=timedelta(0), cancel_latency=10 * MS))
+    order = submit(broker, LimitOrder(DGA.instrument.equity_aapl(), 1, Decimal("100")))
+    assert order.state == OrderState.WORKING
+
+    broker.cancel_order(order)
+    _process_book(broker, sim_start_dt + 3 * MS, "99")
+    assert order.state == OrderState.FILLED
+
+    # The late cancel finds a finished order and is dropped
+    broker.set_timeline_dt(sim_start_dt + 10 * MS)
+    assert order.state == OrderState.FILLED
+
+
+def test_requests_of_one_order_arrive_in_sending_order(create_connected_broker, submit, sim_start_dt):
+    # Cancel is faster than submit, but cannot overtake it
+    broker = create_connected_broker(latency_model=FixedLatencyModel(submit_latency=10 * MS, cancel_latency=1 * MS))
+    order = submit(broker, LimitOrder(DGA.instrument.equity_aapl(), 1, Decimal("100")))
+
+    broker.cancel_order(order)
+    broker.set_timeline_dt(sim_start_dt + 5 * MS)
+    assert order.state == OrderState.PENDING_SUBMIT
+
+    broker.set_timeline_dt(sim_start_dt + 10 * MS)
+    assert order.state == OrderState.CANCELLED
+    assert broker.group._last_request_arrival_by_order_id == {}
+
+
+def test_distribution_latency_model_samples_configured_latencies():
+    model = DistributionLatencyModel(submit_latency_distribution={1 * MS: Decimal("0.5"), 3 * MS: Decimal("0.5")}, cancel_latency_distribution={2 * MS: Decimal("1")}, rng_seed=7)
+    order = LimitOrder(DGA.instrument.equity_aapl(), 1, Decimal("100"))
+
+    submit_latencies = {model.compute_latency(order, OrderAction.SUBMIT) for _ in range(100)}
+
+    assert submit_latencies == {1 * MS, 3 * MS}
+    assert model.compute_latency(order, OrderAction.CANCEL) == 2 * MS
+    assert model.compute_latency(order, OrderAction.UPDATE) in submit_latencies
+    with pytest.raises(ValueError):
+        FixedLatencyModel(submit_latency=-MS)
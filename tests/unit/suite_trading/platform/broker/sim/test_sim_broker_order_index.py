@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+from decimal import Decimal
+
+from suite_trading.domain.order.order_state import OrderState
+from suite_trading.domain.order.order_enums import TimeInForce
+from suite_trading.domain.order.orders import LimitOrder, StopLimitOrder, StopMarketOrder
+from suite_trading.utils.data_generation.assistant import DGA
+
+
+def test_order_book_touches_only_orders_of_its_instrument(create_connected_broker, submit, sim_start_dt):
+    broker = create_connected_broker()
+    aapl, es = DGA.instrument.equity_aapl(), DGA.instrument.future_es()
+    aapl_order = submit(broker, LimitOrder(aapl, 1, Decimal("100")))
+    es_order = submit(broker, LimitOrder(es, 1, Decimal("5000")))
+
+    broker.process_order_book(DGA.order_book.from_strings(aapl, bids=["98@10"], asks=["99@10"], timestamp=sim_start_dt))
+
+    assert aapl_order.state == OrderState.FILLED
+    assert es_order.state == OrderState.WORKING
+    assert broker.list_active_orders() == [es_order]
+    assert not broker.needs_order_books(aapl) and broker.needs_order_books(es)
+
+
+def test_cancelled_orders_are_no_longer_matched(create_connected_broker, submit, sim_start_dt):
+    broker = create_connected_broker()
+    aapl = DGA.instrument.equity_aapl()
+    order = submit(broker, LimitOrder(aapl, 1, Decimal("90")))
+
+    broker.cancel_order(order)
+    broker.process_order_book(DGA.order_book.from_strings(aapl, bids=["88@10"], asks=["89@10"], timestamp=sim_start_dt))
+
+    assert order.state == OrderState.CANCELLED
+    assert broker.list_active_orders() == []
+    assert not broker.needs_order_books(aapl)
+
+
+def test_order_book_fills_only_triggered_stops_and_crossing_limits(create_connected_broker, submit, sim_start_dt):
+    broker = create_connected_broker()
+    aapl = DGA.instrument.equity_aapl()
+    far_buy_limit = submit(broker, LimitOrder(aapl, 1, Decimal("90")))
+    crossing_sell_limit = submit(broker, LimitOrder(aapl, -1, Decimal("97")))
+    far_buy_stop = submit(broker, StopMarketOrder(aapl, 1, Decimal("110")))
+    triggered_sell_stop = submit(broker, StopMarketOrder(aapl, -1, Decimal("98")))
+    ioc_limit = submit(broker, LimitOrder(aapl, 1, Decimal("80"), time_in_force=TimeInForce.IOC))
+
+    broker.process_order_book(DGA.order_book.from_strings(aapl, bids=["98@10"], asks=["99@10"], timestamp=sim_start_dt))
+
+    assert crossing_sell_limit.state == OrderState.FILLED
+    assert triggered_sell_stop.state == OrderState.FILLED
+    assert ioc_limit.state == OrderState.EXPIRED
+    assert far_buy_limit.state == OrderState.WORKING
+    assert far_buy_stop.state == OrderState.TRIGGER_PENDING
+
+
+def test_triggered_stop_limit_waits_for_its_limit_price(create_connected_broker, submit, sim_start_dt):
+    broker = create_connected_broker()
+    aapl = DGA.instrument.equity_aapl()
+    order = submit(broker, StopLimitOrder(aapl, 1, stop_price=Decimal("100"), limit_price=Decimal("100")))
+    assert order.state == OrderState.TRIGGER_PENDING
+
+    # Stop triggers at ask 101, but the limit does not cross yet (also on the next snapshot)
+    for _ in range(2):
+        broker.process_order_book(DGA.order_book.from_strings(aapl, bids=["100@10"], asks=["101@10"], timestamp=sim_start_dt))
+        assert order.state == OrderState.WORKING
+
+    # Ask falls through the limit price, so the resting limit crosses and fills
+    broker.process_order_book(DGA.order_book.from_strings(aapl, bids=["98@10"], asks=["99@10"], timestamp=sim_start_dt))
+    assert order.state == OrderState.FILLED
+    assert broker.list_active_orders() == []
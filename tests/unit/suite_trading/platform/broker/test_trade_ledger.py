@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+import pytest
+
+from suite_trading.domain.market_data.bar.bar_event import wrap_bars_to_events
+from suite_trading.domain.monetary.currency_registry import USD
+from suite_trading.domain.monetary.money import Money
+from suite_trading.domain.order.order_state import OrderAction
+from suite_trading.domain.order.orders import MarketOrder
+from suite_trading.platform.broker.sim.models.fee.fixed_fee import FixedFeeModel
+from suite_trading.platform.broker.sim.models.margin.fixed_ratio import FixedRatioMarginModel
+from suite_trading.platform.broker.sim.sim_broker import SimBroker
+from suite_trading.platform.broker.trade_ledger import LedgerTable
+from suite_trading.platform.engine.trading_engine import TradingEngine
+from suite_trading.platform.event_feed.fixed_sequence_event_feed import FixedSequenceEventFeed
+from suite_trading.strategy.strategy import Strategy
+from suite_trading.utils.data_generation.assistant import DGA
+
+TS = datetime(2025, 1, 2, 10, 0, tzinfo=timezone.utc)
+
+
+def test_ledger_table_spans_chunks_and_exports_typed_columns():
+    table = LedgerTable({"timestamp": "datetime", "order_id": "str", "instrument": "category", "price": "decimal"}, chunk_size=2)
+    for index in range(5):
+        table.append(TS + timedelta(seconds=index), f"order-{index}", "ES" if index % 2 else "NQ", Decimal("100.25") + index)
+
+    df = table.to_dataframe()
+
+    assert len(table) == 5
+    assert df["timestamp"].iloc[-1] == TS + timedelta(seconds=4)
+    assert df["order_id"].tolist() == [f"order-{index}" for index in range(5)]
+    assert df["instrument"].tolist() == ["NQ", "ES", "NQ", "ES", "NQ"]
+    assert list(df["instrument"].cat.categories) == ["NQ", "ES"]
+    assert df["price"].tolist() == [Decimal("100.25") + index for index in range(5)]
+
+
+def test_ledger_table_stores_decimals_exactly():
+    values = [Decimal("0.1"), Decimal("-1234567890.000000001"), Decimal("10.000000000000000000"), Decimal("1E+30"), 0.3]
+    table = LedgerTable({"amount": "decimal"}, chunk_size=2)
+    for value in values:
+        table.append(value)
+
+    exported = table.to_dataframe()["amount"].tolist()
+
+    assert exported == [Decimal("0.1"), Decimal("-1234567890.000000001"), Decimal("10"), Decimal("1E+30"), Decimal("0.3")]
+    assert sum(exported[:1] * 3) == Decimal("0.3")
+
+    with pytest.raises(ValueError):
+        table.append(Decimal("12345678901234567890.1"))
+    assert len(table) == 5
+
+
+def test_sim_broker_records_ledger_without_keeping_order_fills():
+    broker = SimBroker(fee_model=FixedFeeModel(Money(Decimal("0.5"), USD)), margin_model=FixedRatioMarginModel(Decimal("0.2"), Decimal("0.1")), keep_order_fills=False)
+    broker.connect()
+    broker.get_account().add_funds(Money(Decimal("10000"), USD))
+    broker.set_timeline_dt(TS)
+    aapl = DGA.instrument.equity_aapl()
+    broker.process_order_book(DGA.order_book.from_strings(aapl, bids=["99@10"], asks=["100@10"], timestamp=TS))
+
+    for signed_qty in (3, -3):
+        order = MarketOrder(aapl, signed_qty)
+        order.change_state(OrderAction.SUBMIT)
+        broker.submit_order(order)
+
+    assert broker._order_fill_history == []
+    assert broker.get_account().list_paid_fees() == ()
+    ledger = broker.ledger
+    assert ledger.fills_to_dataframe()["signed_qty"].tolist() == [Decimal("3"), Decimal("-3")]
+    assert ledger.fees_to_dataframe()["amount"].tolist() == [Decimal("1.5"), Decimal("1.5")]
+    assert ledger.margins_to_dataframe()["blocked_maint"].tolist() == [Decimal("29.85"), Decimal("0")]
+
+
+class _BuyOnceStrategy(Strategy):
+    def __init__(self, name: str, broker: SimBroker) -> None:
+        super().__init__(name)
+        self._broker = broker
+        self._has_submitted = False
+
+    def on_start(self) -> None:
+        self.add_event_feed("bars", FixedSequenceEventFeed(wrap_bars_to_events(DGA.bar.create_series(num_bars=3))), use_for_simulated_fills=True)
+
+    def on_event(self, event) -> None:
+        if not self._has_submitted:
+            self.submit_order(MarketOrder(event.bar.instrument, 2), self._broker)
+            self._has_submitted = True
+
+
+def test_engine_without_kept_order_fills_exposes_ledger():
+    engine = TradingEngine(keep_order_fills=False)
+    broker = SimBroker()
+    engine.add_broker("sim", broker)
+    engine.add_strategy(_BuyOnceStrategy("buy_once", broker))
+    engine.start()
+
+    with pytest.raises(ValueError):
+        engine.list_order_fills_for_strategy("buy_once")
+    assert engine.get_ledger_for_strategy("buy_once").fills_to_dataframe()["signed_qty"].tolist() == [Decimal("2")]
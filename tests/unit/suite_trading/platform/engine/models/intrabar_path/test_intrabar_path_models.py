@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import pytest
+
+from suite_trading.domain.market_data.bar.bar import Bar
+from suite_trading.domain.market_data.bar.bar_series import BarSeries
+from suite_trading.domain.market_data.order_book.ohlc_price_trajectory import OhlcPriceTrajectory
+from suite_trading.platform.engine.models.intrabar_path.brownian_bridge import BrownianBridgeIntrabarPathModel
+from suite_trading.platform.engine.models.intrabar_path.directional import DirectionalIntrabarPathModel
+from suite_trading.platform.engine.models.intrabar_path.lower_timeframe import LowerTimeframeIntrabarPathModel
+from suite_trading.platform.engine.models.intrabar_path.ohlc import OhlcIntrabarPathModel
+from suite_trading.platform.event_feed.bar_series_event_feed import BarSeriesEventFeed
+from suite_trading.utils.data_generation.assistant import DGA
+
+
+def _aggregate(lower_bars: list[Bar], value: int) -> Bar:
+    """Aggregate consecutive $lower_bars into one bar of $value minutes."""
+    bar_type = DGA.bar.create_type(value=value)
+    return Bar(
+        bar_type,
+        lower_bars[0].start_dt,
+        lower_bars[-1].end_dt,
+        lower_bars[0].open,
+        max(bar.high for bar in lower_bars),
+        min(bar.low for bar in lower_bars),
+        lower_bars[-1].close,
+        sum(bar.volume for bar in lower_bars),
+    )
+
+
+def test_ohlc_model_matches_fixed_decomposition():
+    bar = DGA.bar.create()
+
+    trajectory = OhlcIntrabarPathModel().get_trajectory(bar)
+
+    expected = OhlcPriceTrajectory.from_bar(bar)
+    assert trajectory.timestamps == expected.timestamps
+    assert trajectory.prices == expected.prices
+
+
+def test_directional_model_reaches_far_extreme_first():
+    up_bar = DGA.bar.create(is_bullish=True)
+    down_bar = DGA.bar.create(is_bullish=False)
+    model = DirectionalIntrabarPathModel()
+
+    assert model.get_trajectory(up_bar).prices == (up_bar.open, up_bar.low, up_bar.high, up_bar.close)
+    assert model.get_trajectory(down_bar).prices == (down_bar.open, down_bar.high, down_bar.low, down_bar.close)
+
+
+def test_brownian_bridge_paths_are_precomputed_valid_and_reproducible():
+    bars = DGA.bar.create_series(num_bars=50)
+    model = BrownianBridgeIntrabarPathModel(steps=12, seed=3)
+    model.precompute(bars)
+
+    for bar in bars:
+        trajectory = model.get_trajectory(bar)
+        prices = trajectory.prices
+        increment = bar.instrument.price_increment
+
+        assert len(trajectory) == 13
+        assert trajectory.timestamps[0] == bar.start_dt and trajectory.timestamps[-1] == bar.end_dt
+        assert prices[0] == bar.open and prices[-1] == bar.close
+        assert max(prices) == bar.high and min(prices) == bar.low
+        assert all(price % increment == 0 for price in prices)
+        # Cached path is returned as is
+        assert model.get_trajectory(bar) is trajectory
+
+    other_model = BrownianBridgeIntrabarPathModel(steps=12, seed=3)
+    other_model.precompute(bars)
+    assert [other_model.get_trajectory(bar).prices for bar in bars] == [model.get_trajectory(bar).prices for bar in bars]
+
+
+def test_paths_precomputed_from_bar_series_match_bars_replayed_by_feed():
+    bars = DGA.bar.create_series(num_bars=5)
+    series = BarSeries.from_bars(bars)
+    model = BrownianBridgeIntrabarPathModel(steps=8, seed=7)
+    model.precompute(series)
+    expected_trajectories = [model.get_trajectory(bar) for bar in bars]
+
+    # Every BarView is a new object, so the cache must match by value, not identity
+    feed = BarSeriesEventFeed(series)
+    replayed_trajectories = []
+    while not feed.is_finished():
+        replayed_trajectories.append(model.get_trajectory(feed.pop().bar))
+
+    assert model.precomputed_count == 5
+    assert all(replayed is expected for replayed, expected in zip(replayed_trajectories, expected_trajectories, strict=True))
+    assert model.get_trajectory(series[0]) is model.get_trajectory(series[0])
+
+
+def test_brownian_bridge_needs_room_for_extremes():
+    with pytest.raises(ValueError):
+        BrownianBridgeIntrabarPathModel(steps=2)
+
+
+def test_lower_timeframe_model_follows_lower_bars():
+    lower_bars = DGA.bar.create_series(num_bars=10)
+    bars = [_aggregate(lower_bars[:5], 5), _aggregate(lower_bars[5:], 5)]
+    lower_path_model = DirectionalIntrabarPathModel()
+    model = LowerTimeframeIntrabarPathModel(lower_bars, lower_path_model=lower_path_model)
+    model.precompute(bars)
+
+    trajectory = model.get_trajectory(bars[1])
+
+    expected_points = []
+    for lower_bar in lower_bars[5:]:
+        lower_trajectory = lower_path_model.get_trajectory(lower_bar)
+        for point in zip(lower_trajectory.timestamps, lower_trajectory.prices):
+            if not expected_points or point != expected_points[-1]:
+                expected_points.append(point)
+    assert list(zip(trajectory.timestamps, trajectory.prices)) == expected_points
+    assert trajectory.volume == bars[1].volume
+
+
+def test_lower_timeframe_model_falls_back_without_lower_bars():
+    bar = DGA.bar.create()
+
+    trajectory = LowerTimeframeIntrabarPathModel([]).get_trajectory(bar)
+
+    assert trajectory.prices == DirectionalIntrabarPathModel().get_trajectory(bar).prices
@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+import pytest
+
+from suite_trading.domain.order.order_state import OrderAction, OrderState, create_order_state_machine
+from suite_trading.utils.state_machine import StateMachine, TransitionTable
+
+
+def test_order_state_machines_share_one_transition_table():
+    first = create_order_state_machine(OrderState.INITIALIZED)
+    second = create_order_state_machine(OrderState.INITIALIZED)
+
+    assert first._table is second._table
+
+    first.execute_action(OrderAction.SUBMIT)
+    assert first.current_state == OrderState.PENDING_SUBMIT
+    assert second.current_state == OrderState.INITIALIZED
+
+
+def test_valid_actions_and_terminal_states_come_from_adjacency_table():
+    sm = create_order_state_machine(OrderState.INITIALIZED)
+
+    assert set(sm.list_valid_actions()) == {OrderAction.DENY, OrderAction.SUBMIT}
+    assert sm.can_execute_action(OrderAction.SUBMIT)
+    assert not sm.can_execute_action(OrderAction.FILL)
+
+    sm.execute_action(OrderAction.DENY)
+    assert sm.is_in_terminal_state()
+    assert sm.list_valid_actions() == ()
+
+    with pytest.raises(ValueError):
+        sm.execute_action(OrderAction.SUBMIT)
+
+
+def test_state_machine_runs_on_custom_transition_table():
+    table = TransitionTable({(OrderState.INITIALIZED, OrderAction.SUBMIT): OrderState.PENDING_SUBMIT})
+    sm = StateMachine(OrderState.INITIALIZED, table)
+
+    assert sm.execute_action(OrderAction.SUBMIT) == OrderState.PENDING_SUBMIT
+
+    with pytest.raises(ValueError):
+        TransitionTable({})